@@ -0,0 +1,49 @@
+"""Post-edition analytics report endpoints."""
+
+from fastapi import APIRouter, Response, status
+
+from app.dependencies import DBSession, RequireManager
+from app.schemas.analytics import ComparisonRequest, ReportRequest
+from app.schemas.job import JobSummary
+from app.services.analytics_service import AnalyticsService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(tags=["Stats"])
+
+
+@router.post(
+    "/editions/{edition_id}/stats/rapport",
+    response_model=JobSummary,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_report(
+    edition_id: str,
+    request: ReportRequest,
+    db: DBSession,
+    current_user: dict[str, str] = RequireManager,
+) -> Response:
+    """Start generating an edition's report (sell-through, sales curves, prices).
+
+    Poll the returned job until completed, then download its result.
+    """
+    job = await AnalyticsService(db).submit_report(
+        edition_id, request.format, created_by_id=current_user["id"]
+    )
+    return FastJSONResponse(job, status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.post(
+    "/stats/comparaison",
+    response_model=JobSummary,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_comparison(
+    request: ComparisonRequest,
+    db: DBSession,
+    current_user: dict[str, str] = RequireManager,
+) -> Response:
+    """Start generating a side-by-side comparison of several editions."""
+    job = await AnalyticsService(db).submit_comparison(
+        request.edition_ids, request.format, created_by_id=current_user["id"]
+    )
+    return FastJSONResponse(job, status_code=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,38 @@
+"""Audit trail endpoints."""
+
+from fastapi import APIRouter, Query, Response
+
+from app.dependencies import ReadSession, RequireAdmin
+from app.repositories.audit_repository import AuditRepository
+from app.schemas.audit import AuditEntry
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/audit", tags=["Audit"])
+
+
+@router.get(
+    "",
+    response_model=list[AuditEntry],
+    dependencies=[RequireAdmin],
+)
+async def list_audit_entries(
+    db: ReadSession,
+    entity_type: str | None = Query(default=None, alias="entite"),
+    entity_id: str | None = Query(default=None, alias="entite_id"),
+    actor_id: str | None = Query(default=None, alias="acteur"),
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=50, ge=1, le=200),
+) -> Response:
+    """Get the audit trail of an entity or an actor, newest first.
+
+    Events are written in batches: the latest ones appear after at most
+    the flush interval (1 second by default).
+    """
+    entries = await AuditRepository(db).list_entries(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actor_id=actor_id,
+        limit=limit,
+        offset=(page - 1) * limit,
+    )
+    return FastJSONResponse(entries)
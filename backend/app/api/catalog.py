@@ -0,0 +1,45 @@
+"""Register catalog feed endpoints."""
+
+from fastapi import APIRouter, Query, Request, Response
+
+from app.dependencies import ReadSession, RequireVolunteer
+from app.schemas.catalog import CatalogFeed
+from app.services.catalog_service import CatalogService
+from app.utils.http_cache import etag_matches, make_etag, not_modified, set_etag
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}", tags=["Catalog"])
+
+
+@router.get(
+    "/catalogue",
+    response_model=CatalogFeed,
+    dependencies=[RequireVolunteer],
+)
+async def get_catalog(
+    edition_id: str,
+    request: Request,
+    db: ReadSession,
+    since: int | None = Query(
+        default=None,
+        ge=0,
+        description="Catalog version already cached by the register",
+    ),
+) -> Response:
+    """Get the edition catalog for offline register caches.
+
+    Without `since`, returns a full snapshot of articles on sale or sold.
+    With `since`, returns only the articles whose status or price changed
+    after that version. Answers 304 when the register already holds the
+    current version.
+    """
+    service = CatalogService(db)
+    etag = make_etag(
+        "catalog", edition_id, await service.get_version(edition_id), since
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    feed = await service.get_feed(edition_id, since)
+    response = FastJSONResponse(feed)
+    return set_etag(response, make_etag("catalog", edition_id, feed.v, since))
@@ -0,0 +1,127 @@
+"""Deposit slot endpoints."""
+
+from fastapi import APIRouter, Request, Response, status
+
+from app.dependencies import DBSession, ReadSession, RequireDepositor, RequireManager
+from app.schemas.deposit_slot import (
+    DepositSlotCreate,
+    DepositSlotSummary,
+    DepositSlotUpdate,
+    SlotAvailability,
+    SlotReservation,
+)
+from app.services.deposit_slot_service import DepositSlotService
+from app.utils.http_cache import etag_matches, make_etag, not_modified, set_etag
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/creneaux", tags=["Deposit slots"])
+
+
+@router.get(
+    "",
+    response_model=list[DepositSlotSummary],
+    dependencies=[RequireDepositor],
+)
+async def list_slots(edition_id: str, db: ReadSession) -> Response:
+    """Get the deposit slots of an edition, in time order."""
+    slots = await DepositSlotService(db).list_slots(edition_id)
+    return FastJSONResponse(slots)
+
+
+@router.post(
+    "",
+    response_model=DepositSlotSummary,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[RequireManager],
+)
+async def create_slot(
+    edition_id: str, slot_data: DepositSlotCreate, db: DBSession
+) -> Response:
+    """Add a deposit slot to an edition."""
+    slot = await DepositSlotService(db).create_slot(edition_id, slot_data)
+    return FastJSONResponse(slot, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/disponibilites",
+    response_model=list[SlotAvailability],
+    dependencies=[RequireDepositor],
+)
+async def get_availability(
+    edition_id: str, request: Request, db: ReadSession
+) -> Response:
+    """Get the places left in each slot.
+
+    Served from a view refreshed every few seconds, so registration pages
+    can poll it; answers 304 while availability is unchanged.
+    """
+    slots = await DepositSlotService(db).get_availability(edition_id)
+    etag = make_etag(
+        "slots", edition_id, *(f"{slot.id}:{slot.available_places}" for slot in slots)
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return set_etag(FastJSONResponse(slots), etag)
+
+
+@router.patch(
+    "/{creneau_id}",
+    response_model=DepositSlotSummary,
+    dependencies=[RequireManager],
+)
+async def update_slot(
+    edition_id: str, creneau_id: str, slot_data: DepositSlotUpdate, db: DBSession
+) -> Response:
+    """Change a slot's capacity, resident restriction or description."""
+    slot = await DepositSlotService(db).update_slot(edition_id, creneau_id, slot_data)
+    return FastJSONResponse(slot)
+
+
+@router.delete(
+    "/{creneau_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[RequireManager],
+)
+async def delete_slot(edition_id: str, creneau_id: str, db: DBSession) -> Response:
+    """Delete a slot without reservations."""
+    await DepositSlotService(db).delete_slot(edition_id, creneau_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/{creneau_id}/reservation",
+    response_model=SlotReservation,
+    status_code=status.HTTP_201_CREATED,
+)
+async def reserve_slot(
+    edition_id: str,
+    creneau_id: str,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Reserve a place in a slot for the current depositor.
+
+    Answers 409 when the slot is full, including when its last place was
+    just taken by someone else.
+    """
+    reservation = await DepositSlotService(db).reserve(
+        edition_id, creneau_id, current_user["id"]
+    )
+    return FastJSONResponse(reservation, status_code=status.HTTP_201_CREATED)
+
+
+@router.delete(
+    "/{creneau_id}/reservation",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def cancel_reservation(
+    edition_id: str,
+    creneau_id: str,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Release the current depositor's place in a slot."""
+    await DepositSlotService(db).cancel_reservation(
+        edition_id, creneau_id, current_user["id"]
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
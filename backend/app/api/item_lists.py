@@ -0,0 +1,248 @@
+"""Depositor list endpoints."""
+
+from fastapi import APIRouter, Query, Request, Response, status
+
+from app.dependencies import (
+    DBSession,
+    ReadSession,
+    RequireDepositor,
+    RequireManager,
+    RequireVolunteer,
+)
+from app.exceptions import ItemListNotFoundError
+from app.models import Article
+from app.repositories.article_repository import ArticleRepository
+from app.repositories.item_list_repository import ItemListRepository
+from app.schemas.article import ArticleListDiff, ArticleListSave, ArticleSummary
+from app.schemas.item_list import (
+    CohortCopy,
+    ItemListCopy,
+    ItemListCreate,
+    ItemListSummary,
+    ListCheckIn,
+    ListCheckInResult,
+)
+from app.services.article_service import ArticleService
+from app.services.cache_coherence import LIST_SCOPE, get_entity_version
+from app.services.check_in_service import CheckInService
+from app.services.item_list_service import ItemListService
+from app.utils.http_cache import (
+    etag_matches,
+    get_rows_version,
+    make_etag,
+    not_modified,
+    set_etag,
+)
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/listes", tags=["Lists"])
+
+
+@router.get(
+    "",
+    response_model=list[ItemListSummary],
+    dependencies=[RequireDepositor],
+)
+async def list_item_lists(
+    edition_id: str,
+    db: ReadSession,
+    depositor_id: str | None = Query(default=None, alias="deposant_id"),
+    status: str | None = Query(default=None, alias="statut"),
+    list_type: str | None = Query(default=None, alias="type"),
+) -> Response:
+    """Get the lists of an edition with their article counts."""
+    summaries = await ItemListRepository(db).list_summaries(
+        edition_id,
+        depositor_id=depositor_id,
+        status=status,
+        list_type=list_type,
+    )
+    return FastJSONResponse(summaries)
+
+
+@router.post(
+    "",
+    response_model=ItemListSummary,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_item_list(
+    edition_id: str,
+    list_data: ItemListCreate,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Create an empty list for the current depositor.
+
+    The list gets the next number of its type and the matching label color.
+    """
+    item_list_id = await ItemListService(db).create_list(
+        edition_id, current_user["id"], list_data.list_type.value
+    )
+    (summary,) = await ItemListRepository(db).list_summaries(
+        edition_id, item_list_ids=[item_list_id]
+    )
+    return FastJSONResponse(summary, status_code=status.HTTP_201_CREATED)
+
+
+@router.delete(
+    "/{liste_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_item_list(
+    edition_id: str,
+    liste_id: str,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Delete an empty draft list of the current depositor."""
+    await ItemListService(db).delete_list(
+        edition_id, liste_id, depositor_id=current_user["id"]
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get(
+    "/{liste_id}/articles",
+    response_model=list[ArticleSummary],
+    dependencies=[RequireDepositor],
+)
+async def list_articles(
+    edition_id: str,
+    liste_id: str,
+    request: Request,
+    db: ReadSession,
+) -> Response:
+    """Get the articles of a list, ordered by line number."""
+    if await ItemListRepository(db).get_in_edition(edition_id, liste_id) is None:
+        raise ItemListNotFoundError(liste_id)
+
+    # Declaration edits invalidate the list scope; check-in, sales and
+    # retrieval stamp the articles with the catalog version
+    list_version = await get_entity_version(db, edition_id, LIST_SCOPE, liste_id)
+    count, changed = await get_rows_version(
+        db, Article.change_version, Article.item_list_id == liste_id
+    )
+    etag = make_etag("articles", liste_id, list_version, count, changed)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    articles = await ArticleRepository(db).list_summaries(liste_id)
+    return set_etag(FastJSONResponse(articles), etag)
+
+
+@router.put(
+    "/{liste_id}/articles",
+    response_model=ArticleListDiff,
+)
+async def save_articles(
+    edition_id: str,
+    liste_id: str,
+    list_data: ArticleListSave,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Save the full state of a depositor's list (declaration autosave).
+
+    Articles without an ID are created, submitted articles are updated if
+    they changed, and stored articles missing from the body are deleted.
+    Lines are renumbered by category order.
+    """
+    diff = await ArticleService(db).save_list(
+        edition_id, liste_id, list_data.articles, depositor_id=current_user["id"]
+    )
+    return FastJSONResponse(diff)
+
+
+@router.post(
+    "/reprise",
+    response_model=list[ItemListSummary],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[RequireManager],
+)
+async def copy_cohort(
+    edition_id: str,
+    cohort_data: CohortCopy,
+    db: DBSession,
+) -> Response:
+    """Copy the unsold articles of depositors' lists from another edition.
+
+    Each source list with unsold articles becomes a draft list of this
+    edition.
+    """
+    item_list_ids = await ItemListService(db).copy_cohort(
+        cohort_data.source_edition_id, edition_id, cohort_data.depositor_ids
+    )
+    summaries = await ItemListRepository(db).list_summaries(
+        edition_id, item_list_ids=item_list_ids
+    )
+    return FastJSONResponse(summaries, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/depot",
+    response_model=ListCheckInResult,
+    dependencies=[RequireVolunteer],
+)
+async def check_in_list(
+    edition_id: str,
+    check_in_data: ListCheckIn,
+    db: DBSession,
+) -> Response:
+    """Check in a list scanned at the deposit desk.
+
+    All its validated articles go on sale at once, except the rejected ones.
+    """
+    result = await CheckInService(db).check_in(
+        edition_id, check_in_data.code, check_in_data.excluded_article_ids
+    )
+    return FastJSONResponse(result)
+
+
+@router.post(
+    "/{liste_id}/dupliquer",
+    response_model=ItemListSummary,
+    status_code=status.HTTP_201_CREATED,
+)
+async def duplicate_list(
+    edition_id: str,
+    liste_id: str,
+    copy_data: ItemListCopy,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Copy a depositor's list, or some of its articles, into a new draft list.
+
+    The new list can belong to another edition, to re-declare articles of
+    a previous season.
+    """
+    target_edition_id = copy_data.target_edition_id or edition_id
+    item_list_id = await ItemListService(db).duplicate_list(
+        edition_id,
+        liste_id,
+        target_edition_id=target_edition_id,
+        article_ids=copy_data.article_ids,
+        depositor_id=current_user["id"],
+    )
+    (summary,) = await ItemListRepository(db).list_summaries(
+        target_edition_id, item_list_ids=[item_list_id]
+    )
+    return FastJSONResponse(summary, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/{liste_id}/articles/{article_id}/dupliquer",
+    response_model=ArticleSummary,
+    status_code=status.HTTP_201_CREATED,
+)
+async def duplicate_article(
+    edition_id: str,
+    liste_id: str,
+    article_id: str,
+    db: DBSession,
+    current_user: dict[str, str] = RequireDepositor,
+) -> Response:
+    """Copy an article right after itself in a depositor's list."""
+    article = await ItemListService(db).duplicate_article(
+        edition_id, liste_id, article_id, depositor_id=current_user["id"]
+    )
+    return FastJSONResponse(article, status_code=status.HTTP_201_CREATED)
@@ -0,0 +1,33 @@
+"""Background job endpoints."""
+
+from fastapi import APIRouter, Response
+from fastapi.responses import FileResponse
+
+from app.dependencies import ReadSession, RequireManager
+from app.schemas.job import JobSummary
+from app.services.job_service import JobService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobSummary,
+    dependencies=[RequireManager],
+)
+async def get_job(job_id: str, db: ReadSession) -> Response:
+    """Get a job's status; `resultUrl` is set once it is completed."""
+    job = await JobService(db).get_summary(job_id)
+    return FastJSONResponse(job)
+
+
+@router.get(
+    "/{job_id}/download",
+    response_class=FileResponse,
+    dependencies=[RequireManager],
+)
+async def download_job_result(job_id: str, db: ReadSession) -> Response:
+    """Download a completed job's result file."""
+    path, media_type, filename = await JobService(db).get_result(job_id)
+    return FileResponse(path, media_type=media_type, filename=filename)
@@ -0,0 +1,24 @@
+"""Depositor payout endpoints."""
+
+from fastapi import APIRouter, Response
+
+from app.dependencies import DBSession, RequireManager
+from app.schemas.payout import PayoutSummary
+from app.services.payout_service import PayoutService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/reversements", tags=["Payouts"])
+
+
+@router.post(
+    "",
+    response_model=list[PayoutSummary],
+    dependencies=[RequireManager],
+)
+async def compute_payouts(edition_id: str, db: DBSession) -> Response:
+    """Compute what each depositor is owed, list by list.
+
+    Pending payouts are recomputed; ready and paid payouts are kept.
+    """
+    payouts = await PayoutService(db).compute(edition_id)
+    return FastJSONResponse(payouts)
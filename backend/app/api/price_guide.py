@@ -0,0 +1,30 @@
+"""Price guidance endpoints."""
+
+from fastapi import APIRouter, Query, Response
+
+from app.dependencies import ReadSession, RequireDepositor
+from app.schemas.price_guide import PriceGuidance
+from app.services.price_guide_service import PriceGuideService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/conseils-prix", tags=["Price guidance"])
+
+
+@router.get(
+    "",
+    response_model=PriceGuidance | None,
+    dependencies=[RequireDepositor],
+)
+async def get_price_guidance(
+    db: ReadSession,
+    category: str = Query(alias="categorie", max_length=50),
+    size: str | None = Query(default=None, alias="taille", max_length=50),
+    brand: str | None = Query(default=None, alias="marque", max_length=100),
+) -> Response:
+    """Get the prices at which similar articles sold in past editions.
+
+    Served from memory, for the declaration form; `null` when past
+    editions had no such article.
+    """
+    guidance = await PriceGuideService(db).lookup(category, size, brand)
+    return FastJSONResponse(guidance)
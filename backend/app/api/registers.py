@@ -0,0 +1,80 @@
+"""Register reconciliation endpoints."""
+
+from datetime import date, datetime
+from typing import Literal
+
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import HTMLResponse
+
+from app.dependencies import DBSession, ReadSession, RequireManager, RequireVolunteer
+from app.schemas.register import DrawerCount, TotalCorrection, ZReport
+from app.services.register_service import RegisterService, render_z_report_html
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/caisses", tags=["Registers"])
+
+
+@router.get(
+    "/{register_number}/z",
+    response_model=ZReport,
+    dependencies=[RequireVolunteer],
+)
+async def get_z_report(
+    edition_id: str,
+    register_number: int,
+    db: ReadSession,
+    day: date | None = Query(default=None, alias="date"),
+    format: Literal["json", "html"] = "json",
+) -> Response:
+    """Get a register's end-of-day report, as JSON or as a printable page.
+
+    The day defaults to today (UTC, like sale times).
+    """
+    report = await RegisterService(db).z_report(
+        edition_id, register_number, day or datetime.utcnow().date()
+    )
+    if format == "html":
+        return HTMLResponse(render_z_report_html(report))
+    return FastJSONResponse(report)
+
+
+@router.put(
+    "/{register_number}/comptage",
+    response_model=ZReport,
+)
+async def record_drawer_count(
+    edition_id: str,
+    register_number: int,
+    count: DrawerCount,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Record the amounts counted in the drawer and get the discrepancies."""
+    report = await RegisterService(db).record_count(
+        edition_id,
+        register_number,
+        count.day,
+        count.amounts,
+        count.note,
+        counted_by_id=current_user["id"],
+    )
+    return FastJSONResponse(report)
+
+
+@router.post(
+    "/recalcul",
+    response_model=list[TotalCorrection],
+    dependencies=[RequireManager],
+)
+async def recompute_totals(
+    edition_id: str,
+    db: DBSession,
+    day: date = Query(alias="date"),
+    register_number: int | None = Query(default=None, alias="caisse"),
+) -> Response:
+    """Rebuild a day's register totals from the sales, for audit.
+
+    Returns the totals that were wrong, with their previous values.
+    """
+    corrections = await RegisterService(db).recompute(edition_id, day, register_number)
+    return FastJSONResponse(corrections)
@@ -0,0 +1,94 @@
+"""Unsold article retrieval endpoints."""
+
+from fastapi import APIRouter, Query, Response, status
+
+from app.dependencies import DBSession, ReadSession, RequireManager, RequireVolunteer
+from app.schemas.job import JobSummary
+from app.schemas.retrieval import (
+    ListRetrieval,
+    Picklist,
+    PicklistExport,
+    RetrievalPreparation,
+)
+from app.services.retrieval_service import RetrievalService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/retrait", tags=["Retrieval"])
+
+
+@router.post("", response_model=RetrievalPreparation)
+async def prepare_retrieval(
+    edition_id: str,
+    db: DBSession,
+    current_user: dict[str, str] = RequireManager,
+) -> Response:
+    """End the sale: mark the articles left as unsold and build the picklists."""
+    preparation = await RetrievalService(db).prepare(
+        edition_id, actor_id=current_user["id"]
+    )
+    return FastJSONResponse(preparation)
+
+
+@router.get(
+    "/listes",
+    response_model=list[Picklist],
+    dependencies=[RequireVolunteer],
+)
+async def list_picklists(
+    edition_id: str,
+    db: ReadSession,
+    label_color: str | None = Query(default=None, alias="couleur"),
+) -> Response:
+    """Get the picklists in storage order: label color, then list number."""
+    lists = await RetrievalService(db).list_picklists(edition_id, label_color)
+    return FastJSONResponse(lists)
+
+
+@router.get(
+    "/listes/{code}",
+    response_model=Picklist,
+    dependencies=[RequireVolunteer],
+)
+async def get_picklist(edition_id: str, code: str, db: ReadSession) -> Response:
+    """Get the picklist of a scanned list code."""
+    picklist = await RetrievalService(db).get_picklist(edition_id, code)
+    return FastJSONResponse(picklist)
+
+
+@router.post("/listes/{code}", response_model=Picklist)
+async def process_list(
+    edition_id: str,
+    code: str,
+    retrieval: ListRetrieval,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Hand all unsold articles of a list back to the depositor, or donate them."""
+    picklist = await RetrievalService(db).process(
+        edition_id, code, retrieval.outcome, actor_id=current_user["id"]
+    )
+    return FastJSONResponse(picklist)
+
+
+@router.post(
+    "/export",
+    response_model=JobSummary,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def export_picklists(
+    edition_id: str,
+    export: PicklistExport,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Start rendering printable picklists of the lists not processed yet.
+
+    Poll the returned job until completed, then download its result.
+    """
+    job = await RetrievalService(db).submit_export(
+        edition_id,
+        export.format,
+        export.label_color,
+        created_by_id=current_user["id"],
+    )
+    return FastJSONResponse(job, status_code=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,163 @@
+"""Sale endpoints."""
+
+from datetime import date
+
+from fastapi import APIRouter, Query, Response, status
+
+from app.dependencies import DBSession, ReadSession, RequireManager, RequireVolunteer
+from app.repositories.sale_repository import SaleRepository
+from app.schemas.sale import (
+    BasketCheck,
+    BasketCheckout,
+    BasketItems,
+    BasketReceipt,
+    SaleCancel,
+    SaleCreate,
+    SalePage,
+    SaleSummary,
+    SaleSync,
+    SyncResult,
+)
+from app.services.sale_service import SaleService
+from app.utils.log import bind_context
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/ventes", tags=["Sales"])
+
+
+@router.get(
+    "",
+    response_model=SalePage,
+    dependencies=[RequireVolunteer],
+)
+async def list_sales(
+    edition_id: str,
+    db: ReadSession,
+    day: date | None = Query(default=None, alias="date"),
+    register_number: int | None = Query(default=None, alias="caisse"),
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> Response:
+    """Get the sales history of an edition, most recent first."""
+    repository = SaleRepository(db)
+    items = await repository.list_summaries(
+        edition_id,
+        day=day,
+        register_number=register_number,
+        limit=limit,
+        offset=(page - 1) * limit,
+    )
+    total = await repository.count(edition_id, day=day, register_number=register_number)
+    return FastJSONResponse(
+        SalePage.model_construct(items=items, total=total, page=page, limit=limit)
+    )
+
+
+@router.post(
+    "",
+    response_model=SaleSummary,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_sale(
+    edition_id: str,
+    sale_data: SaleCreate,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Record the sale of an article.
+
+    Returns 409 when the article was already sold, e.g. by another register
+    scanning the same item.
+    """
+    bind_context(register_number=sale_data.register_number)
+    sale = await SaleService(db).record_sale(
+        edition_id,
+        sale_data.payment_method,
+        sale_data.register_number,
+        article_id=sale_data.article_id,
+        barcode=sale_data.barcode,
+        seller_id=current_user["id"],
+    )
+    return FastJSONResponse(sale, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/panier/verification",
+    response_model=BasketCheck,
+    dependencies=[RequireVolunteer],
+)
+async def check_basket(
+    edition_id: str,
+    basket_data: BasketItems,
+    db: DBSession,
+) -> Response:
+    """Check the articles scanned into a basket and compute its total."""
+    basket = await SaleService(db).check_basket(edition_id, basket_data.barcodes)
+    return FastJSONResponse(basket)
+
+
+@router.post(
+    "/panier",
+    response_model=BasketReceipt,
+    status_code=status.HTTP_201_CREATED,
+)
+async def checkout_basket(
+    edition_id: str,
+    basket_data: BasketCheckout,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Sell all articles of a basket with a single payment.
+
+    Either every article is sold or none is: returns 409 with the failure of
+    each unavailable barcode.
+    """
+    bind_context(register_number=basket_data.register_number)
+    receipt = await SaleService(db).checkout_basket(
+        edition_id,
+        basket_data.barcodes,
+        basket_data.payment_method,
+        basket_data.register_number,
+        seller_id=current_user["id"],
+    )
+    return FastJSONResponse(receipt, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/sync", response_model=SyncResult)
+async def sync_sales(
+    edition_id: str,
+    sync_data: SaleSync,
+    db: DBSession,
+    current_user: dict[str, str] = RequireVolunteer,
+) -> Response:
+    """Synchronize sales recorded by a register while offline.
+
+    Sales are recorded one by one; articles sold meanwhile by another
+    register are reported as conflicts instead of failing the batch.
+    """
+    bind_context(register_number=sync_data.register_number)
+    result = await SaleService(db).sync_offline_sales(
+        edition_id,
+        sync_data.register_number,
+        sync_data.sales,
+        seller_id=current_user["id"],
+    )
+    return FastJSONResponse(result)
+
+
+@router.post("/{vente_id}/annuler", response_model=SaleSummary)
+async def cancel_sale(
+    edition_id: str,
+    vente_id: str,
+    cancel_data: SaleCancel,
+    db: DBSession,
+    current_user: dict[str, str] = RequireManager,
+) -> Response:
+    """Cancel a sale. The article goes back on sale.
+
+    The cancellation and its reason are recorded in the audit trail.
+    """
+    sale = await SaleService(db).cancel_sale(
+        edition_id, vente_id, cancel_data.reason, actor_id=current_user["id"]
+    )
+    return FastJSONResponse(sale)
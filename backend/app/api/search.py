@@ -0,0 +1,38 @@
+"""Article search endpoints."""
+
+from decimal import Decimal
+
+from fastapi import APIRouter, Query, Response
+
+from app.dependencies import ReadSession, RequireVolunteer
+from app.schemas.article import ArticleSearchHit
+from app.services.search_service import SearchService
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter(prefix="/editions/{edition_id}/articles", tags=["Search"])
+
+
+@router.get(
+    "/recherche",
+    response_model=list[ArticleSearchHit],
+    dependencies=[RequireVolunteer],
+)
+async def search_articles(
+    edition_id: str,
+    db: ReadSession,
+    q: str = Query(default="", max_length=200, description="Words to look for"),
+    list_number: int | None = Query(default=None, alias="liste"),
+    min_price: Decimal | None = Query(default=None, alias="prix_min", ge=0),
+    max_price: Decimal | None = Query(default=None, alias="prix_max", ge=0),
+    status: str | None = Query(default=None, alias="statut"),
+    limit: int = Query(default=20, ge=1, le=100, alias="limite"),
+) -> Response:
+    """Find articles by description, brand, color, size or category.
+
+    Matching ignores case and accents and tolerates typos; results are
+    ranked by relevance. Used to identify an article whose label was lost.
+    """
+    hits = await SearchService(db).search(
+        edition_id, q, list_number, min_price, max_price, status, limit
+    )
+    return FastJSONResponse(hits)
@@ -0,0 +1,123 @@
+"""Command-line maintenance tasks.
+
+Usage:
+    python -m app.cli archive <edition_id>
+    python -m app.cli restore <edition_id>
+    python -m app.cli price-guide
+    python -m app.cli seed [--seed N] [--depositors N] [--lists N] [--articles N]
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from app.exceptions import AppException
+from app.models.base import async_session_factory, engine
+from app.services.archive_service import ArchiveService, ArchiveSummary
+from app.services.price_guide_service import PriceGuideService
+from app.services.seed_service import EditionShape, SeedService
+
+
+def _format_summary(summary: ArchiveSummary) -> str:
+    counts = ", ".join(f"{table}={count}" for table, count in summary.counts.items())
+    return f"edition {summary.edition_id}: {counts} ({summary.path})"
+
+
+async def _archive(args: argparse.Namespace) -> str:
+    async with async_session_factory() as session:
+        summary = await ArchiveService(session).archive_edition(args.edition_id)
+        # The archived edition's sales now feed the price guidance
+        await PriceGuideService(session).rebuild()
+        await session.commit()
+    return f"Archived {_format_summary(summary)}"
+
+
+async def _restore(args: argparse.Namespace) -> str:
+    async with async_session_factory() as session:
+        summary = await ArchiveService(session).restore_edition(args.edition_id)
+        await session.commit()
+    return f"Restored {_format_summary(summary)}"
+
+
+async def _price_guide(_args: argparse.Namespace) -> str:
+    async with async_session_factory() as session:
+        count = await PriceGuideService(session).rebuild()
+        await session.commit()
+    return f"Rebuilt price guidance: {count} rows"
+
+
+async def _seed(args: argparse.Namespace) -> str:
+    shape = EditionShape(
+        depositors=args.depositors,
+        lists=args.lists,
+        articles=args.articles,
+        registers=args.registers,
+        sold_share=args.sold_share,
+    )
+    async with async_session_factory() as session:
+        summary = await SeedService(session).generate(args.seed, shape)
+        await session.commit()
+    counts = ", ".join(f"{name}={count}" for name, count in summary.counts.items())
+    return f"Seeded edition {summary.edition_id}: {counts}"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    archive = commands.add_parser(
+        "archive", help="Move an archived edition's rows to cold storage"
+    )
+    archive.add_argument("edition_id")
+    archive.set_defaults(handler=_archive)
+
+    restore = commands.add_parser(
+        "restore", help="Restore an edition's rows from cold storage"
+    )
+    restore.add_argument("edition_id")
+    restore.set_defaults(handler=_restore)
+
+    price_guide = commands.add_parser(
+        "price-guide",
+        help="Rebuild the price guidance from closed and archived editions",
+    )
+    price_guide.set_defaults(handler=_price_guide)
+
+    defaults = EditionShape()
+    seed = commands.add_parser(
+        "seed", help="Generate a synthetic edition for load tests and benchmarks"
+    )
+    seed.add_argument("--seed", type=int, default=0)
+    seed.add_argument("--depositors", type=int, default=defaults.depositors)
+    seed.add_argument("--lists", type=int, default=defaults.lists)
+    seed.add_argument("--articles", type=int, default=defaults.articles)
+    seed.add_argument("--registers", type=int, default=defaults.registers)
+    seed.add_argument("--sold-share", type=float, default=defaults.sold_share)
+    seed.set_defaults(handler=_seed)
+
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> str:
+    handler: Callable[[argparse.Namespace], Awaitable[str]] = args.handler
+    try:
+        return await handler(args)
+    finally:
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a maintenance command."""
+    args = build_parser().parse_args(argv)
+    try:
+        message = asyncio.run(_run(args))
+    except AppException as e:
+        print(f"Error: {e.message}")
+        return 1
+    print(message)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
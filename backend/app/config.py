@@ -41,6 +41,9 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
 
+    # HTTP responses
+    compression_minimum_size: int = 1000
+
     # Email (SMTP)
     smtp_host: str = "localhost"
     smtp_port: int = 587
@@ -54,9 +57,51 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     max_upload_size_mb: int = 10
 
-    # Rate limiting
+    # Cold storage for archived editions
+    archive_dir: str = "archives"
+
+    # Result files of background jobs (reports...)
+    job_output_dir: str = "jobs"
+
+    # Rate limiting (requests per window and per client)
     rate_limit_requests: int = 100
     rate_limit_window_seconds: int = 60
+    rate_limit_auth_requests: int = 10
+    rate_limit_scan_requests: int = 1000
+    rate_limit_export_requests: int = 10
+    rate_limit_storage_url: str = ""  # e.g. redis://localhost:6379/0
+
+    # Idempotency keys (replay of retried sale requests)
+    idempotency_ttl_seconds: int = 86400
+    idempotency_max_entries: int = 10000
+
+    # Audit trail (batched writes)
+    audit_batch_size: int = 200
+    audit_flush_interval_seconds: float = 1.0
+    audit_max_pending: int = 10000
+
+    # List numbers of deleted lists are handed out again
+    list_number_reuse: bool = False
+
+    # Deposit slot availability view (seconds before a refresh)
+    slot_availability_ttl_seconds: float = 2.0
+
+    # Logging (JSON lines written by a background thread; stdout if no file)
+    log_level: str = "INFO"
+    log_file: str = ""
+    log_queue_size: int = 10000
+    log_debug_sample_rate: float = 0.01
+
+    # Seconds between checks of other workers' cache invalidations (0: on
+    # every cached read, for read-after-write consistency)
+    cache_sync_interval_seconds: float = 0.0
+
+    # Seconds before a worker reloads the price guidance table (rebuilt when
+    # an edition is archived)
+    price_guide_reload_seconds: float = 600.0
+
+    # Requests logged with their Server-Timing breakdown above this duration
+    slow_request_threshold_ms: float = 500.0
 
     # Invitation token
     invitation_token_expire_days: int = 7
@@ -8,7 +8,9 @@ from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.models.base import get_db_session
+from app.models.base import get_db_session, get_read_session
+from app.utils.log import bind_context
+from app.utils.timing import phase
 
 # HTTP Bearer token security scheme
 security = HTTPBearer(auto_error=False)
@@ -16,26 +18,35 @@ security = HTTPBearer(auto_error=False)
 # Type alias for database session dependency
 DBSession = Annotated[AsyncSession, Depends(get_db_session)]
 
+# Read-only session, for GET endpoints: closed as soon as the endpoint
+# returns, before the response is sent
+ReadSession = Annotated[AsyncSession, Depends(get_read_session, scope="function")]
+
 
 async def get_current_user_optional(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: DBSession,
 ):
-    """Get current user from JWT token (optional, returns None if not authenticated)."""
+    """Get current user from JWT token (optional, returns None if not authenticated).
+
+    Only the token is read: authentication opens no database session, so a
+    request uses the session of its endpoint alone.
+    """
     if credentials is None:
         return None
 
     token = credentials.credentials
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        with phase("auth"):
+            payload = jwt.decode(
+                token,
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm],
+            )
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-        # TODO: Fetch user from database
+        bind_context(user_id=user_id)
+        # TODO: Fetch user from database, with the endpoint's session
         # user = await user_repository.get_by_id(db, user_id)
         # return user
         return {"id": user_id}  # Placeholder
@@ -45,10 +56,9 @@ async def get_current_user_optional(
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: DBSession,
 ):
     """Get current user from JWT token (required, raises 401 if not authenticated)."""
-    user = await get_current_user_optional(credentials, db)
+    user = await get_current_user_optional(credentials)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -87,7 +97,9 @@ def require_role(allowed_roles: list[str]):
 
 
 # Role-based dependencies
-RequireDepositor = Depends(require_role(["depositor", "volunteer", "manager", "administrator"]))
+RequireDepositor = Depends(
+    require_role(["depositor", "volunteer", "manager", "administrator"])
+)
 RequireVolunteer = Depends(require_role(["volunteer", "manager", "administrator"]))
 RequireManager = Depends(require_role(["manager", "administrator"]))
 RequireAdmin = Depends(require_role(["administrator"]))
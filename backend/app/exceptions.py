@@ -49,6 +49,24 @@ class ArticleAlreadySoldError(AppException):
         )
 
 
+class BasketUnavailableError(AppException):
+    """Some articles of a basket cannot be sold."""
+
+    def __init__(self, failures: list[dict[str, str]]):
+        self.failures = failures
+        super().__init__(
+            f"{len(failures)} article(s) of the basket cannot be sold",
+            "BASKET_UNAVAILABLE",
+        )
+
+
+class ArticleNotAvailableError(ValidationError):
+    """Article is not on sale (not checked in, retrieved, donated...)."""
+
+    def __init__(self, article_id: str):
+        super().__init__(f"Article {article_id} is not on sale", field="article_id")
+
+
 class ArticleNotFoundError(NotFoundError):
     """Article not found."""
 
@@ -56,6 +74,20 @@ class ArticleNotFoundError(NotFoundError):
         super().__init__(f"Article {article_id} not found")
 
 
+class ItemListNotFoundError(NotFoundError):
+    """Item list not found."""
+
+    def __init__(self, item_list_id: str):
+        super().__init__(f"List {item_list_id} not found")
+
+
+class SaleNotFoundError(NotFoundError):
+    """Sale not found."""
+
+    def __init__(self, sale_id: str):
+        super().__init__(f"Sale {sale_id} not found")
+
+
 class EditionNotFoundError(NotFoundError):
     """Edition not found."""
 
@@ -73,6 +105,23 @@ class EditionClosedError(AppException):
         )
 
 
+class EditionNotArchivedError(AppException):
+    """Edition must be archived before its data can move to cold storage."""
+
+    def __init__(self, edition_id: str):
+        super().__init__(
+            f"Edition {edition_id} is not archived",
+            "EDITION_NOT_ARCHIVED",
+        )
+
+
+class ArchiveNotFoundError(NotFoundError):
+    """No cold storage archive exists for the edition."""
+
+    def __init__(self, edition_id: str):
+        super().__init__(f"No archive found for edition {edition_id}")
+
+
 class DeclarationDeadlinePassedError(AppException):
     """Declaration deadline has passed."""
 
@@ -83,6 +132,148 @@ class DeclarationDeadlinePassedError(AppException):
         )
 
 
+class ItemListLockedError(AppException):
+    """List is no longer a draft and its articles cannot be edited."""
+
+    def __init__(self, item_list_id: str):
+        super().__init__(
+            f"List {item_list_id} is no longer a draft",
+            "ITEM_LIST_LOCKED",
+        )
+
+
+class ItemListNotEmptyError(AppException):
+    """Only empty draft lists can be deleted."""
+
+    def __init__(self, item_list_id: str):
+        super().__init__(
+            f"List {item_list_id} has articles or is validated",
+            "ITEM_LIST_NOT_EMPTY",
+        )
+
+
+class ItemListNotValidatedError(AppException):
+    """Only validated lists can be checked in."""
+
+    def __init__(self, item_list_id: str, status: str):
+        super().__init__(
+            f"List {item_list_id} is {status}, not validated",
+            "ITEM_LIST_NOT_VALIDATED",
+        )
+
+
+class InvalidListCodeError(ValidationError):
+    """Scanned list code is not readable."""
+
+    def __init__(self, code: str):
+        super().__init__(f"Invalid list code {code!r}", field="code")
+
+
+class ItemListAlreadyRetrievedError(AppException):
+    """List was already processed at the retrieval desk."""
+
+    def __init__(self, item_list_id: str):
+        super().__init__(
+            f"List {item_list_id} was already retrieved",
+            "ITEM_LIST_ALREADY_RETRIEVED",
+        )
+
+
+class MaxListsExceededError(ValidationError):
+    """Depositor already has the maximum number of lists of this type."""
+
+    def __init__(self, max_lists: int):
+        super().__init__(
+            f"Maximum {max_lists} lists of this type per edition",
+            field="type",
+        )
+
+
+class ListNumbersExhaustedError(AppException):
+    """No number is left in the range of a list type."""
+
+    def __init__(self, list_type: str):
+        super().__init__(
+            f"No {list_type} list number is left in this edition",
+            "LIST_NUMBERS_EXHAUSTED",
+        )
+
+
+class RegistrationsClosedError(AppException):
+    """Deposit slots can only be reserved while registrations are open."""
+
+    def __init__(self, edition_id: str):
+        super().__init__(
+            f"Registrations for edition {edition_id} are not open",
+            "REGISTRATIONS_CLOSED",
+        )
+
+
+class DepositSlotNotFoundError(NotFoundError):
+    """Deposit slot not found."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(f"Deposit slot {slot_id} not found")
+
+
+class DepositSlotFullError(AppException):
+    """No place is left in the deposit slot."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(f"Deposit slot {slot_id} is full", "DEPOSIT_SLOT_FULL")
+
+
+class DepositSlotResidentsOnlyError(AppException):
+    """The deposit slot is reserved to Plaisance-du-Touch residents."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(
+            f"Deposit slot {slot_id} is reserved to local residents",
+            "DEPOSIT_SLOT_RESIDENTS_ONLY",
+        )
+
+
+class DepositSlotWeekTakenError(AppException):
+    """The depositor already has a deposit slot in the same week."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(
+            f"A deposit slot is already reserved in the week of slot {slot_id}",
+            "DEPOSIT_SLOT_WEEK_TAKEN",
+        )
+
+
+class SlotReservationNotFoundError(NotFoundError):
+    """The depositor has no reservation in the deposit slot."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(f"No reservation found in deposit slot {slot_id}")
+
+
+class DepositSlotNotEmptyError(AppException):
+    """A deposit slot with reservations cannot be deleted."""
+
+    def __init__(self, slot_id: str):
+        super().__init__(
+            f"Deposit slot {slot_id} has reservations",
+            "DEPOSIT_SLOT_NOT_EMPTY",
+        )
+
+
+class JobNotFoundError(NotFoundError):
+    """Background job not found."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Job {job_id} not found")
+
+
+class JobResultNotReadyError(NotFoundError):
+    """The job has no result file (not completed yet, or failed)."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Result of job {job_id} is not available")
+
+
 class MaxArticlesExceededError(ValidationError):
     """Maximum number of articles exceeded."""
 
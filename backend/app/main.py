@@ -3,10 +3,42 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+from app.api import (
+    analytics,
+    audit,
+    catalog,
+    deposit_slots,
+    item_lists,
+    jobs,
+    payouts,
+    price_guide,
+    registers,
+    retrieval,
+    sales,
+    search,
+)
 from app.config import settings
+from app.exceptions import (
+    AppException,
+    ArticleAlreadySoldError,
+    BasketUnavailableError,
+    DepositSlotFullError,
+    NotFoundError,
+    ValidationError,
+)
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.services.audit_service import audit_log
+from app.services.job_service import job_runner
+from app.utils.log import log_pipeline
+from app.utils.timing import time_queries
 
 
 @asynccontextmanager
@@ -15,8 +47,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     # TODO: Initialize database connection pool
     # TODO: Run pending migrations in production
+    log_pipeline.start()
+    audit_log.start()
     yield
     # Shutdown
+    await job_runner.stop()
+    await audit_log.stop()
+    log_pipeline.stop()
     # TODO: Close database connections
 
 
@@ -37,8 +74,91 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID"],
+)
+
+# Replay responses of retried sale requests (Idempotency-Key header)
+app.add_middleware(IdempotencyMiddleware)
+
+# Reject clients above their route class limit (auth, scan, export, api)
+app.add_middleware(RateLimitMiddleware)
+
+# Compress large responses (brotli or gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+)
+
+# Phase durations in the Server-Timing header; slow requests are logged
+time_queries()
+app.add_middleware(
+    ServerTimingMiddleware,
+    slow_threshold_ms=settings.slow_request_threshold_ms,
 )
 
+# Correlation ID and edition of the request in every log record (outermost)
+app.add_middleware(RequestContextMiddleware)
+
+
+@app.exception_handler(NotFoundError)
+async def not_found_handler(_request: Request, exc: NotFoundError) -> JSONResponse:
+    """Map not found errors to 404 responses."""
+    return JSONResponse(
+        status_code=404,
+        content={"code": exc.code, "message": exc.message},
+    )
+
+
+@app.exception_handler(ValidationError)
+async def validation_handler(_request: Request, exc: ValidationError) -> JSONResponse:
+    """Map business validation errors to 422 responses."""
+    return JSONResponse(
+        status_code=422,
+        content={"code": exc.code, "message": exc.message, "field": exc.field},
+    )
+
+
+@app.exception_handler(ArticleAlreadySoldError)
+async def already_sold_handler(
+    _request: Request, exc: ArticleAlreadySoldError
+) -> JSONResponse:
+    """Map sales of an already sold article to 409 responses."""
+    return JSONResponse(
+        status_code=409,
+        content={"code": exc.code, "message": exc.message},
+    )
+
+
+@app.exception_handler(BasketUnavailableError)
+async def basket_unavailable_handler(
+    _request: Request, exc: BasketUnavailableError
+) -> JSONResponse:
+    """Map basket checkouts with unavailable articles to 409 responses."""
+    return JSONResponse(
+        status_code=409,
+        content={"code": exc.code, "message": exc.message, "failures": exc.failures},
+    )
+
+
+@app.exception_handler(DepositSlotFullError)
+async def slot_full_handler(
+    _request: Request, exc: DepositSlotFullError
+) -> JSONResponse:
+    """Map reservations of a full deposit slot to 409 responses."""
+    return JSONResponse(
+        status_code=409,
+        content={"code": exc.code, "message": exc.message},
+    )
+
+
+@app.exception_handler(AppException)
+async def app_exception_handler(_request: Request, exc: AppException) -> JSONResponse:
+    """Map other application errors to 400 responses."""
+    return JSONResponse(
+        status_code=400,
+        content={"code": exc.code, "message": exc.message},
+    )
+
 
 @app.get("/health", tags=["Health"])
 async def health_check() -> dict[str, str]:
@@ -57,6 +177,18 @@ async def api_root() -> dict[str, str]:
 
 
 # Include routers
+app.include_router(analytics.router, prefix="/api/v1")
+app.include_router(audit.router, prefix="/api/v1")
+app.include_router(catalog.router, prefix="/api/v1")
+app.include_router(deposit_slots.router, prefix="/api/v1")
+app.include_router(item_lists.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(payouts.router, prefix="/api/v1")
+app.include_router(price_guide.router, prefix="/api/v1")
+app.include_router(registers.router, prefix="/api/v1")
+app.include_router(retrieval.router, prefix="/api/v1")
+app.include_router(sales.router, prefix="/api/v1")
+app.include_router(search.router, prefix="/api/v1")
 # TODO: Add routers as they are implemented
 # from app.api import auth, editions, item_lists, articles, sales, payouts
 # app.include_router(auth.router, prefix="/api/v1")
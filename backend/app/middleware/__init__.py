@@ -0,0 +1 @@
+"""HTTP middleware package."""
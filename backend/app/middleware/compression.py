@@ -0,0 +1,88 @@
+"""Response compression middleware (brotli when available, gzip otherwise)."""
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Fast setting suited to dynamic JSON responses
+BROTLI_QUALITY = 4
+
+# Statuses whose body must not be re-encoded
+_UNCOMPRESSED_STATUSES = {204, 206, 304}
+
+
+class CompressionMiddleware:
+    """Compress responses above `minimum_size` bytes.
+
+    Brotli is used when the client accepts it and the optional `brotli`
+    package is installed; other clients fall back to Starlette's gzip.
+    Streaming responses are only compressed by the gzip path.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=6)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        if brotli is not None and "br" in accept_encoding:
+            responder = BrotliResponder(self.app, self.minimum_size)
+            await responder(scope, receive, send)
+            return
+
+        await self.gzip(scope, receive, send)
+
+
+class BrotliResponder:
+    """Compress a single-message response body with brotli."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.send: Send | None = None
+        self.initial_message: Message = {}
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        assert self.send is not None
+        if message["type"] == "http.response.start":
+            # Hold the headers until the body size is known
+            self.initial_message = message
+            return
+        if message["type"] != "http.response.body" or self.started:
+            await self.send(message)
+            return
+
+        self.started = True
+        body = message.get("body", b"")
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        if (
+            message.get("more_body", False)
+            or len(body) < self.minimum_size
+            or "content-encoding" in headers
+            or self.initial_message["status"] in _UNCOMPRESSED_STATUSES
+        ):
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+        headers["Content-Encoding"] = "br"
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        await self.send(self.initial_message)
+        await self.send({"type": "http.response.body", "body": compressed})
@@ -0,0 +1,398 @@
+"""Idempotency-Key handling for retried sale requests.
+
+Registers on flaky Wi-Fi retry POSTs whose response was lost. When a
+request carries an `Idempotency-Key` header, its response is stored and a
+retry with the same key and body gets the stored response back, without
+running the transaction again. Keys are scoped to the user of the bearer
+token, so a key reused by another user does not replay this response.
+
+Only handler outcomes are stored: successes and the domain errors of the
+sale itself (400, 409). Authentication, validation, rate limit and server
+errors are not, so the retry runs again once the cause is fixed.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.rate_limit import token_subject
+from app.models.base import async_session_factory, execute_dml
+from app.models.idempotency_key import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+
+# Mutating sale endpoints: record, basket checkout, offline sync and cancel
+IDEMPOTENT_PATHS = re.compile(
+    r"^/api/v1/editions/[^/]+/ventes(/panier|/sync|/[^/]+/annuler)?$"
+)
+
+# Expired database entries are purged every N saves
+_PURGE_EVERY = 100
+
+# Status code of a key reserved by a request still being processed
+_PENDING = 0
+
+# A reservation left by a crashed worker frees its key after this delay
+_RESERVATION_SECONDS = 120
+
+
+def is_stored_status(status_code: int) -> bool:
+    """Whether a response is a handler outcome worth replaying."""
+    return 200 <= status_code < 300 or status_code in (400, 409)
+
+
+@dataclass
+class StoredResponse:
+    """Response recorded for an idempotency key."""
+
+    request_hash: str
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    expires_at: float
+
+
+class IdempotencyStore:
+    """Bounded TTL store: in-memory LRU backed by the idempotency_keys table.
+
+    Memory answers retries on the same worker in one dictionary lookup. The
+    database lets another worker, or the same one after a restart, replay
+    the response. A key is reserved by inserting its row before the request
+    is processed, so a retry reaching another worker meanwhile is refused.
+    Database errors are logged and ignored: the store is a best-effort
+    shortcut, never a reason to fail a sale.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._saves = 0
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+        self._in_flight.clear()
+
+    async def acquire(self, key: str, request_hash: str) -> bool:
+        """Reserve a key for processing; False if it already is reserved."""
+        if key in self._in_flight or not await self._reserve_in_db(key, request_hash):
+            return False
+        self._in_flight.add(key)
+        return True
+
+    async def release(self, key: str) -> None:
+        """Free a key whose response was not stored, so it can run again."""
+        if key in self._in_flight:
+            self._in_flight.discard(key)
+            await self._release_in_db(key)
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Get the stored response for a key, if not expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._entries.move_to_end(key)
+                return entry
+            del self._entries[key]
+
+        entry = await self._get_from_db(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def save(
+        self,
+        key: str,
+        request_hash: str,
+        status_code: int,
+        headers: list[tuple[str, str]],
+        body: bytes,
+    ) -> None:
+        """Store the response of a processed request."""
+        entry = StoredResponse(
+            request_hash=request_hash,
+            status_code=status_code,
+            headers=headers,
+            body=body,
+            expires_at=time.time() + self.ttl_seconds,
+        )
+        self._remember(key, entry)
+        self._in_flight.discard(key)
+        await self._save_to_db(key, entry)
+
+    def _remember(self, key: str, entry: StoredResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_from_db(self, key: str) -> StoredResponse | None:
+        if self.session_factory is None:
+            return None
+        try:
+            async with self.session_factory() as session:
+                row = await session.get(IdempotencyKey, key)
+        except SQLAlchemyError:
+            logger.warning("Idempotency store lookup failed", exc_info=True)
+            return None
+        if (
+            row is None
+            or row.status_code == _PENDING
+            or row.expires_at <= datetime.utcnow()
+        ):
+            return None
+        return StoredResponse(
+            request_hash=row.request_hash,
+            status_code=row.status_code,
+            headers=[tuple(pair) for pair in json.loads(row.headers)],
+            body=row.body,
+            expires_at=time.time()
+            + (row.expires_at - datetime.utcnow()).total_seconds(),
+        )
+
+    async def _reserve_in_db(self, key: str, request_hash: str) -> bool:
+        if self.session_factory is None:
+            return True
+        now = datetime.utcnow()
+        try:
+            async with self.session_factory() as session:
+                # An expired response or reservation no longer holds the key
+                await session.execute(
+                    delete(IdempotencyKey).where(
+                        IdempotencyKey.key == key, IdempotencyKey.expires_at <= now
+                    )
+                )
+                session.add(
+                    IdempotencyKey(
+                        key=key,
+                        request_hash=request_hash,
+                        status_code=_PENDING,
+                        headers="[]",
+                        body=b"",
+                        expires_at=now + timedelta(seconds=_RESERVATION_SECONDS),
+                    )
+                )
+                await session.commit()
+        except IntegrityError:
+            return False  # Reserved, or answered meanwhile, by another request
+        except SQLAlchemyError:
+            logger.warning("Idempotency key reservation failed", exc_info=True)
+        return True
+
+    async def _release_in_db(self, key: str) -> None:
+        if self.session_factory is None:
+            return
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    delete(IdempotencyKey).where(
+                        IdempotencyKey.key == key,
+                        IdempotencyKey.status_code == _PENDING,
+                    )
+                )
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Idempotency key release failed", exc_info=True)
+
+    async def _save_to_db(self, key: str, entry: StoredResponse) -> None:
+        if self.session_factory is None:
+            return
+        values = {
+            "request_hash": entry.request_hash,
+            "status_code": entry.status_code,
+            "headers": json.dumps(entry.headers),
+            "body": entry.body,
+            "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+        }
+        try:
+            async with self.session_factory() as session:
+                # Fill the reservation; insert if it could not be made
+                result = await execute_dml(
+                    session,
+                    update(IdempotencyKey)
+                    .where(IdempotencyKey.key == key)
+                    .values(**values),
+                )
+                if result.rowcount == 0:
+                    session.add(IdempotencyKey(key=key, **values))
+                self._saves += 1
+                if self._saves % _PURGE_EVERY == 0:
+                    await session.execute(
+                        delete(IdempotencyKey).where(
+                            IdempotencyKey.expires_at < datetime.utcnow()
+                        )
+                    )
+                await session.commit()
+        except IntegrityError:
+            pass  # Stored meanwhile by another worker
+        except SQLAlchemyError:
+            logger.warning("Idempotency store save failed", exc_info=True)
+
+
+idempotency_store = IdempotencyStore(
+    max_entries=settings.idempotency_max_entries,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+    session_factory=async_session_factory,
+)
+
+
+async def _error(send: Send, status_code: int, code: str, message: str) -> None:
+    body = json.dumps({"code": code, "message": message}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class IdempotencyMiddleware:
+    """Replay stored responses for retried requests with an Idempotency-Key."""
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore | None = None) -> None:
+        self.app = app
+        self.store = store or idempotency_store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not IDEMPOTENT_PATHS.match(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        client_key = headers.get(IDEMPOTENCY_HEADER)
+        if not client_key:
+            await self.app(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        request_hash = hashlib.sha256(body).hexdigest()
+        user_id = token_subject(headers.get("authorization", "")) or ""
+        key = hashlib.sha256(
+            f"{user_id}\n{scope['path']}\n{client_key}".encode()
+        ).hexdigest()
+
+        stored = await self.store.get(key)
+        if stored is not None:
+            if stored.request_hash != request_hash:
+                await _error(
+                    send,
+                    422,
+                    "IDEMPOTENCY_KEY_REUSED",
+                    "Idempotency-Key was already used for a different request",
+                )
+                return
+            await self._replay(send, stored)
+            return
+
+        if not await self.store.acquire(key, request_hash):
+            await _error(
+                send,
+                409,
+                "IDEMPOTENCY_KEY_IN_USE",
+                "A request with this Idempotency-Key is still being processed",
+            )
+            return
+
+        try:
+            await self._process(scope, body, receive, send, key, request_hash)
+        finally:
+            await self.store.release(key)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _process(
+        self,
+        scope: Scope,
+        body: bytes,
+        receive: Receive,
+        send: Send,
+        key: str,
+        request_hash: str,
+    ) -> None:
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code = 500
+        headers: list[tuple[str, str]] = []
+        chunks: list[bytes] = []
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    (k.decode("latin-1"), v.decode("latin-1"))
+                    for k, v in message["headers"]
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, replay_receive, capture_send)
+
+        if is_stored_status(status_code):
+            await self.store.save(
+                key, request_hash, status_code, headers, b"".join(chunks)
+            )
+
+    @staticmethod
+    async def _replay(send: Send, stored: StoredResponse) -> None:
+        headers = [
+            (k.encode("latin-1"), v.encode("latin-1")) for k, v in stored.headers
+        ]
+        headers.append((REPLAYED_HEADER, b"true"))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": stored.status_code,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": stored.body})
@@ -0,0 +1,258 @@
+"""Per-client rate limiting with sliding-window counters.
+
+Each client has two counters per route class: requests in the current fixed
+window and in the previous one. The sliding-window estimate weights the
+previous count by the part of it still inside the window, which costs a
+dictionary lookup and a few arithmetic operations per request.
+
+Route classes:
+    auth    login and password reset, limited per client IP
+    scan    register endpoints (sales, catalogue), high limit
+    export  exports and generated documents
+    api     every other API endpoint
+
+With several uvicorn workers, `rate_limit_storage_url` points the counters
+to a shared Redis server (optional `redis` extra).
+"""
+
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass
+
+from jose import JWTError, jwt
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+# Checked in order; unmatched API paths fall in the "api" class
+_ROUTE_CLASSES = (
+    ("auth", re.compile(r"^/api/v1/auth/")),
+    ("export", re.compile(r"^/api/v1/.*(/exports?(/|$)|\.(pdf|csv|xlsx)$)")),
+    ("scan", re.compile(r"^/api/v1/editions/[^/]+/(ventes|catalogue)")),
+)
+
+_RETRY_BODY = b'{"code":"RATE_LIMITED","message":"Too many requests, retry later"}'
+
+
+@dataclass(frozen=True, slots=True)
+class RatePolicy:
+    """Maximum number of requests per window for a route class."""
+
+    name: str
+    requests: int
+    window_seconds: int
+
+
+def build_policies() -> dict[str, RatePolicy]:
+    """Build the route class policies from the settings."""
+    window = settings.rate_limit_window_seconds
+    return {
+        "auth": RatePolicy("auth", settings.rate_limit_auth_requests, window),
+        "scan": RatePolicy("scan", settings.rate_limit_scan_requests, window),
+        "export": RatePolicy("export", settings.rate_limit_export_requests, window),
+        "api": RatePolicy("api", settings.rate_limit_requests, window),
+    }
+
+
+class MemoryRateLimitStore:
+    """Counters of one worker process.
+
+    Entries are `[window index, previous count, current count]` lists, one
+    dictionary per policy. Idle clients are evicted once per window.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, dict[str, list[int]]] = {}
+        self._next_sweep: dict[str, float] = {}
+
+    def clear(self) -> None:
+        """Forget all counters."""
+        self._counters.clear()
+        self._next_sweep.clear()
+
+    def __len__(self) -> int:
+        return sum(len(counters) for counters in self._counters.values())
+
+    async def hit(self, policy: RatePolicy, client: str, now: float) -> float:
+        """Count a request.
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be.
+        """
+        window = policy.window_seconds
+        index = int(now // window)
+        counters = self._counters.get(policy.name)
+        if counters is None:
+            counters = self._counters[policy.name] = {}
+            self._next_sweep[policy.name] = now + window
+        elif now >= self._next_sweep[policy.name]:
+            self._sweep(counters, index)
+            self._next_sweep[policy.name] = now + window
+
+        entry = counters.get(client)
+        if entry is None:
+            entry = counters[client] = [index, 0, 0]
+        elif entry[0] != index:
+            entry[1] = entry[2] if entry[0] == index - 1 else 0
+            entry[2] = 0
+            entry[0] = index
+
+        elapsed = now - index * window
+        if entry[1] * (1 - elapsed / window) + entry[2] >= policy.requests:
+            return window - elapsed
+        entry[2] += 1
+        return 0.0
+
+    @staticmethod
+    def _sweep(counters: dict[str, list[int]], index: int) -> None:
+        """Drop clients without requests in the current or previous window."""
+        idle = [client for client, entry in counters.items() if entry[0] < index - 1]
+        for client in idle:
+            del counters[client]
+
+
+class RedisRateLimitStore:
+    """Counters shared by all workers through Redis.
+
+    Same sliding-window estimate, with one key per client and window that
+    expires after two windows. Redis errors let requests through.
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit") -> None:
+        if redis_asyncio is None:
+            raise RuntimeError("rate_limit_storage_url requires the 'redis' package")
+        self.redis = redis_asyncio.from_url(url)
+        self.prefix = prefix
+
+    def clear(self) -> None:
+        """Counters expire on their own in Redis."""
+
+    async def hit(self, policy: RatePolicy, client: str, now: float) -> float:
+        """Count a request; see `MemoryRateLimitStore.hit`."""
+        window = policy.window_seconds
+        index = int(now // window)
+        key = f"{self.prefix}:{policy.name}:{client}"
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.incr(f"{key}:{index}")
+                pipe.expire(f"{key}:{index}", 2 * window)
+                pipe.get(f"{key}:{index - 1}")
+                current, _, previous = await pipe.execute()
+        except Exception:  # The limiter must not take the API down
+            logger.warning("Rate limit store unavailable", exc_info=True)
+            return 0.0
+
+        elapsed = now - index * window
+        # The request was already counted in `current`
+        if int(previous or 0) * (1 - elapsed / window) + current - 1 >= policy.requests:
+            return window - elapsed
+        return 0.0
+
+
+def create_store(url: str) -> MemoryRateLimitStore | RedisRateLimitStore:
+    """Create the counter store for a storage URL (empty: in memory)."""
+    if url:
+        return RedisRateLimitStore(url)
+    return MemoryRateLimitStore()
+
+
+rate_limit_store = create_store(settings.rate_limit_storage_url)
+
+
+def classify(path: str) -> str | None:
+    """Get the route class of a path, or None if it is not rate limited."""
+    if not path.startswith("/api/"):
+        return None
+    for name, pattern in _ROUTE_CLASSES:
+        if pattern.match(path):
+            return name
+    return "api"
+
+
+def token_subject(authorization: str) -> str | None:
+    """Get the user ID of a valid bearer token, or None."""
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(
+            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+        )
+    except JWTError:
+        return None
+    subject = payload.get("sub")
+    return subject if isinstance(subject, str) else None
+
+
+class RateLimitMiddleware:
+    """Reject requests above their route class limit with 429 responses.
+
+    Authenticated requests are counted per user (the `sub` of a valid
+    bearer token), so registers sharing a venue IP do not share a limit;
+    anonymous requests, invalid tokens and the auth class are counted per
+    client IP, so made-up tokens cannot get fresh counters.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: MemoryRateLimitStore | RedisRateLimitStore | None = None,
+        policies: dict[str, RatePolicy] | None = None,
+    ) -> None:
+        self.app = app
+        self.store = store if store is not None else rate_limit_store
+        self.policies = policies or build_policies()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route_class = classify(scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = self._client_key(scope, by_token=route_class != "auth")
+        retry_after = await self.store.hit(
+            self.policies[route_class], client, time.time()
+        )
+        if retry_after:
+            await self._reject(send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _client_key(scope: Scope, by_token: bool) -> str:
+        if by_token:
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    user_id = token_subject(value.decode("latin-1"))
+                    if user_id is not None:
+                        return f"user:{user_id}"
+                    break
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    @staticmethod
+    async def _reject(send: Send, retry_after: float) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_RETRY_BODY)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": _RETRY_BODY})
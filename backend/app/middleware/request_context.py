@@ -0,0 +1,70 @@
+"""Per-request log context and logging of unhandled errors.
+
+Each request gets a correlation ID, taken from the `X-Request-ID` header
+when the client sends a usable one and echoed in the response. It is bound
+to the log context with the edition of the path, so every record logged
+while handling the request carries them.
+"""
+
+import logging
+import re
+import time
+import uuid
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.log import log_context
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "x-request-id"
+
+_VALID_REQUEST_ID = re.compile(r"^[\w.-]{1,64}$")
+_EDITION_PATH = re.compile(r"^/api/v1/editions/([^/]+)")
+
+
+class RequestContextMiddleware:
+    """Bind the request's correlation ID and edition to the log context."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        context = {"correlation_id": request_id}
+        match = _EDITION_PATH.match(scope["path"])
+        if match:
+            context["edition_id"] = match[1]
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = log_context.set(context)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception:
+            logger.exception(
+                "Unhandled error",
+                extra={
+                    "action": "request.error",
+                    "details": {"method": scope["method"], "path": scope["path"]},
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                },
+            )
+            raise
+        finally:
+            log_context.reset(token)
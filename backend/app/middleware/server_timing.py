@@ -0,0 +1,68 @@
+"""`Server-Timing` header and slow request log.
+
+Registers log their scan-to-display time next to the phases reported by
+the API, which tells apart a slow network from slow authentication, pool
+waits, SQL or serialization. Requests slower than
+`slow_request_threshold_ms` are also logged with their breakdown.
+"""
+
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.timing import PhaseTimer, request_timer
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = b"server-timing"
+
+
+class ServerTimingMiddleware:
+    """Time the phases of each request and report them in the response."""
+
+    def __init__(self, app: ASGIApp, slow_threshold_ms: float | None = None):
+        self.app = app
+        self.slow_threshold_ms = slow_threshold_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = PhaseTimer()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    *message.get("headers", []),
+                    (SERVER_TIMING_HEADER, timer.header().encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = request_timer.set(timer)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_timer.reset(token)
+            if (
+                self.slow_threshold_ms is not None
+                and timer.elapsed() * 1000 >= self.slow_threshold_ms
+            ):
+                breakdown = timer.breakdown()
+                logger.warning(
+                    "Slow request",
+                    extra={
+                        "action": "request.slow",
+                        "details": {
+                            "method": scope["method"],
+                            "path": scope["path"],
+                            "status": status_code,
+                            "phases": breakdown,
+                        },
+                        "duration_ms": breakdown["total"],
+                    },
+                )
@@ -7,6 +7,16 @@ from app.models.item_list import ItemList
 from app.models.article import Article
 from app.models.sale import Sale
 from app.models.payout import Payout
+from app.models.register_total import RegisterTotal
+from app.models.price_guide import PriceGuide
+from app.models.picklist import RetrievalPicklist
+from app.models.catalog_version import CatalogVersion
+from app.models.cache_version import CacheVersion
+from app.models.idempotency_key import IdempotencyKey
+from app.models.job import Job
+from app.models.audit_log import AuditLog
+from app.models.deposit_slot import DepositSlot, DepositSlotReservation
+from app.models.list_number import ListNumberCounter, ReleasedListNumber
 
 __all__ = [
     "Base",
@@ -17,4 +27,16 @@ __all__ = [
     "Article",
     "Sale",
     "Payout",
+    "RegisterTotal",
+    "PriceGuide",
+    "RetrievalPicklist",
+    "CatalogVersion",
+    "CacheVersion",
+    "IdempotencyKey",
+    "Job",
+    "AuditLog",
+    "DepositSlot",
+    "DepositSlotReservation",
+    "ListNumberCounter",
+    "ReleasedListNumber",
 ]
@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import BigInteger, Boolean, ForeignKey, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -53,6 +53,26 @@ MAX_PRICES = {
     ArticleCategory.STROLLER.value: Decimal("150.00"),
     "default": Decimal("100.00"),
 }
+MIN_PRICE = Decimal("1.00")
+
+# List limits (a lot counts as one article)
+MAX_ARTICLES_PER_LIST = 24
+MAX_CLOTHING_PER_LIST = 12
+
+# Order of categories in a list: clothing, shoes, nursery, toys and games,
+# books, accessories, others
+CATEGORY_ORDER = {
+    ArticleCategory.CLOTHING.value: 0,
+    ArticleCategory.SHOES.value: 1,
+    ArticleCategory.NURSERY.value: 2,
+    ArticleCategory.STROLLER.value: 2,
+    ArticleCategory.CAR_SEAT.value: 2,
+    ArticleCategory.TOYS.value: 3,
+    ArticleCategory.GAMES.value: 3,
+    ArticleCategory.BOOKS.value: 4,
+    ArticleCategory.ACCESSORIES.value: 5,
+    ArticleCategory.OTHER.value: 6,
+}
 
 
 class Article(Base, UUIDMixin, TimestampMixin):
@@ -96,6 +116,15 @@ class Article(Base, UUIDMixin, TimestampMixin):
     # Barcode (generated from list number + line number)
     barcode: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
 
+    # Catalog change counter (edition catalog version of the last status/price
+    # change), used by registers to fetch incremental catalog deltas
+    change_version: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        index=True,
+    )
+
     # Foreign key
     item_list_id: Mapped[str] = mapped_column(
         ForeignKey("item_lists.id", ondelete="CASCADE"),
@@ -0,0 +1,31 @@
+"""AuditLog model for the append-only audit trail."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, UUIDMixin
+
+
+class AuditLog(UUIDMixin, Base):
+    """Sensitive action (sale cancellation, payout payment...).
+
+    Rows are only ever inserted. Actor and entity are plain IDs without
+    foreign keys, so the trail survives deletions and archiving.
+    """
+
+    __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_entity", "entity_type", "entity_id", "created_at"),
+        Index("ix_audit_logs_actor", "actor_id", "created_at"),
+    )
+
+    # Time of the action, not of the batched insert
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    event: Mapped[str] = mapped_column(String(50), nullable=False)
+    actor_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    details: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
@@ -1,14 +1,32 @@
 """SQLAlchemy base model and database utilities."""
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Any
-
-from sqlalchemy import DateTime, String, func
-from sqlalchemy.ext.asyncio import AsyncAttrs, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, DateTime, Executable, String, event, func
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import (
+    AsyncAttrs,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+)
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.config import settings
+from app.utils.timing import phase
 
 
 def generate_uuid() -> str:
@@ -16,6 +34,36 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
+class sql_uuid(FunctionElement[str]):
+    """UUID generated by the database, for INSERT ... SELECT statements."""
+
+    type = String(36)
+    inherit_cache = True
+
+
+@compiles(sql_uuid)
+def _compile_uuid(_element: sql_uuid, _compiler: SQLCompiler, **_kw: Any) -> str:
+    return "UUID()"
+
+
+@compiles(sql_uuid, "postgresql")
+def _compile_uuid_postgresql(
+    _element: sql_uuid, _compiler: SQLCompiler, **_kw: Any
+) -> str:
+    return "CAST(gen_random_uuid() AS VARCHAR)"
+
+
+@compiles(sql_uuid, "sqlite")
+def _compile_uuid_sqlite(_element: sql_uuid, _compiler: SQLCompiler, **_kw: Any) -> str:
+    # Random UUID v4 built from random bytes (SQLite has no UUID function)
+    return (
+        "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-4' || "
+        "substr(hex(randomblob(2)), 2) || '-' || "
+        "substr('89AB', 1 + (abs(random()) % 4), 1) || "
+        "substr(hex(randomblob(2)), 2) || '-' || hex(randomblob(6)))"
+    )
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -66,10 +114,61 @@ async_session_factory = async_sessionmaker(
 )
 
 
+class ReadOnlySession(Session):
+    """Session of read requests: flushes nothing, never commits, refuses writes."""
+
+    def flush(self, objects: Any = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            raise InvalidRequestError("Read-only session: changes cannot be flushed")
+        # Nothing pending: the flush writes nothing
+        super().flush(objects)
+
+    def commit(self) -> None:
+        raise InvalidRequestError("Read-only session: cannot commit")
+
+
+@event.listens_for(ReadOnlySession, "do_orm_execute")
+def _refuse_writes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        raise InvalidRequestError("Read-only session: cannot execute a write")
+
+
+def create_read_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    """Create an engine for read-only sessions.
+
+    Its connections are in autocommit mode: no transaction is begun, so none
+    has to be committed or rolled back when the connection is released.
+    Each statement sees the latest committed data.
+    """
+    return create_async_engine(
+        url, isolation_level="AUTOCOMMIT", skip_autocommit_rollback=True, **kwargs
+    )
+
+
+# Separate pool for reads, its connections staying in autocommit mode
+read_engine = create_read_engine(
+    settings.database_url,
+    echo=settings.debug,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=10,
+)
+
+read_session_factory = async_sessionmaker(
+    read_engine,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
 async def get_db_session():
     """Dependency to get database session."""
     async with async_session_factory() as session:
         try:
+            # Check out the connection now, to time the wait for the pool
+            with phase("pool"):
+                await session.connection()
             yield session
             await session.commit()
         except Exception:
@@ -77,3 +176,23 @@ async def get_db_session():
             raise
         finally:
             await session.close()
+
+
+async def execute_dml(
+    session: AsyncSession, statement: Executable
+) -> CursorResult[Any]:
+    """Execute an INSERT, UPDATE or DELETE and get its result, with `rowcount`.
+
+    Conditional updates check their `rowcount` to know whether they applied.
+    """
+    return cast(CursorResult[Any], await session.execute(statement))
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Dependency to get a read-only database session.
+
+    The connection is checked out by the first query and released when the
+    session closes, without a round trip: there is nothing to commit.
+    """
+    async with read_session_factory() as session:
+        yield session
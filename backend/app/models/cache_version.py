@@ -0,0 +1,30 @@
+"""CacheVersion model for cross-worker cache invalidation."""
+
+from sqlalchemy import BigInteger, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CacheVersion(Base):
+    """Edition version at which a cached entity last changed.
+
+    Each edition has a counter row (scope "*") bumped by every write that
+    invalidates cached data; the changed entity's row gets the new value.
+    Bumping the counter locks it until commit, so versions become visible
+    to polling workers in increasing order.
+    """
+
+    __tablename__ = "cache_versions"
+    __table_args__ = (
+        Index("ix_cache_versions_edition_version", "edition_id", "version"),
+    )
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    scope: Mapped[str] = mapped_column(String(20), primary_key=True)
+    # Empty for scopes covering the whole edition
+    entity_id: Mapped[str] = mapped_column(String(36), primary_key=True, default="")
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
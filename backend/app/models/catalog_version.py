@@ -0,0 +1,22 @@
+"""CatalogVersion model for per-edition catalog change counters."""
+
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CatalogVersion(Base):
+    """Monotonic counter bumped on every article status or price change.
+
+    Incrementing the edition's row locks it until commit, so versions become
+    visible to readers in increasing order.
+    """
+
+    __tablename__ = "catalog_versions"
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    version: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
@@ -0,0 +1,113 @@
+"""Deposit slot models (créneaux de dépôt) and their reservations."""
+
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    Time,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.edition import Edition
+
+
+def collection_week(day: date) -> int:
+    """Get the collection week of a date, as ISO year * 100 + ISO week."""
+    year, week, _ = day.isocalendar()
+    return year * 100 + week
+
+
+class DepositSlot(Base, UUIDMixin, TimestampMixin):
+    """Time range in which depositors bring their lists.
+
+    `reserved_count` is only changed by conditional UPDATE statements that
+    check the capacity in the same statement, so concurrent reservations
+    cannot overbook the slot; the check constraint backs this up.
+    """
+
+    __tablename__ = "deposit_slots"
+    __table_args__ = (
+        CheckConstraint(
+            "reserved_count >= 0 AND reserved_count <= capacity",
+            name="ck_deposit_slots_capacity",
+        ),
+    )
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[time] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
+
+    # Collection week of `day`, for the one-slot-per-week rule
+    week: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    capacity: Mapped[int] = mapped_column(Integer, nullable=False)
+    reserved_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Slot reserved to Plaisance-du-Touch residents
+    is_local_only: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Relationships
+    edition: Mapped["Edition"] = relationship("Edition")
+
+    @property
+    def available_places(self) -> int:
+        """Get the number of places left."""
+        return self.capacity - self.reserved_count
+
+
+class DepositSlotReservation(Base, UUIDMixin):
+    """Place taken by a depositor in a deposit slot.
+
+    The unique constraint enforces the one-slot-per-week rule (REQ-F-013)
+    in the database, whatever the concurrency.
+    """
+
+    __tablename__ = "deposit_slot_reservations"
+    __table_args__ = (
+        UniqueConstraint(
+            "edition_id",
+            "depositor_id",
+            "week",
+            name="uq_deposit_slot_reservations_week",
+        ),
+    )
+
+    slot_id: Mapped[str] = mapped_column(
+        ForeignKey("deposit_slots.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    depositor_id: Mapped[str] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Copied from the slot, for the unique constraint
+    edition_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    week: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+    )
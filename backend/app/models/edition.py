@@ -82,6 +82,9 @@ class Edition(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
+    # Cold storage file holding the edition's rows once archived
+    archive_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
     # Creator
     created_by_id: Mapped[str | None] = mapped_column(
         ForeignKey("users.id"),
@@ -0,0 +1,30 @@
+"""IdempotencyKey model for replaying responses to retried requests."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class IdempotencyKey(Base):
+    """Response stored for a client-supplied idempotency key."""
+
+    __tablename__ = "idempotency_keys"
+
+    # SHA-256 of method, path and client key
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Stored response
+    status_code: Mapped[int] = mapped_column(Integer, nullable=False)
+    headers: Mapped[str] = mapped_column(Text, nullable=False)  # JSON pairs
+    body: Mapped[bytes] = mapped_column(LargeBinary(16_777_215), nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=func.now(),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
@@ -46,6 +46,46 @@ LABEL_COLORS = {
     2000: "pink",
 }
 
+# Numbers of each list type, first and last. Standard numbers are handed
+# out in order, so colors follow the registration order.
+LIST_NUMBER_RANGES = {
+    ListType.STANDARD.value: (100, 699),
+    ListType.LIST_1000.value: (1000, 1999),
+    ListType.LIST_2000.value: (2000, 2999),
+}
+
+# Lists of each type a depositor may have in an edition (list 1000 members
+# get 2 on their first sale; not tracked yet)
+MAX_LISTS_PER_DEPOSITOR = {
+    ListType.STANDARD.value: 2,
+    ListType.LIST_1000.value: 4,
+    ListType.LIST_2000.value: 4,
+}
+
+# Standard label color of each hundred below 1000, computed once
+_STANDARD_LABEL_COLORS = tuple(
+    max(
+        (
+            (threshold, color)
+            for threshold, color in LABEL_COLORS.items()
+            if threshold <= hundred * 100
+        ),
+        default=(0, None),
+    )[1]
+    for hundred in range(10)
+)
+
+
+def label_color(list_type: str, number: int) -> str | None:
+    """Get the label color of a list number."""
+    if list_type == ListType.LIST_1000.value:
+        return LABEL_COLORS[1000]
+    if list_type == ListType.LIST_2000.value:
+        return LABEL_COLORS[2000]
+    if number < 0:
+        return None
+    return _STANDARD_LABEL_COLORS[min(number // 100, 9)]
+
 
 class ItemList(Base, UUIDMixin, TimestampMixin):
     """ItemList model representing a depositor's list of articles."""
@@ -119,12 +159,4 @@ class ItemList(Base, UUIDMixin, TimestampMixin):
 
     def get_label_color_for_number(self) -> str | None:
         """Get the label color based on list number range."""
-        if self.list_type == ListType.LIST_1000.value:
-            return LABEL_COLORS[1000]
-        if self.list_type == ListType.LIST_2000.value:
-            return LABEL_COLORS[2000]
-        # Standard lists: determine by number range
-        for threshold in sorted(LABEL_COLORS.keys(), reverse=True):
-            if threshold < 1000 and self.number >= threshold:
-                return LABEL_COLORS[threshold]
-        return None
+        return label_color(self.list_type, self.number)
@@ -0,0 +1,54 @@
+"""Job model for long-running tasks (reports, bulk generations)."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+
+class JobStatus(str, Enum):
+    """Job lifecycle status."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job(Base, UUIDMixin, TimestampMixin):
+    """Task run in the background, polled by the client until completed.
+
+    The result is a file written to `job_output_dir`, downloaded once the
+    job is completed.
+    """
+
+    __tablename__ = "jobs"
+
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    params: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default=JobStatus.PENDING.value,
+        nullable=False,
+    )
+    progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Error of a failed job
+    message: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # Result file
+    result_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    result_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    result_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    # Edition the job is about, if any
+    edition_id: Mapped[str | None] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    created_by_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
@@ -0,0 +1,37 @@
+"""List number counters and released numbers, per edition and list type."""
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ListNumberCounter(Base):
+    """Next list number to hand out for a list type of an edition.
+
+    Numbers are taken by incrementing the row, which locks it until commit:
+    concurrent registrations queue on the counter instead of reading the
+    same `MAX(number)`.
+    """
+
+    __tablename__ = "list_number_counters"
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    list_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    next_number: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class ReleasedListNumber(Base):
+    """Number of a deleted list, available again when reuse is enabled."""
+
+    __tablename__ = "released_list_numbers"
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    list_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    number: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -1,14 +1,14 @@
 """Payout model for depositor reimbursements."""
 
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import DateTime, ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.utils.money import Cents
 
 if TYPE_CHECKING:
     from app.models.item_list import ItemList
@@ -37,15 +37,11 @@ class Payout(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "payouts"
 
-    # Financial breakdown
-    gross_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    commission_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
-    list_fees: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
-        default=Decimal("0.00"),
-        nullable=False,
-    )
-    net_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    # Financial breakdown, in cents (see `app.utils.money`)
+    gross_amount: Mapped[int] = mapped_column(Cents, nullable=False)
+    commission_amount: Mapped[int] = mapped_column(Cents, nullable=False)
+    list_fees: Mapped[int] = mapped_column(Cents, default=0, nullable=False)
+    net_amount: Mapped[int] = mapped_column(Cents, nullable=False)
 
     # Sales statistics
     total_articles: Mapped[int] = mapped_column(default=0)
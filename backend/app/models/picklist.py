@@ -0,0 +1,44 @@
+"""RetrievalPicklist model for the unsold articles to hand back."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RetrievalPicklist(Base):
+    """Unsold articles of a list, as picked on retrieval day.
+
+    Built for every list with unsold articles when the sale ends; `position`
+    follows the bag storage layout (label color zone, then list number).
+    `outcome` is set once the list is processed at the retrieval desk.
+    """
+
+    __tablename__ = "retrieval_picklists"
+    __table_args__ = (
+        Index("ix_retrieval_picklists_edition_position", "edition_id", "position"),
+    )
+
+    item_list_id: Mapped[str] = mapped_column(
+        ForeignKey("item_lists.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    list_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    label_color: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    depositor_name: Mapped[str] = mapped_column(String(201), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Article lines, in line number order
+    lines: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+
+    # "retrieved" or "donated" once processed
+    outcome: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    built_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
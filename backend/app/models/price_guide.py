@@ -0,0 +1,34 @@
+"""PriceGuide model for historical price guidance."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class PriceGuide(Base):
+    """Sold prices and sell-through of past editions for a kind of article.
+
+    Rows are rebuilt all at once from closed and archived editions; an
+    empty size band or brand means all sizes or all brands of the category.
+    """
+
+    __tablename__ = "price_guides"
+
+    category: Mapped[str] = mapped_column(String(50), primary_key=True)
+    size_band: Mapped[str] = mapped_column(String(20), primary_key=True, default="")
+    brand: Mapped[str] = mapped_column(String(100), primary_key=True, default="")
+
+    offered: Mapped[int] = mapped_column(Integer, nullable=False)
+    sold: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Quartiles of the sold prices
+    low_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    median_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    high_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+
+    # Number of editions the row was computed from
+    editions: Mapped[int] = mapped_column(Integer, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,44 @@
+"""RegisterTotal model for per-register running sale totals."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RegisterTotal(Base):
+    """Sales of a register for a day and payment method, and the drawer count.
+
+    `sale_count` and `amount` are updated in the transaction of every sale
+    and cancellation; `counted_amount` is entered at closing, the difference
+    being the register's discrepancy.
+    """
+
+    __tablename__ = "register_totals"
+
+    edition_id: Mapped[str] = mapped_column(
+        ForeignKey("editions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    register_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    payment_method: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    sale_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2), default=Decimal("0"), nullable=False
+    )
+
+    # Drawer count at closing
+    counted_amount: Mapped[Decimal | None] = mapped_column(
+        Numeric(10, 2), nullable=True
+    )
+    counted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    counted_by_id: Mapped[str | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    note: Mapped[str | None] = mapped_column(Text, nullable=True)
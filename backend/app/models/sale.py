@@ -5,7 +5,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -28,6 +28,17 @@ class Sale(Base, UUIDMixin, TimestampMixin):
     """Sale model representing a completed transaction."""
 
     __tablename__ = "sales"
+    __table_args__ = (
+        # Covers the per-register totals recomputed for reconciliation
+        Index(
+            "ix_sales_register_day",
+            "edition_id",
+            "register_number",
+            "sold_at",
+            "payment_method",
+            "price",
+        ),
+    )
 
     # Sale details
     sold_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
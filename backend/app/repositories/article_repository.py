@@ -0,0 +1,35 @@
+"""Article data access."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, ItemList
+from app.repositories.base import BaseRepository
+from app.schemas.article import ArticleSummary
+
+
+class ArticleRepository(BaseRepository[Article]):
+    """Article queries."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Article, session)
+
+    async def list_summaries(self, item_list_id: str) -> list[ArticleSummary]:
+        """Get the articles of a list, ordered by line number."""
+        query = (
+            self.project(ArticleSummary)
+            .where(Article.item_list_id == item_list_id)
+            .order_by(Article.line_number)
+        )
+        result = await self.session.execute(query)
+        return ArticleSummary.from_rows(result.all())
+
+    async def list_summaries_by_edition(self, edition_id: str) -> list[ArticleSummary]:
+        """Get all articles of an edition, ordered by barcode."""
+        query = (
+            self.project(ArticleSummary)
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(ItemList.edition_id == edition_id)
+            .order_by(Article.barcode)
+        )
+        result = await self.session.execute(query)
+        return ArticleSummary.from_rows(result.all())
@@ -0,0 +1,35 @@
+"""Audit trail data access."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import AuditLog
+from app.repositories.base import BaseRepository
+from app.schemas.audit import AuditEntry
+
+
+class AuditRepository(BaseRepository[AuditLog]):
+    """Audit trail queries."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(AuditLog, session)
+
+    async def list_entries(
+        self,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        actor_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[AuditEntry]:
+        """Get audited actions on an entity and/or by an actor, newest first."""
+        query = self.project(AuditEntry)
+        if entity_type is not None:
+            query = query.where(AuditLog.entity_type == entity_type)
+        if entity_id is not None:
+            query = query.where(AuditLog.entity_id == entity_id)
+        if actor_id is not None:
+            query = query.where(AuditLog.actor_id == actor_id)
+        result = await self.session.execute(
+            query.order_by(AuditLog.created_at.desc()).limit(limit).offset(offset)
+        )
+        return AuditEntry.from_rows(result.all())
@@ -0,0 +1,31 @@
+"""Base repository with common data access helpers."""
+
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import Base
+from app.schemas.base import ReadModel
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+
+class BaseRepository(Generic[ModelT]):
+    """Generic repository bound to a model and a session."""
+
+    def __init__(self, model: type[ModelT], session: AsyncSession):
+        self.model = model
+        self.session = session
+
+    async def get_by_id(self, id: str) -> ModelT | None:
+        """Get an entity by primary key."""
+        return await self.session.get(self.model, id)
+
+    def project(self, read_model: type[ReadModel]) -> Select[Any]:
+        """Select only the columns of a read model, in field order.
+
+        Rows of the resulting query are meant for `read_model.from_rows`,
+        which avoids loading and tracking full ORM objects.
+        """
+        return select(*(getattr(self.model, name) for name in read_model.columns()))
@@ -0,0 +1,46 @@
+"""Deposit slot data access."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import DepositSlot
+from app.repositories.base import BaseRepository
+from app.schemas.deposit_slot import DepositSlotSummary
+
+
+class DepositSlotRepository(BaseRepository[DepositSlot]):
+    """Deposit slot queries."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(DepositSlot, session)
+
+    async def get_in_edition(self, edition_id: str, slot_id: str) -> DepositSlot | None:
+        """Get a slot, only if it belongs to the edition."""
+        slot = await self.get_by_id(slot_id)
+        if slot is None or slot.edition_id != edition_id:
+            return None
+        return slot
+
+    async def list_summaries(
+        self, edition_id: str, slot_ids: list[str] | None = None
+    ) -> list[DepositSlotSummary]:
+        """Get an edition's slots with their places left, in time order."""
+        query = (
+            select(
+                DepositSlot.id,
+                DepositSlot.day,
+                DepositSlot.start_time,
+                DepositSlot.end_time,
+                DepositSlot.capacity,
+                DepositSlot.reserved_count,
+                DepositSlot.capacity - DepositSlot.reserved_count,
+                DepositSlot.is_local_only,
+                DepositSlot.description,
+            )
+            .where(DepositSlot.edition_id == edition_id)
+            .order_by(DepositSlot.day, DepositSlot.start_time)
+        )
+        if slot_ids is not None:
+            query = query.where(DepositSlot.id.in_(slot_ids))
+        result = await self.session.execute(query)
+        return DepositSlotSummary.from_rows(result.all())
@@ -0,0 +1,72 @@
+"""ItemList data access."""
+
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, ItemList
+from app.models.article import CLOTHING_CATEGORIES
+from app.repositories.base import BaseRepository
+from app.schemas.item_list import ItemListSummary
+
+
+class ItemListRepository(BaseRepository[ItemList]):
+    """ItemList queries."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(ItemList, session)
+
+    async def get_in_edition(
+        self, edition_id: str, item_list_id: str, for_update: bool = False
+    ) -> ItemList | None:
+        """Get a list, only if it belongs to the edition.
+
+        With `for_update`, the list row is read again and locked until the
+        end of the transaction.
+        """
+        item_list = await self.session.get(
+            ItemList,
+            item_list_id,
+            with_for_update=for_update,
+            populate_existing=for_update,
+        )
+        if item_list is None or item_list.edition_id != edition_id:
+            return None
+        return item_list
+
+    async def list_summaries(
+        self,
+        edition_id: str,
+        depositor_id: str | None = None,
+        status: str | None = None,
+        list_type: str | None = None,
+        item_list_ids: list[str] | None = None,
+    ) -> list[ItemListSummary]:
+        """Get list overviews with article counts computed in one query."""
+        clothing = case((Article.category.in_(CLOTHING_CATEGORIES), 1), else_=0)
+        query = (
+            select(
+                ItemList.id,
+                ItemList.number,
+                ItemList.list_type,
+                ItemList.label_color,
+                ItemList.status,
+                ItemList.depositor_id,
+                func.count(Article.id),
+                func.coalesce(func.sum(clothing), 0),
+            )
+            .outerjoin(Article, Article.item_list_id == ItemList.id)
+            .where(ItemList.edition_id == edition_id)
+            .group_by(ItemList.id)
+            .order_by(ItemList.number)
+        )
+        if depositor_id is not None:
+            query = query.where(ItemList.depositor_id == depositor_id)
+        if status is not None:
+            query = query.where(ItemList.status == status)
+        if list_type is not None:
+            query = query.where(ItemList.list_type == list_type)
+        if item_list_ids is not None:
+            query = query.where(ItemList.id.in_(item_list_ids))
+
+        result = await self.session.execute(query)
+        return ItemListSummary.from_rows(result.all())
@@ -0,0 +1,63 @@
+"""Sale data access."""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Sale
+from app.repositories.base import BaseRepository
+from app.schemas.sale import SaleSummary
+
+
+def _sale_filters(
+    edition_id: str, day: date | None, register_number: int | None
+) -> list[Any]:
+    criteria: list[Any] = [Sale.edition_id == edition_id]
+    if day is not None:
+        start = datetime.combine(day, time.min)
+        criteria += [Sale.sold_at >= start, Sale.sold_at < start + timedelta(days=1)]
+    if register_number is not None:
+        criteria.append(Sale.register_number == register_number)
+    return criteria
+
+
+class SaleRepository(BaseRepository[Sale]):
+    """Sale queries."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Sale, session)
+
+    async def list_summaries(
+        self,
+        edition_id: str,
+        day: date | None = None,
+        register_number: int | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[SaleSummary]:
+        """Get a page of an edition's sales, most recent first."""
+        query = (
+            self.project(SaleSummary)
+            .where(*_sale_filters(edition_id, day, register_number))
+            .order_by(Sale.sold_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(query)
+        return SaleSummary.from_rows(result.all())
+
+    async def count(
+        self,
+        edition_id: str,
+        day: date | None = None,
+        register_number: int | None = None,
+    ) -> int:
+        """Count an edition's sales matching the filters."""
+        result = await self.session.execute(
+            select(func.count(Sale.id)).where(
+                *_sale_filters(edition_id, day, register_number)
+            )
+        )
+        return result.scalar_one()
@@ -0,0 +1,19 @@
+"""Pydantic schemas for post-edition analytics reports."""
+
+from typing import Literal
+
+from pydantic import Field
+
+from app.schemas.base import RequestModel
+
+
+class ReportRequest(RequestModel):
+    """Options of an edition report."""
+
+    format: Literal["pdf", "html"] = "pdf"
+
+
+class ComparisonRequest(ReportRequest):
+    """Editions to compare side by side, in display order."""
+
+    edition_ids: list[str] = Field(min_length=2, max_length=10)
@@ -0,0 +1,83 @@
+"""Pydantic schemas for articles."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import Field
+
+from app.models.article import ArticleCategory
+from app.schemas.base import Price, ReadModel, RequestModel
+
+
+class ArticleSummary(ReadModel):
+    """Article as shown in a list view."""
+
+    id: str
+    line_number: int
+    description: str
+    category: str
+    size: str | None
+    brand: str | None
+    color: str | None
+    price: Price
+    is_lot: bool
+    lot_quantity: int | None
+    status: str
+    barcode: str | None
+
+
+class ArticleResponse(ArticleSummary):
+    """Article details."""
+
+    conformity_certified: bool
+    item_list_id: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class ArticleInput(RequestModel):
+    """Article of a list as edited by its depositor."""
+
+    id: str | None = Field(default=None, description="None for a new article")
+    description: str = Field(min_length=1, max_length=100)
+    category: ArticleCategory
+    size: str | None = Field(default=None, max_length=50)
+    brand: str | None = Field(default=None, max_length=100)
+    color: str | None = Field(default=None, max_length=50)
+    price: Decimal = Field(decimal_places=2)
+    is_lot: bool = False
+    lot_quantity: int | None = Field(default=None, ge=1, le=3)
+    conformity_certified: bool = False
+
+
+class ArticleListSave(RequestModel):
+    """Full state of a list's articles, in the depositor's order."""
+
+    articles: list[ArticleInput]
+
+
+class ArticleListDiff(ReadModel):
+    """Changes applied by a list save, and the resulting articles."""
+
+    created: int
+    updated: int
+    deleted: int
+    articles: list[ArticleSummary]
+
+
+class ArticleSearchHit(ReadModel):
+    """Article found by a search, with its list and relevance score."""
+
+    id: str
+    item_list_id: str
+    list_number: int
+    line_number: int
+    barcode: str | None
+    description: str
+    category: str
+    size: str | None
+    brand: str | None
+    color: str | None
+    price: Price
+    status: str
+    score: float
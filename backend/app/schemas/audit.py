@@ -0,0 +1,18 @@
+"""Pydantic schemas for the audit trail."""
+
+from datetime import datetime
+from typing import Any
+
+from app.schemas.base import ReadModel
+
+
+class AuditEntry(ReadModel):
+    """Audited action."""
+
+    id: str
+    created_at: datetime
+    event: str
+    actor_id: str | None
+    entity_type: str
+    entity_id: str
+    details: dict[str, Any] | None
@@ -0,0 +1,63 @@
+"""Base classes and shared types for response schemas."""
+
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Decimal
+from typing import Annotated, Any, Self, cast
+
+from pydantic import BaseModel, ConfigDict, PlainSerializer
+from pydantic.alias_generators import to_camel
+
+# Money amounts are Decimal in Python and plain numbers in JSON
+Price = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
+# Amounts in integer cents (see `app.utils.money`), numbers of euros in JSON
+Money = Annotated[
+    int,
+    PlainSerializer(lambda cents: cents / 100, return_type=float, when_used="json"),
+]
+
+
+class RequestModel(BaseModel):
+    """Base class for request bodies, accepting camelCase or snake_case keys."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+class ReadModel(BaseModel):
+    """Base class for response models.
+
+    Fields are exposed in camelCase to match the frontend types. Read models
+    are built from trusted database rows with `from_rows`, which skips
+    validation: the data was already validated on the way in, and the
+    response is serialized directly from the model (see `FastJSONResponse`)
+    instead of being re-validated by FastAPI's `response_model`.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+    )
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        """Get the field names to select in a projection query."""
+        return list(cls.model_fields)
+
+    @classmethod
+    def _constructor(cls) -> Callable[..., Self]:
+        # The pydantic mypy plugin types `model_construct` on the class
+        # defining it, not on the subclass it is called on
+        return cast(Callable[..., Self], cls.model_construct)
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> Self:
+        """Build a model from a projection row, in `columns()` order."""
+        return cls._constructor()(**dict(zip(cls.model_fields, row, strict=True)))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> list[Self]:
+        """Build models from projection rows, in `columns()` order."""
+        names = list(cls.model_fields)
+        construct = cls._constructor()
+        return [construct(**dict(zip(names, row, strict=True))) for row in rows]
@@ -0,0 +1,30 @@
+"""Pydantic schemas for the register catalog feed."""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+# Columns of each catalog row, in order
+CATALOG_FIELDS = [
+    "id",
+    "code",
+    "price_cents",
+    "status",
+    "category",
+    "description",
+    "size",
+]
+
+
+class CatalogFeed(BaseModel):
+    """Compact catalog snapshot or delta for offline register caches.
+
+    Keys are kept short and rows are positional arrays described by `f`,
+    so a full 10,000-article snapshot stays small and a delta only carries
+    the articles whose status or price changed.
+    """
+
+    v: int = Field(description="Catalog version to send back as `since`")
+    full: bool = Field(description="True for a full snapshot, False for a delta")
+    f: list[str] = Field(default=CATALOG_FIELDS, description="Row column names")
+    a: list[list[Any]] = Field(description="Article rows")
@@ -0,0 +1,62 @@
+"""Pydantic schemas for deposit slots."""
+
+from datetime import date, time
+from typing import Self
+
+from pydantic import Field, model_validator
+
+from app.schemas.base import ReadModel, RequestModel
+
+
+class DepositSlotSummary(ReadModel):
+    """Deposit slot with its occupancy."""
+
+    id: str
+    day: date
+    start_time: time
+    end_time: time
+    capacity: int
+    reserved_count: int
+    available_places: int
+    is_local_only: bool
+    description: str | None
+
+
+class SlotAvailability(ReadModel):
+    """Places left in a deposit slot."""
+
+    id: str
+    available_places: int
+
+
+class DepositSlotCreate(RequestModel):
+    """New deposit slot."""
+
+    day: date
+    start_time: time
+    end_time: time
+    capacity: int = Field(ge=1)
+    is_local_only: bool = False
+    description: str | None = None
+
+    @model_validator(mode="after")
+    def check_times(self) -> Self:
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        return self
+
+
+class DepositSlotUpdate(RequestModel):
+    """Changes to a deposit slot; omitted fields are kept."""
+
+    capacity: int | None = Field(default=None, ge=1)
+    is_local_only: bool | None = None
+    description: str | None = None
+
+
+class SlotReservation(ReadModel):
+    """Place taken by a depositor in a deposit slot."""
+
+    id: str
+    slot_id: str
+    depositor_id: str
@@ -0,0 +1,63 @@
+"""Pydantic schemas for depositor lists."""
+
+from pydantic import Field
+
+from app.models.item_list import ListType
+from app.schemas.base import ReadModel, RequestModel
+
+
+class ItemListSummary(ReadModel):
+    """List overview with article counts."""
+
+    id: str
+    number: int
+    list_type: str
+    label_color: str | None
+    status: str
+    depositor_id: str
+    article_count: int
+    clothing_count: int
+
+
+class ItemListCreate(RequestModel):
+    """New empty list."""
+
+    list_type: ListType = Field(default=ListType.STANDARD, alias="type")
+
+
+class ItemListCopy(RequestModel):
+    """Copy of a list, or of some of its articles, into a new draft list."""
+
+    target_edition_id: str | None = Field(
+        default=None, description="Edition of the new list (default: same edition)"
+    )
+    article_ids: list[str] | None = Field(
+        default=None, description="Articles to copy (default: all)"
+    )
+
+
+class CohortCopy(RequestModel):
+    """Reuse of the unsold articles of depositors' lists from another edition."""
+
+    source_edition_id: str
+    depositor_ids: list[str] = Field(min_length=1)
+
+
+class ListCheckIn(RequestModel):
+    """Check-in of a list at the deposit desk."""
+
+    code: str = Field(
+        min_length=1, max_length=50, description="Scanned list code (e.g. L142)"
+    )
+    excluded_article_ids: list[str] = Field(
+        default_factory=list, description="Rejected articles, kept off sale"
+    )
+
+
+class ListCheckInResult(ReadModel):
+    """Checked-in list with the outcome for its articles."""
+
+    item_list: ItemListSummary
+    on_sale: int
+    excluded: int
+    catalog_version: int
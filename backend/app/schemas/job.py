@@ -0,0 +1,19 @@
+"""Pydantic schemas for background jobs."""
+
+from datetime import datetime
+
+from app.schemas.base import ReadModel
+
+
+class JobSummary(ReadModel):
+    """Status of a background job, polled until completed."""
+
+    id: str
+    kind: str
+    status: str
+    progress: int
+    message: str | None
+    created_at: datetime
+    completed_at: datetime | None
+    # Download URL of the result, once completed
+    result_url: str | None
@@ -0,0 +1,19 @@
+"""Pydantic schemas for depositor payouts."""
+
+from app.schemas.base import Money, ReadModel
+
+
+class PayoutSummary(ReadModel):
+    """Amounts due to a depositor for a list."""
+
+    id: str
+    item_list_id: str
+    list_number: int
+    depositor_id: str
+    total_articles: int
+    sold_articles: int
+    gross_amount: Money
+    commission_amount: Money
+    list_fees: Money
+    net_amount: Money
+    status: str
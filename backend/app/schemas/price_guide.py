@@ -0,0 +1,24 @@
+"""Pydantic schemas for historical price guidance."""
+
+from app.schemas.base import Price, ReadModel
+
+
+class PriceGuidance(ReadModel):
+    """Prices at which similar articles sold in past editions.
+
+    `sizeBand` and `brand` are empty when the guidance covers all sizes or
+    all brands of the category.
+    """
+
+    category: str
+    size_band: str
+    brand: str
+    offered: int
+    sold: int
+    # Share of the offered articles that were sold
+    sell_through: float
+    # Quartiles of the sold prices
+    low_price: Price | None
+    median_price: Price | None
+    high_price: Price | None
+    editions: int
@@ -0,0 +1,57 @@
+"""Pydantic schemas for register reconciliation."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import Field
+
+from app.models.sale import PaymentMethod
+from app.schemas.base import Price, ReadModel, RequestModel
+
+
+class RegisterLine(ReadModel):
+    """Sales of a register with one payment method, against the drawer count."""
+
+    payment_method: str
+    sale_count: int
+    amount: Price
+    counted_amount: Price | None
+    discrepancy: Price | None
+
+
+class ZReport(ReadModel):
+    """End-of-day report of a register."""
+
+    edition_id: str
+    day: date
+    register_number: int
+    lines: list[RegisterLine]
+    sale_count: int
+    amount: Price
+    counted_amount: Price | None
+    discrepancy: Price | None
+    counted_at: datetime | None
+    note: str | None
+
+
+class DrawerCount(RequestModel):
+    """Amounts counted in a register's drawer at closing."""
+
+    day: date = Field(alias="date")
+    amounts: dict[PaymentMethod, Decimal] = Field(
+        min_length=1, description="Counted amount per payment method"
+    )
+    note: str | None = Field(
+        default=None, max_length=1000, description="Explanation of discrepancies"
+    )
+
+
+class TotalCorrection(ReadModel):
+    """Running total found wrong by a recomputation, with its previous value."""
+
+    register_number: int
+    payment_method: str
+    sale_count: int
+    amount: Price
+    previous_sale_count: int
+    previous_amount: Price
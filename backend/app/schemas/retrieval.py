@@ -0,0 +1,55 @@
+"""Pydantic schemas for unsold article retrieval."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from app.schemas.base import Price, ReadModel, RequestModel
+
+
+class PicklistLine(ReadModel):
+    """Unsold article to pick."""
+
+    line_number: int
+    barcode: str | None
+    description: str
+    category: str
+    size: str | None
+    price: Price
+
+
+class Picklist(ReadModel):
+    """Unsold articles of a list, with the list's retrieval outcome."""
+
+    item_list_id: str
+    list_number: int
+    label_color: str | None
+    depositor_name: str
+    lines: list[PicklistLine]
+    outcome: str | None
+    processed_at: datetime | None
+
+
+class RetrievalPreparation(ReadModel):
+    """Outcome of the end of the sale."""
+
+    lists: int
+    articles: int
+    catalog_version: int
+
+
+class ListRetrieval(RequestModel):
+    """Processing of a list at the retrieval desk."""
+
+    outcome: Literal["retrieved", "donated"] = Field(
+        default="retrieved",
+        description="Unsold articles handed back, or donated to charity",
+    )
+
+
+class PicklistExport(RequestModel):
+    """Printable picklists, optionally of one label color."""
+
+    format: Literal["pdf", "html"] = "pdf"
+    label_color: str | None = None
@@ -0,0 +1,129 @@
+"""Pydantic schemas for sales."""
+
+from datetime import datetime
+
+from pydantic import Field, model_validator
+
+from app.models.sale import PaymentMethod
+from app.schemas.base import Price, ReadModel, RequestModel
+
+
+class SaleCreate(RequestModel):
+    """Sale of a scanned article at a register."""
+
+    article_id: str | None = None
+    barcode: str | None = Field(default=None, description="Alternative to article_id")
+    payment_method: PaymentMethod
+    register_number: int = Field(ge=1)
+
+    @model_validator(mode="after")
+    def check_article_reference(self) -> "SaleCreate":
+        """Require an article ID or a barcode."""
+        if self.article_id is None and self.barcode is None:
+            raise ValueError("article_id or barcode is required")
+        return self
+
+
+class SaleSummary(ReadModel):
+    """Sale as shown in the sales history."""
+
+    id: str
+    article_id: str
+    price: Price
+    payment_method: str
+    register_number: int
+    sold_at: datetime
+    is_offline_sale: bool
+
+
+class SalePage(ReadModel):
+    """Page of the sales history."""
+
+    items: list[SaleSummary]
+    total: int
+    page: int
+    limit: int
+
+
+class BasketCheckout(RequestModel):
+    """Articles scanned into a customer's basket, paid in one payment."""
+
+    barcodes: list[str] = Field(min_length=1, max_length=100)
+    payment_method: PaymentMethod
+    register_number: int = Field(ge=1)
+
+
+class BasketItems(RequestModel):
+    """Articles scanned into a basket, checked before payment."""
+
+    barcodes: list[str] = Field(min_length=1, max_length=100)
+
+
+class BasketLine(ReadModel):
+    """Sellable article of a basket."""
+
+    article_id: str
+    barcode: str
+    description: str
+    price: Price
+
+
+class BasketFailure(ReadModel):
+    """Scanned barcode that cannot be sold."""
+
+    barcode: str
+    error: str
+
+
+class BasketCheck(ReadModel):
+    """Server-side validation of a basket before payment."""
+
+    lines: list[BasketLine]
+    failures: list[BasketFailure]
+    total: Price
+
+
+class BasketReceipt(ReadModel):
+    """Sales recorded by a basket checkout."""
+
+    sales: list[SaleSummary]
+    total: Price
+    payment_method: str
+
+
+class SaleCancel(RequestModel):
+    """Cancellation of a sale by a manager."""
+
+    reason: str = Field(min_length=1, max_length=255)
+
+
+class OfflineSale(RequestModel):
+    """Sale recorded by a register while offline."""
+
+    offline_id: str
+    barcode: str
+    payment_method: PaymentMethod
+    sold_at: datetime = Field(description="Local timestamp of the sale")
+
+
+class SaleSync(RequestModel):
+    """Batch of offline sales from one register."""
+
+    register_number: int = Field(ge=1)
+    sales: list[OfflineSale]
+
+
+class SyncConflict(ReadModel):
+    """Offline sale that could not be recorded."""
+
+    offline_id: str
+    barcode: str
+    error: str
+
+
+class SyncResult(ReadModel):
+    """Outcome of an offline sales synchronization."""
+
+    total: int
+    synchronized: int
+    conflicts: list[SyncConflict]
@@ -0,0 +1,539 @@
+"""Post-edition analytics: sell-through, sales curves and price elasticity.
+
+An edition's data is read as columns: one query per table (articles with
+their list's type and label color, then sales), or a single pass over the
+archive file of an archived edition, transposed into one list per field.
+Aggregates are then computed over whole columns, with grouping keys
+derived by `map` and counted by `Counter`, without per-article objects.
+
+Reports are rendered as HTML, or PDF through WeasyPrint, by background
+jobs (see `job_service`): "analytics.report" for one edition and
+"analytics.comparison" for several editions side by side.
+"""
+
+import asyncio
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from html import escape
+from itertools import compress
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import EditionNotFoundError
+from app.models import Article, Edition, ItemList, Sale
+from app.models.article import MAX_PRICES, ArticleStatus
+from app.schemas.job import JobSummary
+from app.services.archive_service import ArchiveReader
+from app.services.job_service import JobResult, JobService, html_result, job_runner
+from app.utils.html_document import document, table
+from app.utils.money import to_cents
+
+REPORT_JOB = "analytics.report"
+COMPARISON_JOB = "analytics.comparison"
+
+# Articles that were put on sale, whatever became of them
+OFFERED_STATUSES = frozenset(
+    {
+        ArticleStatus.ON_SALE.value,
+        ArticleStatus.SOLD.value,
+        ArticleStatus.UNSOLD.value,
+        ArticleStatus.RETRIEVED.value,
+        ArticleStatus.DONATED.value,
+    }
+)
+
+# Lower bounds of the price bands, in euros (from the minimum price)
+PRICE_BANDS = (1, 2, 5, 10, 20, 50)
+PRICE_BAND_LABELS = tuple(
+    f"{low}–{high} €" for low, high in zip(PRICE_BANDS, PRICE_BANDS[1:], strict=False)
+) + (f"{PRICE_BANDS[-1]} € et plus",)
+
+# Bands of price relative to the category's maximum price (tenths)
+RATIO_BANDS = 10
+RATIO_BAND_LABELS = tuple(
+    f"{band * 10}–{band * 10 + 10} %" for band in range(RATIO_BANDS)
+)
+
+NO_SIZE = "(sans taille)"
+
+ARTICLE_COLUMNS = (
+    "category",
+    "size",
+    "brand",
+    "price",
+    "status",
+    "list_type",
+    "label_color",
+)
+SALE_COLUMNS = ("price", "sold_at", "register_number", "payment_method")
+
+# Sell-through breakdowns of a report, with their titles
+BREAKDOWNS = {
+    "category": "Catégorie",
+    "size": "Taille",
+    "price_band": "Tranche de prix",
+    "list_type": "Type de liste",
+    "label_color": "Couleur d'étiquette",
+}
+
+
+@dataclass
+class EditionColumns:
+    """An edition's articles and sales, one list per field."""
+
+    edition_id: str
+    name: str
+    articles: dict[str, list[Any]]
+    sales: dict[str, list[Any]]
+
+
+@dataclass
+class SellThrough:
+    """Articles offered and sold in a group."""
+
+    key: str
+    offered: int
+    sold: int
+    revenue: float
+
+    @property
+    def rate(self) -> float:
+        """Get the share of offered articles that were sold."""
+        return self.sold / self.offered if self.offered else 0.0
+
+
+@dataclass
+class SalesCurve:
+    """Sales per hour of each register."""
+
+    hours: list[int]
+    # Register number -> sales count per hour, in `hours` order
+    registers: dict[int, list[int]]
+
+
+@dataclass
+class PriceElasticity:
+    """Sell-through against price relative to the category's maximum.
+
+    `slope` is the change in sell-through per unit of relative price (a
+    least-squares fit over articles); `elasticity` is the same at the mean
+    point, as a ratio of relative changes.
+    """
+
+    bands: list[SellThrough]
+    slope: float
+    elasticity: float
+
+
+@dataclass
+class EditionReport:
+    """Aggregates of an edition, for planning the next one."""
+
+    edition_id: str
+    name: str
+    offered: int
+    sold: int
+    sales: int
+    revenue: float
+    breakdowns: dict[str, list[SellThrough]] = field(default_factory=dict)
+    payments: dict[str, SellThrough] = field(default_factory=dict)
+    curve: SalesCurve = field(default_factory=lambda: SalesCurve([], {}))
+    elasticity: PriceElasticity = field(
+        default_factory=lambda: PriceElasticity([], 0.0, 0.0)
+    )
+
+    @property
+    def rate(self) -> float:
+        """Get the edition's sell-through rate."""
+        return self.sold / self.offered if self.offered else 0.0
+
+
+def _transpose(
+    rows: Iterable[Sequence[Any]], names: Sequence[str]
+) -> dict[str, list[Any]]:
+    """Turn rows into one list per column."""
+    columns = list(zip(*rows, strict=True)) or [()] * len(names)
+    return {name: list(column) for name, column in zip(names, columns, strict=True)}
+
+
+def sell_through(
+    keys: Sequence[Any],
+    sold: Sequence[bool],
+    prices: Sequence[float],
+    order: Sequence[Any] | None = None,
+) -> list[SellThrough]:
+    """Count offered and sold articles per key.
+
+    Args:
+        keys: Group of each article.
+        sold: Whether each article was sold.
+        prices: Price of each article.
+        order: Keys in display order (all of them, even without articles);
+            by default, the most offered groups come first.
+    """
+    offered = Counter(keys)
+    sold_keys = list(compress(keys, sold))
+    sold_counts = Counter(sold_keys)
+    # Summed in integer cents, exact whatever the number of articles
+    revenue: Counter[Any] = Counter()
+    for key, price in zip(sold_keys, compress(prices, sold), strict=True):
+        revenue[key] += round(price * 100)
+    if order is None:
+        order = [key for key, _ in offered.most_common()]
+    return [
+        SellThrough(str(key), offered[key], sold_counts[key], revenue[key] / 100)
+        for key in order
+    ]
+
+
+def price_band(price: float) -> str:
+    """Get the label of a price's band."""
+    return PRICE_BAND_LABELS[max(bisect_right(PRICE_BANDS, price) - 1, 0)]
+
+
+def price_elasticity(
+    categories: Sequence[str], prices: Sequence[float], sold: Sequence[bool]
+) -> PriceElasticity:
+    """Relate sell-through to price relative to each category's maximum."""
+    default_max = float(MAX_PRICES["default"])
+    max_prices = {category: float(price) for category, price in MAX_PRICES.items()}
+    ratios = [
+        price / max_prices.get(category, default_max)
+        for category, price in zip(categories, prices, strict=True)
+    ]
+    bands = [
+        RATIO_BAND_LABELS[min(int(ratio * RATIO_BANDS), RATIO_BANDS - 1)]
+        for ratio in ratios
+    ]
+    rows = sell_through(bands, sold, prices, order=RATIO_BAND_LABELS)
+
+    count = len(ratios)
+    if count < 2:
+        return PriceElasticity(rows, 0.0, 0.0)
+    mean_ratio = sum(ratios) / count
+    mean_sold = sum(sold) / count
+    covariance = sum(
+        (ratio - mean_ratio) * (is_sold - mean_sold)
+        for ratio, is_sold in zip(ratios, sold, strict=True)
+    )
+    variance = sum((ratio - mean_ratio) ** 2 for ratio in ratios)
+    slope = covariance / variance if variance else 0.0
+    elasticity = slope * mean_ratio / mean_sold if mean_sold else 0.0
+    return PriceElasticity(rows, round(slope, 4), round(elasticity, 4))
+
+
+def sales_curve(sold_at: Sequence[Any], registers: Sequence[int]) -> SalesCurve:
+    """Count sales per register and hour of the day."""
+    hours = [moment.hour for moment in sold_at]
+    if not hours:
+        return SalesCurve([], {})
+    counts = Counter(zip(registers, hours, strict=True))
+    span = list(range(min(hours), max(hours) + 1))
+    return SalesCurve(
+        hours=span,
+        registers={
+            register: [counts[register, hour] for hour in span]
+            for register in sorted(set(registers))
+        },
+    )
+
+
+def build_report(columns: EditionColumns) -> EditionReport:
+    """Compute every aggregate of an edition report from its columns."""
+    articles = columns.articles
+    offered = [status in OFFERED_STATUSES for status in articles["status"]]
+
+    def offered_only(name: str) -> list[Any]:
+        return list(compress(articles[name], offered))
+
+    statuses = offered_only("status")
+    categories = offered_only("category")
+    prices = list(map(float, offered_only("price")))
+    sold = [status == ArticleStatus.SOLD.value for status in statuses]
+    keys = {
+        "category": categories,
+        "size": [
+            size.strip().lower() if size else NO_SIZE for size in offered_only("size")
+        ],
+        "price_band": list(map(price_band, prices)),
+        "list_type": offered_only("list_type"),
+        "label_color": [color or "" for color in offered_only("label_color")],
+    }
+
+    sales = columns.sales
+    sale_prices = list(map(float, sales["price"]))
+    methods = sales["payment_method"]
+    return EditionReport(
+        edition_id=columns.edition_id,
+        name=columns.name,
+        offered=len(statuses),
+        sold=sum(sold),
+        sales=len(sale_prices),
+        revenue=sum(map(to_cents, sales["price"])) / 100,
+        breakdowns={
+            name: sell_through(
+                values,
+                sold,
+                prices,
+                order=PRICE_BAND_LABELS if name == "price_band" else None,
+            )
+            for name, values in keys.items()
+        },
+        payments={
+            row.key: row
+            for row in sell_through(methods, [True] * len(methods), sale_prices)
+        },
+        curve=sales_curve(sales["sold_at"], sales["register_number"]),
+        elasticity=price_elasticity(categories, prices, sold),
+    )
+
+
+def _load_archive(edition: Edition, archive_path: str) -> EditionColumns:
+    """Read an archived edition's columns from its cold storage file."""
+    lists: dict[str, tuple[str, str | None]] = {}
+    article_rows: list[tuple[Any, ...]] = []
+    sale_rows: list[tuple[Any, ...]] = []
+    for table_name, row in ArchiveReader(archive_path).iter_rows():
+        if table_name == "item_lists":
+            lists[row["id"]] = (row["list_type"], row["label_color"])
+        elif table_name == "articles":
+            article_rows.append(
+                (
+                    row["category"],
+                    row["size"],
+                    row["brand"],
+                    row["price"],
+                    row["status"],
+                    *lists[row["item_list_id"]],
+                )
+            )
+        elif table_name == "sales":
+            sale_rows.append(tuple(row[name] for name in SALE_COLUMNS))
+    return EditionColumns(
+        edition_id=edition.id,
+        name=edition.name,
+        articles=_transpose(article_rows, ARTICLE_COLUMNS),
+        sales=_transpose(sale_rows, SALE_COLUMNS),
+    )
+
+
+class AnalyticsService:
+    """Post-edition reports, from hot tables or cold storage."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def load(self, edition_id: str) -> EditionColumns:
+        """Read an edition's articles and sales as columns.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        if edition.archive_path is not None:
+            return await asyncio.to_thread(_load_archive, edition, edition.archive_path)
+
+        result = await self.session.execute(
+            select(
+                Article.category,
+                Article.size,
+                Article.brand,
+                Article.price,
+                Article.status,
+                ItemList.list_type,
+                ItemList.label_color,
+            )
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(ItemList.edition_id == edition_id)
+        )
+        articles = _transpose(result.all(), ARTICLE_COLUMNS)
+        result = await self.session.execute(
+            select(
+                Sale.price, Sale.sold_at, Sale.register_number, Sale.payment_method
+            ).where(Sale.edition_id == edition_id)
+        )
+        sales = _transpose(result.all(), SALE_COLUMNS)
+        return EditionColumns(edition.id, edition.name, articles, sales)
+
+    async def _check_editions(self, edition_ids: Sequence[str]) -> None:
+        result = await self.session.execute(
+            select(Edition.id).where(Edition.id.in_(edition_ids))
+        )
+        missing = set(edition_ids) - set(result.scalars())
+        if missing:
+            raise EditionNotFoundError(min(missing))
+
+    async def submit_report(
+        self, edition_id: str, output_format: str, created_by_id: str | None = None
+    ) -> JobSummary:
+        """Start the report job of an edition.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self._check_editions([edition_id])
+        return await JobService(self.session).submit(
+            REPORT_JOB,
+            {"edition_id": edition_id, "format": output_format},
+            edition_id=edition_id,
+            created_by_id=created_by_id,
+        )
+
+    async def submit_comparison(
+        self,
+        edition_ids: Sequence[str],
+        output_format: str,
+        created_by_id: str | None = None,
+    ) -> JobSummary:
+        """Start the comparison job of several editions.
+
+        Raises:
+            EditionNotFoundError: If an edition does not exist.
+        """
+        await self._check_editions(edition_ids)
+        return await JobService(self.session).submit(
+            COMPARISON_JOB,
+            {"edition_ids": list(edition_ids), "format": output_format},
+            created_by_id=created_by_id,
+        )
+
+    async def report(self, edition_id: str) -> EditionReport:
+        """Compute an edition's report.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        return build_report(await self.load(edition_id))
+
+    async def compare(self, edition_ids: Sequence[str]) -> list[EditionReport]:
+        """Compute the reports of several editions, in the given order.
+
+        Raises:
+            EditionNotFoundError: If an edition does not exist.
+        """
+        return [await self.report(edition_id) for edition_id in edition_ids]
+
+
+def _percent(rate: float) -> str:
+    return f"{rate * 100:.1f} %"
+
+
+def _sell_through_table(title: str, rows: list[SellThrough]) -> str:
+    return table(
+        [title, "Proposés", "Vendus", "Écoulement", "Chiffre d'affaires"],
+        (
+            (row.key, row.offered, row.sold, _percent(row.rate), f"{row.revenue:.2f}")
+            for row in rows
+        ),
+    )
+
+
+def render_report_html(report: EditionReport) -> str:
+    """Render an edition report as a standalone HTML page."""
+    sections = [
+        table(
+            ["Indicateur", "Valeur"],
+            [
+                ("Articles proposés", report.offered),
+                ("Articles vendus", report.sold),
+                ("Taux d'écoulement", _percent(report.rate)),
+                ("Ventes", report.sales),
+                ("Chiffre d'affaires", f"{report.revenue:.2f}"),
+            ],
+        ),
+        "<h2>Moyens de paiement</h2>",
+        table(
+            ["Moyen", "Ventes", "Montant"],
+            (
+                (row.key, row.sold, f"{row.revenue:.2f}")
+                for row in report.payments.values()
+            ),
+        ),
+    ]
+    for name, title in BREAKDOWNS.items():
+        sections.append(f"<h2>Écoulement par {escape(title.lower())}</h2>")
+        sections.append(_sell_through_table(title, report.breakdowns[name]))
+
+    curve = report.curve
+    sections.append("<h2>Ventes par heure et par caisse</h2>")
+    sections.append(
+        table(
+            ["Caisse", *(f"{hour} h" for hour in curve.hours)],
+            ((register, *counts) for register, counts in curve.registers.items()),
+        )
+    )
+
+    elasticity = report.elasticity
+    sections.append("<h2>Écoulement selon le prix (part du prix maximum)</h2>")
+    sections.append(
+        f"<p>Pente : {elasticity.slope:+.3f} par unité de prix relatif ; "
+        f"élasticité au point moyen : {elasticity.elasticity:+.3f}</p>"
+    )
+    sections.append(_sell_through_table("Prix / maximum", elasticity.bands))
+    return document(f"Bilan — {report.name}", sections)
+
+
+def render_comparison_html(reports: Sequence[EditionReport]) -> str:
+    """Render editions side by side as a standalone HTML page."""
+    names = [report.name for report in reports]
+    sections = [
+        table(
+            ["Indicateur", *names],
+            [
+                ("Articles proposés", *(report.offered for report in reports)),
+                ("Articles vendus", *(report.sold for report in reports)),
+                ("Taux d'écoulement", *(_percent(report.rate) for report in reports)),
+                ("Chiffre d'affaires", *(f"{r.revenue:.2f}" for r in reports)),
+            ],
+        )
+    ]
+    for name, title in BREAKDOWNS.items():
+        rates = [
+            {row.key: row.rate for row in report.breakdowns[name]} for report in reports
+        ]
+        keys = list(dict.fromkeys(key for edition in rates for key in edition))
+        sections.append(f"<h2>Écoulement par {escape(title.lower())}</h2>")
+        sections.append(
+            table(
+                [title, *names],
+                (
+                    (
+                        key,
+                        *(
+                            _percent(edition[key]) if key in edition else "—"
+                            for edition in rates
+                        ),
+                    )
+                    for key in keys
+                ),
+            )
+        )
+    return document("Comparaison des éditions", sections)
+
+
+async def run_report_job(session: AsyncSession, params: dict[str, Any]) -> JobResult:
+    """Job handler: report of one edition."""
+    report = await AnalyticsService(session).report(params["edition_id"])
+    return await html_result(
+        render_report_html(report), params["format"], f"bilan-{report.edition_id}"
+    )
+
+
+async def run_comparison_job(
+    session: AsyncSession, params: dict[str, Any]
+) -> JobResult:
+    """Job handler: editions side by side."""
+    reports = await AnalyticsService(session).compare(params["edition_ids"])
+    return await html_result(
+        render_comparison_html(reports), params["format"], "comparaison-editions"
+    )
+
+
+job_runner.register(REPORT_JOB, run_report_job)
+job_runner.register(COMPARISON_JOB, run_comparison_job)
@@ -0,0 +1,301 @@
+"""Cold storage for archived editions.
+
+Once an edition is archived, its lists, retrieval picklists, articles, sales
+and payouts are moved out of the hot tables into one compressed file per
+edition. The file is gzip-compressed JSON lines with a column header per
+table followed by one JSON array per row, which keeps it compact and
+streamable.
+
+File layout:
+    {"format": 1, "edition_id": "...", "archived_at": "...", "counts": {...}}
+    {"table": "item_lists", "columns": ["id", "number", ...]}
+    ["3f1c...", 101, ...]
+    ...
+    {"table": "articles", "columns": [...]}
+    ...
+"""
+
+import asyncio
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Numeric,
+    Table,
+    delete,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.exceptions import (
+    ArchiveNotFoundError,
+    EditionNotArchivedError,
+    EditionNotFoundError,
+)
+from app.models import Article, Edition, ItemList, Payout, RetrievalPicklist, Sale
+from app.models.edition import EditionStatus
+from app.services.cache_coherence import EDITION_SCOPE, cache_coherence
+from app.utils.money import Cents, to_cents
+
+ARCHIVE_FORMAT_VERSION = 1
+
+# Parent tables first: restore inserts in this order, archiving deletes in reverse
+ARCHIVED_TABLES = cast(
+    tuple[Table, ...],
+    (
+        ItemList.__table__,
+        RetrievalPicklist.__table__,
+        Article.__table__,
+        Sale.__table__,
+        Payout.__table__,
+    ),
+)
+
+
+@dataclass
+class ArchiveSummary:
+    """Result of moving an edition between hot tables and cold storage."""
+
+    edition_id: str
+    path: str
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a column value to a JSON-serializable value."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_row(table: Table, columns: list[str], values: list[Any]) -> dict[str, Any]:
+    """Convert a stored row back to column values of the right Python type."""
+    row: dict[str, Any] = {}
+    for name, value in zip(columns, values, strict=True):
+        if value is not None:
+            column_type = table.c[name].type
+            if isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Numeric):
+                value = Decimal(value)
+            elif isinstance(column_type, Cents) and isinstance(value, str):
+                # Archived before payout amounts were mapped in cents
+                value = to_cents(value)
+        row[name] = value
+    return row
+
+
+def get_archive_path(edition_id: str, archive_dir: str | None = None) -> Path:
+    """Get the cold storage file path for an edition."""
+    return Path(archive_dir or settings.archive_dir) / f"edition-{edition_id}.jsonl.gz"
+
+
+class ArchiveReader:
+    """Read-only access to an archived edition, for historical reports.
+
+    Rows are streamed from the compressed file and never touch the database.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            edition_id = self.path.name.removeprefix("edition-").removesuffix(
+                ".jsonl.gz"
+            )
+            raise ArchiveNotFoundError(edition_id)
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            self.header: dict[str, Any] = json.loads(f.readline())
+
+    @property
+    def edition_id(self) -> str:
+        """Get the archived edition ID."""
+        return str(self.header["edition_id"])
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Get the number of archived rows per table."""
+        return cast(dict[str, int], self.header["counts"])
+
+    def iter_rows(
+        self, table_name: str | None = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Stream archived rows as (table name, row) pairs.
+
+        Args:
+            table_name: Only yield rows of this table (e.g. "articles").
+        """
+        tables = {table.name: table for table in ARCHIVED_TABLES}
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            f.readline()  # Skip header
+            current: Table | None = None
+            columns: list[str] = []
+            for line in f:
+                record = json.loads(line)
+                if isinstance(record, dict):
+                    current = tables[record["table"]]
+                    columns = record["columns"]
+                    continue
+                if current is None:
+                    continue
+                if table_name is None or current.name == table_name:
+                    yield current.name, _decode_row(current, columns, record)
+
+    def rows(self, table_name: str) -> list[dict[str, Any]]:
+        """Get all archived rows of a table."""
+        return [row for _, row in self.iter_rows(table_name)]
+
+
+class ArchiveService:
+    """Move archived editions between hot tables and cold storage files."""
+
+    def __init__(self, session: AsyncSession, archive_dir: str | None = None):
+        self.session = session
+        self.archive_dir = archive_dir or settings.archive_dir
+
+    async def _get_edition(self, edition_id: str) -> Edition:
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        return edition
+
+    @staticmethod
+    def _edition_filter(table: Table, edition_id: str) -> ColumnElement[bool]:
+        """Build the WHERE clause selecting an edition's rows in a table."""
+        if "edition_id" in table.c:
+            return table.c.edition_id == edition_id
+        list_ids = select(ItemList.id).where(ItemList.edition_id == edition_id)
+        return table.c.item_list_id.in_(list_ids)
+
+    async def count_hot_rows(self, edition_id: str) -> dict[str, int]:
+        """Count an edition's rows still present in the hot tables."""
+        counts = {}
+        for table in ARCHIVED_TABLES:
+            result = await self.session.execute(
+                select(func.count())
+                .select_from(table)
+                .where(self._edition_filter(table, edition_id))
+            )
+            counts[table.name] = result.scalar_one()
+        return counts
+
+    async def open_archive(self, edition_id: str) -> ArchiveReader:
+        """Open the read-only archive of an edition for historical reports.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+            ArchiveNotFoundError: If the edition has no cold storage archive.
+        """
+        edition = await self._get_edition(edition_id)
+        if edition.archive_path is None:
+            raise ArchiveNotFoundError(edition_id)
+        return ArchiveReader(edition.archive_path)
+
+    async def archive_edition(self, edition_id: str) -> ArchiveSummary:
+        """Move an archived edition's rows into its cold storage file.
+
+        The file is fully written before any row is deleted, and deletions
+        happen in the caller's transaction.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+            EditionNotArchivedError: If the edition status is not ARCHIVED.
+        """
+        edition = await self._get_edition(edition_id)
+        if edition.status != EditionStatus.ARCHIVED.value:
+            raise EditionNotArchivedError(edition_id)
+
+        # Rows are already in cold storage: only a restore brings them back
+        if edition.archive_path is not None:
+            return ArchiveSummary(
+                edition_id=edition_id,
+                path=edition.archive_path,
+                counts=ArchiveReader(edition.archive_path).counts,
+            )
+
+        sections: list[tuple[Table, list[tuple[Any, ...]]]] = []
+        for table in ARCHIVED_TABLES:
+            result = await self.session.execute(
+                select(table).where(self._edition_filter(table, edition_id))
+            )
+            sections.append((table, [tuple(row) for row in result]))
+
+        path = get_archive_path(edition_id, self.archive_dir)
+        counts = {table.name: len(rows) for table, rows in sections}
+        await asyncio.to_thread(self._write_archive, path, edition_id, sections, counts)
+
+        for table, _ in reversed(sections):
+            await self.session.execute(
+                delete(table).where(self._edition_filter(table, edition_id))
+            )
+        edition.archive_path = str(path)
+        await self.session.flush()
+        await cache_coherence.invalidate(self.session, edition_id, EDITION_SCOPE)
+
+        return ArchiveSummary(edition_id=edition_id, path=str(path), counts=counts)
+
+    async def restore_edition(self, edition_id: str) -> ArchiveSummary:
+        """Re-insert an edition's archived rows into the hot tables.
+
+        The archive file is kept on disk as a backup and is overwritten by the
+        next archive run.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+            ArchiveNotFoundError: If the edition has no cold storage archive.
+        """
+        edition = await self._get_edition(edition_id)
+        if edition.archive_path is None:
+            raise ArchiveNotFoundError(edition_id)
+
+        reader = ArchiveReader(edition.archive_path)
+        for table in ARCHIVED_TABLES:
+            rows = reader.rows(table.name)
+            if rows:
+                await self.session.execute(insert(table), rows)
+
+        path = edition.archive_path
+        edition.archive_path = None
+        await self.session.flush()
+        await cache_coherence.invalidate(self.session, edition_id, EDITION_SCOPE)
+
+        return ArchiveSummary(edition_id=edition_id, path=path, counts=reader.counts)
+
+    @staticmethod
+    def _write_archive(
+        path: Path,
+        edition_id: str,
+        sections: list[tuple[Table, list[tuple[Any, ...]]]],
+        counts: dict[str, int],
+    ) -> None:
+        """Write the compressed archive file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        header = {
+            "format": ARCHIVE_FORMAT_VERSION,
+            "edition_id": edition_id,
+            "archived_at": datetime.now(UTC).isoformat(),
+            "counts": counts,
+        }
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+            for table, rows in sections:
+                columns = [column.name for column in table.columns]
+                f.write(json.dumps({"table": table.name, "columns": columns}) + "\n")
+                for row in rows:
+                    values = [_encode_value(value) for value in row]
+                    f.write(json.dumps(values, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, path)
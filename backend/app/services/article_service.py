@@ -0,0 +1,202 @@
+"""Article declaration by depositors."""
+
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleNotFoundError,
+    DeclarationDeadlinePassedError,
+    EditionNotFoundError,
+    InvalidPriceError,
+    ItemListLockedError,
+    ItemListNotFoundError,
+    MaxArticlesExceededError,
+    MaxClothingExceededError,
+    ValidationError,
+)
+from app.models import Article, Edition
+from app.models.article import (
+    CATEGORY_ORDER,
+    CLOTHING_CATEGORIES,
+    MAX_ARTICLES_PER_LIST,
+    MAX_CLOTHING_PER_LIST,
+    MAX_PRICES,
+    MIN_PRICE,
+)
+from app.models.base import generate_uuid
+from app.models.item_list import ListStatus
+from app.repositories.article_repository import ArticleRepository
+from app.repositories.item_list_repository import ItemListRepository
+from app.schemas.article import ArticleInput, ArticleListDiff
+from app.services.audit_service import AuditEvent, audit_log
+from app.services.cache_coherence import LIST_SCOPE, cache_coherence
+
+# Columns a depositor edits; everything else is managed by the application
+EDITABLE_COLUMNS = (
+    "description",
+    "category",
+    "size",
+    "brand",
+    "color",
+    "price",
+    "is_lot",
+    "lot_quantity",
+    "conformity_certified",
+    "line_number",
+)
+
+
+def validate_articles(articles: Sequence[tuple[str, Decimal]]) -> None:
+    """Check list limits and prices over the whole list, in memory.
+
+    Args:
+        articles: Category and price of every article of the list.
+
+    Raises:
+        MaxArticlesExceededError: Above 24 articles (a lot counts as one).
+        MaxClothingExceededError: Above 12 clothing articles.
+        InvalidPriceError: If a price is outside its category range.
+    """
+    if len(articles) > MAX_ARTICLES_PER_LIST:
+        raise MaxArticlesExceededError(MAX_ARTICLES_PER_LIST)
+    clothing = sum(1 for category, _ in articles if category in CLOTHING_CATEGORIES)
+    if clothing > MAX_CLOTHING_PER_LIST:
+        raise MaxClothingExceededError(MAX_CLOTHING_PER_LIST)
+    for category, price in articles:
+        max_price = MAX_PRICES.get(category, MAX_PRICES["default"])
+        if not MIN_PRICE <= price <= max_price:
+            raise InvalidPriceError(str(price), str(MIN_PRICE), str(max_price))
+
+
+def number_articles(articles: list[ArticleInput]) -> list[dict[str, Any]]:
+    """Get the column values of each article, numbered 1 to N.
+
+    Articles are sorted by category order; within a category the
+    depositor's order is kept.
+    """
+    ordered = sorted(
+        enumerate(articles),
+        key=lambda item: (CATEGORY_ORDER[item[1].category.value], item[0]),
+    )
+    rows = []
+    for line_number, (_, article) in enumerate(ordered, start=1):
+        row = article.model_dump(exclude={"id"})
+        row["category"] = article.category.value
+        row["line_number"] = line_number
+        row["id"] = article.id
+        rows.append(row)
+    return rows
+
+
+def _audit_price_change(
+    article_id: str, old_price: Decimal, new_price: Decimal, actor_id: str | None
+) -> None:
+    audit_log.record(
+        AuditEvent.PRICE_CHANGED,
+        "article",
+        article_id,
+        actor_id=actor_id,
+        details={"old_price": str(old_price), "new_price": str(new_price)},
+    )
+
+
+class ArticleService:
+    """Declaration of a depositor's articles."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save_list(
+        self,
+        edition_id: str,
+        item_list_id: str,
+        articles: list[ArticleInput],
+        depositor_id: str | None = None,
+    ) -> ArticleListDiff:
+        """Replace a list's articles with the submitted state.
+
+        The submitted list is validated as a whole, then diffed against the
+        stored rows: only new, changed and removed articles are written,
+        with at most one DELETE, one multi-row INSERT and one executemany
+        UPDATE. The transaction is committed here rather than at the end of
+        the request, so the edition's `cache_versions` counter row, locked
+        by the invalidation, is released before the list is read back.
+
+        The list row is locked before its status and articles are read, so
+        concurrent saves of one list are diffed one after the other. Price
+        changes of stored articles are audited once committed.
+
+        Raises:
+            ItemListNotFoundError: If the list is not in the edition, or not
+                owned by `depositor_id` when given.
+            DeclarationDeadlinePassedError: If declarations are closed.
+            ItemListLockedError: If the list is no longer a draft.
+            ArticleNotFoundError: If a submitted ID is not in the list.
+            ValidationError: If a limit, a price or an ID is invalid.
+        """
+        item_list = await ItemListRepository(self.session).get_in_edition(
+            edition_id, item_list_id, for_update=True
+        )
+        if item_list is None or (
+            depositor_id is not None and item_list.depositor_id != depositor_id
+        ):
+            raise ItemListNotFoundError(item_list_id)
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        if not edition.can_accept_declarations:
+            raise DeclarationDeadlinePassedError(edition_id)
+        if item_list.status != ListStatus.DRAFT.value:
+            raise ItemListLockedError(item_list_id)
+
+        validate_articles([(a.category.value, a.price) for a in articles])
+        submitted_ids = [a.id for a in articles if a.id is not None]
+        if len(submitted_ids) != len(set(submitted_ids)):
+            raise ValidationError("An article is submitted twice", field="articles")
+
+        result = await self.session.execute(
+            select(Article.id, *(getattr(Article, c) for c in EDITABLE_COLUMNS)).where(
+                Article.item_list_id == item_list_id
+            )
+        )
+        stored = {row.id: row._asdict() for row in result}
+        unknown = set(submitted_ids) - stored.keys()
+        if unknown:
+            raise ArticleNotFoundError(min(unknown))
+
+        inserts, updates = [], []
+        for row in number_articles(articles):
+            if row["id"] is None:
+                inserts.append(
+                    {**row, "id": generate_uuid(), "item_list_id": item_list_id}
+                )
+            elif any(row[c] != stored[row["id"]][c] for c in EDITABLE_COLUMNS):
+                updates.append(row)
+        deleted = stored.keys() - set(submitted_ids)
+
+        if deleted:
+            await self.session.execute(delete(Article).where(Article.id.in_(deleted)))
+        if inserts:
+            await self.session.execute(insert(Article), inserts)
+        if updates:
+            await self.session.execute(update(Article), updates)
+        if deleted or inserts or updates:
+            await cache_coherence.invalidate(
+                self.session, edition_id, LIST_SCOPE, item_list_id
+            )
+            await self.session.commit()
+        for row in updates:
+            old_price = stored[row["id"]]["price"]
+            if row["price"] != old_price:
+                _audit_price_change(row["id"], old_price, row["price"], depositor_id)
+
+        return ArticleListDiff.model_construct(
+            created=len(inserts),
+            updated=len(updates),
+            deleted=len(deleted),
+            articles=await ArticleRepository(self.session).list_summaries(item_list_id),
+        )
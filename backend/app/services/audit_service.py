@@ -0,0 +1,157 @@
+"""Audit trail of sensitive actions.
+
+Events are queued in memory by `audit_log.record()`, which does no I/O, and
+written by a background task in multi-row inserts, every
+`audit_flush_interval_seconds` or as soon as `audit_batch_size` events are
+pending. The queue is flushed on application shutdown.
+
+While the database is unavailable, events stay queued up to
+`audit_max_pending`; beyond that the oldest are dropped, counted and logged.
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models import AuditLog
+from app.models.base import async_session_factory, generate_uuid
+
+logger = logging.getLogger(__name__)
+
+
+class AuditEvent(str, Enum):
+    """Audited actions (docs/securite.md §8)."""
+
+    SALE_RECORDED = "VENTE_ENREGISTREE"
+    SALE_CANCELLED = "VENTE_ANNULEE"
+    PRICE_CHANGED = "PRIX_MODIFIE"
+    STATUS_OVERRIDDEN = "STATUT_FORCE"
+    PAYOUT_PAID = "REVERSEMENT_PAYE"
+
+
+class AuditWriter:
+    """In-memory queue of audit events written in batches."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int,
+        flush_interval: float,
+        max_pending: int = 10_000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._unlogged_drops = 0
+        self._pending: list[dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> list[dict[str, Any]]:
+        """Get the events not written yet."""
+        return list(self._pending)
+
+    def record(
+        self,
+        event: AuditEvent,
+        entity_type: str,
+        entity_id: str,
+        actor_id: str | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue an event. Never blocks and never fails the caller."""
+        self._pending.append(
+            {
+                "id": generate_uuid(),
+                "created_at": datetime.utcnow(),
+                "event": AuditEvent(event).value,
+                "actor_id": actor_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "details": details,
+            }
+        )
+        if len(self._pending) > self.max_pending:
+            self._drop_oldest()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest events above `max_pending`."""
+        overflow = len(self._pending) - self.max_pending
+        del self._pending[:overflow]
+        self.dropped += overflow
+        self._unlogged_drops += overflow
+
+    async def flush(self) -> int:
+        """Write all pending events in one multi-row insert.
+
+        On database errors the events are put back in the queue for the
+        next flush, within `max_pending`.
+
+        Returns:
+            Number of events written.
+        """
+        if self._unlogged_drops:
+            logger.error(
+                "Dropped %d audit events: queue full (%d dropped in total)",
+                self._unlogged_drops,
+                self.dropped,
+            )
+            self._unlogged_drops = 0
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, []
+        try:
+            async with self.session_factory() as session:
+                await session.execute(insert(AuditLog), batch)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.exception("Failed to write %d audit events", len(batch))
+            self._pending[:0] = batch
+            if len(self._pending) > self.max_pending:
+                self._drop_oldest()
+            return 0
+        return len(batch)
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task after a last flush."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+audit_log = AuditWriter(
+    async_session_factory,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    max_pending=settings.audit_max_pending,
+)
@@ -0,0 +1,218 @@
+"""Cache coherence between uvicorn workers, through the database.
+
+Each worker keeps in-memory caches (search indexes, slot availability,
+retrieval picklists). A write that makes cached data stale calls
+`cache_coherence.invalidate()` in its transaction: this bumps the
+edition's counter in `cache_versions` and stamps the changed entity's row
+with the new version. The worker's own entries are dropped once the
+transaction commits, so a read in between cannot cache the old data again;
+a rollback drops nothing.
+
+Before serving an edition from a cache, each worker calls
+`cache_coherence.sync()`, which reads the rows above the last version it
+applied (usually none, through an index) and runs the invalidation
+handlers registered for their scope. A read that starts after a write has
+committed therefore never sees the stale entry, whichever worker served the
+write. `cache_sync_interval_seconds` spaces the checks out when a short
+staleness window is acceptable. No shared cache server is needed.
+
+Scopes:
+    - "list": articles of a list (entity: list ID);
+    - "slots": deposit slots of an edition;
+    - "retrieval": retrieval picklists (entity: list ID, or empty for all);
+    - "edition": everything cached about an edition (e.g. once archived).
+"""
+
+import time
+from collections.abc import Callable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.config import settings
+from app.models import CacheVersion
+from app.models.base import execute_dml
+
+LIST_SCOPE = "list"
+SLOTS_SCOPE = "slots"
+RETRIEVAL_SCOPE = "retrieval"
+EDITION_SCOPE = "edition"
+
+# Scope of the per-edition counter row
+_COUNTER_SCOPE = "*"
+
+# Called with the edition ID and entity ID of an invalidation
+InvalidationHandler = Callable[[str, str], None]
+
+
+async def _set_version(
+    session: AsyncSession, edition_id: str, scope: str, entity_id: str, version: int
+) -> None:
+    """Stamp an entity's row with a version, creating the row if needed."""
+    criteria = (
+        CacheVersion.edition_id == edition_id,
+        CacheVersion.scope == scope,
+        CacheVersion.entity_id == entity_id,
+    )
+    result = await execute_dml(
+        session,
+        update(CacheVersion)
+        .where(*criteria)
+        .values(version=version)
+        .execution_options(synchronize_session=False),
+    )
+    if result.rowcount == 0:
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    insert(CacheVersion).values(
+                        edition_id=edition_id,
+                        scope=scope,
+                        entity_id=entity_id,
+                        version=version,
+                    )
+                )
+        except IntegrityError:
+            # Created by a concurrent transaction, which holds the counter
+            # before us: our version is the newer one
+            await _set_version(session, edition_id, scope, entity_id, version)
+
+
+async def _next_version(session: AsyncSession, edition_id: str) -> int:
+    """Increment the edition's counter row; get the new value."""
+    criteria = (
+        CacheVersion.edition_id == edition_id,
+        CacheVersion.scope == _COUNTER_SCOPE,
+        CacheVersion.entity_id == "",
+    )
+    result = await execute_dml(
+        session,
+        update(CacheVersion)
+        .where(*criteria)
+        .values(version=CacheVersion.version + 1)
+        .execution_options(synchronize_session=False),
+    )
+    if result.rowcount == 0:
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    insert(CacheVersion).values(
+                        edition_id=edition_id,
+                        scope=_COUNTER_SCOPE,
+                        entity_id="",
+                        version=1,
+                    )
+                )
+            return 1
+        except IntegrityError:
+            # Another transaction created the counter first
+            return await _next_version(session, edition_id)
+    version = await session.execute(select(CacheVersion.version).where(*criteria))
+    return version.scalar_one()
+
+
+async def get_entity_version(
+    session: AsyncSession, edition_id: str, scope: str, entity_id: str = ""
+) -> int:
+    """Get the version of an entity's last invalidation (0 if none).
+
+    Versions only increase, so they can version HTTP responses too (ETags).
+    """
+    result = await session.execute(
+        select(CacheVersion.version).where(
+            CacheVersion.edition_id == edition_id,
+            CacheVersion.scope == scope,
+            CacheVersion.entity_id == entity_id,
+        )
+    )
+    return result.scalar_one_or_none() or 0
+
+
+class CacheCoherence:
+    """Invalidation of the worker's caches by writes from any worker."""
+
+    def __init__(self, sync_interval: float = 0.0):
+        self.sync_interval = sync_interval
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._seen: dict[str, int] = {}
+        self._next_sync: dict[str, float] = {}
+
+    def register(self, scope: str, handler: InvalidationHandler) -> None:
+        """Run a handler for every invalidation of a scope."""
+        self._handlers.setdefault(scope, []).append(handler)
+
+    def clear(self) -> None:
+        """Forget the versions applied, e.g. along with the caches."""
+        self._seen.clear()
+        self._next_sync.clear()
+
+    def _apply(self, edition_id: str, scope: str, entity_id: str) -> None:
+        for handler in self._handlers.get(scope, ()):
+            handler(edition_id, entity_id)
+
+    def _pending(self, session: Session) -> list[tuple[str, str, str]]:
+        """Get the invalidations to apply locally when the session commits."""
+        if not event.contains(session, "after_commit", self._after_commit):
+            event.listen(session, "after_commit", self._after_commit)
+            event.listen(session, "after_transaction_end", self._after_end)
+        pending: list[tuple[str, str, str]] = session.info.setdefault(self, [])
+        return pending
+
+    def _after_commit(self, session: Session) -> None:
+        # Also dispatched when a savepoint is released
+        if session.in_nested_transaction():
+            return
+        for invalidation in session.info.pop(self, ()):
+            self._apply(*invalidation)
+
+    def _after_end(self, session: Session, transaction: SessionTransaction) -> None:
+        # Rolled back: the other workers will not see the changes either
+        if transaction.parent is None:
+            session.info.pop(self, None)
+
+    async def invalidate(
+        self, session: AsyncSession, edition_id: str, scope: str, entity_id: str = ""
+    ) -> None:
+        """Invalidate cached data in every worker, with the current transaction.
+
+        Must be called in the transaction making the change; every worker,
+        this one included, drops its entries once it commits.
+        """
+        version = await _next_version(session, edition_id)
+        await _set_version(session, edition_id, scope, entity_id, version)
+        self._pending(session.sync_session).append((edition_id, scope, entity_id))
+
+    async def sync(self, session: AsyncSession, edition_id: str) -> None:
+        """Apply the invalidations of an edition committed since the last sync."""
+        now = time.monotonic()
+        if self.sync_interval and self._next_sync.get(edition_id, 0.0) > now:
+            return
+        self._next_sync[edition_id] = now + self.sync_interval
+
+        seen = self._seen.get(edition_id)
+        if seen is None:
+            # First use of the edition: nothing is cached yet
+            result = await session.execute(
+                select(CacheVersion.version).where(
+                    CacheVersion.edition_id == edition_id,
+                    CacheVersion.scope == _COUNTER_SCOPE,
+                )
+            )
+            self._seen[edition_id] = result.scalar_one_or_none() or 0
+            return
+
+        changes = await session.execute(
+            select(CacheVersion.scope, CacheVersion.entity_id, CacheVersion.version)
+            .where(CacheVersion.edition_id == edition_id, CacheVersion.version > seen)
+            .order_by(CacheVersion.version)
+        )
+        for scope, entity_id, version in changes.all():
+            if scope != _COUNTER_SCOPE:
+                self._apply(edition_id, scope, entity_id)
+            seen = max(seen, version)
+        self._seen[edition_id] = seen
+
+
+cache_coherence = CacheCoherence(settings.cache_sync_interval_seconds)
@@ -0,0 +1,112 @@
+"""Register catalog feed: versioned snapshots and incremental deltas."""
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import EditionNotFoundError
+from app.models import Article, CatalogVersion, Edition, ItemList
+from app.models.article import ArticleStatus
+from app.models.base import execute_dml
+from app.schemas.catalog import CatalogFeed
+from app.utils.money import to_cents
+
+# Article statuses a register needs to know about in a full snapshot
+CATALOG_STATUSES = (ArticleStatus.ON_SALE.value, ArticleStatus.SOLD.value)
+
+
+async def next_catalog_version(session: AsyncSession, edition_id: str) -> int:
+    """Increment and return the edition's catalog version.
+
+    Must be called in the transaction that changes article status or price,
+    and the returned value stored in `Article.change_version` of every
+    changed article. The counter row stays locked until commit, which keeps
+    versions ordered for delta readers.
+    """
+    result = await execute_dml(
+        session,
+        update(CatalogVersion)
+        .where(CatalogVersion.edition_id == edition_id)
+        .values(version=CatalogVersion.version + 1)
+        .execution_options(synchronize_session=False),
+    )
+    if result.rowcount == 0:
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    insert(CatalogVersion).values(edition_id=edition_id, version=1)
+                )
+            return 1
+        except IntegrityError:
+            # Another transaction created the counter first
+            return await next_catalog_version(session, edition_id)
+    return await get_catalog_version(session, edition_id)
+
+
+async def get_catalog_version(session: AsyncSession, edition_id: str) -> int:
+    """Get the edition's current catalog version (0 if never changed)."""
+    result = await session.execute(
+        select(CatalogVersion.version).where(CatalogVersion.edition_id == edition_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+
+class CatalogService:
+    """Build the compact catalog feed prefetched by register PWAs."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_version(self, edition_id: str) -> int:
+        """Get the edition's current catalog version.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        if await self.session.get(Edition, edition_id) is None:
+            raise EditionNotFoundError(edition_id)
+        return await get_catalog_version(self.session, edition_id)
+
+    async def get_feed(self, edition_id: str, since: int | None = None) -> CatalogFeed:
+        """Get a full catalog snapshot, or the delta since a known version.
+
+        Args:
+            edition_id: Edition whose catalog is requested.
+            since: Version returned by a previous call. When omitted, or ahead
+                of the server (e.g. after a database restore), a full snapshot
+                is returned.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        # Read the version before the rows: a change committed in between is
+        # sent again on the next delta rather than missed
+        version = await self.get_version(edition_id)
+        full = since is None or since > version
+
+        query = (
+            select(
+                Article.id,
+                Article.barcode,
+                Article.price,
+                Article.status,
+                Article.category,
+                Article.description,
+                Article.size,
+            )
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(ItemList.edition_id == edition_id)
+        )
+        if full:
+            query = query.where(Article.status.in_(CATALOG_STATUSES))
+        elif since == version:
+            return CatalogFeed.model_construct(v=version, full=False, a=[])
+        else:
+            query = query.where(Article.change_version > since)
+
+        result = await self.session.execute(query.order_by(Article.barcode))
+        rows = [
+            [id_, code, to_cents(price), status, category, description, size]
+            for id_, code, price, status, category, description, size in result
+        ]
+        return CatalogFeed.model_construct(v=version, full=full, a=rows)
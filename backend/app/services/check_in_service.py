@@ -0,0 +1,161 @@
+"""List check-in at the deposit desk."""
+
+import logging
+import re
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, String, cast, func, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleNotFoundError,
+    InvalidListCodeError,
+    ItemListNotFoundError,
+    ItemListNotValidatedError,
+)
+from app.models import Article, ItemList
+from app.models.article import ArticleStatus
+from app.models.base import execute_dml
+from app.models.item_list import ListStatus
+from app.repositories.item_list_repository import ItemListRepository
+from app.schemas.item_list import ListCheckInResult
+from app.services.catalog_service import next_catalog_version
+
+logger = logging.getLogger(__name__)
+
+# List number alone ("142", "0142") or as printed on labels ("L142",
+# "E2025-L142")
+_LIST_CODE = re.compile(r"(?:^|-)L?(\d{1,4})$", re.IGNORECASE)
+
+
+def parse_list_code(code: str) -> int:
+    """Get the list number of a scanned list code.
+
+    Raises:
+        InvalidListCodeError: If the code holds no list number.
+    """
+    match = _LIST_CODE.search(code.strip())
+    if match is None:
+        raise InvalidListCodeError(code)
+    return int(match.group(1))
+
+
+def _barcode(list_number: int) -> ColumnElement[str]:
+    """SQL expression of an article's label barcode (list and line number)."""
+    line = func.substr(literal("0") + cast(Article.line_number, String), -2)
+    return literal(f"{list_number:04d}") + line
+
+
+class CheckInService:
+    """Receive depositors' lists and put their articles on sale."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def check_in(
+        self,
+        edition_id: str,
+        code: str,
+        excluded_article_ids: Iterable[str] = (),
+    ) -> ListCheckInResult:
+        """Check a validated list in and put its articles on sale.
+
+        The list and all its validated articles change status with two
+        set-based `UPDATE`s, whatever the number of articles; rejected
+        articles (`excluded_article_ids`) stay validated, off sale. Articles
+        without a barcode get the one printed on their label.
+
+        The articles are stamped with a new catalog version, so register
+        catalogs and search indexes of every worker pick them up with their
+        next delta. The transaction is committed here, releasing the
+        catalog counter before the summary is read.
+
+        Raises:
+            InvalidListCodeError: If the code holds no list number.
+            ItemListNotFoundError: If no list of the edition has the number.
+            ItemListNotValidatedError: If the list is not validated, e.g.
+                already checked in by another volunteer.
+            ArticleNotFoundError: If an excluded article is not a validated
+                article of the list.
+        """
+        number = parse_list_code(code)
+        result = await self.session.execute(
+            select(ItemList.id, ItemList.status).where(
+                ItemList.edition_id == edition_id, ItemList.number == number
+            )
+        )
+        item_list = result.first()
+        if item_list is None:
+            raise ItemListNotFoundError(code)
+        if item_list.status != ListStatus.VALIDATED.value:
+            raise ItemListNotValidatedError(item_list.id, item_list.status)
+
+        criteria = [
+            Article.item_list_id == item_list.id,
+            Article.status == ArticleStatus.VALIDATED.value,
+        ]
+        excluded = set(excluded_article_ids)
+        if excluded:
+            result = await self.session.execute(
+                select(Article.id).where(*criteria, Article.id.in_(excluded))
+            )
+            unknown = excluded - set(result.scalars())
+            if unknown:
+                raise ArticleNotFoundError(min(unknown))
+            criteria.append(Article.id.not_in(excluded))
+
+        # Catalog counter first, then list and articles: the lock order of
+        # sales, so both queue instead of deadlocking
+        version = await next_catalog_version(self.session, edition_id)
+        checked_in = await execute_dml(
+            self.session,
+            update(ItemList)
+            .where(
+                ItemList.id == item_list.id,
+                ItemList.status == ListStatus.VALIDATED.value,
+            )
+            .values(status=ListStatus.CHECKED_IN.value, checked_in_at=datetime.utcnow())
+            .execution_options(synchronize_session=False),
+        )
+        if checked_in.rowcount == 0:
+            await self.session.rollback()
+            current = await self.session.execute(
+                select(ItemList.status).where(ItemList.id == item_list.id)
+            )
+            raise ItemListNotValidatedError(item_list.id, current.scalar_one())
+
+        put_on_sale = await execute_dml(
+            self.session,
+            update(Article)
+            .where(*criteria)
+            .values(
+                status=ArticleStatus.ON_SALE.value,
+                change_version=version,
+                barcode=func.coalesce(Article.barcode, _barcode(number)),
+            )
+            .execution_options(synchronize_session=False),
+        )
+        on_sale = put_on_sale.rowcount
+        await self.session.commit()
+        logger.info(
+            "List checked in",
+            extra={
+                "action": "liste.depot",
+                "details": {
+                    "item_list_id": item_list.id,
+                    "on_sale": on_sale,
+                    "excluded": len(excluded),
+                },
+            },
+        )
+
+        (summary,) = await ItemListRepository(self.session).list_summaries(
+            edition_id, item_list_ids=[item_list.id]
+        )
+        return ListCheckInResult.model_construct(
+            item_list=summary,
+            on_sale=on_sale,
+            excluded=len(excluded),
+            catalog_version=version,
+        )
@@ -0,0 +1,375 @@
+"""Deposit slot management and reservation.
+
+Places are counted in `DepositSlot.reserved_count`, which only changes
+through conditional updates: `UPDATE ... SET reserved_count =
+reserved_count + 1 WHERE reserved_count < capacity` checks and takes a
+place in one statement, so the database row lock serializes concurrent
+reservations and a slot can never be overbooked. The one-slot-per-week
+rule is a unique constraint on reservations, checked in the same
+transaction.
+
+Full slots are rejected from a per-worker availability view, without a
+database round trip. The view is refreshed every
+`slot_availability_ttl_seconds`, updated by the worker's own reservations
+and reloaded when any worker changes the slots (`cache_coherence`, scope
+"slots"); it only serves fast rejections and the availability endpoint,
+never the capacity check itself.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import delete, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.exceptions import (
+    DepositSlotFullError,
+    DepositSlotNotEmptyError,
+    DepositSlotNotFoundError,
+    DepositSlotResidentsOnlyError,
+    DepositSlotWeekTakenError,
+    EditionClosedError,
+    EditionNotFoundError,
+    RegistrationsClosedError,
+    SlotReservationNotFoundError,
+    ValidationError,
+)
+from app.models import DepositSlot, DepositSlotReservation, Edition, User
+from app.models.base import execute_dml, generate_uuid
+from app.models.deposit_slot import collection_week
+from app.models.edition import EditionStatus
+from app.repositories.deposit_slot_repository import DepositSlotRepository
+from app.schemas.deposit_slot import (
+    DepositSlotCreate,
+    DepositSlotSummary,
+    DepositSlotUpdate,
+    SlotAvailability,
+    SlotReservation,
+)
+from app.services.cache_coherence import (
+    EDITION_SCOPE,
+    SLOTS_SCOPE,
+    CacheCoherence,
+    cache_coherence,
+)
+
+
+@dataclass(slots=True)
+class EditionAvailability:
+    """Places left in each slot of an edition, as of `expires_at - ttl`."""
+
+    expires_at: float
+    is_open: bool
+    places: dict[str, int]
+
+
+class SlotAvailabilityCache:
+    """Per-worker view of the places left in each deposit slot."""
+
+    def __init__(self, ttl: float, coherence: CacheCoherence = cache_coherence):
+        self.ttl = ttl
+        self.coherence = coherence
+        self._editions: dict[str, EditionAvailability] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        for scope in (SLOTS_SCOPE, EDITION_SCOPE):
+            coherence.register(scope, lambda edition_id, _: self.invalidate(edition_id))
+
+    def clear(self) -> None:
+        """Forget all editions."""
+        self._editions.clear()
+
+    def invalidate(self, edition_id: str) -> None:
+        """Reload an edition's slots on next use."""
+        self._editions.pop(edition_id, None)
+
+    def set_places(self, edition_id: str, slot_id: str, places: int) -> None:
+        """Record the places left in a slot, as just read or changed."""
+        availability = self._editions.get(edition_id)
+        if availability is not None and slot_id in availability.places:
+            availability.places[slot_id] = places
+
+    def add_places(self, edition_id: str, slot_id: str, delta: int) -> None:
+        """Record places taken (negative) or released in a slot."""
+        availability = self._editions.get(edition_id)
+        if availability is not None and slot_id in availability.places:
+            availability.places[slot_id] += delta
+
+    async def get(self, session: AsyncSession, edition_id: str) -> EditionAvailability:
+        """Get an edition's availability, loaded once per TTL.
+
+        Concurrent requests wait for a single load instead of each querying.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self.coherence.sync(session, edition_id)
+        availability = self._editions.get(edition_id)
+        if availability is not None and availability.expires_at > time.monotonic():
+            return availability
+        async with self._locks.setdefault(edition_id, asyncio.Lock()):
+            availability = self._editions.get(edition_id)
+            if availability is not None and availability.expires_at > time.monotonic():
+                return availability
+
+            result = await session.execute(
+                select(Edition.status).where(Edition.id == edition_id)
+            )
+            edition_status = result.scalar_one_or_none()
+            if edition_status is None:
+                raise EditionNotFoundError(edition_id)
+            slots = await session.execute(
+                select(
+                    DepositSlot.id, DepositSlot.capacity - DepositSlot.reserved_count
+                )
+                .where(DepositSlot.edition_id == edition_id)
+                .order_by(DepositSlot.day, DepositSlot.start_time)
+            )
+            availability = EditionAvailability(
+                expires_at=time.monotonic() + self.ttl,
+                is_open=edition_status == EditionStatus.REGISTRATIONS_OPEN.value,
+                places=dict(slots.tuples().all()),
+            )
+            self._editions[edition_id] = availability
+            return availability
+
+
+slot_availability = SlotAvailabilityCache(settings.slot_availability_ttl_seconds)
+
+
+class DepositSlotService:
+    """Deposit slots of an edition and their reservations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _get_slot(self, edition_id: str, slot_id: str) -> DepositSlot:
+        slot = await DepositSlotRepository(self.session).get_in_edition(
+            edition_id, slot_id
+        )
+        if slot is None:
+            raise DepositSlotNotFoundError(slot_id)
+        return slot
+
+    async def _get_summary(self, edition_id: str, slot_id: str) -> DepositSlotSummary:
+        (summary,) = await DepositSlotRepository(self.session).list_summaries(
+            edition_id, slot_ids=[slot_id]
+        )
+        return summary
+
+    async def list_slots(self, edition_id: str) -> list[DepositSlotSummary]:
+        """Get an edition's slots with their places left.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        if await self.session.get(Edition, edition_id) is None:
+            raise EditionNotFoundError(edition_id)
+        return await DepositSlotRepository(self.session).list_summaries(edition_id)
+
+    async def get_availability(self, edition_id: str) -> list[SlotAvailability]:
+        """Get the places left in each slot, from the availability view.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        availability = await slot_availability.get(self.session, edition_id)
+        return [
+            SlotAvailability.model_construct(id=slot_id, available_places=places)
+            for slot_id, places in availability.places.items()
+        ]
+
+    async def create_slot(
+        self, edition_id: str, data: DepositSlotCreate
+    ) -> DepositSlotSummary:
+        """Add a deposit slot to an edition.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+            EditionClosedError: If the edition is closed.
+        """
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        if edition.is_closed:
+            raise EditionClosedError(edition_id)
+
+        slot = DepositSlot(
+            **data.model_dump(),
+            week=collection_week(data.day),
+            reserved_count=0,
+            edition_id=edition_id,
+        )
+        self.session.add(slot)
+        await self.session.flush()
+        await cache_coherence.invalidate(self.session, edition_id, SLOTS_SCOPE)
+        return await self._get_summary(edition_id, slot.id)
+
+    async def update_slot(
+        self, edition_id: str, slot_id: str, data: DepositSlotUpdate
+    ) -> DepositSlotSummary:
+        """Change a slot's capacity, resident restriction or description.
+
+        The capacity is changed by a conditional update, so it cannot drop
+        below the places reserved, even by a concurrent reservation.
+
+        Raises:
+            DepositSlotNotFoundError: If the slot is not in the edition.
+            ValidationError: If the capacity is below the places reserved.
+        """
+        await self._get_slot(edition_id, slot_id)
+        values = data.model_dump(exclude_unset=True, exclude_none=True)
+        if values:
+            query = update(DepositSlot).where(DepositSlot.id == slot_id)
+            if "capacity" in values:
+                query = query.where(DepositSlot.reserved_count <= values["capacity"])
+            result = await execute_dml(
+                self.session,
+                query.values(**values).execution_options(synchronize_session=False),
+            )
+            if result.rowcount == 0:
+                raise ValidationError(
+                    "Capacity is below the places already reserved", field="capacity"
+                )
+            await cache_coherence.invalidate(self.session, edition_id, SLOTS_SCOPE)
+        return await self._get_summary(edition_id, slot_id)
+
+    async def delete_slot(self, edition_id: str, slot_id: str) -> None:
+        """Delete a slot without reservations.
+
+        Raises:
+            DepositSlotNotFoundError: If the slot is not in the edition.
+            DepositSlotNotEmptyError: If places are reserved in the slot.
+        """
+        await self._get_slot(edition_id, slot_id)
+        result = await execute_dml(
+            self.session,
+            delete(DepositSlot)
+            .where(DepositSlot.id == slot_id, DepositSlot.reserved_count == 0)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount == 0:
+            raise DepositSlotNotEmptyError(slot_id)
+        await cache_coherence.invalidate(self.session, edition_id, SLOTS_SCOPE)
+
+    async def reserve(
+        self, edition_id: str, slot_id: str, depositor_id: str
+    ) -> SlotReservation:
+        """Take a place in a slot for a depositor and commit immediately.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+            RegistrationsClosedError: If registrations are not open.
+            DepositSlotNotFoundError: If the slot is not in the edition.
+            DepositSlotFullError: If no place is left, including when the
+                last one was taken by a concurrent reservation.
+            DepositSlotResidentsOnlyError: If the slot is reserved to local
+                residents and the depositor is not one.
+            DepositSlotWeekTakenError: If the depositor already has a slot
+                in the same week.
+        """
+        # Fast path: answered from memory for closed editions and full slots
+        availability = await slot_availability.get(self.session, edition_id)
+        if not availability.is_open:
+            raise RegistrationsClosedError(edition_id)
+        places = availability.places.get(slot_id)
+        if places is None:
+            raise DepositSlotNotFoundError(slot_id)
+        if places <= 0:
+            raise DepositSlotFullError(slot_id)
+
+        is_resident = (
+            select(User.id)
+            .where(User.id == depositor_id, User.is_local_resident.is_(True))
+            .exists()
+        )
+        result = await execute_dml(
+            self.session,
+            update(DepositSlot)
+            .where(
+                DepositSlot.id == slot_id,
+                DepositSlot.reserved_count < DepositSlot.capacity,
+                or_(DepositSlot.is_local_only.is_(False), is_resident),
+            )
+            .values(reserved_count=DepositSlot.reserved_count + 1)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount == 0:
+            await self.session.rollback()
+            raise await self._rejection(edition_id, slot_id, depositor_id)
+
+        reservation = SlotReservation.model_construct(
+            id=generate_uuid(), slot_id=slot_id, depositor_id=depositor_id
+        )
+        try:
+            await self.session.execute(
+                insert(DepositSlotReservation).from_select(
+                    ["id", "slot_id", "depositor_id", "edition_id", "week"],
+                    select(
+                        literal(reservation.id),
+                        DepositSlot.id,
+                        literal(depositor_id),
+                        DepositSlot.edition_id,
+                        DepositSlot.week,
+                    ).where(DepositSlot.id == slot_id),
+                )
+            )
+            await self.session.commit()
+        except IntegrityError:
+            # Releases the place taken above
+            await self.session.rollback()
+            raise DepositSlotWeekTakenError(slot_id) from None
+
+        slot_availability.add_places(edition_id, slot_id, -1)
+        return reservation
+
+    async def _rejection(
+        self, edition_id: str, slot_id: str, depositor_id: str
+    ) -> Exception:
+        """Explain why a reservation's conditional update matched no row."""
+        result = await self.session.execute(
+            select(
+                DepositSlot.is_local_only,
+                DepositSlot.capacity - DepositSlot.reserved_count,
+            ).where(DepositSlot.id == slot_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return DepositSlotNotFoundError(slot_id)
+        is_local_only, places = row
+        if is_local_only:
+            user = await self.session.get(User, depositor_id)
+            if user is None or not user.is_local_resident:
+                return DepositSlotResidentsOnlyError(slot_id)
+        slot_availability.set_places(edition_id, slot_id, places)
+        return DepositSlotFullError(slot_id)
+
+    async def cancel_reservation(
+        self, edition_id: str, slot_id: str, depositor_id: str
+    ) -> None:
+        """Release a depositor's place in a slot and commit immediately.
+
+        Raises:
+            SlotReservationNotFoundError: If the depositor has no
+                reservation in the slot.
+        """
+        result = await execute_dml(
+            self.session,
+            delete(DepositSlotReservation).where(
+                DepositSlotReservation.slot_id == slot_id,
+                DepositSlotReservation.edition_id == edition_id,
+                DepositSlotReservation.depositor_id == depositor_id,
+            ),
+        )
+        if result.rowcount == 0:
+            raise SlotReservationNotFoundError(slot_id)
+        await self.session.execute(
+            update(DepositSlot)
+            .where(DepositSlot.id == slot_id)
+            .values(reserved_count=DepositSlot.reserved_count - 1)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        slot_availability.add_places(edition_id, slot_id, 1)
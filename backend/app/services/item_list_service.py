@@ -0,0 +1,371 @@
+"""Depositor list management: duplication and reuse across editions."""
+
+from typing import Any
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleNotFoundError,
+    DeclarationDeadlinePassedError,
+    EditionNotFoundError,
+    ItemListLockedError,
+    ItemListNotEmptyError,
+    ItemListNotFoundError,
+    MaxListsExceededError,
+)
+from app.models import Article, Edition, ItemList, User
+from app.models.article import ArticleStatus
+from app.models.base import generate_uuid, sql_uuid
+from app.models.item_list import MAX_LISTS_PER_DEPOSITOR, ListStatus, label_color
+from app.repositories.article_repository import ArticleRepository
+from app.repositories.item_list_repository import ItemListRepository
+from app.schemas.article import ArticleSummary
+from app.services.article_service import validate_articles
+from app.services.cache_coherence import LIST_SCOPE, cache_coherence
+from app.services.list_number_service import ListNumberAllocator
+
+# Article attributes carried over by a copy; status, barcode, notes and
+# sales are not
+COPIED_COLUMNS = (
+    "description",
+    "category",
+    "size",
+    "brand",
+    "color",
+    "price",
+    "is_lot",
+    "lot_quantity",
+    "conformity_certified",
+)
+
+
+class ItemListService:
+    """Create lists from existing ones."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _get_open_edition(self, edition_id: str) -> Edition:
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        if not edition.can_accept_declarations:
+            raise DeclarationDeadlinePassedError(edition_id)
+        return edition
+
+    async def _get_list(
+        self, edition_id: str, item_list_id: str, depositor_id: str | None = None
+    ) -> ItemList:
+        """Get a list of the edition, owned by `depositor_id` if given."""
+        item_list = await ItemListRepository(self.session).get_in_edition(
+            edition_id, item_list_id
+        )
+        if item_list is None or (
+            depositor_id is not None and item_list.depositor_id != depositor_id
+        ):
+            raise ItemListNotFoundError(item_list_id)
+        return item_list
+
+    async def _new_list(
+        self, edition_id: str, depositor_id: str, list_type: str
+    ) -> ItemList:
+        """Add a draft list with the next number of its type.
+
+        The depositor's row is locked while their lists are counted, so two
+        concurrent requests cannot both take the last list allowed.
+
+        Raises:
+            MaxListsExceededError: If the depositor has all the lists of
+                this type allowed in an edition.
+            ListNumbersExhaustedError: If the type's numbers are used up.
+        """
+        await self.session.execute(
+            select(User.id).where(User.id == depositor_id).with_for_update()
+        )
+        max_lists = MAX_LISTS_PER_DEPOSITOR[list_type]
+        result = await self.session.execute(
+            select(func.count(ItemList.id)).where(
+                ItemList.edition_id == edition_id,
+                ItemList.depositor_id == depositor_id,
+                ItemList.list_type == list_type,
+            )
+        )
+        if result.scalar_one() >= max_lists:
+            raise MaxListsExceededError(max_lists)
+        number = await ListNumberAllocator(self.session).allocate(edition_id, list_type)
+        item_list = ItemList(
+            number=number,
+            list_type=list_type,
+            label_color=label_color(list_type, number),
+            status=ListStatus.DRAFT.value,
+            edition_id=edition_id,
+            depositor_id=depositor_id,
+        )
+        self.session.add(item_list)
+        await self.session.flush()
+        return item_list
+
+    async def create_list(
+        self, edition_id: str, depositor_id: str, list_type: str
+    ) -> str:
+        """Create an empty draft list for a depositor.
+
+        Returns:
+            The ID of the new list.
+
+        Raises:
+            DeclarationDeadlinePassedError: If declarations are closed.
+            MaxListsExceededError: If the depositor has all the lists of
+                this type allowed in an edition.
+            ListNumbersExhaustedError: If the type's numbers are used up.
+        """
+        await self._get_open_edition(edition_id)
+        item_list = await self._new_list(edition_id, depositor_id, list_type)
+        return item_list.id
+
+    async def delete_list(
+        self, edition_id: str, item_list_id: str, depositor_id: str | None = None
+    ) -> None:
+        """Delete an empty draft list, giving its number back for reuse.
+
+        Raises:
+            ItemListNotFoundError: If the list is not in the edition, or not
+                owned by `depositor_id` when given.
+            ItemListNotEmptyError: If the list has articles or is not a
+                draft.
+        """
+        item_list = await self._get_list(edition_id, item_list_id, depositor_id)
+        result = await self.session.execute(
+            select(func.count(Article.id)).where(Article.item_list_id == item_list_id)
+        )
+        if item_list.status != ListStatus.DRAFT.value or result.scalar_one():
+            raise ItemListNotEmptyError(item_list_id)
+        await self.session.delete(item_list)
+        await self.session.flush()
+        await ListNumberAllocator(self.session).release(
+            edition_id, item_list.list_type, item_list.number
+        )
+
+    async def _validate_selection(self, criteria: list[Any]) -> int:
+        """Check the limits of the selected articles; get their count."""
+        result = await self.session.execute(
+            select(Article.category, Article.price).where(*criteria)
+        )
+        rows = result.tuples().all()
+        validate_articles(rows)
+        return len(rows)
+
+    async def _copy_articles(self, criteria: list[Any], target_list_id: str) -> None:
+        """Copy the selected articles into a list with one INSERT ... SELECT.
+
+        Copies are drafts without barcode, numbered 1..N in source order.
+        """
+        columns = [getattr(Article, name) for name in COPIED_COLUMNS]
+        await self.session.execute(
+            insert(Article).from_select(
+                [
+                    "id",
+                    *COPIED_COLUMNS,
+                    "line_number",
+                    "status",
+                    "change_version",
+                    "item_list_id",
+                ],
+                select(
+                    sql_uuid(),
+                    *columns,
+                    func.row_number().over(order_by=Article.line_number),
+                    literal(ArticleStatus.DRAFT.value),
+                    literal(0),
+                    literal(target_list_id),
+                ).where(*criteria),
+            )
+        )
+
+    async def _create_copy(
+        self,
+        source: ItemList,
+        edition_id: str,
+        criteria: list[Any],
+        skip_empty: bool = False,
+    ) -> ItemList | None:
+        """Create a draft list holding a copy of the selected articles.
+
+        Returns:
+            The new list, or None if no article is selected and `skip_empty`.
+        """
+        count = await self._validate_selection(criteria)
+        if count == 0 and skip_empty:
+            return None
+        item_list = await self._new_list(
+            edition_id, source.depositor_id, source.list_type
+        )
+        if count:
+            await self._copy_articles(criteria, item_list.id)
+            await cache_coherence.invalidate(
+                self.session, edition_id, LIST_SCOPE, item_list.id
+            )
+        return item_list
+
+    async def duplicate_list(
+        self,
+        edition_id: str,
+        item_list_id: str,
+        target_edition_id: str | None = None,
+        article_ids: list[str] | None = None,
+        depositor_id: str | None = None,
+    ) -> str:
+        """Copy a list, or some of its articles, into a new draft list.
+
+        The new list belongs to the same depositor, in the same edition or in
+        `target_edition_id`, which must accept declarations.
+
+        Returns:
+            The ID of the new list.
+
+        Raises:
+            ItemListNotFoundError: If the list is not in the edition, or not
+                owned by `depositor_id` when given.
+            ArticleNotFoundError: If a selected article is not in the list.
+            DeclarationDeadlinePassedError: If the target edition is closed
+                to declarations.
+            MaxListsExceededError: If the depositor has all the lists of
+                this type allowed in the target edition.
+            ValidationError: If the copy breaks list limits or price ranges.
+        """
+        source = await self._get_list(edition_id, item_list_id, depositor_id)
+        target_edition_id = target_edition_id or edition_id
+        await self._get_open_edition(target_edition_id)
+
+        criteria: list[Any] = [Article.item_list_id == item_list_id]
+        if article_ids is not None:
+            criteria.append(Article.id.in_(article_ids))
+            result = await self.session.execute(select(Article.id).where(*criteria))
+            unknown = set(article_ids) - set(result.scalars())
+            if unknown:
+                raise ArticleNotFoundError(min(unknown))
+
+        item_list = await self._create_copy(source, target_edition_id, criteria)
+        assert item_list is not None  # only skipped with skip_empty
+        return item_list.id
+
+    async def copy_cohort(
+        self,
+        source_edition_id: str,
+        target_edition_id: str,
+        depositor_ids: list[str],
+    ) -> list[str]:
+        """Copy the unsold articles of depositors' lists into a new edition.
+
+        Unsold articles are those put on sale and not sold: unsold or
+        retrieved. Sold, donated and never offered articles are not copied.
+        Each source list with unsold articles gets a draft copy in the target
+        edition; other lists are skipped.
+
+        Returns:
+            The IDs of the new lists.
+
+        Raises:
+            EditionNotFoundError: If an edition does not exist.
+            DeclarationDeadlinePassedError: If the target edition is closed
+                to declarations.
+            MaxListsExceededError: If a depositor would get more lists of a
+                type than allowed in the target edition.
+        """
+        if await self.session.get(Edition, source_edition_id) is None:
+            raise EditionNotFoundError(source_edition_id)
+        await self._get_open_edition(target_edition_id)
+
+        result = await self.session.execute(
+            select(ItemList)
+            .where(
+                ItemList.edition_id == source_edition_id,
+                ItemList.depositor_id.in_(depositor_ids),
+            )
+            .order_by(ItemList.number)
+        )
+        copies = []
+        for source in result.scalars().all():
+            item_list = await self._create_copy(
+                source,
+                target_edition_id,
+                [
+                    Article.item_list_id == source.id,
+                    Article.status.in_(
+                        (ArticleStatus.UNSOLD.value, ArticleStatus.RETRIEVED.value)
+                    ),
+                ],
+                skip_empty=True,
+            )
+            if item_list is not None:
+                copies.append(item_list.id)
+        return copies
+
+    async def duplicate_article(
+        self,
+        edition_id: str,
+        item_list_id: str,
+        article_id: str,
+        depositor_id: str | None = None,
+    ) -> ArticleSummary:
+        """Copy an article right after itself in its draft list.
+
+        Raises:
+            ItemListNotFoundError: If the list is not in the edition, or not
+                owned by `depositor_id` when given.
+            ArticleNotFoundError: If the article is not in the list.
+            DeclarationDeadlinePassedError: If declarations are closed.
+            ItemListLockedError: If the list is no longer a draft.
+            ValidationError: If the copy breaks list limits.
+        """
+        item_list = await self._get_list(edition_id, item_list_id, depositor_id)
+        await self._get_open_edition(edition_id)
+        if item_list.status != ListStatus.DRAFT.value:
+            raise ItemListLockedError(item_list_id)
+
+        result = await self.session.execute(
+            select(
+                Article.id, Article.category, Article.price, Article.line_number
+            ).where(Article.item_list_id == item_list_id)
+        )
+        rows = result.all()
+        source = next((row for row in rows if row.id == article_id), None)
+        if source is None:
+            raise ArticleNotFoundError(article_id)
+        validate_articles(
+            [(row.category, row.price) for row in rows]
+            + [(source.category, source.price)]
+        )
+
+        await self.session.execute(
+            update(Article)
+            .where(
+                Article.item_list_id == item_list_id,
+                Article.line_number > source.line_number,
+            )
+            .values(line_number=Article.line_number + 1)
+            .execution_options(synchronize_session=False)
+        )
+        new_id = generate_uuid()
+        await self.session.execute(
+            insert(Article).from_select(
+                ["id", *COPIED_COLUMNS, "line_number", "status", "item_list_id"],
+                select(
+                    literal(new_id),
+                    *(getattr(Article, name) for name in COPIED_COLUMNS),
+                    literal(source.line_number + 1),
+                    literal(ArticleStatus.DRAFT.value),
+                    literal(item_list_id),
+                ).where(Article.id == article_id),
+            )
+        )
+        await cache_coherence.invalidate(
+            self.session, edition_id, LIST_SCOPE, item_list_id
+        )
+        result = await self.session.execute(
+            ArticleRepository(self.session)
+            .project(ArticleSummary)
+            .where(Article.id == new_id)
+        )
+        return ArticleSummary.from_row(result.one())
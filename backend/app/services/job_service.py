@@ -0,0 +1,200 @@
+"""Background jobs: reports and other tasks too long for a request.
+
+`JobService.submit()` records a pending job and starts its handler in a
+task of the worker that received the request, with a session of its own.
+Status and result location are stored in the `jobs` table, so any worker
+answers the polling requests; result files are written to
+`job_output_dir`.
+
+Handlers are registered per job kind with `job_runner.register()` by the
+modules defining them. They get the job parameters and return the result
+file's content, media type and download name.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.exceptions import JobNotFoundError, JobResultNotReadyError
+from app.models import Job
+from app.models.base import async_session_factory
+from app.models.job import JobStatus
+from app.schemas.job import JobSummary
+from app.utils.html_document import html_to_pdf
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobResult:
+    """File produced by a job."""
+
+    content: bytes
+    media_type: str
+    filename: str
+
+
+async def html_result(html: str, output_format: str, filename: str) -> JobResult:
+    """Job result of an HTML page, as is ("html") or rendered as PDF ("pdf")."""
+    if output_format == "pdf":
+        content = await asyncio.to_thread(html_to_pdf, html)
+        return JobResult(content, "application/pdf", f"{filename}.pdf")
+    return JobResult(html.encode(), "text/html; charset=utf-8", f"{filename}.html")
+
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[JobResult]]
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+async def _get_job(session: AsyncSession, job_id: str) -> Job:
+    job = await session.get(Job, job_id, populate_existing=True)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return job
+
+
+class JobRunner:
+    """Run job handlers in background tasks of the worker."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], output_dir: str
+    ):
+        self.session_factory = session_factory
+        self.output_dir = output_dir
+        self._handlers: dict[str, JobHandler] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Set the handler of a job kind."""
+        self._handlers[kind] = handler
+
+    def start(self, job: Job) -> None:
+        """Run a committed job in a background task."""
+        if job.kind not in self._handlers:
+            raise ValueError(f"No handler for job kind {job.kind!r}")
+        task = asyncio.create_task(self._run(job.id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        """Wait for the running jobs to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job_id: str) -> None:
+        async with self.session_factory() as session:
+            job = await _get_job(session, job_id)
+            kind, params = job.kind, job.params
+            job.status = JobStatus.RUNNING.value
+            await session.commit()
+            try:
+                result = await self._handlers[kind](session, params)
+                path = Path(self.output_dir) / (job_id + Path(result.filename).suffix)
+                await asyncio.to_thread(_write_file, path, result.content)
+            except Exception as exc:
+                logger.exception(
+                    "Job failed",
+                    extra={
+                        "action": "job.failed",
+                        "details": {"job_id": job_id, "kind": kind},
+                    },
+                )
+                await session.rollback()
+                job = await _get_job(session, job_id)
+                job.status = JobStatus.FAILED.value
+                job.message = str(exc)[:255]
+            else:
+                job.status = JobStatus.COMPLETED.value
+                job.progress = 100
+                job.result_path = str(path)
+                job.result_type = result.media_type
+                job.result_name = result.filename
+            job.completed_at = datetime.utcnow()
+            await session.commit()
+
+
+job_runner = JobRunner(async_session_factory, settings.job_output_dir)
+
+
+class JobService:
+    """Submit background jobs and follow them up."""
+
+    def __init__(self, session: AsyncSession, runner: JobRunner = job_runner):
+        self.session = session
+        self.runner = runner
+
+    async def submit(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        edition_id: str | None = None,
+        created_by_id: str | None = None,
+    ) -> JobSummary:
+        """Record a job and start it.
+
+        Commits the session, so the job's task finds the job and the data
+        written before it.
+        """
+        job = Job(
+            kind=kind,
+            params=params,
+            edition_id=edition_id,
+            created_by_id=created_by_id,
+            status=JobStatus.PENDING.value,
+            progress=0,
+            created_at=datetime.utcnow(),
+        )
+        self.session.add(job)
+        await self.session.commit()
+        self.runner.start(job)
+        return self._summary(job)
+
+    async def get_summary(self, job_id: str) -> JobSummary:
+        """Get a job's status.
+
+        Raises:
+            JobNotFoundError: If the job does not exist.
+        """
+        return self._summary(await _get_job(self.session, job_id))
+
+    async def get_result(self, job_id: str) -> tuple[Path, str, str]:
+        """Get a completed job's result file, media type and download name.
+
+        Raises:
+            JobNotFoundError: If the job does not exist.
+            JobResultNotReadyError: If the job is not completed.
+        """
+        job = await _get_job(self.session, job_id)
+        if (
+            job.status != JobStatus.COMPLETED.value
+            or job.result_path is None
+            or job.result_type is None
+            or job.result_name is None
+        ):
+            raise JobResultNotReadyError(job_id)
+        return Path(job.result_path), job.result_type, job.result_name
+
+    @staticmethod
+    def _summary(job: Job) -> JobSummary:
+        completed = job.status == JobStatus.COMPLETED.value
+        return JobSummary.model_construct(
+            id=job.id,
+            kind=job.kind,
+            status=job.status,
+            progress=job.progress,
+            message=job.message,
+            created_at=job.created_at,
+            completed_at=job.completed_at,
+            result_url=f"/api/v1/jobs/{job.id}/download" if completed else None,
+        )
@@ -0,0 +1,161 @@
+"""List number allocation.
+
+Each edition and list type has a counter row holding the next number.
+Numbers are taken with a conditional increment that also checks the end of
+the type's range, so a block of numbers is either handed out whole or not
+at all, and two registrations never get the same number. The counter
+starts after the highest number already used, which is read once per
+edition and type.
+
+With `list_number_reuse`, numbers of deleted lists are handed out again,
+smallest first, before the counter moves on.
+"""
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.exceptions import ListNumbersExhaustedError
+from app.models import ItemList, ListNumberCounter, ReleasedListNumber
+from app.models.base import execute_dml
+from app.models.item_list import LIST_NUMBER_RANGES
+
+# Attempts at claiming a released number taken by a concurrent request
+_CLAIM_ATTEMPTS = 3
+
+
+class ListNumberAllocator:
+    """Hand out list numbers of an edition, by list type."""
+
+    def __init__(self, session: AsyncSession, reuse: bool | None = None):
+        self.session = session
+        self.reuse = settings.list_number_reuse if reuse is None else reuse
+
+    async def allocate(self, edition_id: str, list_type: str) -> int:
+        """Get a number for a new list.
+
+        Raises:
+            ListNumbersExhaustedError: If the type's range is used up.
+        """
+        if self.reuse:
+            number = await self._claim_released(edition_id, list_type)
+            if number is not None:
+                return number
+        return await self._take(edition_id, list_type, 1)
+
+    async def allocate_batch(
+        self, edition_id: str, list_type: str, count: int
+    ) -> list[int]:
+        """Get consecutive numbers for several new lists in one increment.
+
+        Meant for imports (e.g. Billetweb registrations), which would
+        otherwise lock the counter once per list.
+
+        Raises:
+            ListNumbersExhaustedError: If fewer than `count` numbers are
+                left; no number is taken then.
+        """
+        if count <= 0:
+            return []
+        first = await self._take(edition_id, list_type, count)
+        return list(range(first, first + count))
+
+    async def release(self, edition_id: str, list_type: str, number: int) -> None:
+        """Give back the number of a deleted list, if reuse is enabled."""
+        if not self.reuse:
+            return
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(
+                    insert(ReleasedListNumber).values(
+                        edition_id=edition_id, list_type=list_type, number=number
+                    )
+                )
+        except IntegrityError:
+            pass  # Already released
+
+    async def _take(self, edition_id: str, list_type: str, count: int) -> int:
+        """Increment the counter by `count`; get the first number taken."""
+        _, last = LIST_NUMBER_RANGES[list_type]
+        criteria = (
+            ListNumberCounter.edition_id == edition_id,
+            ListNumberCounter.list_type == list_type,
+        )
+        result = await execute_dml(
+            self.session,
+            update(ListNumberCounter)
+            .where(*criteria, ListNumberCounter.next_number + count - 1 <= last)
+            .values(next_number=ListNumberCounter.next_number + count)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount == 0:
+            if await self._counter_exists(edition_id, list_type):
+                raise ListNumbersExhaustedError(list_type)
+            await self._create_counter(edition_id, list_type)
+            return await self._take(edition_id, list_type, count)
+
+        # The row stays locked until commit: the value read is ours
+        next_number = await self.session.execute(
+            select(ListNumberCounter.next_number).where(*criteria)
+        )
+        return next_number.scalar_one() - count
+
+    async def _counter_exists(self, edition_id: str, list_type: str) -> bool:
+        result = await self.session.execute(
+            select(ListNumberCounter.next_number).where(
+                ListNumberCounter.edition_id == edition_id,
+                ListNumberCounter.list_type == list_type,
+            )
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def _create_counter(self, edition_id: str, list_type: str) -> None:
+        """Start the counter after the highest number in use."""
+        first, last = LIST_NUMBER_RANGES[list_type]
+        result = await self.session.execute(
+            select(func.max(ItemList.number)).where(
+                ItemList.edition_id == edition_id,
+                ItemList.list_type == list_type,
+                ItemList.number.between(first, last),
+            )
+        )
+        highest = result.scalar_one()
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(
+                    insert(ListNumberCounter).values(
+                        edition_id=edition_id,
+                        list_type=list_type,
+                        next_number=first if highest is None else highest + 1,
+                    )
+                )
+        except IntegrityError:
+            pass  # Created by a concurrent request
+
+    async def _claim_released(self, edition_id: str, list_type: str) -> int | None:
+        """Take the smallest released number, if any.
+
+        Deleting the row is the claim: when a concurrent request deletes it
+        first, the next smallest is tried.
+        """
+        criteria = (
+            ReleasedListNumber.edition_id == edition_id,
+            ReleasedListNumber.list_type == list_type,
+        )
+        for _ in range(_CLAIM_ATTEMPTS):
+            result = await self.session.execute(
+                select(func.min(ReleasedListNumber.number)).where(*criteria)
+            )
+            number = result.scalar_one()
+            if number is None:
+                return None
+            claimed = await execute_dml(
+                self.session,
+                delete(ReleasedListNumber).where(
+                    *criteria, ReleasedListNumber.number == number
+                ),
+            )
+            if claimed.rowcount:
+                return number
+        return None
@@ -0,0 +1,142 @@
+"""Depositor payouts: gross sales, commission and net amount per list."""
+
+from decimal import Decimal
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import EditionNotFoundError
+from app.models import Article, Edition, ItemList, Payout
+from app.models.article import ArticleStatus
+from app.models.base import generate_uuid
+from app.models.item_list import ListStatus, ListType
+from app.models.payout import PayoutStatus
+from app.schemas.payout import PayoutSummary
+from app.utils.money import payout_cents, rate_to_basis, to_cents
+
+# Lists whose articles went on sale
+PAYABLE_LIST_STATUSES = (
+    ListStatus.CHECKED_IN.value,
+    ListStatus.RETRIEVED.value,
+    ListStatus.PAYOUT_PENDING.value,
+)
+
+# Fees deducted from each list's payout, in cents: 1 € per list 1000 and
+# 5 € for 2 lists 2000. Standard lists pay their registration fee upfront,
+# outside the application.
+LIST_FEES = {
+    ListType.STANDARD.value: 0,
+    ListType.LIST_1000.value: 100,
+    ListType.LIST_2000.value: 250,
+}
+
+# Articles that were put on sale
+OFFERED_STATUSES = (
+    ArticleStatus.ON_SALE.value,
+    ArticleStatus.SOLD.value,
+    ArticleStatus.UNSOLD.value,
+    ArticleStatus.RETRIEVED.value,
+    ArticleStatus.DONATED.value,
+)
+
+
+class PayoutService:
+    """Compute what each depositor is owed at the end of an edition."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def compute(self, edition_id: str) -> list[PayoutSummary]:
+        """Compute the pending payouts of an edition's lists.
+
+        Pending payouts are replaced, so the computation can run again after
+        a late sale or cancellation; other payouts (ready, paid or cancelled)
+        are kept.
+
+        Gross sales are summed per list by the database and the commission
+        is computed in integer cents (see `app.utils.money` for the rounding
+        rule). The list fees of the list's type (`LIST_FEES`) are deducted
+        from the net amount.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        rate = rate_to_basis(edition.commission_rate or Decimal(0))
+
+        list_ids = select(ItemList.id).where(ItemList.edition_id == edition_id)
+        await self.session.execute(
+            delete(Payout)
+            .where(
+                Payout.item_list_id.in_(list_ids),
+                Payout.status == PayoutStatus.PENDING.value,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        sold = Article.status == ArticleStatus.SOLD.value
+        result = await self.session.execute(
+            select(
+                ItemList.id,
+                ItemList.number,
+                ItemList.list_type,
+                ItemList.depositor_id,
+                func.count(Article.id),
+                func.count(case((sold, Article.id))),
+                func.coalesce(func.sum(case((sold, Article.price))), 0),
+            )
+            .join(Article, Article.item_list_id == ItemList.id)
+            .where(
+                ItemList.edition_id == edition_id,
+                ItemList.status.in_(PAYABLE_LIST_STATUSES),
+                Article.status.in_(OFFERED_STATUSES),
+                ItemList.id.not_in(select(Payout.item_list_id)),
+            )
+            .group_by(
+                ItemList.id, ItemList.number, ItemList.list_type, ItemList.depositor_id
+            )
+            .order_by(ItemList.number)
+        )
+
+        payouts = []
+        for (
+            list_id,
+            number,
+            list_type,
+            depositor_id,
+            total,
+            sold_count,
+            gross,
+        ) in result:
+            gross = to_cents(str(gross))
+            list_fees = LIST_FEES.get(list_type, 0)
+            commission, net = payout_cents(gross, rate, list_fees)
+            payouts.append(
+                PayoutSummary.model_construct(
+                    id=generate_uuid(),
+                    item_list_id=list_id,
+                    list_number=number,
+                    depositor_id=depositor_id,
+                    total_articles=total,
+                    sold_articles=sold_count,
+                    gross_amount=gross,
+                    commission_amount=commission,
+                    list_fees=list_fees,
+                    net_amount=net,
+                    status=PayoutStatus.PENDING.value,
+                )
+            )
+        if payouts:
+            await self.session.execute(
+                insert(Payout),
+                [
+                    {
+                        **payout.model_dump(exclude={"list_number"}),
+                        "unsold_articles": payout.total_articles - payout.sold_articles,
+                    }
+                    for payout in payouts
+                ],
+            )
+        return payouts
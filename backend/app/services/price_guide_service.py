@@ -0,0 +1,258 @@
+"""Price guidance for article declaration, from past editions.
+
+The sold prices and sell-through of closed and archived editions are
+aggregated once, by `PriceGuideService.rebuild()` (run when an edition is
+archived, or with `python -m app.cli price-guide`), into the
+`price_guides` table: one row per category, per category and size band,
+and per category, size band and brand seen often enough.
+
+Workers keep the whole table in memory (`price_guide`), reloaded every
+`price_guide_reload_seconds`. A lookup is at most three dictionary reads,
+from the most to the least specific row; no aggregate ever runs at
+request time.
+"""
+
+import asyncio
+import re
+import statistics
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Edition, PriceGuide
+from app.models.article import ArticleStatus
+from app.models.edition import EditionStatus
+from app.schemas.price_guide import PriceGuidance
+from app.services.analytics_service import (
+    OFFERED_STATUSES,
+    AnalyticsService,
+    EditionColumns,
+)
+from app.services.search_service import normalize
+
+# Editions whose sales are final
+SOURCE_STATUSES = (EditionStatus.CLOSED.value, EditionStatus.ARCHIVED.value)
+
+# Articles offered below which a size band or brand gets no row of its own
+MIN_ARTICLES = 10
+
+_SIZE = re.compile(r"(\d+)\s*(mois|ans?)?")
+
+CENT = Decimal("0.01")
+
+# Guide key: category, size band, brand ("" for all)
+GuideKey = tuple[str, str, str]
+
+
+def size_band(size: str | None) -> str:
+    """Group a free-text size into a band; empty if not recognized."""
+    match = _SIZE.search(size.lower()) if size else None
+    if match is None:
+        return ""
+    number, unit = int(match.group(1)), match.group(2)
+    if unit == "mois":
+        return "0–11 mois" if number < 12 else "12–36 mois"
+    if unit is not None:
+        if number <= 5:
+            return "2–5 ans"
+        return "6–10 ans" if number <= 10 else "11 ans et plus"
+    # Shoe or adult size
+    for band, high in (("16–23", 23), ("24–29", 29), ("30–35", 35)):
+        if number <= high:
+            return band
+    return "36 et plus"
+
+
+def _brand_key(brand: str | None) -> str:
+    return normalize(brand).strip() if brand else ""
+
+
+@dataclass(slots=True)
+class _Group:
+    offered: int = 0
+    prices: list[float] = field(default_factory=list)
+
+
+def _price(value: float) -> Decimal:
+    return Decimal(str(value)).quantize(CENT)
+
+
+def build_guide_rows(
+    editions: Iterable[EditionColumns], built_at: datetime
+) -> list[dict[str, Any]]:
+    """Aggregate editions' articles into price guide rows."""
+    groups: dict[GuideKey, _Group] = {}
+    count = 0
+    for columns in editions:
+        count += 1
+        articles = columns.articles
+        for category, size, brand, price, status in zip(
+            articles["category"],
+            articles["size"],
+            articles["brand"],
+            articles["price"],
+            articles["status"],
+            strict=True,
+        ):
+            if status not in OFFERED_STATUSES:
+                continue
+            band = size_band(size)
+            # The same key twice when the size band or brand is unknown
+            keys = dict.fromkeys(
+                (
+                    (category, "", ""),
+                    (category, band, ""),
+                    (category, band, _brand_key(brand)),
+                )
+            )
+            for key in keys:
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = _Group()
+                group.offered += 1
+                if status == ArticleStatus.SOLD.value:
+                    group.prices.append(float(price))
+
+    rows = []
+    for (category, band, brand), group in groups.items():
+        if (band or brand) and group.offered < MIN_ARTICLES:
+            continue
+        prices = sorted(group.prices)
+        low: float | None
+        median: float | None
+        high: float | None
+        if len(prices) >= 2:
+            low, median, high = statistics.quantiles(prices, n=4, method="inclusive")
+        elif prices:
+            low = median = high = prices[0]
+        else:
+            low = median = high = None
+        rows.append(
+            {
+                "category": category,
+                "size_band": band,
+                "brand": brand,
+                "offered": group.offered,
+                "sold": len(prices),
+                "low_price": None if low is None else _price(low),
+                "median_price": None if median is None else _price(median),
+                "high_price": None if high is None else _price(high),
+                "editions": count,
+                "built_at": built_at,
+            }
+        )
+    return rows
+
+
+class PriceGuideCache:
+    """Per-worker copy of the price guide table."""
+
+    def __init__(self, reload_interval: float):
+        self.reload_interval = reload_interval
+        self._entries: dict[GuideKey, PriceGuidance] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def clear(self) -> None:
+        """Reload the table on next use."""
+        self._entries = {}
+        self._expires_at = 0.0
+
+    def set(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Replace the entries, e.g. with just rebuilt rows."""
+        self._entries = {
+            (
+                row["category"],
+                row["size_band"],
+                row["brand"],
+            ): PriceGuidance.model_construct(
+                category=row["category"],
+                size_band=row["size_band"],
+                brand=row["brand"],
+                offered=row["offered"],
+                sold=row["sold"],
+                sell_through=round(row["sold"] / row["offered"], 4),
+                low_price=row["low_price"],
+                median_price=row["median_price"],
+                high_price=row["high_price"],
+                editions=row["editions"],
+            )
+            for row in rows
+        }
+        self._expires_at = time.monotonic() + self.reload_interval
+
+    async def _entries_for(
+        self, session: AsyncSession
+    ) -> dict[GuideKey, PriceGuidance]:
+        if self._expires_at > time.monotonic():
+            return self._entries
+        async with self._lock:
+            if self._expires_at <= time.monotonic():
+                result = await session.execute(select(PriceGuide.__table__))
+                self.set(row._asdict() for row in result)
+            return self._entries
+
+    async def lookup(
+        self,
+        session: AsyncSession,
+        category: str,
+        size: str | None = None,
+        brand: str | None = None,
+    ) -> PriceGuidance | None:
+        """Get the most specific guidance for an article, if any."""
+        entries = await self._entries_for(session)
+        band = size_band(size)
+        for key in (
+            (category, band, _brand_key(brand)),
+            (category, band, ""),
+            (category, "", ""),
+        ):
+            guidance = entries.get(key)
+            if guidance is not None:
+                return guidance
+        return None
+
+
+price_guide = PriceGuideCache(settings.price_guide_reload_seconds)
+
+
+class PriceGuideService:
+    """Build and query the historical price guidance."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def rebuild(self) -> int:
+        """Recompute the price guide from closed and archived editions.
+
+        Runs in the caller's transaction; the worker's copy is replaced at
+        once, other workers reload theirs within the reload interval.
+
+        Returns:
+            Number of guide rows.
+        """
+        result = await self.session.execute(
+            select(Edition.id).where(Edition.status.in_(SOURCE_STATUSES))
+        )
+        analytics = AnalyticsService(self.session)
+        editions = [await analytics.load(edition_id) for edition_id in result.scalars()]
+        rows = build_guide_rows(editions, built_at=datetime.utcnow())
+
+        await self.session.execute(delete(PriceGuide))
+        if rows:
+            await self.session.execute(insert(PriceGuide), rows)
+        price_guide.set(rows)
+        return len(rows)
+
+    async def lookup(
+        self, category: str, size: str | None = None, brand: str | None = None
+    ) -> PriceGuidance | None:
+        """Get the guidance for an article being declared, if any."""
+        return await price_guide.lookup(self.session, category, size, brand)
@@ -0,0 +1,338 @@
+"""Register reconciliation: running totals, drawer counts and Z-reports.
+
+Every sale and cancellation adds to its row of `register_totals` (edition,
+day of the sale, register, payment method) in its own transaction, through
+`add_to_register_total()`. Offline sales count on the day they were made:
+a late synchronization updates that day's totals incrementally, sale by
+sale, like online sales.
+
+A Z-report reads the few rows of a register and day, whatever the number
+of sales. For audit, `RegisterService.recompute()` rebuilds a day's totals
+from the sales, read through the covering index `ix_sales_register_day`,
+and reports the rows it corrected.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from html import escape
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import EditionNotFoundError
+from app.models import Edition, RegisterTotal, Sale
+from app.models.base import execute_dml
+from app.models.sale import PaymentMethod
+from app.schemas.register import RegisterLine, TotalCorrection, ZReport
+from app.utils.html_document import document, table
+
+ZERO = Decimal("0.00")
+
+# Payment method labels of the printed report
+PAYMENT_LABELS = {
+    PaymentMethod.CASH.value: "Espèces",
+    PaymentMethod.CARD.value: "Carte bancaire",
+    PaymentMethod.CHECK.value: "Chèque",
+}
+
+
+async def add_to_register_total(
+    session: AsyncSession,
+    edition_id: str,
+    day: date,
+    register_number: int,
+    payment_method: str,
+    count: int,
+    amount: Decimal,
+) -> None:
+    """Add sales to a register's running total (negative to cancel them).
+
+    Must be called in the transaction recording the sales; the total's row
+    stays locked until commit.
+    """
+    result = await execute_dml(
+        session,
+        update(RegisterTotal)
+        .where(
+            RegisterTotal.edition_id == edition_id,
+            RegisterTotal.day == day,
+            RegisterTotal.register_number == register_number,
+            RegisterTotal.payment_method == payment_method,
+        )
+        .values(
+            sale_count=RegisterTotal.sale_count + count,
+            amount=RegisterTotal.amount + amount,
+        )
+        .execution_options(synchronize_session=False),
+    )
+    if result.rowcount == 0:
+        try:
+            async with session.begin_nested():
+                await session.execute(
+                    insert(RegisterTotal).values(
+                        edition_id=edition_id,
+                        day=day,
+                        register_number=register_number,
+                        payment_method=payment_method,
+                        sale_count=count,
+                        amount=amount,
+                    )
+                )
+        except IntegrityError:
+            # Another transaction created the row first
+            await add_to_register_total(
+                session,
+                edition_id,
+                day,
+                register_number,
+                payment_method,
+                count,
+                amount,
+            )
+
+
+def _day_range(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+class RegisterService:
+    """Reconcile registers with their drawers at the end of the day."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _check_edition(self, edition_id: str) -> None:
+        if await self.session.get(Edition, edition_id) is None:
+            raise EditionNotFoundError(edition_id)
+
+    async def z_report(
+        self, edition_id: str, register_number: int, day: date
+    ) -> ZReport:
+        """Get a register's totals for a day, against its drawer count.
+
+        Every payment method has a line, with zero sales if none was used.
+        """
+        result = await self.session.execute(
+            select(
+                RegisterTotal.payment_method,
+                RegisterTotal.sale_count,
+                RegisterTotal.amount,
+                RegisterTotal.counted_amount,
+                RegisterTotal.counted_at,
+                RegisterTotal.note,
+            ).where(
+                RegisterTotal.edition_id == edition_id,
+                RegisterTotal.day == day,
+                RegisterTotal.register_number == register_number,
+            )
+        )
+        rows = {row.payment_method: row for row in result}
+        latest = max(
+            (row for row in rows.values() if row.counted_at is not None),
+            key=lambda row: row.counted_at,
+            default=None,
+        )
+
+        lines = []
+        for method in PaymentMethod:
+            row = rows.get(method.value)
+            if row is None:
+                sale_count, amount, counted = 0, ZERO, None
+            else:
+                sale_count, amount, counted = (
+                    row.sale_count,
+                    row.amount,
+                    row.counted_amount,
+                )
+            lines.append(
+                RegisterLine.model_construct(
+                    payment_method=method.value,
+                    sale_count=sale_count,
+                    amount=amount,
+                    counted_amount=counted,
+                    discrepancy=None if counted is None else counted - amount,
+                )
+            )
+
+        counted_lines = [line for line in lines if line.counted_amount is not None]
+        amount = sum((line.amount for line in lines), ZERO)
+        counted_amount = (
+            sum((line.counted_amount or ZERO for line in counted_lines), ZERO)
+            if counted_lines
+            else None
+        )
+        return ZReport.model_construct(
+            edition_id=edition_id,
+            day=day,
+            register_number=register_number,
+            lines=lines,
+            sale_count=sum(line.sale_count for line in lines),
+            amount=amount,
+            counted_amount=counted_amount,
+            discrepancy=(
+                sum((line.discrepancy or ZERO for line in counted_lines), ZERO)
+                if counted_lines
+                else None
+            ),
+            counted_at=latest.counted_at if latest else None,
+            note=latest.note if latest else None,
+        )
+
+    async def record_count(
+        self,
+        edition_id: str,
+        register_number: int,
+        day: date,
+        amounts: dict[PaymentMethod, Decimal],
+        note: str | None = None,
+        counted_by_id: str | None = None,
+    ) -> ZReport:
+        """Record the amounts counted in a register's drawer.
+
+        A new count replaces the previous one of the same payment methods.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self._check_edition(edition_id)
+        counted_at = datetime.utcnow()
+        for payment_method, counted in amounts.items():
+            method = PaymentMethod(payment_method).value
+            # Creates the row of a payment method without sales
+            await add_to_register_total(
+                self.session, edition_id, day, register_number, method, 0, ZERO
+            )
+            await self.session.execute(
+                update(RegisterTotal)
+                .where(
+                    RegisterTotal.edition_id == edition_id,
+                    RegisterTotal.day == day,
+                    RegisterTotal.register_number == register_number,
+                    RegisterTotal.payment_method == method,
+                )
+                .values(
+                    counted_amount=counted,
+                    counted_at=counted_at,
+                    counted_by_id=counted_by_id,
+                    note=note,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        return await self.z_report(edition_id, register_number, day)
+
+    async def recompute(
+        self, edition_id: str, day: date, register_number: int | None = None
+    ) -> list[TotalCorrection]:
+        """Rebuild a day's running totals from the sales.
+
+        Only the rows that differ are written.
+
+        Returns:
+            The corrected rows, with their previous values.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self._check_edition(edition_id)
+        start, end = _day_range(day)
+        criteria = [
+            Sale.edition_id == edition_id,
+            Sale.sold_at >= start,
+            Sale.sold_at < end,
+        ]
+        if register_number is not None:
+            criteria.append(Sale.register_number == register_number)
+        result = await self.session.execute(
+            select(
+                Sale.register_number,
+                Sale.payment_method,
+                func.count(),
+                func.coalesce(func.sum(Sale.price), 0),
+            )
+            .where(*criteria)
+            .group_by(Sale.register_number, Sale.payment_method)
+        )
+        actual = {
+            (register, method): (count, Decimal(str(amount)).quantize(ZERO))
+            for register, method, count, amount in result
+        }
+
+        criteria = [RegisterTotal.edition_id == edition_id, RegisterTotal.day == day]
+        if register_number is not None:
+            criteria.append(RegisterTotal.register_number == register_number)
+        result = await self.session.execute(
+            select(
+                RegisterTotal.register_number,
+                RegisterTotal.payment_method,
+                RegisterTotal.sale_count,
+                RegisterTotal.amount,
+            ).where(*criteria)
+        )
+        stored = {
+            (register, method): (count, amount)
+            for register, method, count, amount in result
+        }
+
+        corrections = []
+        for key in sorted(actual.keys() | stored.keys()):
+            count, amount = actual.get(key, (0, ZERO))
+            previous_count, previous_amount = stored.get(key, (0, ZERO))
+            if (count, amount) == (previous_count, previous_amount):
+                continue
+            await add_to_register_total(
+                self.session,
+                edition_id,
+                day,
+                *key,
+                count - previous_count,
+                amount - previous_amount,
+            )
+            corrections.append(
+                TotalCorrection.model_construct(
+                    register_number=key[0],
+                    payment_method=key[1],
+                    sale_count=count,
+                    amount=amount,
+                    previous_sale_count=previous_count,
+                    previous_amount=previous_amount,
+                )
+            )
+        return corrections
+
+
+def _money(amount: Decimal | None) -> str:
+    return "" if amount is None else f"{amount:.2f}"
+
+
+def render_z_report_html(report: ZReport) -> str:
+    """Render a Z-report as a printable page."""
+    rows = [
+        (
+            PAYMENT_LABELS.get(line.payment_method, line.payment_method),
+            line.sale_count,
+            _money(line.amount),
+            _money(line.counted_amount),
+            _money(line.discrepancy),
+        )
+        for line in report.lines
+    ]
+    rows.append(
+        (
+            "Total",
+            report.sale_count,
+            _money(report.amount),
+            _money(report.counted_amount),
+            _money(report.discrepancy),
+        )
+    )
+    sections = [
+        table(["Paiement", "Ventes", "Montant", "Compté", "Écart"], rows),
+    ]
+    if report.note:
+        sections.append(f"<p>Observations : {escape(report.note)}</p>")
+    return document(
+        f"Ticket Z — caisse {report.register_number} — {report.day:%d/%m/%Y}",
+        sections,
+    )
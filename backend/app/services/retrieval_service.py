@@ -0,0 +1,473 @@
+"""Unsold article retrieval: picklists and the retrieval desk.
+
+When the sale ends, `RetrievalService.prepare()` marks the articles still
+on sale as unsold and precomputes one picklist per list with unsold
+articles, in the `retrieval_picklists` table. Picklists are ordered as the
+bags are stored: by label color zone, then by list number.
+
+Workers serve picklists from memory (`picklists`), loaded with one query
+per edition. Processing a list at the desk updates the list, its articles
+and its picklist with one statement each, and invalidates that picklist
+only, in every worker (`cache_coherence`, scope "retrieval").
+
+Printable picklists are rendered by the "retrieval.picklists" job.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from html import escape
+from itertools import groupby
+from typing import Any
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    EditionNotFoundError,
+    ItemListAlreadyRetrievedError,
+    ItemListNotFoundError,
+)
+from app.models import Article, Edition, ItemList, RetrievalPicklist, User
+from app.models.article import ArticleStatus
+from app.models.base import execute_dml
+from app.models.item_list import LABEL_COLORS, ListStatus
+from app.schemas.job import JobSummary
+from app.schemas.retrieval import Picklist, PicklistLine, RetrievalPreparation
+from app.services.audit_service import AuditEvent, audit_log
+from app.services.cache_coherence import (
+    EDITION_SCOPE,
+    RETRIEVAL_SCOPE,
+    CacheCoherence,
+    cache_coherence,
+)
+from app.services.catalog_service import next_catalog_version
+from app.services.check_in_service import parse_list_code
+from app.services.job_service import JobResult, JobService, html_result, job_runner
+from app.utils.html_document import STYLE, document, table
+
+logger = logging.getLogger(__name__)
+
+PICKLIST_JOB = "retrieval.picklists"
+
+# Article status of each retrieval outcome
+OUTCOME_STATUSES = {
+    "retrieved": ArticleStatus.RETRIEVED.value,
+    "donated": ArticleStatus.DONATED.value,
+}
+
+# Storage zones, in the order of the label colors
+COLOR_ORDER = {color: index for index, color in enumerate(LABEL_COLORS.values())}
+
+# Label colors as printed for volunteers
+COLOR_NAMES = {
+    "sky_blue": "bleu ciel",
+    "yellow": "jaune",
+    "fuchsia": "fuchsia",
+    "lilac": "lilas",
+    "mint_green": "vert menthe",
+    "orange": "clémentine",
+    "white": "blanc",
+    "pink": "groseille",
+}
+
+LINE_COLUMNS = ("line_number", "barcode", "description", "category", "size", "price")
+
+
+def layout_key(label_color: str | None, list_number: int) -> tuple[int, int]:
+    """Sort key of a list's bag in the storage layout."""
+    return COLOR_ORDER.get(label_color or "", len(COLOR_ORDER)), list_number
+
+
+def _picklist(row: Any) -> Picklist:
+    return Picklist.model_construct(
+        item_list_id=row.item_list_id,
+        list_number=row.list_number,
+        label_color=row.label_color,
+        depositor_name=row.depositor_name,
+        lines=[
+            PicklistLine.model_construct(**{**line, "price": Decimal(line["price"])})
+            for line in row.lines
+        ],
+        outcome=row.outcome,
+        processed_at=row.processed_at,
+    )
+
+
+@dataclass(slots=True)
+class _EditionPicklists:
+    """Picklists of an edition by list number, in layout order."""
+
+    by_number: dict[int, Picklist]
+    dirty_lists: set[str] = field(default_factory=set)
+
+
+class PicklistCache:
+    """Per-worker copy of the editions' picklists."""
+
+    def __init__(self, coherence: CacheCoherence = cache_coherence):
+        self.coherence = coherence
+        self._editions: dict[str, _EditionPicklists] = {}
+        coherence.register(RETRIEVAL_SCOPE, self.invalidate)
+        coherence.register(
+            EDITION_SCOPE, lambda edition_id, _: self.discard(edition_id)
+        )
+
+    def clear(self) -> None:
+        """Drop all picklists."""
+        self._editions.clear()
+
+    def discard(self, edition_id: str) -> None:
+        """Drop an edition's picklists; the next read reloads them."""
+        self._editions.pop(edition_id, None)
+
+    def invalidate(self, edition_id: str, item_list_id: str) -> None:
+        """Reload a list's picklist, or all of them, on next read."""
+        entry = self._editions.get(edition_id)
+        if entry is None:
+            return
+        if item_list_id:
+            entry.dirty_lists.add(item_list_id)
+        else:
+            self.discard(edition_id)
+
+    async def get(self, session: AsyncSession, edition_id: str) -> dict[int, Picklist]:
+        """Get an edition's picklists by list number, in layout order."""
+        await self.coherence.sync(session, edition_id)
+        entry = self._editions.get(edition_id)
+        if entry is None:
+            rows = await self._load(session, RetrievalPicklist.edition_id == edition_id)
+            entry = self._editions[edition_id] = _EditionPicklists(
+                {row.list_number: _picklist(row) for row in rows}
+            )
+        elif entry.dirty_lists:
+            dirty, entry.dirty_lists = entry.dirty_lists, set()
+            # Positions do not change: reloaded lists keep their place
+            for row in await self._load(
+                session, RetrievalPicklist.item_list_id.in_(dirty)
+            ):
+                entry.by_number[row.list_number] = _picklist(row)
+        return entry.by_number
+
+    @staticmethod
+    async def _load(session: AsyncSession, *criteria: Any) -> list[Any]:
+        result = await session.execute(
+            select(
+                RetrievalPicklist.item_list_id,
+                RetrievalPicklist.list_number,
+                RetrievalPicklist.label_color,
+                RetrievalPicklist.depositor_name,
+                RetrievalPicklist.lines,
+                RetrievalPicklist.outcome,
+                RetrievalPicklist.processed_at,
+            )
+            .where(*criteria)
+            .order_by(RetrievalPicklist.position)
+        )
+        return list(result)
+
+
+picklists = PicklistCache()
+
+
+class RetrievalService:
+    """End the sale and hand unsold articles back to depositors."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _get_edition(self, edition_id: str) -> Edition:
+        edition = await self.session.get(Edition, edition_id)
+        if edition is None:
+            raise EditionNotFoundError(edition_id)
+        return edition
+
+    async def prepare(
+        self, edition_id: str, actor_id: str | None = None
+    ) -> RetrievalPreparation:
+        """End the sale: mark unsold articles and build the picklists.
+
+        Articles still on sale become unsold with one `UPDATE` and a new
+        catalog version, so registers stop offering them; the change is
+        audited once for the edition. Picklists of lists already processed
+        are kept; the others are rebuilt, which makes a second call after a
+        late sale cancellation safe.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self._get_edition(edition_id)
+        version = await next_catalog_version(self.session, edition_id)
+        unsold = await execute_dml(
+            self.session,
+            update(Article)
+            .where(
+                Article.status == ArticleStatus.ON_SALE.value,
+                Article.item_list_id.in_(
+                    select(ItemList.id).where(ItemList.edition_id == edition_id)
+                ),
+            )
+            .values(status=ArticleStatus.UNSOLD.value, change_version=version)
+            .execution_options(synchronize_session=False),
+        )
+
+        result = await self.session.execute(
+            select(
+                ItemList.id,
+                ItemList.number,
+                ItemList.label_color,
+                User.first_name,
+                User.last_name,
+                *(getattr(Article, name) for name in LINE_COLUMNS),
+            )
+            .join(Article, Article.item_list_id == ItemList.id)
+            .join(User, ItemList.depositor_id == User.id)
+            .where(
+                ItemList.edition_id == edition_id,
+                ItemList.status != ListStatus.RETRIEVED.value,
+                Article.status == ArticleStatus.UNSOLD.value,
+            )
+            .order_by(ItemList.number, Article.line_number)
+        )
+        built_at = datetime.utcnow()
+        rows = []
+        articles = 0
+        for (item_list_id, number, color, first_name, last_name), group in groupby(
+            result.all(), key=lambda row: tuple(row[:5])
+        ):
+            lines = [
+                {
+                    **dict(zip(LINE_COLUMNS, row[5:], strict=True)),
+                    "price": str(row.price),
+                }
+                for row in group
+            ]
+            articles += len(lines)
+            rows.append(
+                {
+                    "item_list_id": item_list_id,
+                    "edition_id": edition_id,
+                    "list_number": number,
+                    "label_color": color,
+                    "depositor_name": f"{first_name} {last_name}",
+                    "lines": lines,
+                    "built_at": built_at,
+                }
+            )
+        rows.sort(key=lambda row: layout_key(row["label_color"], row["list_number"]))
+        for position, row in enumerate(rows):
+            row["position"] = position
+
+        await self.session.execute(
+            delete(RetrievalPicklist).where(
+                RetrievalPicklist.edition_id == edition_id,
+                RetrievalPicklist.outcome.is_(None),
+            )
+        )
+        if rows:
+            await self.session.execute(insert(RetrievalPicklist), rows)
+        await cache_coherence.invalidate(self.session, edition_id, RETRIEVAL_SCOPE)
+        await self.session.commit()
+        if unsold.rowcount:
+            audit_log.record(
+                AuditEvent.STATUS_OVERRIDDEN,
+                "edition",
+                edition_id,
+                actor_id=actor_id,
+                details={
+                    "from_status": ArticleStatus.ON_SALE.value,
+                    "status": ArticleStatus.UNSOLD.value,
+                    "articles": unsold.rowcount,
+                },
+            )
+        logger.info(
+            "Retrieval prepared",
+            extra={
+                "action": "retrait.preparer",
+                "details": {"lists": len(rows), "articles": articles},
+            },
+        )
+        return RetrievalPreparation.model_construct(
+            lists=len(rows), articles=articles, catalog_version=version
+        )
+
+    async def list_picklists(
+        self, edition_id: str, label_color: str | None = None
+    ) -> list[Picklist]:
+        """Get the edition's picklists in layout order, optionally of one color."""
+        by_number = await picklists.get(self.session, edition_id)
+        return [
+            picklist
+            for picklist in by_number.values()
+            if label_color is None or picklist.label_color == label_color
+        ]
+
+    async def get_picklist(self, edition_id: str, code: str) -> Picklist:
+        """Get the picklist of a scanned list code.
+
+        Raises:
+            InvalidListCodeError: If the code holds no list number.
+            ItemListNotFoundError: If the list has no picklist.
+        """
+        number = parse_list_code(code)
+        picklist = (await picklists.get(self.session, edition_id)).get(number)
+        if picklist is None:
+            raise ItemListNotFoundError(code)
+        return picklist
+
+    async def process(
+        self, edition_id: str, code: str, outcome: str, actor_id: str | None = None
+    ) -> Picklist:
+        """Hand a list's unsold articles back, or donate them, in one call.
+
+        The picklist, the list and all its unsold articles are updated with
+        one statement each, whatever the number of articles. The picklist
+        update is conditional, so a list processed at two desks at once is
+        processed only once. The list's move to RETRIEVED is audited.
+
+        Raises:
+            InvalidListCodeError: If the code holds no list number.
+            ItemListNotFoundError: If the list has no picklist.
+            ItemListAlreadyRetrievedError: If the list was already processed.
+        """
+        picklist = await self.get_picklist(edition_id, code)
+        if picklist.outcome is not None:
+            raise ItemListAlreadyRetrievedError(picklist.item_list_id)
+
+        now = datetime.utcnow()
+        version = await next_catalog_version(self.session, edition_id)
+        result = await execute_dml(
+            self.session,
+            update(RetrievalPicklist)
+            .where(
+                RetrievalPicklist.item_list_id == picklist.item_list_id,
+                RetrievalPicklist.outcome.is_(None),
+            )
+            .values(outcome=outcome, processed_at=now)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount == 0:
+            await self.session.rollback()
+            raise ItemListAlreadyRetrievedError(picklist.item_list_id)
+        await self.session.execute(
+            update(ItemList)
+            .where(ItemList.id == picklist.item_list_id)
+            .values(status=ListStatus.RETRIEVED.value, retrieved_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        handed_back = await execute_dml(
+            self.session,
+            update(Article)
+            .where(
+                Article.item_list_id == picklist.item_list_id,
+                Article.status == ArticleStatus.UNSOLD.value,
+            )
+            .values(status=OUTCOME_STATUSES[outcome], change_version=version)
+            .execution_options(synchronize_session=False),
+        )
+        await cache_coherence.invalidate(
+            self.session, edition_id, RETRIEVAL_SCOPE, picklist.item_list_id
+        )
+        await self.session.commit()
+        audit_log.record(
+            AuditEvent.STATUS_OVERRIDDEN,
+            "liste",
+            picklist.item_list_id,
+            actor_id=actor_id,
+            details={
+                "status": ListStatus.RETRIEVED.value,
+                "outcome": outcome,
+                "articles": handed_back.rowcount,
+            },
+        )
+        logger.info(
+            "List retrieved",
+            extra={
+                "action": "retrait.liste",
+                "details": {"item_list_id": picklist.item_list_id, "outcome": outcome},
+            },
+        )
+        return picklist.model_copy(update={"outcome": outcome, "processed_at": now})
+
+    async def submit_export(
+        self,
+        edition_id: str,
+        output_format: str,
+        label_color: str | None = None,
+        created_by_id: str | None = None,
+    ) -> JobSummary:
+        """Start rendering printable picklists of the lists not processed yet.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        await self._get_edition(edition_id)
+        return await JobService(self.session).submit(
+            PICKLIST_JOB,
+            {
+                "edition_id": edition_id,
+                "format": output_format,
+                "label_color": label_color,
+            },
+            edition_id=edition_id,
+            created_by_id=created_by_id,
+        )
+
+
+PICKLIST_STYLE = (
+    STYLE
+    + """
+h2 { page-break-before: always; } h2:first-of-type { page-break-before: auto; }
+h3 { font-size: 11pt; margin: 1em 0 0.3em; }
+.liste { page-break-inside: avoid; }
+"""
+)
+
+
+def render_picklists_html(title: str, lists: list[Picklist]) -> str:
+    """Render picklists as a printable page, one section per label color."""
+    sections = []
+    for color, group in groupby(lists, key=lambda picklist: picklist.label_color):
+        sections.append(f"<h2>Étiquettes {COLOR_NAMES.get(color, color or '')}</h2>")
+        for picklist in group:
+            lines = picklist.lines
+            sections.append(
+                f'<div class="liste"><h3>Liste {picklist.list_number} — '
+                f"{escape(picklist.depositor_name)} ({len(lines)} articles)</h3>"
+                + table(
+                    ["", "Ligne", "Code", "Article", "Taille", "Prix"],
+                    (
+                        (
+                            "☐",
+                            line.line_number,
+                            line.barcode or "",
+                            line.description,
+                            line.size or "",
+                            f"{line.price:.2f}",
+                        )
+                        for line in lines
+                    ),
+                )
+                + "</div>"
+            )
+    return document(title, sections, style=PICKLIST_STYLE)
+
+
+async def run_picklist_job(session: AsyncSession, params: dict[str, Any]) -> JobResult:
+    """Job handler: printable picklists of an edition."""
+    service = RetrievalService(session)
+    edition = await service._get_edition(params["edition_id"])
+    lists = [
+        picklist
+        for picklist in await service.list_picklists(edition.id, params["label_color"])
+        if picklist.outcome is None
+    ]
+    return await html_result(
+        render_picklists_html(f"Retrait des invendus — {edition.name}", lists),
+        params["format"],
+        f"retrait-{edition.id}",
+    )
+
+
+job_runner.register(PICKLIST_JOB, run_picklist_job)
@@ -0,0 +1,439 @@
+"""Sale recording at the registers."""
+
+import logging
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleAlreadySoldError,
+    ArticleNotAvailableError,
+    ArticleNotFoundError,
+    BasketUnavailableError,
+    SaleNotFoundError,
+)
+from app.models import Article, ItemList, Sale
+from app.models.article import ArticleStatus
+from app.models.base import execute_dml, generate_uuid
+from app.models.sale import PaymentMethod
+from app.schemas.sale import (
+    BasketCheck,
+    BasketFailure,
+    BasketLine,
+    BasketReceipt,
+    OfflineSale,
+    SaleSummary,
+    SyncConflict,
+    SyncResult,
+)
+from app.services.audit_service import AuditEvent, audit_log
+from app.services.catalog_service import next_catalog_version
+from app.services.register_service import add_to_register_total
+
+logger = logging.getLogger(__name__)
+
+
+class SaleService:
+    """Record sales without a check-then-write race between registers."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _find_article(
+        self, edition_id: str, article_id: str | None, barcode: str | None
+    ) -> tuple[str, Decimal, str]:
+        """Get (id, price, status) of an edition article by ID or barcode."""
+        criteria = []
+        if article_id is not None:
+            criteria.append(Article.id == article_id)
+        if barcode is not None:
+            criteria.append(Article.barcode == barcode)
+        result = await self.session.execute(
+            select(Article.id, Article.price, Article.status)
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(ItemList.edition_id == edition_id, or_(*criteria))
+        )
+        article = result.first()
+        if article is None:
+            raise ArticleNotFoundError(article_id or barcode or "")
+        return article.tuple()
+
+    async def record_sale(
+        self,
+        edition_id: str,
+        payment_method: PaymentMethod,
+        register_number: int,
+        *,
+        article_id: str | None = None,
+        barcode: str | None = None,
+        seller_id: str | None = None,
+        sold_at: datetime | None = None,
+        is_offline_sale: bool = False,
+    ) -> SaleSummary:
+        """Sell an article and commit immediately.
+
+        The article is flipped to SOLD by a conditional
+        `UPDATE ... WHERE status = 'on_sale'`: when two registers scan the
+        same article, the database row lock decides the winner and the
+        loser's update matches no row, failing before it locks anything
+        else. The winner then locks its register total and, last, the
+        edition's catalog counter shared by all registers, so that row is
+        only held for the final statements. Locks are always taken in this
+        order: concurrent sales queue instead of deadlocking and need no
+        retry.
+
+        The sale is added to its register's running total (see
+        `register_service`) in the same transaction, which is committed here
+        rather than at the end of the request, so locks are released before
+        the response is serialized.
+
+        Raises:
+            ArticleNotFoundError: If no article of the edition matches.
+            ArticleAlreadySoldError: If the article is sold, including by a
+                concurrent register.
+            ArticleNotAvailableError: If the article is not on sale.
+        """
+        # Unlocked read: fails fast on unknown or unavailable articles
+        found_id, price, status = await self._find_article(
+            edition_id, article_id, barcode
+        )
+        if status == ArticleStatus.SOLD.value:
+            raise ArticleAlreadySoldError(found_id)
+        if status != ArticleStatus.ON_SALE.value:
+            raise ArticleNotAvailableError(found_id)
+
+        result = await execute_dml(
+            self.session,
+            update(Article)
+            .where(
+                Article.id == found_id,
+                Article.status == ArticleStatus.ON_SALE.value,
+            )
+            .values(status=ArticleStatus.SOLD.value)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount == 0:
+            await self.session.rollback()
+            raise ArticleAlreadySoldError(found_id)
+
+        sale = SaleSummary.model_construct(
+            id=generate_uuid(),
+            article_id=found_id,
+            price=price,
+            payment_method=PaymentMethod(payment_method).value,
+            register_number=register_number,
+            sold_at=sold_at or datetime.utcnow(),
+            is_offline_sale=is_offline_sale,
+        )
+        await add_to_register_total(
+            self.session,
+            edition_id,
+            sale.sold_at.date(),
+            register_number,
+            sale.payment_method,
+            1,
+            price,
+        )
+        await self.session.execute(
+            insert(Sale).values(
+                **sale.model_dump(),
+                edition_id=edition_id,
+                seller_id=seller_id,
+                synced_at=datetime.utcnow() if is_offline_sale else None,
+            )
+        )
+        version = await next_catalog_version(self.session, edition_id)
+        await self.session.execute(
+            update(Article)
+            .where(Article.id == found_id)
+            .values(change_version=version)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        _audit_sale(sale, seller_id)
+        return sale
+
+    async def check_basket(self, edition_id: str, barcodes: list[str]) -> BasketCheck:
+        """Validate scanned barcodes with one query, without locking anything.
+
+        Every barcode is reported either as a sellable line or as a failure
+        (not_found, already_sold, not_available or duplicate).
+        """
+        result = await self.session.execute(
+            select(
+                Article.id,
+                Article.barcode,
+                Article.description,
+                Article.price,
+                Article.status,
+            )
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(
+                ItemList.edition_id == edition_id, Article.barcode.in_(set(barcodes))
+            )
+        )
+        articles = {article.barcode: article for article in result}
+
+        lines: list[BasketLine] = []
+        failures: list[BasketFailure] = []
+        seen: set[str] = set()
+        for barcode in barcodes:
+            article = articles.get(barcode)
+            if barcode in seen:
+                error = "duplicate"
+            elif article is None:
+                error = "not_found"
+            elif article.status == ArticleStatus.SOLD.value:
+                error = "already_sold"
+            elif article.status != ArticleStatus.ON_SALE.value:
+                error = "not_available"
+            else:
+                error = None
+                lines.append(
+                    BasketLine.model_construct(
+                        article_id=article.id,
+                        barcode=barcode,
+                        description=article.description,
+                        price=article.price,
+                    )
+                )
+            if error is not None:
+                failures.append(
+                    BasketFailure.model_construct(barcode=barcode, error=error)
+                )
+            seen.add(barcode)
+
+        return BasketCheck.model_construct(
+            lines=lines,
+            failures=failures,
+            total=sum((line.price for line in lines), Decimal("0")),
+        )
+
+    async def checkout_basket(
+        self,
+        edition_id: str,
+        barcodes: list[str],
+        payment_method: PaymentMethod,
+        register_number: int,
+        seller_id: str | None = None,
+    ) -> BasketReceipt:
+        """Sell all articles of a basket in one transaction, or none of them.
+
+        The statements do not depend on the basket size: one SELECT, one
+        catalog version, one `UPDATE ... WHERE id IN (...) AND status =
+        'on_sale'` and one multi-row INSERT. If the update matches fewer rows
+        than expected, another register sold an article meanwhile: the
+        transaction is rolled back and the basket is checked again to report
+        which articles failed.
+
+        Raises:
+            BasketUnavailableError: If any article cannot be sold, with the
+                failure of each such barcode.
+        """
+        basket = await self.check_basket(edition_id, barcodes)
+        if basket.failures:
+            raise BasketUnavailableError(
+                [failure.model_dump() for failure in basket.failures]
+            )
+
+        article_ids = [line.article_id for line in basket.lines]
+        version = await next_catalog_version(self.session, edition_id)
+        result = await execute_dml(
+            self.session,
+            update(Article)
+            .where(
+                Article.id.in_(article_ids),
+                Article.status == ArticleStatus.ON_SALE.value,
+            )
+            .values(status=ArticleStatus.SOLD.value, change_version=version)
+            .execution_options(synchronize_session=False),
+        )
+        if result.rowcount != len(article_ids):
+            await self.session.rollback()
+            basket = await self.check_basket(edition_id, barcodes)
+            raise BasketUnavailableError(
+                [failure.model_dump() for failure in basket.failures]
+            )
+
+        sold_at = datetime.utcnow()
+        sales = [
+            SaleSummary.model_construct(
+                id=generate_uuid(),
+                article_id=line.article_id,
+                price=line.price,
+                payment_method=PaymentMethod(payment_method).value,
+                register_number=register_number,
+                sold_at=sold_at,
+                is_offline_sale=False,
+            )
+            for line in basket.lines
+        ]
+        await add_to_register_total(
+            self.session,
+            edition_id,
+            sold_at.date(),
+            register_number,
+            PaymentMethod(payment_method).value,
+            len(sales),
+            basket.total,
+        )
+        await self.session.execute(
+            insert(Sale).values(
+                [
+                    {
+                        **sale.model_dump(),
+                        "edition_id": edition_id,
+                        "seller_id": seller_id,
+                    }
+                    for sale in sales
+                ]
+            )
+        )
+        await self.session.commit()
+        for sale in sales:
+            _audit_sale(sale, seller_id)
+        return BasketReceipt.model_construct(
+            sales=sales,
+            total=basket.total,
+            payment_method=PaymentMethod(payment_method).value,
+        )
+
+    async def cancel_sale(
+        self,
+        edition_id: str,
+        sale_id: str,
+        reason: str,
+        actor_id: str | None = None,
+    ) -> SaleSummary:
+        """Cancel a sale and put the article back on sale.
+
+        The sale row is deleted (an article can only be sold once) and the
+        article returns to ON_SALE with a new catalog version.
+
+        Raises:
+            SaleNotFoundError: If the sale does not exist in the edition.
+        """
+        result = await self.session.execute(
+            select(*(getattr(Sale, name) for name in SaleSummary.columns())).where(
+                Sale.id == sale_id, Sale.edition_id == edition_id
+            )
+        )
+        row = result.first()
+        if row is None:
+            raise SaleNotFoundError(sale_id)
+        sale = SaleSummary.from_row(row)
+
+        version = await next_catalog_version(self.session, edition_id)
+        await self.session.execute(delete(Sale).where(Sale.id == sale_id))
+        await add_to_register_total(
+            self.session,
+            edition_id,
+            sale.sold_at.date(),
+            sale.register_number,
+            sale.payment_method,
+            -1,
+            -sale.price,
+        )
+        await self.session.execute(
+            update(Article)
+            .where(Article.id == sale.article_id)
+            .values(status=ArticleStatus.ON_SALE.value, change_version=version)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        audit_log.record(
+            AuditEvent.SALE_CANCELLED,
+            "vente",
+            sale.id,
+            actor_id=actor_id,
+            details={"motif": reason, "article_id": sale.article_id},
+        )
+        logger.info(
+            "Sale cancelled",
+            extra={
+                "action": "vente.cancel",
+                "details": {"sale_id": sale.id, "article_id": sale.article_id},
+            },
+        )
+        return sale
+
+    async def sync_offline_sales(
+        self,
+        edition_id: str,
+        register_number: int,
+        sales: list[OfflineSale],
+        seller_id: str | None = None,
+    ) -> SyncResult:
+        """Record a register's offline sales, reporting conflicts per sale.
+
+        Each sale is committed on its own, so one conflict (e.g. an article
+        sold online meanwhile) does not reject the rest of the batch.
+        """
+        conflicts = []
+        for offline_sale in sales:
+            try:
+                await self.record_sale(
+                    edition_id,
+                    offline_sale.payment_method,
+                    register_number,
+                    barcode=offline_sale.barcode,
+                    seller_id=seller_id,
+                    sold_at=_to_utc_naive(offline_sale.sold_at),
+                    is_offline_sale=True,
+                )
+            except (
+                ArticleAlreadySoldError,
+                ArticleNotFoundError,
+                ArticleNotAvailableError,
+            ) as e:
+                conflicts.append(
+                    SyncConflict.model_construct(
+                        offline_id=offline_sale.offline_id,
+                        barcode=offline_sale.barcode,
+                        error=_SYNC_ERRORS[type(e)],
+                    )
+                )
+        logger.info(
+            "Offline sales synchronized",
+            extra={
+                "action": "vente.sync",
+                "details": {"total": len(sales), "conflicts": len(conflicts)},
+            },
+        )
+        return SyncResult.model_construct(
+            total=len(sales),
+            synchronized=len(sales) - len(conflicts),
+            conflicts=conflicts,
+        )
+
+
+def _audit_sale(sale: SaleSummary, seller_id: str | None) -> None:
+    details = {
+        "article_id": sale.article_id,
+        "price": str(sale.price),
+        "register_number": sale.register_number,
+    }
+    audit_log.record(
+        AuditEvent.SALE_RECORDED, "vente", sale.id, actor_id=seller_id, details=details
+    )
+    logger.info(
+        "Sale recorded",
+        extra={"action": "vente.create", "details": {"sale_id": sale.id, **details}},
+    )
+
+
+def _to_utc_naive(value: datetime) -> datetime:
+    """Convert a client timestamp to the naive UTC datetimes stored in DB."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+# Conflict codes reported to registers by the offline sync
+_SYNC_ERRORS = {
+    ArticleAlreadySoldError: "already_sold",
+    ArticleNotFoundError: "not_found",
+    ArticleNotAvailableError: "not_available",
+}
@@ -0,0 +1,370 @@
+"""Article search for the returns desk and registers.
+
+Each worker keeps an in-memory index per edition, built on the first query:
+accent-insensitive word tokens and character trigrams of the description,
+brand, color, size and category of every article. A query term matches a
+word exactly, by prefix, or through shared trigrams, which absorbs typos.
+
+The index stays current without rebuilding:
+    - status and price changes are read back as a catalog delta
+      (`Article.change_version` above the indexed catalog version);
+    - lists whose articles are edited, created or copied are invalidated
+      through `cache_coherence` (scope "list"), in every worker, and
+      reloaded on the next query;
+    - an edition invalidated as a whole (e.g. once archived) is dropped.
+"""
+
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import EditionNotFoundError
+from app.models import Article, Edition, ItemList
+from app.schemas.article import ArticleSearchHit
+from app.services.cache_coherence import (
+    EDITION_SCOPE,
+    LIST_SCOPE,
+    CacheCoherence,
+    cache_coherence,
+)
+from app.services.catalog_service import get_catalog_version
+
+# Indexed article attributes
+SEARCHED_COLUMNS = ("description", "brand", "color", "size", "category")
+
+# Minimum share of a term's trigrams found in an article for a fuzzy match
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+# Score of a term found as a whole word, as a word prefix, or by trigrams
+# (trigram scores are the matched share of trigrams, at most 1)
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+
+# Category values indexed with their French names, as volunteers search them
+CATEGORY_LABELS = {
+    "clothing": "vetement",
+    "shoes": "chaussures",
+    "accessories": "accessoire",
+    "toys": "jouet",
+    "games": "jeu",
+    "books": "livre",
+    "nursery": "puericulture",
+    "stroller": "poussette",
+    "car_seat": "siege auto",
+    "other": "autre",
+}
+
+
+def normalize(text: str) -> str:
+    """Lowercase a text and strip its accents ("Bébé" -> "bebe")."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into normalized alphanumeric words."""
+    normalized = normalize(text)
+    words = "".join(char if char.isalnum() else " " for char in normalized)
+    return words.split()
+
+
+def trigrams(word: str) -> set[str]:
+    """Get the trigrams of a word, padded to weight its start."""
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(slots=True)
+class _Document:
+    """Indexed article with the fields returned by searches."""
+
+    id: str
+    item_list_id: str
+    list_number: int
+    line_number: int
+    barcode: str | None
+    description: str
+    category: str
+    size: str | None
+    brand: str | None
+    color: str | None
+    price: Decimal
+    status: str
+    words: frozenset[str]
+
+
+class EditionIndex:
+    """Word and trigram postings of an edition's articles."""
+
+    def __init__(self, version: int = 0):
+        self.version = version
+        self.documents: dict[str, _Document] = {}
+        self.lists: dict[str, set[str]] = {}
+        self.dirty_lists: set[str] = set()
+        self._words: dict[str, set[str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, row: Any) -> None:
+        """Index an article row, replacing its previous version."""
+        self.remove(row.id)
+        text = " ".join(
+            CATEGORY_LABELS.get(value, value) if column == "category" else value
+            for column in SEARCHED_COLUMNS
+            if (value := getattr(row, column))
+        )
+        words = frozenset(tokenize(text))
+        self.documents[row.id] = _Document(
+            **{field: getattr(row, field) for field in _ROW_FIELDS}, words=words
+        )
+        self.lists.setdefault(row.item_list_id, set()).add(row.id)
+        for word in words:
+            self._words.setdefault(word, set()).add(row.id)
+            for trigram in trigrams(word):
+                self._trigrams.setdefault(trigram, set()).add(row.id)
+
+    def remove(self, article_id: str) -> None:
+        """Remove an article from the index, if present."""
+        document = self.documents.pop(article_id, None)
+        if document is None:
+            return
+        self._discard(self.lists, document.item_list_id, article_id)
+        for word in document.words:
+            self._discard(self._words, word, article_id)
+            for trigram in trigrams(word):
+                self._discard(self._trigrams, trigram, article_id)
+
+    def remove_list(self, item_list_id: str) -> None:
+        """Remove all articles of a list from the index."""
+        for article_id in list(self.lists.pop(item_list_id, ())):
+            self.remove(article_id)
+
+    @staticmethod
+    def _discard(postings: dict[str, set[str]], key: str, article_id: str) -> None:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(article_id)
+            if not ids:
+                del postings[key]
+
+    def _match_term(self, term: str) -> dict[str, float]:
+        """Score the articles matching one query term."""
+        scores: dict[str, float] = {}
+        term_trigrams = trigrams(term)
+        counts: Counter[str] = Counter()
+        for trigram in term_trigrams:
+            ids = self._trigrams.get(trigram)
+            if ids:
+                counts.update(ids)
+        threshold = MIN_TRIGRAM_SIMILARITY * len(term_trigrams)
+        for article_id, count in counts.items():
+            if count >= threshold:
+                scores[article_id] = count / len(term_trigrams)
+
+        # Whole words and prefixes rank above fuzzy matches
+        for article_id in self._words.get(term, ()):
+            scores[article_id] = EXACT_SCORE
+        if len(term) >= 3:
+            for word, ids in self._words.items():
+                if word != term and word.startswith(term):
+                    for article_id in ids:
+                        scores[article_id] = max(
+                            scores.get(article_id, 0.0), PREFIX_SCORE
+                        )
+        return scores
+
+    def search(
+        self,
+        query: str,
+        list_number: int | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        status: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[_Document, float]]:
+        """Find the articles matching every query term and the filters.
+
+        Returns:
+            Matching articles with their score, best first, then by list
+            number and line number. Without query terms, all articles
+            passing the filters are returned in list order.
+        """
+        terms = tokenize(query)
+        if terms:
+            scores = self._match_term(terms[0])
+            for term in terms[1:]:
+                if not scores:
+                    break
+                term_scores = self._match_term(term)
+                scores = {
+                    article_id: score + term_scores[article_id]
+                    for article_id, score in scores.items()
+                    if article_id in term_scores
+                }
+        else:
+            scores = dict.fromkeys(self.documents, 0.0)
+
+        hits = []
+        for article_id, score in scores.items():
+            document = self.documents[article_id]
+            if list_number is not None and document.list_number != list_number:
+                continue
+            if min_price is not None and document.price < min_price:
+                continue
+            if max_price is not None and document.price > max_price:
+                continue
+            if status is not None and document.status != status:
+                continue
+            hits.append((document, score))
+        hits.sort(key=lambda hit: (-hit[1], hit[0].list_number, hit[0].line_number))
+        return hits[:limit]
+
+
+# Article fields kept in the index, besides the words
+_ROW_FIELDS = (
+    "id",
+    "item_list_id",
+    "list_number",
+    "line_number",
+    "barcode",
+    "description",
+    "category",
+    "size",
+    "brand",
+    "color",
+    "price",
+    "status",
+)
+
+
+class SearchIndexRegistry:
+    """Edition indexes of the worker, least recently searched evicted first."""
+
+    def __init__(
+        self, max_editions: int = 4, coherence: CacheCoherence = cache_coherence
+    ):
+        self.max_editions = max_editions
+        self.coherence = coherence
+        self._indexes: OrderedDict[str, EditionIndex] = OrderedDict()
+        coherence.register(LIST_SCOPE, self.invalidate_list)
+        coherence.register(
+            EDITION_SCOPE, lambda edition_id, _: self.discard(edition_id)
+        )
+
+    def __contains__(self, edition_id: str) -> bool:
+        return edition_id in self._indexes
+
+    def clear(self) -> None:
+        """Drop all indexes."""
+        self._indexes.clear()
+
+    def discard(self, edition_id: str) -> None:
+        """Drop an edition's index; the next search rebuilds it."""
+        self._indexes.pop(edition_id, None)
+
+    def invalidate_list(self, edition_id: str, item_list_id: str) -> None:
+        """Reload a list's articles on the next search of its edition."""
+        index = self._indexes.get(edition_id)
+        if index is not None:
+            index.dirty_lists.add(item_list_id)
+
+    async def get(self, session: AsyncSession, edition_id: str) -> EditionIndex:
+        """Get an edition's index, built or brought up to date as needed."""
+        await self.coherence.sync(session, edition_id)
+        index = self._indexes.get(edition_id)
+        # Read the version before the rows: a change committed in between is
+        # applied again by the next refresh rather than missed
+        version = await get_catalog_version(session, edition_id)
+        if index is None:
+            index = EditionIndex(version)
+            for row in await self._load(session, ItemList.edition_id == edition_id):
+                index.add(row)
+            self._indexes[edition_id] = index
+            while len(self._indexes) > self.max_editions:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(edition_id)
+            await self._refresh(session, edition_id, index, version)
+        return index
+
+    async def _refresh(
+        self, session: AsyncSession, edition_id: str, index: EditionIndex, version: int
+    ) -> None:
+        if index.dirty_lists:
+            dirty, index.dirty_lists = index.dirty_lists, set()
+            for item_list_id in dirty:
+                index.remove_list(item_list_id)
+            for row in await self._load(session, ItemList.id.in_(dirty)):
+                index.add(row)
+        if version > index.version:
+            rows = await self._load(
+                session,
+                ItemList.edition_id == edition_id,
+                Article.change_version > index.version,
+            )
+            for row in rows:
+                index.add(row)
+            index.version = version
+
+    @staticmethod
+    async def _load(session: AsyncSession, *criteria: Any) -> list[Any]:
+        result = await session.execute(
+            select(
+                *(
+                    getattr(Article, field)
+                    for field in _ROW_FIELDS
+                    if field != "list_number"
+                ),
+                ItemList.number.label("list_number"),
+            )
+            .join(ItemList, Article.item_list_id == ItemList.id)
+            .where(*criteria)
+        )
+        return list(result)
+
+
+search_index = SearchIndexRegistry()
+
+
+class SearchService:
+    """Search an edition's articles by description, brand, color or size."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(
+        self,
+        edition_id: str,
+        query: str,
+        list_number: int | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        status: str | None = None,
+        limit: int = 20,
+    ) -> list[ArticleSearchHit]:
+        """Find the best matching articles of an edition.
+
+        Raises:
+            EditionNotFoundError: If the edition does not exist.
+        """
+        if (
+            edition_id not in search_index
+            and await self.session.get(Edition, edition_id) is None
+        ):
+            raise EditionNotFoundError(edition_id)
+        index = await search_index.get(self.session, edition_id)
+        hits = index.search(query, list_number, min_price, max_price, status, limit)
+        return [
+            ArticleSearchHit.model_construct(
+                **{field: getattr(document, field) for field in _ROW_FIELDS},
+                score=round(score, 3),
+            )
+            for document, score in hits
+        ]
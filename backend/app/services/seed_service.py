@@ -0,0 +1,485 @@
+"""Synthetic edition generator for scale tests and benchmarks.
+
+Fills the database with a realistic sale-day edition: depositors with
+lists of every type and label color, articles following the category mix
+and price rules of docs/categories-articles.md, and sales spread over the
+registers along a sale-day arrival curve. The same seed always gives the
+same rows (IDs included), so benchmarks, load tests and the `seed` CLI
+command work on the same dataset.
+
+Rows are built in memory and written with one executemany INSERT per table.
+"""
+
+import math
+import random
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, cast
+
+from sqlalchemy import Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import ValidationError
+from app.models import (
+    Article,
+    CatalogVersion,
+    Edition,
+    ItemList,
+    Role,
+    Sale,
+    User,
+)
+from app.models.article import (
+    CATEGORY_ORDER,
+    CLOTHING_CATEGORIES,
+    MAX_ARTICLES_PER_LIST,
+    MAX_CLOTHING_PER_LIST,
+    MAX_PRICES,
+    MIN_PRICE,
+    ArticleStatus,
+)
+from app.models.edition import EditionStatus
+from app.models.item_list import (
+    LIST_NUMBER_RANGES,
+    MAX_LISTS_PER_DEPOSITOR,
+    ListStatus,
+    ListType,
+    label_color,
+)
+from app.models.sale import PaymentMethod
+
+# Articles by category: (description, lowest price, highest price), from
+# the indicative prices of docs/categories-articles.md. Car seats are
+# refused at deposit and never generated.
+CATALOG = {
+    "clothing": [
+        ("Jupe", 2, 10),
+        ("Tee-shirt", 1, 8),
+        ("Robe", 3, 23),
+        ("Pantalon", 3, 13),
+        ("Short", 2, 10),
+        ("Jogging", 3, 16),
+        ("Pull", 2, 10),
+        ("Sweat", 2, 10),
+        ("Imperméable", 3, 23),
+        ("Veste", 3, 16),
+        ("Manteau", 3, 31),
+        ("Body", 1, 8),
+        ("Pyjama", 1, 8),
+    ],
+    "shoes": [
+        ("Bottes de pluie", 3, 10),
+        ("Bottes de neige", 5, 15),
+        ("Chaussures de randonnée", 5, 25),
+        ("Crampons", 5, 20),
+        ("Chaussons de danse", 2, 8),
+    ],
+    "accessories": [
+        ("Bonnet", 1, 5),
+        ("Gants de ski", 2, 8),
+        ("Lunettes de ski", 3, 15),
+        ("Foulard", 1, 6),
+        ("Sac à main", 5, 20),
+    ],
+    "toys": [
+        ("Peluche", 1, 5),
+        ("Puzzle 100 pièces", 2, 6),
+        ("Poupée", 2, 10),
+        ("Jeu de construction", 3, 20),
+        ("Garage en bois", 5, 30),
+        ("Cuisine en bois", 10, 40),
+    ],
+    "games": [
+        ("Jeu de société", 3, 15),
+        ("Jeu Nintendo DS", 5, 15),
+        ("Jeu de cartes", 1, 5),
+    ],
+    "books": [
+        ("Album jeunesse", 1, 4),
+        ("Livre documentaire", 2, 6),
+        ("Roman adulte", 1, 5),
+        ("Lot de magazines Picsou", 2, 6),
+    ],
+    "nursery": [
+        ("Tour de lit", 3, 15),
+        ("Transat", 5, 25),
+        ("Chaise haute", 10, 40),
+        ("Lit parapluie", 10, 35),
+    ],
+    "stroller": [
+        ("Poussette canne", 10, 60),
+        ("Poussette trio", 40, 150),
+        ("Landau", 30, 150),
+    ],
+    "other": [
+        ("Trottinette", 5, 25),
+        ("Vélo enfant", 10, 50),
+        ("Luge", 3, 12),
+    ],
+}
+
+# Share of each category among deposited articles
+CATEGORY_WEIGHTS = {
+    "clothing": 45,
+    "shoes": 7,
+    "accessories": 5,
+    "toys": 15,
+    "games": 6,
+    "books": 12,
+    "nursery": 5,
+    "stroller": 1,
+    "other": 4,
+}
+
+BRANDS = ["Petit Bateau", "Kiabi", "Okaïdi", "Jacadi", "Vertbaudet", "Zara", None]
+COLORS = ["bleu", "rouge", "vert", "écru", "rose", "marine", "gris", "jaune", None]
+CLOTHING_SIZES = ["3 mois", "6 mois", "12 mois", "2 ans", "4 ans", "6 ans", "8 ans"]
+SHOE_SIZES = [str(size) for size in range(20, 40)]
+FIRST_NAMES = ["Marie", "Julie", "Claire", "Sophie", "Thomas", "Nicolas", "Léa"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Durand", "Lefebvre", "Moreau", "Roux"]
+
+# Children's clothes sold as a lot of 3 (bodys, pyjamas)
+LOT_DESCRIPTIONS = {"Body", "Pyjama"}
+LOT_SHARE = 0.3
+
+# Share of lists of each type, and average lists per depositor holding one
+LIST_TYPE_SHARES = {
+    ListType.STANDARD.value: 0.6,
+    ListType.LIST_1000.value: 0.25,
+    ListType.LIST_2000.value: 0.15,
+}
+LISTS_PER_HOLDER = {
+    ListType.STANDARD.value: 1.2,
+    ListType.LIST_1000.value: 2.5,
+    ListType.LIST_2000.value: 2.0,
+}
+
+# Customers arriving at each hour of the sale day: opening rush, lunch dip
+# and a smaller afternoon peak
+ARRIVAL_CURVE = {9: 22, 10: 18, 11: 12, 12: 6, 13: 5, 14: 9, 15: 10, 16: 8, 17: 5}
+
+PAYMENT_WEIGHTS = {
+    PaymentMethod.CASH.value: 55,
+    PaymentMethod.CARD.value: 35,
+    PaymentMethod.CHECK.value: 10,
+}
+
+SALE_DAY = datetime(2025, 3, 15)
+
+
+@dataclass(frozen=True)
+class EditionShape:
+    """Size of a synthetic edition."""
+
+    depositors: int = 500
+    lists: int = 1000
+    articles: int = 10_000
+    registers: int = 8
+    sold_share: float = 0.6
+
+
+@dataclass
+class SeedSummary:
+    """Result of generating a synthetic edition."""
+
+    edition_id: str
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+class SeedService:
+    """Generate synthetic editions."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def generate(
+        self, seed: int = 0, shape: EditionShape | None = None
+    ) -> SeedSummary:
+        """Insert a synthetic in-progress edition, without committing.
+
+        Raises:
+            ValidationError: If the shape does not fit the list rules, or
+                this seed's edition already exists.
+        """
+        shape = shape or EditionShape()
+        _check_shape(shape)
+        rng = random.Random(seed)
+        name = f"Bourse synthétique {seed}"
+        result = await self.session.execute(
+            select(Edition.id).where(Edition.name == name)
+        )
+        if result.first() is not None:
+            raise ValidationError(f"Edition '{name}' already exists", field="seed")
+
+        depositor_role_id = await self._role_id("depositor")
+        volunteer_role_id = await self._role_id("volunteer")
+        edition_id = _uuid(rng)
+        depositors: list[dict[str, Any]] = [
+            {
+                "id": _uuid(rng),
+                "email": f"deposant{n:04d}.{seed}@example.org",
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "is_active": True,
+                "is_local_resident": rng.random() < 0.7,
+                "role_id": depositor_role_id,
+            }
+            for n in range(1, shape.depositors + 1)
+        ]
+        cashiers: list[dict[str, Any]] = [
+            {
+                "id": _uuid(rng),
+                "email": f"caisse{n}.{seed}@example.org",
+                "first_name": "Caisse",
+                "last_name": str(n),
+                "is_active": True,
+                "is_local_resident": False,
+                "role_id": volunteer_role_id,
+            }
+            for n in range(1, shape.registers + 1)
+        ]
+        lists = _make_lists(rng, edition_id, [row["id"] for row in depositors], shape)
+        articles = _make_articles(rng, lists, shape.articles)
+        sales = _make_sales(rng, edition_id, articles, cashiers, shape.sold_share)
+
+        self.session.add(
+            Edition(
+                id=edition_id,
+                name=name,
+                status=EditionStatus.IN_PROGRESS.value,
+                start_datetime=SALE_DAY.replace(hour=9),
+                end_datetime=SALE_DAY.replace(hour=18) + timedelta(days=1),
+                sale_start_datetime=SALE_DAY.replace(hour=9),
+                sale_end_datetime=SALE_DAY.replace(hour=18),
+                commission_rate=Decimal("0.20"),
+            )
+        )
+        await self.session.flush()
+        for model, rows in (
+            (User, depositors + cashiers),
+            (ItemList, lists),
+            (Article, articles),
+            (Sale, sales),
+        ):
+            # Core executemany: one driver call per table, no ORM bookkeeping
+            await self.session.execute(insert(cast(Table, model.__table__)), rows)
+        if sales:
+            await self.session.execute(
+                insert(CatalogVersion).values(edition_id=edition_id, version=1)
+            )
+
+        return SeedSummary(
+            edition_id=edition_id,
+            counts={
+                "depositors": len(depositors),
+                "lists": len(lists),
+                "articles": len(articles),
+                "sales": len(sales),
+            },
+        )
+
+    async def _role_id(self, name: str) -> int:
+        """Get a role's ID, creating the role if needed."""
+        result = await self.session.execute(select(Role.id).where(Role.name == name))
+        role_id = result.scalar_one_or_none()
+        if role_id is None:
+            role = Role(name=name)
+            self.session.add(role)
+            await self.session.flush()
+            role_id = role.id
+        return role_id
+
+
+def _uuid(rng: random.Random) -> str:
+    """Get a UUID4 drawn from the generator, for reproducible IDs."""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _check_shape(shape: EditionShape) -> None:
+    for list_type, share in LIST_TYPE_SHARES.items():
+        first, last = LIST_NUMBER_RANGES[list_type]
+        count = round(shape.lists * share)
+        if count > last - first + 1:
+            raise ValidationError(
+                f"Too many {list_type} lists for the number range", field="lists"
+            )
+        if count > shape.depositors * MAX_LISTS_PER_DEPOSITOR[list_type]:
+            raise ValidationError(
+                f"Too few depositors for {count} {list_type} lists",
+                field="depositors",
+            )
+    if not shape.lists <= shape.articles <= shape.lists * MAX_ARTICLES_PER_LIST:
+        raise ValidationError(
+            "Lists must hold between 1 and 24 articles", field="articles"
+        )
+    if shape.registers < 1:
+        raise ValidationError("At least one register is needed", field="registers")
+
+
+def _make_lists(
+    rng: random.Random,
+    edition_id: str,
+    depositor_ids: Sequence[str],
+    shape: EditionShape,
+) -> list[dict[str, Any]]:
+    """Number lists of each type and share them out among depositors.
+
+    Each type goes round-robin to a random subset of depositors large
+    enough to stay within the lists allowed per depositor.
+    """
+    lists: list[dict[str, Any]] = []
+    types = list(LIST_TYPE_SHARES)
+    for list_type in types:
+        if list_type == types[-1]:
+            count = shape.lists - len(lists)
+        else:
+            count = round(shape.lists * LIST_TYPE_SHARES[list_type])
+        holders = min(
+            len(depositor_ids),
+            max(
+                math.ceil(count / LISTS_PER_HOLDER[list_type]),
+                math.ceil(count / MAX_LISTS_PER_DEPOSITOR[list_type]),
+            ),
+        )
+        owners = rng.sample(depositor_ids, holders)
+        first, _ = LIST_NUMBER_RANGES[list_type]
+        for n in range(count):
+            number = first + n
+            lists.append(
+                {
+                    "id": _uuid(rng),
+                    "number": number,
+                    "list_type": list_type,
+                    "label_color": label_color(list_type, number),
+                    "status": ListStatus.CHECKED_IN.value,
+                    "is_validated": True,
+                    "labels_printed": True,
+                    "checked_in_at": SALE_DAY - timedelta(days=1),
+                    "edition_id": edition_id,
+                    "depositor_id": owners[n % holders],
+                }
+            )
+    return lists
+
+
+def _list_sizes(rng: random.Random, lists: int, articles: int) -> list[int]:
+    """Split the articles among the lists, 1 to 24 each."""
+    sizes = [1] * lists
+    open_lists = list(range(lists))
+    for _ in range(articles - lists):
+        i = rng.randrange(len(open_lists))
+        sizes[open_lists[i]] += 1
+        if sizes[open_lists[i]] == MAX_ARTICLES_PER_LIST:
+            open_lists[i] = open_lists[-1]
+            open_lists.pop()
+    return sizes
+
+
+def _make_articles(
+    rng: random.Random, lists: list[dict[str, Any]], count: int
+) -> list[dict[str, Any]]:
+    """Fill the lists with articles in category order.
+
+    Clothing, shoes and accessories stop at 12 per list; the other
+    categories take the remaining lines.
+    """
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+    other_categories = [c for c in categories if c not in CLOTHING_CATEGORIES]
+    other_weights = [CATEGORY_WEIGHTS[c] for c in other_categories]
+
+    articles = []
+    for item_list, size in zip(lists, _list_sizes(rng, len(lists), count), strict=True):
+        drawn = []
+        clothing = 0
+        for _ in range(size):
+            category = rng.choices(categories, weights)[0]
+            if category in CLOTHING_CATEGORIES:
+                if clothing == MAX_CLOTHING_PER_LIST:
+                    category = rng.choices(other_categories, other_weights)[0]
+                else:
+                    clothing += 1
+            drawn.append(category)
+        drawn.sort(key=CATEGORY_ORDER.__getitem__)
+
+        for line_number, category in enumerate(drawn, start=1):
+            description, low, high = rng.choice(CATALOG[category])
+            is_lot = description in LOT_DESCRIPTIONS and rng.random() < LOT_SHARE
+            if is_lot:
+                description = f"Lot de 3 {description.lower()}s"
+            article_size = None
+            if category == "clothing":
+                article_size = rng.choice(CLOTHING_SIZES)
+            elif category == "shoes":
+                article_size = rng.choice(SHOE_SIZES)
+            articles.append(
+                {
+                    "id": _uuid(rng),
+                    "description": description,
+                    "category": category,
+                    "size": article_size,
+                    "brand": rng.choice(BRANDS)
+                    if category in CLOTHING_CATEGORIES
+                    else None,
+                    "color": rng.choice(COLORS),
+                    "price": _price(rng, category, low, high),
+                    "line_number": line_number,
+                    "is_lot": is_lot,
+                    "lot_quantity": 3 if is_lot else None,
+                    "status": ArticleStatus.ON_SALE.value,
+                    "conformity_certified": True,
+                    "barcode": f"{item_list['number']:04d}{line_number:02d}",
+                    "change_version": 0,
+                    "item_list_id": item_list["id"],
+                }
+            )
+    return articles
+
+
+def _price(rng: random.Random, category: str, low: int, high: int) -> Decimal:
+    """Draw a price in steps of 0.50, within the category's limits."""
+    price = Decimal(round(rng.uniform(low, high) * 2)) / 2
+    max_price = MAX_PRICES.get(category, MAX_PRICES["default"])
+    return min(max(price, MIN_PRICE), max_price).quantize(Decimal("0.01"))
+
+
+def _make_sales(
+    rng: random.Random,
+    edition_id: str,
+    articles: list[dict[str, Any]],
+    cashiers: list[dict[str, Any]],
+    sold_share: float,
+) -> list[dict[str, Any]]:
+    """Sell a share of the articles along the sale-day arrival curve.
+
+    Sold articles are marked SOLD at catalog version 1.
+    """
+    hours = list(ARRIVAL_CURVE)
+    hour_weights = list(ARRIVAL_CURVE.values())
+    methods = list(PAYMENT_WEIGHTS)
+    method_weights = list(PAYMENT_WEIGHTS.values())
+
+    sales = []
+    for article in rng.sample(articles, round(len(articles) * sold_share)):
+        article["status"] = ArticleStatus.SOLD.value
+        article["change_version"] = 1
+        register = rng.randrange(len(cashiers))
+        hour = rng.choices(hours, hour_weights)[0]
+        sales.append(
+            {
+                "id": _uuid(rng),
+                "sold_at": SALE_DAY.replace(hour=hour)
+                + timedelta(seconds=rng.randrange(3600)),
+                "price": article["price"],
+                "payment_method": rng.choices(methods, method_weights)[0],
+                "register_number": register + 1,
+                "is_offline_sale": False,
+                "edition_id": edition_id,
+                "article_id": article["id"],
+                "seller_id": cashiers[register]["id"],
+            }
+        )
+    return sales
@@ -0,0 +1,40 @@
+"""Printable HTML documents (reports, picklists), optionally as PDF."""
+
+from collections.abc import Iterable, Sequence
+from html import escape
+from typing import Any
+
+STYLE = """
+body { font-family: sans-serif; font-size: 10pt; }
+h1 { font-size: 16pt; } h2 { font-size: 12pt; margin-top: 1.5em; }
+table { border-collapse: collapse; margin-bottom: 1em; }
+th, td { border: 1px solid #bbb; padding: 2px 6px; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+"""
+
+
+def table(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """Render an HTML table, escaping every cell."""
+    head = "".join(f"<th>{escape(str(header))}</th>" for header in headers)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(str(cell))}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><tr>{head}</tr>{body}</table>"
+
+
+def document(title: str, sections: Iterable[str], style: str = STYLE) -> str:
+    """Render a standalone HTML page from rendered sections."""
+    return (
+        '<!DOCTYPE html><html lang="fr"><head><meta charset="utf-8">'
+        f"<title>{escape(title)}</title><style>{style}</style></head>"
+        f"<body><h1>{escape(title)}</h1>{''.join(sections)}</body></html>"
+    )
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Render an HTML page as PDF (requires WeasyPrint's system libraries)."""
+    from weasyprint import HTML
+
+    pdf: bytes = HTML(string=html).write_pdf()
+    return pdf
@@ -0,0 +1,67 @@
+"""Conditional GET helpers (strong ETags and 304 responses)."""
+
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Let browsers keep the response but revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values identifying a response version.
+
+    Example:
+        >>> make_etag("edition", edition.id, edition.updated_at)
+    """
+    raw = "|".join(
+        part.isoformat() if isinstance(part, datetime) else str(part) for part in parts
+    )
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a matching ETag."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """Attach the ETag and revalidation headers to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+async def get_rows_version(
+    session: AsyncSession, version_column: Any, *criteria: Any
+) -> tuple[int, Any]:
+    """Get the row count and highest version of the matching rows.
+
+    Together they version a collection response: the count changes on
+    inserts and deletes, the version column on updates. The column must
+    only ever increase (a counter, not a timestamp: two updates within the
+    same second would share a DATETIME).
+    """
+    result = await session.execute(
+        select(func.count(), func.max(version_column)).where(*criteria)
+    )
+    count, latest = result.one()
+    return count, latest
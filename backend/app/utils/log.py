@@ -0,0 +1,199 @@
+"""Structured JSON logging, written off the request path.
+
+Records go to a bounded queue; a listener thread formats them as JSON lines
+(docs/operations.md §5.2) and writes them to stdout or a daily rotated
+file. A request only pays for a context snapshot and a `put_nowait`: when
+the queue is full, the record is dropped and counted rather than blocking
+the event loop. DEBUG records are sampled at `log_debug_sample_rate`.
+
+The request context (correlation ID, user, edition, register) is kept in a
+context variable and added to every record logged during the request.
+
+Example:
+    >>> logger.info(
+    ...     "Sale recorded",
+    ...     extra={"action": "vente.create", "details": {"price": "5.00"}},
+    ... )
+"""
+
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from collections.abc import Mapping
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any
+
+import pydantic_core
+
+from app.config import settings
+
+SERVICE_NAME = "api"
+
+# Rotated log files kept, one per day
+LOG_FILE_BACKUPS = 90
+
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+log_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    "log_context", default=_EMPTY_CONTEXT
+)
+
+# Level names of the documented format
+_LEVEL_NAMES = {"WARNING": "WARN", "CRITICAL": "ERROR"}
+
+# Record attributes set through `extra` and copied to the JSON entry
+_EXTRA_FIELDS = ("action", "details", "duration_ms")
+
+
+def bind_context(**values: Any) -> None:
+    """Add fields to the log context of the current request."""
+    log_context.set({**log_context.get(), **values})
+
+
+def get_context() -> Mapping[str, Any]:
+    """Get the log context of the current request."""
+    return log_context.get()
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def __init__(self, service: str = SERVICE_NAME):
+        super().__init__()
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created, UTC)
+        entry: dict[str, Any] = {
+            "timestamp": timestamp.isoformat(timespec="milliseconds")[:-6] + "Z",
+            "level": _LEVEL_NAMES.get(record.levelname, record.levelname),
+            "service": self.service,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        # Snapshot taken when the record was queued, else the current one
+        entry.update(getattr(record, "context", None) or log_context.get())
+        for field in _EXTRA_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return pydantic_core.to_json(entry, fallback=str).decode()
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue records with the request context, without formatting them.
+
+    Unlike `QueueHandler.prepare()`, the message is not formatted here:
+    the listener thread does it. Arguments of a record should therefore
+    not be mutated after logging.
+    """
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord], debug_sample_rate: float = 1.0
+    ):
+        super().__init__(log_queue)
+        self.queue: queue.Queue[logging.LogRecord] = log_queue
+        self.debug_sample_rate = debug_sample_rate
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if (
+            record.levelno < logging.INFO
+            and self.debug_sample_rate < 1.0
+            and random.random() >= self.debug_sample_rate
+        ):
+            self.sampled_out += 1
+            return
+        record.context = log_context.get()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    """Root logger setup: queue handler and background writer thread."""
+
+    def __init__(self) -> None:
+        self.handler: ContextQueueHandler | None = None
+        self._listener: logging.handlers.QueueListener | None = None
+        self._previous_handlers: list[logging.Handler] = []
+        self._previous_level = logging.WARNING
+
+    @property
+    def is_running(self) -> bool:
+        return self._listener is not None
+
+    def start(self, output: logging.Handler | None = None) -> None:
+        """Route the root logger through the queue.
+
+        Args:
+            output: Handler run by the writer thread; by default stdout, or
+                a file rotated at midnight if `log_file` is set.
+        """
+        if self.is_running:
+            return
+        if output is None:
+            if settings.log_file:
+                output = logging.handlers.TimedRotatingFileHandler(
+                    settings.log_file,
+                    when="midnight",
+                    backupCount=LOG_FILE_BACKUPS,
+                    encoding="utf-8",
+                    utc=True,
+                )
+            else:
+                output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JSONFormatter())
+
+        # Attributes unused by the JSON format, not collected on each record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        self.handler = ContextQueueHandler(
+            queue.Queue(settings.log_queue_size), settings.log_debug_sample_rate
+        )
+        self._listener = logging.handlers.QueueListener(self.handler.queue, output)
+        self._listener.start()
+
+        root = logging.getLogger()
+        self._previous_handlers = root.handlers[:]
+        self._previous_level = root.level
+        root.handlers = [self.handler]
+        root.setLevel(settings.log_level.upper())
+
+    def stop(self) -> None:
+        """Write the queued records, stop the thread and restore the root logger."""
+        if self._listener is None:
+            return
+        root = logging.getLogger()
+        root.handlers = self._previous_handlers
+        root.setLevel(self._previous_level)
+        self._listener.stop()
+        self._listener = None
+        stats = self.stats()
+        if stats["dropped"]:
+            logging.getLogger(__name__).warning(
+                "%d log records dropped on a full queue", stats["dropped"]
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Get the queue depth and the records dropped or sampled out."""
+        if self.handler is None:
+            return {"queued": 0, "dropped": 0, "sampled_out": 0}
+        return {
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": self.handler.sampled_out,
+        }
+
+
+log_pipeline = LoggingPipeline()
@@ -0,0 +1,79 @@
+"""Money amounts in integer cents.
+
+Amounts are stored as `NUMERIC(10, 2)` and exposed as `Decimal` by the
+article and sale models. Code adding up many amounts (payouts, reports)
+works on integer cents instead: integer sums are exact and much faster
+than `Decimal` arithmetic. Convert at the boundary with `to_cents()` and
+`from_cents()`, or map a column with the `Cents` type.
+
+Commission rounding rule: the commission of a list is computed once, on
+the list's gross sales (never article by article), and rounded to the
+nearest cent, halves up. The net amount is what remains after commission
+and list fees, so commission + fees + net always equals gross.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from sqlalchemy import Numeric
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+# Commission rates have 4 decimals (`Edition.commission_rate`)
+RATE_SCALE = 10_000
+
+
+def to_cents(amount: Decimal | str) -> int:
+    """Convert an amount in euros to cents, rounding halves up."""
+    return int(Decimal(amount).scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert cents to an amount in euros, with 2 decimals."""
+    return Decimal(cents).scaleb(-2)
+
+
+def rate_to_basis(rate: Decimal) -> int:
+    """Convert a commission rate (0.2 for 20%) to ten-thousandths."""
+    return int(Decimal(rate).scaleb(4).to_integral_value(ROUND_HALF_UP))
+
+
+def commission_cents(gross: int, rate: int) -> int:
+    """Get the commission on a list's gross sales.
+
+    Args:
+        gross: Gross sales of the list, in cents (not negative).
+        rate: Commission rate, in ten-thousandths (see `rate_to_basis()`).
+
+    Returns:
+        The commission in cents, rounded to the nearest cent, halves up.
+    """
+    return (gross * rate + RATE_SCALE // 2) // RATE_SCALE
+
+
+def payout_cents(gross: int, rate: int, list_fees: int = 0) -> tuple[int, int]:
+    """Split a list's gross sales into commission and net amount.
+
+    Returns:
+        The commission and the net amount due to the depositor, in cents.
+    """
+    commission = commission_cents(gross, rate)
+    return commission, gross - commission - list_fees
+
+
+class Cents(TypeDecorator[int]):
+    """Money column holding euros in the database and cents in Python.
+
+    The column stays `NUMERIC(10, 2)`, so existing rows and reports are
+    unaffected.
+    """
+
+    impl = Numeric(10, 2)
+    cache_ok = True
+
+    def process_bind_param(self, value: int | None, _dialect: Any) -> Decimal | None:
+        return None if value is None else from_cents(value)
+
+    def process_result_value(self, value: Any, _dialect: Any) -> int | None:
+        return None if value is None else to_cents(str(value))
@@ -0,0 +1,21 @@
+"""Response classes."""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+from app.utils.timing import phase
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized in one pass by pydantic-core.
+
+    Accepts Pydantic models (or lists of them) as well as plain JSON data,
+    and encodes Decimal, datetime and models natively without going through
+    `jsonable_encoder`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with phase("serialize"):
+            return pydantic_core.to_json(content)
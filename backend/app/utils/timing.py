@@ -0,0 +1,110 @@
+"""Per-request phase timing, reported in the `Server-Timing` header.
+
+The timing middleware puts a `PhaseTimer` in a context variable; code on
+the request path adds the time spent in its phase:
+    - auth: JWT decoding (`app.dependencies`);
+    - pool: waiting for a database connection (`get_db_session`);
+    - db: SQL statements, through engine events;
+    - serialize: JSON rendering of the response.
+The rest of the time until the response starts is reported as `handler`.
+
+Outside a request (CLI, background tasks), there is no timer and marking
+a phase costs a context variable lookup.
+
+Example:
+    >>> with phase("auth"):
+    ...     payload = jwt.decode(token, key)
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# Phases in header order; `handler` is computed as the remainder
+PHASES = ("auth", "pool", "db", "serialize")
+
+
+class PhaseTimer:
+    """Time spent by a request in each phase, in seconds."""
+
+    __slots__ = ("start", "phases")
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.phases: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        """Get the time since the request started."""
+        return time.perf_counter() - self.start
+
+    def breakdown(self) -> dict[str, float]:
+        """Get each phase and the total in milliseconds, rounded to 0.1 ms."""
+        total = self.elapsed()
+        measured = {name: self.phases[name] for name in PHASES if name in self.phases}
+        measured["handler"] = max(total - sum(measured.values()), 0.0)
+        measured["total"] = total
+        return {name: round(seconds * 1000, 1) for name, seconds in measured.items()}
+
+    def header(self) -> str:
+        """Format the breakdown as a `Server-Timing` header value."""
+        return ", ".join(
+            f"{name};dur={duration}" for name, duration in self.breakdown().items()
+        )
+
+
+request_timer: ContextVar[PhaseTimer | None] = ContextVar("request_timer", default=None)
+
+
+def add_phase(name: str, seconds: float) -> None:
+    """Add time to a phase of the current request, if timed."""
+    timer = request_timer.get()
+    if timer is not None:
+        timer.add(name, seconds)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as a phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase(name, time.perf_counter() - start)
+
+
+def _before_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _many: bool,
+) -> None:
+    context.query_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _many: bool,
+) -> None:
+    add_phase("db", time.perf_counter() - context.query_start)
+
+
+def time_queries() -> None:
+    """Count the SQL statements of every engine in the `db` phase."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
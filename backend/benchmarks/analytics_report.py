@@ -0,0 +1,82 @@
+"""Post-edition report time over a 10,000-article edition.
+
+Measures the columnar load (one query per table), the aggregates and the
+HTML rendering, compared with loading the articles as ORM objects with
+their list and sale.
+
+Usage:
+    python -m benchmarks.analytics_report
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload
+
+from app.models import Article, ItemList
+from app.models.base import Base
+from app.services.analytics_service import (
+    AnalyticsService,
+    build_report,
+    render_report_html,
+)
+from app.services.seed_service import EditionShape, SeedService
+
+ROUNDS = 5
+
+
+async def _seed(session_factory) -> str:
+    async with session_factory() as session:
+        summary = await SeedService(session).generate(seed=0)
+        await session.commit()
+        return summary.edition_id
+
+
+def _best(times: list[float]) -> str:
+    return f"{min(times) * 1000:.0f} ms"
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    edition_id = await _seed(session_factory)
+    print(f"{EditionShape().articles} articles, best of {ROUNDS} rounds")
+
+    loads, aggregates, renders, orm_loads = [], [], [], []
+    for _ in range(ROUNDS):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            columns = await AnalyticsService(session).load(edition_id)
+            loads.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            report = build_report(columns)
+            aggregates.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            render_report_html(report)
+            renders.append(time.perf_counter() - start)
+
+        async with session_factory() as session:
+            start = time.perf_counter()
+            result = await session.execute(
+                select(Article)
+                .join(Article.item_list)
+                .where(ItemList.edition_id == edition_id)
+                .options(joinedload(Article.item_list), joinedload(Article.sale))
+            )
+            result.unique().scalars().all()
+            orm_loads.append(time.perf_counter() - start)
+
+    print(f"{'columnar load':>16}: {_best(loads)} (ORM objects: {_best(orm_loads)})")
+    print(f"{'aggregates':>16}: {_best(aggregates)}")
+    print(f"{'HTML rendering':>16}: {_best(renders)}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""Article search time over a 10,000-article edition.
+
+Measures the lazy index build and typical returns desk queries, compared
+with a `LIKE '%...%'` scan.
+
+Usage:
+    python -m benchmarks.article_search
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Article
+from app.models.base import Base
+from app.services.search_service import SearchService, search_index
+from app.services.seed_service import EditionShape, SeedService
+
+ROUNDS = 50
+
+QUERIES = ["pull bleu", "robe jacadi", "okaidi 6 ans", "pantallon", "ecru"]
+
+
+async def _seed(session_factory) -> str:
+    async with session_factory() as session:
+        summary = await SeedService(session).generate(seed=0)
+        await session.commit()
+        return summary.edition_id
+
+
+def _best(times: list[float]) -> str:
+    return f"{min(times) * 1000:.2f} ms"
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    edition_id = await _seed(session_factory)
+    print(f"{EditionShape().articles} articles, best of {ROUNDS} rounds")
+
+    async with session_factory() as session:
+        start = time.perf_counter()
+        await search_index.get(session, edition_id)
+        print(f"{'index build':>24}: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        for query in QUERIES:
+            indexed, scanned = [], []
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                await SearchService(session).search(edition_id, query)
+                indexed.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                pattern = f"%{query.split()[0]}%"
+                await session.execute(
+                    select(Article.id)
+                    .where(func.lower(Article.description).like(pattern))
+                    .limit(20)
+                )
+                scanned.append(time.perf_counter() - start)
+            print(f"{query:>24}: {_best(indexed)} (LIKE: {_best(scanned)})")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Checkout time of a 30-article basket.
+
+Compares selling a basket article by article (one transaction per sale, as
+with `POST /ventes`) with one basket checkout (`POST /ventes/panier`), and
+with the sale of a single article.
+
+Usage:
+    python -m benchmarks.basket_checkout
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Article, Edition, ItemList, Role, User
+from app.models.base import Base
+from app.models.sale import PaymentMethod
+from app.services.sale_service import SaleService
+
+BASKET_SIZE = 30
+ROUNDS = 20
+
+
+async def _seed(session_factory) -> tuple[str, list[str]]:
+    async with session_factory() as session:
+        role = Role(name="depositor")
+        user = User(email="bench@example.com", first_name="A", last_name="B", role=role)
+        edition = Edition(
+            name="Benchmark",
+            start_datetime=datetime(2025, 3, 15),
+            end_datetime=datetime(2025, 3, 16),
+        )
+        session.add_all([role, user, edition])
+        await session.flush()
+        item_list = ItemList(number=100, edition_id=edition.id, depositor_id=user.id)
+        session.add(item_list)
+        await session.flush()
+        articles = [
+            Article(
+                description=f"Article {line}",
+                category="clothing",
+                price=Decimal("3.50"),
+                line_number=line,
+                status="on_sale",
+                barcode=f"0100{line:04d}",
+                item_list_id=item_list.id,
+            )
+            for line in range(1, ROUNDS * (2 * BASKET_SIZE + 1) + 1)
+        ]
+        session.add_all(articles)
+        await session.commit()
+        return edition.id, [article.barcode for article in articles]
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    edition_id, barcodes = await _seed(session_factory)
+    stock = iter(barcodes)
+
+    async def single_article() -> None:
+        async with session_factory() as session:
+            await SaleService(session).record_sale(
+                edition_id, PaymentMethod.CASH, 1, barcode=next(stock)
+            )
+
+    async def one_sale_per_article() -> None:
+        for _ in range(BASKET_SIZE):
+            async with session_factory() as session:
+                await SaleService(session).record_sale(
+                    edition_id, PaymentMethod.CASH, 1, barcode=next(stock)
+                )
+
+    async def basket_checkout() -> None:
+        basket = [next(stock) for _ in range(BASKET_SIZE)]
+        async with session_factory() as session:
+            await SaleService(session).checkout_basket(
+                edition_id, basket, PaymentMethod.CASH, 1
+            )
+
+    print(f"{BASKET_SIZE}-article basket, best of {ROUNDS} rounds")
+    for name, checkout in (
+        ("1 article", single_article),
+        (f"{BASKET_SIZE} single sales", one_sale_per_article),
+        (f"{BASKET_SIZE}-article basket", basket_checkout),
+    ):
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            await checkout()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<24}{min(timings) * 1000:>8.1f} ms")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
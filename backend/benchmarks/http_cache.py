@@ -0,0 +1,126 @@
+"""Bytes transferred and server CPU for repeated catalog fetches.
+
+Simulates a register session that refreshes the edition catalog 20 times,
+comparing plain responses, gzip, brotli and ETag revalidation (304).
+
+Usage:
+    python -m benchmarks.http_cache
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.main import app
+from app.models import Article, Edition, ItemList, Role, User
+from app.models.base import Base, get_db_session
+
+LISTS = 300
+ARTICLES_PER_LIST = 24
+FETCHES = 20
+
+
+async def _seed(session_factory) -> str:
+    async with session_factory() as session:
+        role = Role(name="depositor")
+        user = User(email="bench@example.com", first_name="A", last_name="B", role=role)
+        edition = Edition(
+            name="Benchmark",
+            start_datetime=datetime(2025, 3, 15),
+            end_datetime=datetime(2025, 3, 16),
+        )
+        session.add_all([role, user, edition])
+        await session.flush()
+        for number in range(100, 100 + LISTS):
+            item_list = ItemList(
+                number=number, edition_id=edition.id, depositor_id=user.id
+            )
+            session.add(item_list)
+            await session.flush()
+            session.add_all(
+                Article(
+                    description=f"Article {line} de la liste {number}",
+                    category="clothing",
+                    size="8 ans",
+                    price=Decimal("3.50"),
+                    line_number=line,
+                    status="on_sale",
+                    barcode=f"{number:04d}{line:02d}",
+                    item_list_id=item_list.id,
+                )
+                for line in range(1, ARTICLES_PER_LIST + 1)
+            )
+        await session.commit()
+        return edition.id
+
+
+async def _session(
+    client: AsyncClient, url: str, headers: dict[str, str], revalidate: bool
+):
+    downloaded = 0
+    etag = None
+    start = time.process_time()
+    for _ in range(FETCHES):
+        request_headers = dict(headers)
+        if revalidate and etag:
+            request_headers["If-None-Match"] = etag
+        response = await client.get(url, headers=request_headers)
+        etag = response.headers.get("etag")
+        downloaded += response.num_bytes_downloaded
+    return downloaded, time.process_time() - start
+
+
+async def main() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    edition_id = await _seed(session_factory)
+
+    async def override_get_db_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    token = jwt.encode(
+        {"sub": "bench"}, settings.jwt_secret_key, settings.jwt_algorithm
+    )
+    auth = {"Authorization": f"Bearer {token}"}
+    url = f"/api/v1/editions/{edition_id}/catalogue"
+    scenarios = [
+        ("plain", {"Accept-Encoding": "identity"}, False),
+        ("gzip", {"Accept-Encoding": "gzip"}, False),
+        ("brotli", {"Accept-Encoding": "br"}, False),
+        ("brotli + ETag", {"Accept-Encoding": "br"}, True),
+    ]
+
+    print(
+        f"{LISTS * ARTICLES_PER_LIST} articles, {FETCHES} catalog fetches per session"
+    )
+    print(f"{'scenario':<16}{'bytes':>12}{'CPU (ms)':>12}")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for name, headers, revalidate in scenarios:
+            downloaded, cpu = await _session(
+                client, url, {**auth, **headers}, revalidate
+            )
+            print(f"{name:<16}{downloaded:>12,}{cpu * 1000:>12.0f}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Cost of logging a sale on the request path.
+
+Logs the "vente.create" record with its request context through the
+queue handler, whose writer thread formats and writes it, then through a
+stream handler doing that work in the calling thread. Output goes to a
+temporary file, as in production.
+
+Usage:
+    python -m benchmarks.logging_overhead
+"""
+
+import logging
+import tempfile
+import time
+
+from app.utils.log import JSONFormatter, bind_context, log_pipeline
+
+RECORDS = 50_000
+
+logger = logging.getLogger("benchmarks.sale")
+
+
+def log_sales() -> float:
+    """Log sale records; get the time per call in the calling thread."""
+    details = {"sale_id": "s1", "article_id": "a1", "price": "5.00"}
+    start = time.perf_counter()
+    for _ in range(RECORDS):
+        logger.info(
+            "Sale recorded", extra={"action": "vente.create", "details": details}
+        )
+    return (time.perf_counter() - start) / RECORDS
+
+
+def main() -> None:
+    bind_context(correlation_id="bench", user_id="u1", register_number=1)
+    root = logging.getLogger()
+    previous = root.handlers[:]
+    root.setLevel(logging.INFO)
+
+    with tempfile.TemporaryFile("w") as output:
+        log_pipeline.start(logging.StreamHandler(output))
+        # The queue holds every record: nothing is dropped while measuring
+        log_pipeline.handler.queue.maxsize = 0
+        timing = log_sales()
+        log_pipeline.stop()
+        print(f"{'queue handler':<16}{timing * 1e6:>8.2f} µs/record")
+
+    with tempfile.TemporaryFile("w") as output:
+        direct = logging.StreamHandler(output)
+        direct.setFormatter(JSONFormatter())
+        root.handlers = [direct]  # Same record attributes as above
+        timing = log_sales()
+        print(f"{'direct handler':<16}{timing * 1e6:>8.2f} µs/record")
+
+    root.handlers = previous
+
+
+if __name__ == "__main__":
+    main()
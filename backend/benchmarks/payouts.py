@@ -0,0 +1,82 @@
+"""Payout computation time for 500 lists, in Decimal and in integer cents.
+
+Each path gets every list's gross sales, computes the commission (rounded
+to the cent, halves up) and the net amount; the results are checked equal.
+
+- Python sums: the gross is summed from the article prices, as `Decimal`
+  or as cents. Converting each price to cents costs more than the sum
+  saves, so cents only pay off on amounts already held in cents.
+- Database sums: the database returns one gross per list, as in
+  `PayoutService.compute()`, converted to cents once per list.
+
+Every path takes well under a millisecond for 500 lists: integer cents are
+about exactness and a single rounding rule more than speed.
+
+Usage:
+    python -m benchmarks.payouts
+"""
+
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from app.utils.money import CENT, payout_cents, rate_to_basis, to_cents
+
+LISTS = 500
+ARTICLES = 24
+ROUNDS = 50
+RATE = Decimal("0.2000")
+
+
+def decimal_payout(gross: Decimal, rate: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+    commission = (gross * rate).quantize(CENT, ROUND_HALF_UP)
+    return gross, commission, gross - commission
+
+
+def cents_payout(gross: int, rate: int) -> tuple[int, int, int]:
+    commission, net = payout_cents(gross, rate)
+    return gross, commission, net
+
+
+def main() -> None:
+    rng = random.Random(2025)
+    lists = [
+        [Decimal(rng.randrange(50, 15000, 50)).scaleb(-2) for _ in range(ARTICLES)]
+        for _ in range(LISTS)
+    ]
+    cents = [list(map(to_cents, prices)) for prices in lists]
+    totals = [sum(prices, Decimal("0.00")) for prices in lists]
+    rate = rate_to_basis(RATE)
+
+    paths = {
+        "Python sums, Decimal": lambda: [
+            decimal_payout(sum(prices, Decimal("0.00")), RATE) for prices in lists
+        ],
+        "Python sums, cents": lambda: [
+            cents_payout(sum(prices), rate) for prices in cents
+        ],
+        "Database sums, Decimal": lambda: [
+            decimal_payout(gross, RATE) for gross in totals
+        ],
+        "Database sums, cents": lambda: [
+            cents_payout(to_cents(gross), rate) for gross in totals
+        ],
+    }
+    expected = [
+        tuple(map(to_cents, payout)) for payout in paths["Python sums, Decimal"]()
+    ]
+    assert paths["Python sums, cents"]() == expected
+    assert paths["Database sums, cents"]() == expected
+
+    print(f"{LISTS} lists of {ARTICLES} articles, best of {ROUNDS} rounds")
+    for name, compute in paths.items():
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            compute()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<26}{min(timings) * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
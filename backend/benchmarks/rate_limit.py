@@ -0,0 +1,68 @@
+"""Per-request overhead of the rate limiting middleware.
+
+Calls a minimal ASGI app directly and through `RateLimitMiddleware` with
+the in-memory store, for 1,000 distinct register tokens.
+
+Usage:
+    python -m benchmarks.rate_limit
+"""
+
+import asyncio
+import time
+
+from app.middleware.rate_limit import (
+    MemoryRateLimitStore,
+    RateLimitMiddleware,
+    RatePolicy,
+)
+
+REQUESTS = 200_000
+CLIENTS = 1000
+
+
+async def ok_app(_scope, _receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message) -> None:
+    pass
+
+
+async def main() -> None:
+    policies = {
+        name: RatePolicy(name, 10**9, 60) for name in ("auth", "scan", "export", "api")
+    }
+    limited = RateLimitMiddleware(ok_app, MemoryRateLimitStore(), policies)
+    scopes = [
+        {
+            "type": "http",
+            "path": path,
+            "headers": [
+                (b"user-agent", b"register"),
+                (b"authorization", f"Bearer register-{n}".encode()),
+            ],
+            "client": ("10.0.0.1", 5000),
+        }
+        for n in range(CLIENTS)
+        for path in ("/api/v1/editions/e1/ventes", "/api/v1/editions/e1/listes")
+    ]
+
+    timings = {}
+    for name, app in (("without limiter", ok_app), ("with limiter", limited)):
+        start = time.perf_counter()
+        for i in range(REQUESTS):
+            await app(scopes[i % len(scopes)], receive, send)
+        timings[name] = (time.perf_counter() - start) / REQUESTS
+        print(f"{name:<18}{timings[name] * 1e6:>8.2f} µs/request")
+
+    overhead = timings["with limiter"] - timings["without limiter"]
+    print(f"{'overhead':<18}{overhead * 1e6:>8.2f} µs/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
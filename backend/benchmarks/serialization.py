@@ -0,0 +1,105 @@
+"""Serialization time of a 1,000-article list response.
+
+Compares the default FastAPI path (full ORM objects, `response_model`
+validation from attributes, `jsonable_encoder` + `json.dumps`) with the
+projection path (selected columns, `model_construct`, pydantic-core JSON).
+
+Usage:
+    python -m benchmarks.serialization
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Article, Edition, ItemList, Role, User
+from app.models.base import Base
+from app.repositories.article_repository import ArticleRepository
+from app.schemas.article import ArticleSummary
+from app.utils.responses import FastJSONResponse
+
+ARTICLES = 1000
+ROUNDS = 20
+
+
+async def _seed(session_factory) -> str:
+    async with session_factory() as session:
+        role = Role(name="depositor")
+        user = User(email="bench@example.com", first_name="A", last_name="B", role=role)
+        edition = Edition(
+            name="Benchmark",
+            start_datetime=datetime(2025, 3, 15),
+            end_datetime=datetime(2025, 3, 16),
+        )
+        session.add_all([role, user, edition])
+        await session.flush()
+        item_list = ItemList(number=100, edition_id=edition.id, depositor_id=user.id)
+        session.add(item_list)
+        await session.flush()
+        session.add_all(
+            Article(
+                description=f"Article {line}",
+                category="clothing",
+                size="8 ans",
+                brand="Petit Bateau",
+                price=Decimal("3.50"),
+                line_number=line,
+                status="on_sale",
+                barcode=f"0100{line:04d}",
+                item_list_id=item_list.id,
+            )
+            for line in range(1, ARTICLES + 1)
+        )
+        await session.commit()
+        return item_list.id
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    item_list_id = await _seed(session_factory)
+    adapter = TypeAdapter(list[ArticleSummary])
+
+    async def before() -> bytes:
+        async with session_factory() as session:
+            result = await session.execute(
+                select(Article)
+                .where(Article.item_list_id == item_list_id)
+                .order_by(Article.line_number)
+            )
+            articles = adapter.validate_python(
+                result.scalars().all(), from_attributes=True
+            )
+            return json.dumps(jsonable_encoder(articles, by_alias=True)).encode()
+
+    async def after() -> bytes:
+        async with session_factory() as session:
+            articles = await ArticleRepository(session).list_summaries(item_list_id)
+            return FastJSONResponse(articles).body
+
+    print(f"{ARTICLES}-article list response, best of {ROUNDS} rounds")
+    for name, build in (
+        ("before (ORM + validation)", before),
+        ("after (projection)", after),
+    ):
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            body = await build()
+            timings.append(time.perf_counter() - start)
+        print(f"{name:<28}{min(timings) * 1000:>8.1f} ms  {len(body):>8,} bytes")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,9 +14,21 @@ from app.models.base import Base
 # Import all models to ensure they are registered with Base.metadata
 from app.models import (  # noqa: F401
     Article,
+    AuditLog,
+    CacheVersion,
+    CatalogVersion,
+    DepositSlot,
+    DepositSlotReservation,
     Edition,
+    IdempotencyKey,
     ItemList,
+    Job,
+    ListNumberCounter,
     Payout,
+    PriceGuide,
+    RegisterTotal,
+    ReleasedListNumber,
+    RetrievalPicklist,
     Role,
     Sale,
     User,
@@ -2,16 +2,25 @@
 
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+from datetime import datetime
+from decimal import Decimal
 from typing import Any
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
 from app.main import app
-from app.models.base import Base, get_db_session
+from app.middleware.rate_limit import rate_limit_store
+from app.models import Article, Edition, ItemList, Role, User
+from app.models.article import ArticleStatus
+from app.models.base import Base, get_db_session, get_read_session
+from app.models.edition import EditionStatus
+from app.models.item_list import ListStatus
+from app.services.seed_service import SeedService, SeedSummary
 
 # Use SQLite for tests (in-memory)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -25,6 +34,12 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits() -> None:
+    """Start every test with fresh rate limit counters."""
+    rate_limit_store.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def test_engine():
     """Create a test database engine."""
@@ -66,6 +81,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_read_session] = override_get_db_session
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -76,6 +92,105 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def auth_headers() -> dict[str, str]:
+    """Authorization headers with a valid access token."""
+    token = jwt.encode(
+        {"sub": "test-user"},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture(scope="function")
+async def depositor(db_session: AsyncSession) -> User:
+    """Create a depositor user."""
+    role = Role(name="depositor")
+    user = User(
+        email="depositor@example.com",
+        first_name="Marie",
+        last_name="Martin",
+        is_active=True,
+        role=role,
+    )
+    db_session.add_all([role, user])
+    await db_session.flush()
+    return user
+
+
+@pytest.fixture
+def depositor_headers(depositor: User) -> dict[str, str]:
+    """Authorization headers with an access token of the depositor."""
+    token = jwt.encode(
+        {"sub": depositor.id},
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture(scope="function")
+async def edition(db_session: AsyncSession) -> Edition:
+    """Create an edition in progress."""
+    edition = Edition(
+        name="Bourse Printemps 2025",
+        status=EditionStatus.IN_PROGRESS.value,
+        start_datetime=datetime(2025, 3, 15, 9, 0),
+        end_datetime=datetime(2025, 3, 16, 18, 0),
+        commission_rate=Decimal("0.20"),
+    )
+    db_session.add(edition)
+    await db_session.flush()
+    return edition
+
+
+@pytest_asyncio.fixture(scope="function")
+async def item_list(
+    db_session: AsyncSession, edition: Edition, depositor: User
+) -> ItemList:
+    """Create a checked-in list with three articles on sale."""
+    item_list = ItemList(
+        number=123,
+        label_color="sky_blue",
+        status=ListStatus.CHECKED_IN.value,
+        edition_id=edition.id,
+        depositor_id=depositor.id,
+    )
+    db_session.add(item_list)
+    await db_session.flush()
+    for line_number, (description, category, price) in enumerate(
+        [
+            ("Pantalon bleu", "clothing", Decimal("5.00")),
+            ("Puzzle 100 pièces", "toys", Decimal("3.50")),
+            ("Poussette canne", "stroller", Decimal("40.00")),
+        ],
+        start=1,
+    ):
+        db_session.add(
+            Article(
+                description=description,
+                category=category,
+                price=price,
+                line_number=line_number,
+                status=ArticleStatus.ON_SALE.value,
+                barcode=f"{item_list.number:04d}{line_number:02d}",
+                item_list_id=item_list.id,
+            )
+        )
+    await db_session.flush()
+    return item_list
+
+
+@pytest_asyncio.fixture(scope="function")
+async def synthetic_edition(db_session: AsyncSession) -> SeedSummary:
+    """Generate a full-size synthetic edition in progress (seed 0).
+
+    500 depositors, 1,000 lists and 10,000 articles, 60% of them sold.
+    """
+    return await SeedService(db_session).generate(seed=0)
+
+
 @pytest.fixture
 def sample_edition_data() -> dict[str, Any]:
     """Sample edition data for tests."""
@@ -0,0 +1,120 @@
+"""Read-after-write consistency across uvicorn worker processes."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from datetime import date, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Edition
+from app.models.base import Base
+from app.models.edition import EditionStatus
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+STARTUP_TIMEOUT = 30
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_up(base_url: str, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Worker {base_url} exited with {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Worker {base_url} did not start")
+
+
+@pytest.fixture
+def start_workers() -> Iterator:
+    """Start uvicorn workers on a shared file database; get their URLs."""
+    processes: list[subprocess.Popen] = []
+
+    def start(database_url: str, count: int) -> list[str]:
+        env = {
+            **os.environ,
+            "DATABASE_URL": database_url,
+            # Caches would never expire during the test on their own
+            "SLOT_AVAILABILITY_TTL_SECONDS": "3600",
+        }
+        base_urls = []
+        for _ in range(count):
+            port = _free_port()
+            processes.append(
+                subprocess.Popen(
+                    [sys.executable, "-m", "uvicorn", "app.main:app"]
+                    + ["--port", str(port), "--log-level", "warning"],
+                    cwd=BACKEND_DIR,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            )
+            base_urls.append(f"http://127.0.0.1:{port}")
+        for base_url, process in zip(base_urls, processes, strict=True):
+            _wait_until_up(base_url, process)
+        return base_urls
+
+    yield start
+
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.wait(timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_write_on_one_worker_is_read_on_another(
+    tmp_path, start_workers, auth_headers: dict[str, str]
+):
+    """Test that a slot created through worker A is served at once by B."""
+    database_url = f"sqlite+aiosqlite:///{tmp_path / 'workers.db'}"
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        edition = Edition(
+            name="Bourse multi-workers",
+            status=EditionStatus.REGISTRATIONS_OPEN.value,
+            start_datetime=datetime(2025, 3, 15, 9, 0),
+            end_datetime=datetime(2025, 3, 16, 18, 0),
+        )
+        session.add(edition)
+        await session.commit()
+    await engine.dispose()
+
+    worker_a, worker_b = start_workers(database_url, 2)
+    path = f"/api/v1/editions/{edition.id}/creneaux"
+    async with httpx.AsyncClient(headers=auth_headers) as client:
+        before = await client.get(f"{worker_b}{path}/disponibilites")
+        assert before.json() == []
+
+        created = await client.post(
+            f"{worker_a}{path}",
+            json={
+                "day": date(2025, 3, 12).isoformat(),
+                "startTime": "14:00:00",
+                "endTime": "18:00:00",
+                "capacity": 40,
+            },
+        )
+        assert created.status_code == 201
+        after = await client.get(f"{worker_b}{path}/disponibilites")
+
+    assert after.json() == [{"id": created.json()["id"], "availablePlaces": 40}]
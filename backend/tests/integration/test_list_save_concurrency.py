@@ -0,0 +1,98 @@
+"""Concurrent saves of one depositor list."""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Article, Edition, ItemList, Role, User
+from app.models.base import Base
+from app.models.edition import EditionStatus
+from app.schemas.article import ArticleInput
+from app.services.article_service import ArticleService
+
+
+@pytest.fixture
+async def list_db(tmp_path):
+    """A file database with an empty draft list open for declarations.
+
+    Yields its session factory and the list.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lists.db'}")
+
+    # SQLite ignores FOR UPDATE: take its database write lock when each
+    # transaction begins instead, as the list row lock does on MySQL
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_pysqlite_begin(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        role = Role(name="depositor")
+        user = User(email="d@example.com", first_name="A", last_name="B", role=role)
+        edition = Edition(
+            name="Bourse Automne 2025",
+            status=EditionStatus.REGISTRATIONS_OPEN.value,
+            start_datetime=datetime(2025, 10, 4, 9, 0),
+            end_datetime=datetime(2025, 10, 5, 18, 0),
+            declaration_deadline=datetime.utcnow() + timedelta(days=3),
+        )
+        session.add_all([role, user, edition])
+        await session.flush()
+        item_list = ItemList(number=250, edition_id=edition.id, depositor_id=user.id)
+        session.add(item_list)
+        await session.commit()
+
+    yield session_factory, item_list
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_insert_one_set(list_db):
+    """Test that two autosaves of a new list leave only one set of articles."""
+    session_factory, item_list = list_db
+    articles = [
+        ArticleInput(description="Vélo", category="toys", price=Decimal("25")),
+        ArticleInput(description="Poupée", category="toys", price=Decimal("5")),
+    ]
+    locked_reads = []
+
+    async def save() -> tuple[int, int]:
+        async with session_factory() as session:
+
+            @event.listens_for(session.sync_session, "do_orm_execute")
+            def record(state):
+                if not state.is_select:
+                    return
+                sql = str(state.statement.compile(dialect=mysql.dialect()))
+                if "FROM item_lists" in sql:
+                    locked_reads.append(sql.endswith("FOR UPDATE"))
+
+            diff = await ArticleService(session).save_list(
+                item_list.edition_id, item_list.id, articles
+            )
+            return diff.created, diff.deleted
+
+    diffs = await asyncio.gather(save(), save())
+
+    # The second save sees the first one's articles and replaces them
+    assert sorted(diffs) == [(2, 0), (2, 2)]
+    assert locked_reads == [True, True]
+    async with session_factory() as session:
+        stored = await session.execute(
+            select(Article.line_number, Article.description)
+            .where(Article.item_list_id == item_list.id)
+            .order_by(Article.line_number)
+        )
+        assert stored.tuples().all() == [(1, "Vélo"), (2, "Poupée")]
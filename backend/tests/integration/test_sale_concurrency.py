@@ -0,0 +1,190 @@
+"""Concurrent sales from several registers."""
+
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.exceptions import ArticleAlreadySoldError
+from app.models import (
+    Article,
+    CatalogVersion,
+    Edition,
+    ItemList,
+    RegisterTotal,
+    Role,
+    Sale,
+    User,
+)
+from app.models.article import ArticleStatus
+from app.models.base import Base
+from app.models.sale import PaymentMethod
+from app.services.sale_service import SaleService
+
+REGISTERS = 8
+
+# Articles sold by each register in the load test
+SALES_PER_REGISTER = 6
+
+
+@pytest.fixture
+async def sales_db(tmp_path):
+    """A file database with 2 lists of 24 articles.
+
+    Yields its engine, session factory and edition ID.
+    """
+    # File database: each session gets its own connection, as in production
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'sales.db'}",
+        pool_size=REGISTERS,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        role = Role(name="depositor")
+        user = User(email="d@example.com", first_name="A", last_name="B", role=role)
+        edition = Edition(
+            name="Bourse",
+            start_datetime=datetime(2025, 3, 15),
+            end_datetime=datetime(2025, 3, 16),
+        )
+        session.add_all([role, user, edition])
+        await session.flush()
+        for number in (245, 246):
+            item_list = ItemList(
+                number=number, edition_id=edition.id, depositor_id=user.id
+            )
+            session.add(item_list)
+            await session.flush()
+            session.add_all(
+                Article(
+                    description=f"Jouet {line_number}",
+                    category="toys",
+                    price=Decimal("12.00"),
+                    line_number=line_number,
+                    status=ArticleStatus.ON_SALE.value,
+                    barcode=f"{number:04d}{line_number:02d}",
+                    item_list_id=item_list.id,
+                )
+                for line_number in range(1, 25)
+            )
+        await session.commit()
+        edition_id = edition.id
+
+    # Open one pooled connection per register before timing
+    async def warm_up() -> None:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(warm_up() for _ in range(REGISTERS)))
+    yield engine, session_factory, edition_id
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_only_one_register_wins(sales_db):
+    """Test that 8 simultaneous sales of one barcode produce exactly one sale."""
+    engine, session_factory, edition_id = sales_db
+    counter_updates = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        if statement.startswith("UPDATE catalog_versions"):
+            counter_updates.append(statement)
+
+    async def sell(register_number: int, barcode: str) -> tuple[str, float]:
+        async with session_factory() as session:
+            start = time.perf_counter()
+            try:
+                await SaleService(session).record_sale(
+                    edition_id, PaymentMethod.CASH, register_number, barcode=barcode
+                )
+                outcome = "sold"
+            except ArticleAlreadySoldError:
+                outcome = "already_sold"
+            return outcome, time.perf_counter() - start
+
+    results = await asyncio.gather(
+        *(sell(n, "024503") for n in range(1, REGISTERS + 1))
+    )
+
+    outcomes = [outcome for outcome, _ in results]
+    assert outcomes.count("sold") == 1
+    assert outcomes.count("already_sold") == REGISTERS - 1
+    # Losers queue behind the winner's lock and fail without retries. SQLite
+    # polls its write lock with a sleeping backoff, so their wait is longer
+    # here than with InnoDB row locks.
+    assert max(elapsed for _, elapsed in results) < 1.0
+    # Only the winner locked the edition's catalog counter
+    assert len(counter_updates) == 1
+
+    # Server time of a sale on a warm connection
+    outcome, elapsed = await sell(1, "024504")
+    assert outcome == "sold"
+    assert elapsed < 0.05
+
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count(Sale.id))) == 2
+        assert await session.scalar(select(CatalogVersion.version)) == 2
+
+
+@pytest.mark.asyncio
+async def test_registers_selling_different_articles(sales_db):
+    """Test 8 registers each selling their own articles at the same time."""
+    _, session_factory, edition_id = sales_db
+    barcodes = [
+        f"{number:04d}{line_number:02d}"
+        for number in (245, 246)
+        for line_number in range(1, 25)
+    ]
+
+    async def sell_all(register_number: int) -> list[float]:
+        timings = []
+        for barcode in barcodes[register_number - 1 :: REGISTERS]:
+            async with session_factory() as session:
+                start = time.perf_counter()
+                await SaleService(session).record_sale(
+                    edition_id, PaymentMethod.CASH, register_number, barcode=barcode
+                )
+                timings.append(time.perf_counter() - start)
+        return timings
+
+    start = time.perf_counter()
+    timings = await asyncio.gather(*(sell_all(n) for n in range(1, REGISTERS + 1)))
+    elapsed = time.perf_counter() - start
+
+    sales = REGISTERS * SALES_PER_REGISTER
+    assert [len(register) for register in timings] == [SALES_PER_REGISTER] * REGISTERS
+    # SQLite has one writer at a time: sales queue, without failing or
+    # deadlocking. Its write lock is polled with a sleeping backoff, so
+    # waits vary with the machine's load; a sale waiting past the busy
+    # timeout would have raised "database is locked".
+    assert elapsed < sales * 0.1
+
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count(Sale.id))) == sales
+        versions = await session.scalars(
+            select(Article.change_version).order_by(Article.change_version)
+        )
+        assert list(versions) == list(range(1, sales + 1))
+        totals = await session.execute(
+            select(RegisterTotal.register_number, RegisterTotal.sale_count)
+        )
+        assert sorted(totals.tuples()) == [
+            (n, SALES_PER_REGISTER) for n in range(1, REGISTERS + 1)
+        ]
@@ -0,0 +1,166 @@
+"""Post-edition analytics report tests."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.exceptions import JobNotFoundError
+from app.models import Edition
+from app.models.edition import EditionStatus
+from app.services.analytics_service import (
+    AnalyticsService,
+    price_band,
+    price_elasticity,
+    render_comparison_html,
+    sell_through,
+)
+from app.services.archive_service import ArchiveService
+from app.services.job_service import job_runner
+from app.services.seed_service import EditionShape, SeedService, SeedSummary
+
+
+def test_sell_through_per_group():
+    """Test offered, sold and revenue counts, in the requested order."""
+    rows = sell_through(
+        ["toys", "books", "toys", "toys"],
+        [True, False, False, True],
+        [3.0, 2.0, 5.0, 4.5],
+        order=["toys", "books", "games"],
+    )
+
+    assert [(row.key, row.offered, row.sold, row.revenue) for row in rows] == [
+        ("toys", 3, 2, 7.5),
+        ("books", 1, 0, 0.0),
+        ("games", 0, 0, 0.0),
+    ]
+    assert rows[0].rate == pytest.approx(2 / 3)
+    assert [price_band(price) for price in (1, 4.99, 5, 150)] == [
+        "1–2 €",
+        "2–5 €",
+        "5–10 €",
+        "50 € et plus",
+    ]
+
+
+def test_expensive_articles_sell_less():
+    """Test that elasticity is negative when high relative prices do not sell."""
+    elasticity = price_elasticity(
+        ["toys", "toys", "stroller", "stroller"],
+        [5.0, 90.0, 10.0, 140.0],
+        [True, False, True, False],
+    )
+
+    assert elasticity.slope < 0
+    assert elasticity.elasticity < 0
+    assert [band.offered for band in elasticity.bands] == [2, 0, 0, 0, 0, 0, 0, 0, 0, 2]
+
+
+@pytest.mark.asyncio
+async def test_report_of_synthetic_edition(
+    db_session: AsyncSession, synthetic_edition: SeedSummary
+):
+    """Test the aggregates of the full-size edition."""
+    report = await AnalyticsService(db_session).report(synthetic_edition.edition_id)
+
+    assert (report.offered, report.sold, report.sales) == (10000, 6000, 6000)
+    for rows in report.breakdowns.values():
+        assert sum(row.offered for row in rows) == report.offered
+        assert sum(row.sold for row in rows) == report.sold
+    assert sum(row.revenue for row in report.payments.values()) == pytest.approx(
+        report.revenue
+    )
+    assert list(report.curve.registers) == list(range(1, 9))
+    assert report.curve.hours == list(range(9, 18))
+    assert sum(map(sum, report.curve.registers.values())) == 6000
+
+
+@pytest.mark.asyncio
+async def test_archived_edition_report_matches(db_session: AsyncSession, tmp_path):
+    """Test that an edition moved to cold storage gives the same report."""
+    summary = await SeedService(db_session).generate(
+        3, EditionShape(depositors=20, lists=30, articles=200, registers=2)
+    )
+    service = AnalyticsService(db_session)
+    before = await service.report(summary.edition_id)
+
+    edition = await db_session.get(Edition, summary.edition_id)
+    edition.status = EditionStatus.ARCHIVED.value
+    await ArchiveService(db_session, archive_dir=str(tmp_path)).archive_edition(
+        edition.id
+    )
+
+    assert await service.report(summary.edition_id) == before
+
+
+@pytest.mark.asyncio
+async def test_comparison_of_editions(db_session: AsyncSession):
+    """Test that editions are compared side by side, in the requested order."""
+    shape = EditionShape(depositors=20, lists=30, articles=200, registers=2)
+    first = await SeedService(db_session).generate(1, shape)
+    second = await SeedService(db_session).generate(2, shape)
+
+    reports = await AnalyticsService(db_session).compare(
+        [second.edition_id, first.edition_id]
+    )
+    html = render_comparison_html(reports)
+
+    assert [report.name for report in reports] == [
+        "Bourse synthétique 2",
+        "Bourse synthétique 1",
+    ]
+    assert "<th>Bourse synthétique 2</th><th>Bourse synthétique 1</th>" in html
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_report_job(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    test_engine,
+    edition: Edition,
+    monkeypatch,
+    tmp_path,
+):
+    """Test report generation through a job, then its download."""
+    monkeypatch.setattr(job_runner, "session_factory", async_sessionmaker(test_engine))
+    monkeypatch.setattr(job_runner, "output_dir", str(tmp_path))
+
+    created = await client.post(
+        f"/api/v1/editions/{edition.id}/stats/rapport",
+        json={"format": "html"},
+        headers=auth_headers,
+    )
+    assert created.status_code == 202
+    assert created.json()["status"] == "pending"
+    await job_runner.stop()
+
+    job = await client.get(f"/api/v1/jobs/{created.json()['id']}", headers=auth_headers)
+    assert job.json()["status"] == "completed"
+    download = await client.get(job.json()["resultUrl"], headers=auth_headers)
+    assert download.headers["content-type"].startswith("text/html")
+    assert "Bourse Printemps 2025" in download.text
+    assert "Écoulement par catégorie" in download.text
+    assert "<td>stroller</td><td>1</td>" in download.text
+
+
+@pytest.mark.asyncio
+async def test_job_deleted_before_it_runs(test_engine, monkeypatch):
+    """Test that a job missing from the database fails with a not found error."""
+    monkeypatch.setattr(job_runner, "session_factory", async_sessionmaker(test_engine))
+
+    with pytest.raises(JobNotFoundError):
+        await job_runner._run("unknown")
+
+
+@pytest.mark.asyncio
+async def test_comparison_of_unknown_edition(
+    client: AsyncClient, auth_headers: dict[str, str], edition: Edition
+):
+    """Test that a comparison is refused before any job is started."""
+    response = await client.post(
+        "/api/v1/stats/comparaison",
+        json={"editionIds": [edition.id, "unknown"], "format": "html"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 404
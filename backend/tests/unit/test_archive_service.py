@@ -0,0 +1,151 @@
+"""Archive service tests."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import ArchiveNotFoundError, EditionNotArchivedError
+from app.models import Article, Edition, ItemList, Payout, RetrievalPicklist, Sale
+from app.models.edition import EditionStatus
+from app.models.sale import PaymentMethod
+from app.services.archive_service import ArchiveService
+
+
+@pytest.fixture
+async def archived_edition(
+    db_session: AsyncSession, edition: Edition, item_list: ItemList
+) -> Edition:
+    """An archived edition with one sale, one payout and one picklist."""
+    result = await db_session.execute(
+        select(Article).where(Article.item_list_id == item_list.id)
+    )
+    article = result.scalars().first()
+    db_session.add_all(
+        [
+            Sale(
+                sold_at=datetime(2025, 3, 15, 10, 30),
+                price=article.price,
+                payment_method=PaymentMethod.CASH.value,
+                register_number=1,
+                edition_id=edition.id,
+                article_id=article.id,
+            ),
+            Payout(
+                gross_amount=Decimal("5.00"),
+                commission_amount=Decimal("1.00"),
+                net_amount=Decimal("4.00"),
+                item_list_id=item_list.id,
+                depositor_id=item_list.depositor_id,
+            ),
+            RetrievalPicklist(
+                item_list_id=item_list.id,
+                edition_id=edition.id,
+                list_number=item_list.number,
+                label_color=item_list.label_color,
+                depositor_name="Marie Martin",
+                position=0,
+                lines=[{"line_number": 2, "description": "Puzzle 100 pièces"}],
+                outcome="retrieved",
+                processed_at=datetime(2025, 3, 17, 18, 45),
+                built_at=datetime(2025, 3, 16, 18, 0),
+            ),
+        ]
+    )
+    edition.status = EditionStatus.ARCHIVED.value
+    await db_session.flush()
+    return edition
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_rows_out_of_hot_tables(
+    db_session: AsyncSession, archived_edition: Edition, tmp_path
+):
+    """Test that archiving empties the hot tables and records the archive file."""
+    service = ArchiveService(db_session, archive_dir=str(tmp_path))
+
+    summary = await service.archive_edition(archived_edition.id)
+
+    assert summary.counts == {
+        "item_lists": 1,
+        "retrieval_picklists": 1,
+        "articles": 3,
+        "sales": 1,
+        "payouts": 1,
+    }
+    assert await service.count_hot_rows(archived_edition.id) == {
+        "item_lists": 0,
+        "retrieval_picklists": 0,
+        "articles": 0,
+        "sales": 0,
+        "payouts": 0,
+    }
+    assert archived_edition.archive_path == summary.path
+
+
+@pytest.mark.asyncio
+async def test_archive_is_readable_without_database(
+    db_session: AsyncSession, archived_edition: Edition, tmp_path
+):
+    """Test that archived rows can be read back with their original types."""
+    service = ArchiveService(db_session, archive_dir=str(tmp_path))
+    await service.archive_edition(archived_edition.id)
+
+    reader = await service.open_archive(archived_edition.id)
+    articles = reader.rows("articles")
+    sales = reader.rows("sales")
+
+    assert reader.edition_id == archived_edition.id
+    assert sorted(a["price"] for a in articles) == [
+        Decimal("3.50"),
+        Decimal("5.00"),
+        Decimal("40.00"),
+    ]
+    assert sales[0]["sold_at"] == datetime(2025, 3, 15, 10, 30)
+    (picklist,) = reader.rows("retrieval_picklists")
+    assert picklist["lines"][0]["line_number"] == 2
+    assert picklist["processed_at"] == datetime(2025, 3, 17, 18, 45)
+
+
+@pytest.mark.asyncio
+async def test_restore_brings_rows_back(
+    db_session: AsyncSession, archived_edition: Edition, tmp_path
+):
+    """Test that restoring re-inserts every archived row."""
+    service = ArchiveService(db_session, archive_dir=str(tmp_path))
+    await service.archive_edition(archived_edition.id)
+
+    await service.restore_edition(archived_edition.id)
+
+    assert await service.count_hot_rows(archived_edition.id) == {
+        "item_lists": 1,
+        "retrieval_picklists": 1,
+        "articles": 3,
+        "sales": 1,
+        "payouts": 1,
+    }
+    assert archived_edition.archive_path is None
+
+
+@pytest.mark.asyncio
+async def test_archive_requires_archived_status(
+    db_session: AsyncSession, edition: Edition, tmp_path
+):
+    """Test that only archived editions can be moved to cold storage."""
+    service = ArchiveService(db_session, archive_dir=str(tmp_path))
+
+    with pytest.raises(EditionNotArchivedError):
+        await service.archive_edition(edition.id)
+
+
+@pytest.mark.asyncio
+async def test_restore_without_archive_fails(
+    db_session: AsyncSession, edition: Edition, tmp_path
+):
+    """Test that restoring an edition never archived is rejected."""
+    service = ArchiveService(db_session, archive_dir=str(tmp_path))
+
+    with pytest.raises(ArchiveNotFoundError):
+        await service.restore_edition(edition.id)
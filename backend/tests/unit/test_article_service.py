@@ -0,0 +1,301 @@
+"""Article declaration tests."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.exceptions import (
+    DeclarationDeadlinePassedError,
+    InvalidPriceError,
+    ItemListLockedError,
+    MaxArticlesExceededError,
+    MaxClothingExceededError,
+)
+from app.models import Article, Edition, ItemList, User
+from app.models.edition import EditionStatus
+from app.models.item_list import ListStatus
+from app.repositories.article_repository import ArticleRepository
+from app.schemas.article import ArticleInput
+from app.services import article_service
+from app.services.article_service import ArticleService
+from app.services.audit_service import AuditEvent, AuditWriter
+
+
+@pytest.fixture
+async def draft_list(db_session: AsyncSession, depositor: User) -> ItemList:
+    """A draft list with two articles, in an edition open for declarations."""
+    edition = Edition(
+        name="Bourse Automne 2025",
+        status=EditionStatus.REGISTRATIONS_OPEN.value,
+        start_datetime=datetime(2025, 10, 4, 9, 0),
+        end_datetime=datetime(2025, 10, 5, 18, 0),
+        declaration_deadline=datetime.utcnow() + timedelta(days=3),
+    )
+    db_session.add(edition)
+    await db_session.flush()
+    item_list = ItemList(number=250, edition_id=edition.id, depositor_id=depositor.id)
+    db_session.add(item_list)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Article(
+                description="Puzzle 100 pièces",
+                category="toys",
+                price=Decimal("3.00"),
+                line_number=1,
+                item_list_id=item_list.id,
+            ),
+            Article(
+                description="Robe",
+                category="clothing",
+                size="6 ans",
+                price=Decimal("4.00"),
+                line_number=2,
+                item_list_id=item_list.id,
+            ),
+        ]
+    )
+    await db_session.flush()
+    return item_list
+
+
+def _clothing(count: int) -> list[ArticleInput]:
+    return [
+        ArticleInput(description=f"Pull {n}", category="clothing", price=Decimal("2"))
+        for n in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_applies_diff_and_renumbers(
+    db_session: AsyncSession, draft_list: ItemList
+):
+    """Test that only changes are written and lines follow category order."""
+    stored = await ArticleRepository(db_session).list_summaries(draft_list.id)
+    puzzle, robe = stored
+
+    diff = await ArticleService(db_session).save_list(
+        draft_list.edition_id,
+        draft_list.id,
+        [
+            ArticleInput(
+                id=puzzle.id,
+                description="Puzzle 100 pièces",
+                category="toys",
+                price=Decimal("3"),
+            ),
+            ArticleInput(description="Baskets", category="shoes", price=Decimal("8")),
+            ArticleInput(
+                id=robe.id,
+                description="Robe",
+                category="clothing",
+                size="6 ans",
+                price=Decimal("4.50"),
+            ),
+        ],
+    )
+
+    assert (diff.created, diff.updated, diff.deleted) == (1, 2, 0)
+    assert [(a.line_number, a.description, a.price) for a in diff.articles] == [
+        (1, "Robe", Decimal("4.50")),
+        (2, "Baskets", Decimal("8.00")),
+        (3, "Puzzle 100 pièces", Decimal("3.00")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_articles_are_not_written(
+    db_session: AsyncSession, draft_list: ItemList
+):
+    """Test that saving the same state again writes nothing."""
+    puzzle, robe = await ArticleRepository(db_session).list_summaries(draft_list.id)
+    articles = [
+        ArticleInput(
+            id=puzzle.id,
+            description="Puzzle 100 pièces",
+            category="toys",
+            price=Decimal("3"),
+        ),
+        ArticleInput(
+            id=robe.id,
+            description="Robe",
+            category="clothing",
+            size="6 ans",
+            price=Decimal("4"),
+        ),
+    ]
+    service = ArticleService(db_session)
+
+    first = await service.save_list(draft_list.edition_id, draft_list.id, articles)
+    second = await service.save_list(draft_list.edition_id, draft_list.id, articles)
+
+    # Only the line numbers changed: the robe moves before the puzzle
+    assert (first.created, first.updated, first.deleted) == (0, 2, 0)
+    assert (second.created, second.updated, second.deleted) == (0, 0, 0)
+    assert [a.description for a in second.articles] == ["Robe", "Puzzle 100 pièces"]
+
+
+@pytest.mark.asyncio
+async def test_save_deletes_missing_articles(
+    db_session: AsyncSession, draft_list: ItemList
+):
+    """Test that stored articles absent from the body are deleted."""
+    puzzle, _ = await ArticleRepository(db_session).list_summaries(draft_list.id)
+
+    diff = await ArticleService(db_session).save_list(
+        draft_list.edition_id,
+        draft_list.id,
+        [
+            ArticleInput(
+                id=puzzle.id, description="Puzzle", category="toys", price=Decimal("3")
+            )
+        ],
+    )
+
+    assert (diff.created, diff.updated, diff.deleted) == (0, 1, 1)
+    assert [(a.line_number, a.description) for a in diff.articles] == [(1, "Puzzle")]
+
+
+@pytest.mark.asyncio
+async def test_price_changes_are_audited(
+    db_session: AsyncSession, draft_list: ItemList, monkeypatch
+):
+    """Test that only articles whose price changed are audited."""
+    writer = AuditWriter(async_sessionmaker(), batch_size=100, flush_interval=60)
+    monkeypatch.setattr(article_service, "audit_log", writer)
+    puzzle, robe = await ArticleRepository(db_session).list_summaries(draft_list.id)
+
+    await ArticleService(db_session).save_list(
+        draft_list.edition_id,
+        draft_list.id,
+        [
+            ArticleInput(
+                id=puzzle.id, description="Puzzle", category="toys", price=Decimal("3")
+            ),
+            ArticleInput(
+                id=robe.id,
+                description="Robe",
+                category="clothing",
+                size="6 ans",
+                price=Decimal("4.50"),
+            ),
+        ],
+        depositor_id=draft_list.depositor_id,
+    )
+
+    assert [
+        (event["event"], event["entity_id"], event["actor_id"], event["details"])
+        for event in writer.pending
+    ] == [
+        (
+            AuditEvent.PRICE_CHANGED.value,
+            robe.id,
+            draft_list.depositor_id,
+            {"old_price": "4.00", "new_price": "4.50"},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("articles", "error"),
+    [
+        (_clothing(13), MaxClothingExceededError),
+        (
+            _clothing(12)
+            + [
+                ArticleInput(
+                    description=f"Livre {n}", category="books", price=Decimal("1")
+                )
+                for n in range(13)
+            ],
+            MaxArticlesExceededError,
+        ),
+        (
+            [
+                ArticleInput(
+                    description="Poussette",
+                    category="stroller",
+                    price=Decimal("150.01"),
+                )
+            ],
+            InvalidPriceError,
+        ),
+        (
+            [
+                ArticleInput(
+                    description="Bavoir", category="nursery", price=Decimal("0.50")
+                )
+            ],
+            InvalidPriceError,
+        ),
+    ],
+)
+async def test_save_validates_whole_list(
+    db_session: AsyncSession, draft_list: ItemList, articles, error
+):
+    """Test that list limits and price ranges are enforced."""
+    with pytest.raises(error):
+        await ArticleService(db_session).save_list(
+            draft_list.edition_id, draft_list.id, articles
+        )
+
+
+@pytest.mark.asyncio
+async def test_save_requires_open_declarations(
+    db_session: AsyncSession, draft_list: ItemList
+):
+    """Test that lists cannot be edited after the declaration deadline."""
+    edition = await db_session.get(Edition, draft_list.edition_id)
+    edition.declaration_deadline = datetime.utcnow() - timedelta(hours=1)
+
+    with pytest.raises(DeclarationDeadlinePassedError):
+        await ArticleService(db_session).save_list(edition.id, draft_list.id, [])
+
+
+@pytest.mark.asyncio
+async def test_save_requires_draft_list(db_session: AsyncSession, draft_list: ItemList):
+    """Test that validated lists cannot be edited."""
+    draft_list.status = ListStatus.VALIDATED.value
+    await db_session.flush()
+
+    with pytest.raises(ItemListLockedError):
+        await ArticleService(db_session).save_list(
+            draft_list.edition_id, draft_list.id, []
+        )
+
+
+@pytest.mark.asyncio
+async def test_save_articles_endpoint(
+    client: AsyncClient, depositor_headers: dict[str, str], draft_list: ItemList
+):
+    """Test that the endpoint returns the diff and the renumbered articles."""
+    url = f"/api/v1/editions/{draft_list.edition_id}/listes/{draft_list.id}/articles"
+    body = {"articles": [{"description": "Vélo", "category": "toys", "price": 25}]}
+
+    response = await client.put(url, json=body, headers=depositor_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["deleted"]) == (1, 2)
+    assert data["articles"][0]["lineNumber"] == 1
+
+
+@pytest.mark.asyncio
+async def test_save_articles_of_another_depositor(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    draft_list: ItemList,
+):
+    """Test that a depositor cannot save the articles of someone else's list."""
+    url = f"/api/v1/editions/{draft_list.edition_id}/listes/{draft_list.id}/articles"
+
+    response = await client.put(url, json={"articles": []}, headers=auth_headers)
+
+    assert response.status_code == 404
+    stored = await ArticleRepository(db_session).list_summaries(draft_list.id)
+    assert len(stored) == 2
@@ -0,0 +1,146 @@
+"""Audit trail tests."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import AuditLog, Edition
+from app.models.sale import PaymentMethod
+from app.repositories.audit_repository import AuditRepository
+from app.services import sale_service
+from app.services.audit_service import AuditEvent, AuditWriter
+from app.services.sale_service import SaleService
+
+
+@pytest.fixture
+async def audit_factory(tmp_path):
+    """Session factory of a separate audit database.
+
+    The writer commits on its own connection, so it must not share the
+    in-memory connection holding the test's uncommitted fixtures.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditLog.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def writer(audit_factory, monkeypatch) -> AuditWriter:
+    """Audit writer used by the sale service during the test."""
+    writer = AuditWriter(audit_factory, batch_size=3, flush_interval=60)
+    monkeypatch.setattr(sale_service, "audit_log", writer)
+    return writer
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_cancellation_is_audited(
+    db_session: AsyncSession,
+    edition: Edition,
+    writer: AuditWriter,
+    audit_factory,
+):
+    """Test that a cancellation is recorded with its reason and actor."""
+    service = SaleService(db_session)
+    sale = await service.record_sale(
+        edition.id, PaymentMethod.CASH, 1, barcode="012301", seller_id="volunteer"
+    )
+    await service.cancel_sale(edition.id, sale.id, "Erreur de scan", actor_id="manager")
+
+    assert await writer.flush() == 2
+    async with audit_factory() as session:
+        entries = await AuditRepository(session).list_entries(actor_id="manager")
+        history = await AuditRepository(session).list_entries("vente", sale.id)
+
+    assert len(entries) == 1
+    assert entries[0].event == AuditEvent.SALE_CANCELLED.value
+    assert entries[0].details == {
+        "motif": "Erreur de scan",
+        "article_id": sale.article_id,
+    }
+    assert {entry.event for entry in history} == {"VENTE_ENREGISTREE", "VENTE_ANNULEE"}
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_flush(writer: AuditWriter, audit_factory):
+    """Test that a full batch is written without waiting for the interval."""
+    writer.start()
+    for number in range(3):
+        writer.record(AuditEvent.PAYOUT_PAID, "reversement", str(number))
+
+    for _ in range(100):
+        if not writer.pending:
+            break
+        await asyncio.sleep(0.01)
+    await writer.stop()
+
+    async with audit_factory() as session:
+        entries = await AuditRepository(session).list_entries("reversement")
+    assert len(entries) == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_events(writer: AuditWriter, audit_factory):
+    """Test that events queued before shutdown are written."""
+    writer.start()
+    writer.record(AuditEvent.PRICE_CHANGED, "article", "a1", actor_id="manager")
+
+    await writer.stop()
+
+    async with audit_factory() as session:
+        entries = await AuditRepository(session).list_entries("article", "a1")
+    assert [entry.actor_id for entry in entries] == ["manager"]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_events(tmp_path):
+    """Test that events are kept for the next flush when the insert fails."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+    writer = AuditWriter(async_sessionmaker(engine), batch_size=10, flush_interval=60)
+    writer.record(AuditEvent.SALE_CANCELLED, "vente", "s1")
+
+    assert await writer.flush() == 0
+    assert len(writer.pending) == 1
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded(tmp_path, caplog):
+    """Test that the oldest events are dropped and logged above max_pending."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+    writer = AuditWriter(
+        async_sessionmaker(engine), batch_size=10, flush_interval=60, max_pending=3
+    )
+    for number in range(3):
+        writer.record(AuditEvent.SALE_CANCELLED, "vente", f"s{number}")
+    await writer.flush()
+    for number in range(3, 5):
+        writer.record(AuditEvent.SALE_CANCELLED, "vente", f"s{number}")
+
+    await writer.flush()
+
+    assert [event["entity_id"] for event in writer.pending] == ["s2", "s3", "s4"]
+    assert writer.dropped == 2
+    assert "Dropped 2 audit events" in caplog.text
+    await engine.dispose()
+
+
+def test_record_overhead(writer: AuditWriter):
+    """Test that queuing an event costs well under a millisecond."""
+    writer.batch_size = 100_000
+    start = time.perf_counter()
+    for number in range(1000):
+        writer.record(
+            AuditEvent.SALE_RECORDED,
+            "vente",
+            str(number),
+            actor_id="volunteer",
+            details={"article_id": "a1", "price": "5.00", "register_number": 1},
+        )
+    elapsed = (time.perf_counter() - start) / 1000
+
+    assert elapsed < 0.001
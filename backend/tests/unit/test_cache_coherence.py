@@ -0,0 +1,142 @@
+"""Cache coherence tests, each registry standing for another worker."""
+
+from datetime import time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition, ItemList
+from app.schemas.deposit_slot import DepositSlotCreate
+from app.services.cache_coherence import LIST_SCOPE, SLOTS_SCOPE, CacheCoherence
+from app.services.deposit_slot_service import (
+    DepositSlotService,
+    SlotAvailabilityCache,
+)
+from app.services.search_service import SearchIndexRegistry
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_worker(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that another worker applies each invalidation once."""
+    writer, reader = CacheCoherence(), CacheCoherence()
+    calls = []
+    reader.register(LIST_SCOPE, lambda *args: calls.append(args))
+    await reader.sync(db_session, edition.id)
+
+    await writer.invalidate(db_session, edition.id, LIST_SCOPE, "list-1")
+    await writer.invalidate(db_session, edition.id, SLOTS_SCOPE)
+    await writer.invalidate(db_session, edition.id, LIST_SCOPE, "list-2")
+    await reader.sync(db_session, edition.id)
+    await reader.sync(db_session, edition.id)
+
+    assert sorted(calls) == [(edition.id, "list-1"), (edition.id, "list-2")]
+
+
+@pytest.mark.asyncio
+async def test_own_caches_are_dropped_on_commit(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that the writing worker drops its entries once the change commits."""
+    coherence = CacheCoherence()
+    calls = []
+    coherence.register(LIST_SCOPE, lambda *args: calls.append(args))
+
+    # Creating the version rows releases savepoints, not the transaction
+    await coherence.invalidate(db_session, edition.id, LIST_SCOPE, "list-1")
+    assert calls == []
+    await db_session.commit()
+
+    assert calls == [(edition.id, "list-1")]
+
+
+@pytest.mark.asyncio
+async def test_rollback_keeps_own_caches(db_session: AsyncSession, edition: Edition):
+    """Test that a rolled back change does not drop the writer's entries."""
+    coherence = CacheCoherence()
+    calls = []
+    coherence.register(LIST_SCOPE, lambda *args: calls.append(args))
+    edition_id = edition.id
+
+    await coherence.invalidate(db_session, edition_id, LIST_SCOPE, "list-1")
+    await db_session.rollback()
+    await db_session.commit()
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_first_sync_skips_older_invalidations(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that a worker starting with empty caches ignores past writes."""
+    writer, reader = CacheCoherence(), CacheCoherence()
+    calls = []
+    reader.register(LIST_SCOPE, lambda *args: calls.append(args))
+    await writer.invalidate(db_session, edition.id, LIST_SCOPE, "list-1")
+
+    await reader.sync(db_session, edition.id)
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_sync_interval(db_session: AsyncSession, edition: Edition):
+    """Test that invalidations wait for the next check with an interval."""
+    writer, reader = CacheCoherence(), CacheCoherence(sync_interval=60)
+    calls = []
+    reader.register(LIST_SCOPE, lambda *args: calls.append(args))
+    await reader.sync(db_session, edition.id)
+
+    await writer.invalidate(db_session, edition.id, LIST_SCOPE, "list-1")
+    await reader.sync(db_session, edition.id)
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_other_worker_reloads_edited_list(
+    db_session: AsyncSession, edition: Edition, item_list: ItemList
+):
+    """Test that a list invalidated by one worker is reloaded by another."""
+    writer = CacheCoherence()
+    other_worker = SearchIndexRegistry(coherence=CacheCoherence())
+    index = await other_worker.get(db_session, edition.id)
+    assert index.search("trottinette") == []
+
+    db_session.add(
+        Article(
+            description="Trottinette",
+            category="toys",
+            price=Decimal("12.00"),
+            line_number=4,
+            item_list_id=item_list.id,
+        )
+    )
+    await db_session.flush()
+    await writer.invalidate(db_session, edition.id, LIST_SCOPE, item_list.id)
+    index = await other_worker.get(db_session, edition.id)
+
+    assert [doc.line_number for doc, _ in index.search("trottinette")] == [4]
+
+
+@pytest.mark.asyncio
+async def test_other_worker_sees_new_slot(db_session: AsyncSession, edition: Edition):
+    """Test that slot availability cached for an hour shows a new slot."""
+    other_worker = SlotAvailabilityCache(ttl=3600, coherence=CacheCoherence())
+    assert (await other_worker.get(db_session, edition.id)).places == {}
+
+    slot = await DepositSlotService(db_session).create_slot(
+        edition.id,
+        DepositSlotCreate(
+            day=edition.start_datetime.date(),
+            start_time=time(9),
+            end_time=time(11),
+            capacity=30,
+        ),
+    )
+    availability = await other_worker.get(db_session, edition.id)
+
+    assert availability.places == {slot.id: 30}
@@ -0,0 +1,108 @@
+"""Register catalog feed tests."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition
+from app.models.article import ArticleStatus
+from app.services.catalog_service import CatalogService, next_catalog_version
+
+
+async def _sell(db_session: AsyncSession, edition: Edition, article: Article) -> None:
+    article.status = ArticleStatus.SOLD.value
+    article.change_version = await next_catalog_version(db_session, edition.id)
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_full_snapshot(db_session: AsyncSession, edition: Edition):
+    """Test that a snapshot lists every article on sale with compact rows."""
+    feed = await CatalogService(db_session).get_feed(edition.id)
+
+    assert feed.full is True
+    assert feed.v == 0
+    assert [row[1] for row in feed.a] == ["012301", "012302", "012303"]
+    assert feed.a[0][2] == 500
+    assert feed.a[0][3] == "on_sale"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_delta_only_returns_changed_articles(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that a delta carries only articles changed after `since`."""
+    service = CatalogService(db_session)
+    snapshot = await service.get_feed(edition.id)
+    result = await db_session.execute(
+        select(Article).where(Article.barcode == "012302")
+    )
+    await _sell(db_session, edition, result.scalar_one())
+
+    delta = await service.get_feed(edition.id, since=snapshot.v)
+
+    assert delta.full is False
+    assert delta.v == snapshot.v + 1
+    assert [(row[1], row[3]) for row in delta.a] == [("012302", "sold")]
+    assert (await service.get_feed(edition.id, since=delta.v)).a == []
+
+
+@pytest.mark.asyncio
+async def test_versions_are_monotonic(db_session: AsyncSession, edition: Edition):
+    """Test that each change gets a strictly greater catalog version."""
+    versions = [await next_catalog_version(db_session, edition.id) for _ in range(3)]
+
+    assert versions == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_unknown_version_returns_snapshot(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that a version ahead of the server falls back to a full snapshot."""
+    feed = await CatalogService(db_session).get_feed(edition.id, since=999)
+
+    assert feed.full is True
+    assert len(feed.a) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_catalog_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test the catalog endpoint with and without `since`."""
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/catalogue", headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["full"] is True
+    assert data["f"][:3] == ["id", "code", "price_cents"]
+
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/catalogue",
+        params={"since": data["v"]},
+        headers=auth_headers,
+    )
+    assert response.json()["a"] == []
+
+
+@pytest.mark.asyncio
+async def test_catalog_endpoint_unknown_edition(
+    client: AsyncClient, auth_headers: dict[str, str]
+):
+    """Test that an unknown edition returns 404."""
+    response = await client.get(
+        "/api/v1/editions/unknown/catalogue", headers=auth_headers
+    )
+
+    assert response.status_code == 404
+    assert response.json()["code"] == "NOT_FOUND"
@@ -0,0 +1,198 @@
+"""Deposit desk check-in tests."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleNotFoundError,
+    InvalidListCodeError,
+    ItemListNotValidatedError,
+)
+from app.models import Article, Edition, ItemList, User
+from app.models.article import ArticleStatus
+from app.models.item_list import ListStatus
+from app.services.catalog_service import CatalogService
+from app.services.check_in_service import CheckInService, parse_list_code
+
+
+async def _validated_list(
+    db_session: AsyncSession, edition: Edition, depositor: User, number: int, size: int
+) -> ItemList:
+    item_list = ItemList(
+        number=number,
+        label_color="sky_blue",
+        status=ListStatus.VALIDATED.value,
+        edition_id=edition.id,
+        depositor_id=depositor.id,
+    )
+    db_session.add(item_list)
+    await db_session.flush()
+    db_session.add_all(
+        Article(
+            description=f"Jouet {line_number}",
+            category="toys",
+            price=Decimal("2.00"),
+            line_number=line_number,
+            status=ArticleStatus.VALIDATED.value,
+            item_list_id=item_list.id,
+        )
+        for line_number in range(1, size + 1)
+    )
+    await db_session.commit()
+    return item_list
+
+
+@pytest.fixture
+async def validated_list(
+    db_session: AsyncSession, edition: Edition, depositor: User
+) -> ItemList:
+    """A validated list of 12 articles, not checked in yet."""
+    return await _validated_list(db_session, edition, depositor, 142, 12)
+
+
+async def _articles(db_session: AsyncSession, item_list_id: str) -> list[Article]:
+    result = await db_session.execute(
+        select(Article)
+        .where(Article.item_list_id == item_list_id)
+        .order_by(Article.line_number)
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars())
+
+
+def test_parse_list_code():
+    """Test the list codes accepted from the scanner or typed in."""
+    assert {
+        parse_list_code(code) for code in ("142", "0142", "L142", "e2025-l142")
+    } == {142}
+    for code in ("E2025", "L142-A07", ""):
+        with pytest.raises(InvalidListCodeError):
+            parse_list_code(code)
+
+
+@pytest.mark.asyncio
+async def test_check_in_puts_articles_on_sale(
+    db_session: AsyncSession, edition: Edition, validated_list: ItemList
+):
+    """Test the list and article transitions, barcodes and catalog delta."""
+    catalog = CatalogService(db_session)
+    before = await catalog.get_version(edition.id)
+
+    result = await CheckInService(db_session).check_in(edition.id, "L142")
+
+    await db_session.refresh(validated_list)
+    articles = await _articles(db_session, validated_list.id)
+    assert validated_list.status == ListStatus.CHECKED_IN.value
+    assert validated_list.checked_in_at is not None
+    assert {article.status for article in articles} == {ArticleStatus.ON_SALE.value}
+    assert [article.barcode for article in articles[8:]] == [
+        "014209",
+        "014210",
+        "014211",
+        "014212",
+    ]
+    assert (result.on_sale, result.excluded) == (12, 0)
+    assert (result.item_list.status, result.item_list.article_count) == (
+        ListStatus.CHECKED_IN.value,
+        12,
+    )
+    delta = await catalog.get_feed(edition.id, since=before)
+    assert delta.v == result.catalog_version
+    assert len(delta.a) == 12
+
+
+@pytest.mark.asyncio
+async def test_rejected_articles_stay_off_sale(
+    db_session: AsyncSession, edition: Edition, validated_list: ItemList
+):
+    """Test that excluded articles are neither on sale nor labelled."""
+    rejected = (await _articles(db_session, validated_list.id))[:2]
+
+    result = await CheckInService(db_session).check_in(
+        edition.id, "142", [article.id for article in rejected]
+    )
+
+    articles = await _articles(db_session, validated_list.id)
+    assert (result.on_sale, result.excluded) == (10, 2)
+    assert [(article.status, article.barcode) for article in articles[:3]] == [
+        (ArticleStatus.VALIDATED.value, None),
+        (ArticleStatus.VALIDATED.value, None),
+        (ArticleStatus.ON_SALE.value, "014203"),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("validated_list")
+async def test_check_in_is_refused_twice(
+    db_session: AsyncSession,
+    edition: Edition,
+    item_list: ItemList,
+):
+    """Test unknown exclusions and lists that are not validated."""
+    service = CheckInService(db_session)
+
+    with pytest.raises(ArticleNotFoundError):
+        await service.check_in(edition.id, "142", ["unknown"])
+    await service.check_in(edition.id, "142")
+    with pytest.raises(ItemListNotValidatedError):
+        await service.check_in(edition.id, "142")
+    with pytest.raises(ItemListNotValidatedError):
+        await service.check_in(edition.id, str(item_list.number))
+
+
+@pytest.mark.asyncio
+async def test_statements_do_not_depend_on_list_size(
+    db_session: AsyncSession, edition: Edition, depositor: User, test_engine
+):
+    """Test that a full list takes as many statements as a short one."""
+    first = await _validated_list(db_session, edition, depositor, 100, 2)
+    short = await _validated_list(db_session, edition, depositor, 101, 2)
+    full = await _validated_list(db_session, edition, depositor, 102, 24)
+    # The first check-in of an edition creates its catalog counter
+    await CheckInService(db_session).check_in(edition.id, str(first.number))
+    statements = []
+
+    @event.listens_for(test_engine.sync_engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    counts = []
+    try:
+        for item_list in (short, full):
+            statements.clear()
+            await CheckInService(db_session).check_in(edition.id, str(item_list.number))
+            counts.append(len(statements))
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert counts[0] == counts[1]
+    assert sum("UPDATE articles" in statement for statement in statements) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("validated_list")
+async def test_check_in_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test the summary returned to the deposit desk."""
+    url = f"/api/v1/editions/{edition.id}/listes/depot"
+
+    response = await client.post(url, json={"code": "L142"}, headers=auth_headers)
+    again = await client.post(url, json={"code": "L142"}, headers=auth_headers)
+    unknown = await client.post(url, json={"code": "L999"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["onSale"], data["excluded"]) == (12, 0)
+    assert (data["itemList"]["number"], data["itemList"]["status"]) == (
+        142,
+        "checked_in",
+    )
+    assert again.json()["code"] == "ITEM_LIST_NOT_VALIDATED"
+    assert unknown.status_code == 404
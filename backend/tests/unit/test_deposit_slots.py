@@ -0,0 +1,307 @@
+"""Deposit slot reservation tests."""
+
+import asyncio
+from datetime import date, datetime, time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.exceptions import (
+    DepositSlotFullError,
+    DepositSlotResidentsOnlyError,
+    DepositSlotWeekTakenError,
+    RegistrationsClosedError,
+    ValidationError,
+)
+from app.models import DepositSlot, DepositSlotReservation, Edition, Role, User
+from app.models.base import Base, generate_uuid
+from app.models.deposit_slot import collection_week
+from app.models.edition import EditionStatus
+from app.schemas.deposit_slot import DepositSlotCreate, DepositSlotUpdate
+from app.services.deposit_slot_service import DepositSlotService, slot_availability
+
+WEDNESDAY = date(2025, 3, 12)
+
+
+def _slot(
+    edition_id: str, capacity: int, day: date = WEDNESDAY, **kwargs
+) -> DepositSlot:
+    return DepositSlot(
+        day=day,
+        start_time=time(9, 30),
+        end_time=time(11, 30),
+        week=collection_week(day),
+        capacity=capacity,
+        reserved_count=0,
+        edition_id=edition_id,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+async def open_edition(db_session: AsyncSession) -> Edition:
+    """An edition open for registrations."""
+    edition = Edition(
+        name="Bourse Printemps 2025",
+        status=EditionStatus.REGISTRATIONS_OPEN.value,
+        start_datetime=datetime(2025, 3, 15, 9, 0),
+        end_datetime=datetime(2025, 3, 16, 18, 0),
+    )
+    db_session.add(edition)
+    await db_session.flush()
+    return edition
+
+
+@pytest.fixture
+async def slot(db_session: AsyncSession, open_edition: Edition) -> DepositSlot:
+    """A two-place slot."""
+    slot = _slot(open_edition.id, capacity=2)
+    db_session.add(slot)
+    await db_session.flush()
+    return slot
+
+
+async def _depositors(db_session: AsyncSession, count: int) -> list[str]:
+    role = Role(name="depositor")
+    db_session.add(role)
+    await db_session.flush()
+    ids = [generate_uuid() for _ in range(count)]
+    await db_session.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "email": f"deposant{n}@example.com",
+                "first_name": "D",
+                "last_name": str(n),
+                "role_id": role.id,
+            }
+            for n, user_id in enumerate(ids)
+        ],
+    )
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_reserve_takes_places_until_full(
+    db_session: AsyncSession, open_edition: Edition, slot: DepositSlot
+):
+    """Test that reservations stop at the slot capacity."""
+    first, second, third = await _depositors(db_session, 3)
+    service = DepositSlotService(db_session)
+
+    await service.reserve(open_edition.id, slot.id, first)
+    await service.reserve(open_edition.id, slot.id, second)
+    with pytest.raises(DepositSlotFullError):
+        await service.reserve(open_edition.id, slot.id, third)
+
+    (availability,) = await service.get_availability(open_edition.id)
+    assert availability.available_places == 0
+    (summary,) = await service.list_slots(open_edition.id)
+    assert (summary.reserved_count, summary.available_places) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_cancel_releases_place(
+    db_session: AsyncSession, open_edition: Edition, slot: DepositSlot
+):
+    """Test that a cancelled reservation frees its place."""
+    (depositor,) = await _depositors(db_session, 1)
+    service = DepositSlotService(db_session)
+    await service.reserve(open_edition.id, slot.id, depositor)
+
+    await service.cancel_reservation(open_edition.id, slot.id, depositor)
+
+    (availability,) = await service.get_availability(open_edition.id)
+    assert availability.available_places == 2
+    count = await db_session.scalar(select(func.count(DepositSlotReservation.id)))
+    assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_one_slot_per_week(
+    db_session: AsyncSession, open_edition: Edition, slot: DepositSlot
+):
+    """Test that a second slot in the same week is refused and not counted."""
+    thursday = _slot(open_edition.id, capacity=5, day=date(2025, 3, 13))
+    next_week = _slot(open_edition.id, capacity=5, day=date(2025, 3, 19))
+    db_session.add_all([thursday, next_week])
+    await db_session.flush()
+    (depositor,) = await _depositors(db_session, 1)
+    # A refused reservation rolls back: keep the test data
+    await db_session.commit()
+    edition_id, slot_ids = open_edition.id, [slot.id, thursday.id, next_week.id]
+    service = DepositSlotService(db_session)
+    await service.reserve(edition_id, slot_ids[0], depositor)
+
+    with pytest.raises(DepositSlotWeekTakenError):
+        await service.reserve(edition_id, slot_ids[1], depositor)
+    await service.reserve(edition_id, slot_ids[2], depositor)
+
+    counts = [s.reserved_count for s in await service.list_slots(edition_id)]
+    assert counts == [1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_local_only_slot(db_session: AsyncSession, open_edition: Edition):
+    """Test that resident slots are refused to other depositors."""
+    local_slot = _slot(open_edition.id, capacity=5, is_local_only=True)
+    db_session.add(local_slot)
+    await db_session.flush()
+    outsider, resident = await _depositors(db_session, 2)
+    (await db_session.get(User, resident)).is_local_resident = True
+    await db_session.commit()
+    edition_id, slot_id = open_edition.id, local_slot.id
+    service = DepositSlotService(db_session)
+
+    with pytest.raises(DepositSlotResidentsOnlyError):
+        await service.reserve(edition_id, slot_id, outsider)
+    reservation = await service.reserve(edition_id, slot_id, resident)
+
+    assert reservation.slot_id == slot_id
+
+
+@pytest.mark.asyncio
+async def test_reserve_requires_open_registrations(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that slots of an edition in progress cannot be reserved."""
+    in_progress_slot = _slot(edition.id, capacity=5)
+    db_session.add(in_progress_slot)
+    await db_session.flush()
+
+    with pytest.raises(RegistrationsClosedError):
+        await DepositSlotService(db_session).reserve(
+            edition.id, in_progress_slot.id, "someone"
+        )
+
+
+@pytest.mark.asyncio
+async def test_capacity_cannot_drop_below_reservations(
+    db_session: AsyncSession, open_edition: Edition, slot: DepositSlot
+):
+    """Test that the capacity update is conditional on reservations."""
+    first, second = await _depositors(db_session, 2)
+    service = DepositSlotService(db_session)
+    await service.reserve(open_edition.id, slot.id, first)
+    await service.reserve(open_edition.id, slot.id, second)
+
+    with pytest.raises(ValidationError):
+        await service.update_slot(
+            open_edition.id, slot.id, DepositSlotUpdate(capacity=1)
+        )
+    summary = await service.update_slot(
+        open_edition.id, slot.id, DepositSlotUpdate(capacity=3)
+    )
+
+    assert summary.available_places == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_never_overbook(tmp_path):
+    """Test 500 concurrent reservations of a 20-place slot.
+
+    Each reservation runs in its own session on a file database, so the
+    requests really compete for the slot row.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'slots.db'}",
+        connect_args={"timeout": 30},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        edition = Edition(
+            name="Bourse concurrente",
+            status=EditionStatus.REGISTRATIONS_OPEN.value,
+            start_datetime=datetime(2025, 3, 15, 9, 0),
+            end_datetime=datetime(2025, 3, 16, 18, 0),
+        )
+        session.add(edition)
+        await session.flush()
+        popular = _slot(edition.id, capacity=20)
+        session.add(popular)
+        depositors = await _depositors(session, 500)
+        await session.commit()
+
+    async def reserve(depositor_id: str) -> str:
+        async with session_factory() as session:
+            try:
+                await DepositSlotService(session).reserve(
+                    edition.id, popular.id, depositor_id
+                )
+            except DepositSlotFullError:
+                return "full"
+            return "reserved"
+
+    try:
+        outcomes = await asyncio.gather(*(reserve(d) for d in depositors))
+
+        async with session_factory() as session:
+            reserved_count = await session.scalar(
+                select(DepositSlot.reserved_count).where(DepositSlot.id == popular.id)
+            )
+            reservations = await session.scalar(
+                select(func.count(DepositSlotReservation.id))
+            )
+    finally:
+        slot_availability.invalidate(edition.id)
+        await engine.dispose()
+
+    assert outcomes.count("reserved") == 20
+    assert outcomes.count("full") == 480
+    assert reserved_count == reservations == 20
+
+
+@pytest.mark.asyncio
+async def test_slot_endpoints(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    open_edition: Edition,
+):
+    """Test slot creation, availability polling and reservation."""
+    role = Role(name="depositor")
+    db_session.add_all(
+        [
+            role,
+            User(
+                id="test-user",
+                email="test@example.com",
+                first_name="T",
+                last_name="U",
+                role=role,
+            ),
+        ]
+    )
+    await db_session.flush()
+    base_url = f"/api/v1/editions/{open_edition.id}/creneaux"
+    body = DepositSlotCreate(
+        day=WEDNESDAY, start_time=time(14), end_time=time(18), capacity=40
+    ).model_dump(mode="json", by_alias=True)
+
+    created = await client.post(base_url, json=body, headers=auth_headers)
+    assert created.status_code == 201
+    slot_id = created.json()["id"]
+    availability = await client.get(f"{base_url}/disponibilites", headers=auth_headers)
+    assert availability.json() == [{"id": slot_id, "availablePlaces": 40}]
+
+    reserved = await client.post(
+        f"{base_url}/{slot_id}/reservation", headers=auth_headers
+    )
+    assert reserved.status_code == 201
+    assert reserved.json()["depositorId"] == "test-user"
+
+    polled = await client.get(
+        f"{base_url}/disponibilites",
+        headers={**auth_headers, "If-None-Match": availability.headers["etag"]},
+    )
+    assert polled.json() == [{"id": slot_id, "availablePlaces": 39}]
+    again = await client.get(
+        f"{base_url}/disponibilites",
+        headers={**auth_headers, "If-None-Match": polled.headers["etag"]},
+    )
+    assert again.status_code == 304
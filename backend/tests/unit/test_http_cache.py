@@ -0,0 +1,145 @@
+"""Conditional GET and response compression tests."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition, ItemList
+from app.services.cache_coherence import LIST_SCOPE, cache_coherence
+from app.utils.http_cache import get_rows_version, make_etag
+
+
+def test_make_etag_is_strong_and_stable():
+    """Test that ETags are quoted, deterministic and version-sensitive."""
+    etag = make_etag("catalog", "edition-1", 3)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("catalog", "edition-1", 3)
+    assert etag != make_etag("catalog", "edition-1", 4)
+
+
+@pytest.mark.asyncio
+async def test_get_rows_version(db_session: AsyncSession, item_list: ItemList):
+    """Test that the collection version counts the matching rows."""
+    count, latest = await get_rows_version(
+        db_session, Article.change_version, Article.item_list_id == item_list.id
+    )
+
+    assert count == 3
+    assert latest is not None
+
+
+@pytest.mark.asyncio
+async def test_article_list_etag_follows_versions(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+    item_list: ItemList,
+):
+    """Test that edits and sales change the ETag, even within one second."""
+    url = f"/api/v1/editions/{edition.id}/listes/{item_list.id}/articles"
+    first = (await client.get(url, headers=auth_headers)).headers["etag"]
+
+    # A declaration edit keeping the same updated_at
+    await db_session.execute(
+        update(Article)
+        .where(Article.barcode == "012301")
+        .values(price=Decimal("6.00"), updated_at=Article.updated_at)
+    )
+    await cache_coherence.invalidate(db_session, edition.id, LIST_SCOPE, item_list.id)
+    edited = await client.get(url, headers={**auth_headers, "If-None-Match": first})
+    await client.post(
+        f"/api/v1/editions/{edition.id}/ventes",
+        json={"barcode": "012302", "paymentMethod": "cash", "registerNumber": 1},
+        headers=auth_headers,
+    )
+    sold = await client.get(
+        url, headers={**auth_headers, "If-None-Match": edited.headers["etag"]}
+    )
+
+    assert edited.status_code == sold.status_code == 200
+    assert edited.json()[0]["price"] == 6.0
+    assert sold.headers["etag"] not in (first, edited.headers["etag"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_catalog_revalidation_returns_304(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that a matching If-None-Match returns an empty 304."""
+    url = f"/api/v1/editions/{edition.id}/catalogue"
+    response = await client.get(url, headers=auth_headers)
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_stale_etag_returns_body(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that a stale ETag gets the full response."""
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/catalogue",
+        headers={**auth_headers, "If-None-Match": '"stale"'},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["a"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+    item_list: ItemList,
+):
+    """Test that responses above the threshold are compressed."""
+    for line_number in range(4, 40):
+        db_session.add(
+            Article(
+                description=f"Body taille {line_number} mois",
+                category="clothing",
+                price=2,
+                line_number=line_number,
+                status="on_sale",
+                barcode=f"0123{line_number:02d}",
+                item_list_id=item_list.id,
+            )
+        )
+    await db_session.flush()
+    url = f"/api/v1/editions/{edition.id}/catalogue"
+
+    gzipped = await client.get(url, headers={**auth_headers, "Accept-Encoding": "gzip"})
+    brotli_encoded = await client.get(
+        url, headers={**auth_headers, "Accept-Encoding": "br"}
+    )
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert brotli_encoded.headers["content-encoding"] == "br"
+    assert int(gzipped.headers["content-length"]) < len(gzipped.content)
+    assert brotli_encoded.json() == gzipped.json()
+
+
+@pytest.mark.asyncio
+async def test_small_responses_are_not_compressed(client: AsyncClient):
+    """Test that responses below the threshold are sent as is."""
+    response = await client.get("/health", headers={"Accept-Encoding": "gzip, br"})
+
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,243 @@
+"""Idempotency-Key middleware tests."""
+
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from jose import jwt
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.middleware.idempotency import IdempotencyStore, idempotency_store
+from app.models import Edition, IdempotencyKey, Sale
+
+
+@pytest.fixture
+async def store(tmp_path):
+    """Point the application store at its own test database.
+
+    The store commits on its own connection, so it must not share the
+    in-memory connection holding the test's uncommitted fixtures.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'keys.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(IdempotencyKey.__table__.create)
+
+    session_factory = idempotency_store.session_factory
+    idempotency_store.session_factory = async_sessionmaker(
+        engine, expire_on_commit=False
+    )
+    idempotency_store.clear()
+    yield idempotency_store
+    idempotency_store.clear()
+    idempotency_store.session_factory = session_factory
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list", "store")
+async def test_retry_replays_original_response(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+):
+    """Test that a retried sale returns the stored 201 instead of a 409."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+    headers = {**auth_headers, "Idempotency-Key": "sale-1"}
+
+    first = await client.post(url, json=body, headers=headers)
+    retry = await client.post(url, json=body, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert await db_session.scalar(select(func.count(Sale.id))) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list", "store")
+async def test_key_reused_with_different_body(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that a key reused for another request is rejected."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    headers = {**auth_headers, "Idempotency-Key": "sale-2"}
+    await client.post(
+        url,
+        json={"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1},
+        headers=headers,
+    )
+
+    response = await client.post(
+        url,
+        json={"barcode": "012302", "paymentMethod": "cash", "registerNumber": 1},
+        headers=headers,
+    )
+
+    assert response.status_code == 422
+    assert response.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_replay_from_database_after_memory_loss(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+    store: IdempotencyStore,
+):
+    """Test that a response is replayed from the database fallback."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012303", "paymentMethod": "card", "registerNumber": 2}
+    headers = {**auth_headers, "Idempotency-Key": "sale-3"}
+    first = await client.post(url, json=body, headers=headers)
+
+    store.clear()
+    retry = await client.post(url, json=body, headers=headers)
+
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    async with store.session_factory() as session:
+        assert await session.scalar(select(func.count(IdempotencyKey.key))) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list", "store")
+async def test_key_reused_by_another_user(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+):
+    """Test that a key only replays responses to the user who sent it."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+    token = jwt.encode(
+        {"sub": "other-user"}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+    )
+    first = await client.post(
+        url, json=body, headers={**auth_headers, "Idempotency-Key": "sale-6"}
+    )
+
+    response = await client.post(
+        url,
+        json=body,
+        headers={"Authorization": f"Bearer {token}", "Idempotency-Key": "sale-6"},
+    )
+
+    assert first.status_code == 201
+    assert response.status_code == 409
+    assert "idempotent-replayed" not in response.headers
+    assert await db_session.scalar(select(func.count(Sale.id))) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list", "store")
+async def test_requests_without_key_are_not_stored(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that requests without a key go straight through."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+
+    await client.post(url, json=body, headers=auth_headers)
+    response = await client.post(url, json=body, headers=auth_headers)
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list", "store")
+async def test_auth_errors_are_not_stored(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that a retry after a 401 runs the sale instead of replaying."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+    key = {"Idempotency-Key": "sale-4"}
+
+    first = await client.post(url, json=body, headers=key)
+    retry = await client.post(url, json=body, headers={**auth_headers, **key})
+
+    assert first.status_code == 401
+    assert retry.status_code == 201
+    assert "idempotent-replayed" not in retry.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_key_reserved_by_another_worker(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+    store: IdempotencyStore,
+):
+    """Test that a key reserved in the database is refused until released."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+    headers = {**auth_headers, "Idempotency-Key": "sale-5"}
+    worker = IdempotencyStore(
+        max_entries=10, ttl_seconds=60, session_factory=store.session_factory
+    )
+    key = hashlib.sha256(f"test-user\n{url}\nsale-5".encode()).hexdigest()
+    assert await worker.acquire(key, "hash")
+
+    response = await client.post(url, json=body, headers=headers)
+    await worker.release(key)
+    retry = await client.post(url, json=body, headers=headers)
+
+    assert response.status_code == 409
+    assert response.json()["code"] == "IDEMPOTENCY_KEY_IN_USE"
+    assert retry.status_code == 201
+    assert await db_session.scalar(select(func.count(Sale.id))) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_reservation_expires(store: IdempotencyStore):
+    """Test that a reservation left by a crashed worker frees its key."""
+    async with store.session_factory() as session:
+        session.add(
+            IdempotencyKey(
+                key="stale",
+                request_hash="hash",
+                status_code=0,
+                headers="[]",
+                body=b"",
+                expires_at=datetime.utcnow() - timedelta(seconds=1),
+            )
+        )
+        await session.commit()
+
+    assert await store.get("stale") is None
+    assert await store.acquire("stale", "hash")
+
+
+@pytest.mark.asyncio
+async def test_memory_store_is_bounded():
+    """Test that the oldest entries are evicted beyond max_entries."""
+    store = IdempotencyStore(max_entries=2, ttl_seconds=60)
+    for key in ("a", "b", "c"):
+        await store.save(key, "hash", 201, [], b"{}")
+
+    assert await store.get("a") is None
+    assert await store.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_ignored():
+    """Test that entries past their TTL are not replayed."""
+    store = IdempotencyStore(max_entries=10, ttl_seconds=0)
+    await store.save("a", "hash", 201, [], b"{}")
+
+    assert await store.get("a") is None
@@ -0,0 +1,232 @@
+"""List duplication tests."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    DeclarationDeadlinePassedError,
+    MaxClothingExceededError,
+    MaxListsExceededError,
+)
+from app.models import Article, Edition, ItemList
+from app.models.article import ArticleStatus
+from app.models.edition import EditionStatus
+from app.models.item_list import ListStatus
+from app.services.item_list_service import ItemListService
+
+
+@pytest.fixture
+async def next_edition(db_session: AsyncSession) -> Edition:
+    """An edition open for declarations."""
+    edition = Edition(
+        name="Bourse Automne 2025",
+        status=EditionStatus.REGISTRATIONS_OPEN.value,
+        start_datetime=datetime(2025, 10, 4, 9, 0),
+        end_datetime=datetime(2025, 10, 5, 18, 0),
+    )
+    db_session.add(edition)
+    await db_session.flush()
+    return edition
+
+
+async def _articles(db_session: AsyncSession, item_list_id: str) -> list[Article]:
+    result = await db_session.execute(
+        select(Article)
+        .where(Article.item_list_id == item_list_id)
+        .order_by(Article.line_number)
+    )
+    return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_duplicate_list_into_next_edition(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that a copy is a numbered draft list without barcodes."""
+    new_id = await ItemListService(db_session).duplicate_list(
+        item_list.edition_id, item_list.id, target_edition_id=next_edition.id
+    )
+
+    copy = await db_session.get(ItemList, new_id)
+    articles = await _articles(db_session, new_id)
+    assert (copy.edition_id, copy.number, copy.label_color) == (
+        next_edition.id,
+        100,
+        "sky_blue",
+    )
+    assert copy.status == ListStatus.DRAFT.value
+    assert copy.depositor_id == item_list.depositor_id
+    assert [(a.line_number, a.description) for a in articles] == [
+        (1, "Pantalon bleu"),
+        (2, "Puzzle 100 pièces"),
+        (3, "Poussette canne"),
+    ]
+    assert {a.status for a in articles} == {ArticleStatus.DRAFT.value}
+    assert {a.barcode for a in articles} == {None}
+    assert len({a.id for a in articles}) == 3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_selected_articles(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that only the selected articles are copied, renumbered."""
+    source = await _articles(db_session, item_list.id)
+
+    new_id = await ItemListService(db_session).duplicate_list(
+        item_list.edition_id,
+        item_list.id,
+        target_edition_id=next_edition.id,
+        article_ids=[source[1].id, source[2].id],
+    )
+
+    articles = await _articles(db_session, new_id)
+    assert [(a.line_number, a.description) for a in articles] == [
+        (1, "Puzzle 100 pièces"),
+        (2, "Poussette canne"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_requires_open_edition(
+    db_session: AsyncSession, item_list: ItemList
+):
+    """Test that lists cannot be created in an edition closed to declarations."""
+    with pytest.raises(DeclarationDeadlinePassedError):
+        await ItemListService(db_session).duplicate_list(
+            item_list.edition_id, item_list.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_checks_max_lists(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that copies count towards the depositor's lists of a type."""
+    service = ItemListService(db_session)
+    for _ in range(2):
+        await service.duplicate_list(
+            item_list.edition_id, item_list.id, target_edition_id=next_edition.id
+        )
+
+    with pytest.raises(MaxListsExceededError):
+        await service.duplicate_list(
+            item_list.edition_id, item_list.id, target_edition_id=next_edition.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_copy_cohort_skips_sold_articles(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that a cohort copy only carries unsold articles over."""
+    for barcode, status in (
+        ("012301", ArticleStatus.SOLD),
+        ("012302", ArticleStatus.UNSOLD),
+        ("012303", ArticleStatus.RETRIEVED),
+    ):
+        await db_session.execute(
+            update(Article)
+            .where(Article.barcode == barcode)
+            .values(status=status.value)
+        )
+    for line_number, status in ((4, ArticleStatus.DONATED), (5, ArticleStatus.DRAFT)):
+        db_session.add(
+            Article(
+                description="Bavoir",
+                category="other",
+                price=Decimal("1.00"),
+                line_number=line_number,
+                status=status.value,
+                item_list_id=item_list.id,
+            )
+        )
+    await db_session.flush()
+
+    (new_id,) = await ItemListService(db_session).copy_cohort(
+        item_list.edition_id, next_edition.id, [item_list.depositor_id]
+    )
+
+    articles = await _articles(db_session, new_id)
+    assert [a.description for a in articles] == ["Puzzle 100 pièces", "Poussette canne"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_article_inserts_after_source(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that a duplicated article is placed right after its source."""
+    service = ItemListService(db_session)
+    new_id = await service.duplicate_list(
+        item_list.edition_id, item_list.id, target_edition_id=next_edition.id
+    )
+    pantalon = (await _articles(db_session, new_id))[0]
+
+    copy = await service.duplicate_article(next_edition.id, new_id, pantalon.id)
+
+    articles = await _articles(db_session, new_id)
+    assert copy.line_number == 2
+    assert [(a.line_number, a.description) for a in articles] == [
+        (1, "Pantalon bleu"),
+        (2, "Pantalon bleu"),
+        (3, "Puzzle 100 pièces"),
+        (4, "Poussette canne"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_article_checks_limits(
+    db_session: AsyncSession, item_list: ItemList, next_edition: Edition
+):
+    """Test that duplicating a 13th clothing article is rejected."""
+    draft = ItemList(
+        number=300,
+        edition_id=next_edition.id,
+        depositor_id=item_list.depositor_id,
+    )
+    db_session.add(draft)
+    await db_session.flush()
+    db_session.add_all(
+        Article(
+            description=f"Pull {line}",
+            category="clothing",
+            price=Decimal("2.00"),
+            line_number=line,
+            item_list_id=draft.id,
+        )
+        for line in range(1, 13)
+    )
+    await db_session.flush()
+    pull = (await _articles(db_session, draft.id))[0]
+
+    with pytest.raises(MaxClothingExceededError):
+        await ItemListService(db_session).duplicate_article(
+            next_edition.id, draft.id, pull.id
+        )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_list_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    depositor_headers: dict[str, str],
+    item_list: ItemList,
+    next_edition: Edition,
+):
+    """Test that the endpoint returns the new list overview, to its owner."""
+    url = f"/api/v1/editions/{item_list.edition_id}/listes/{item_list.id}/dupliquer"
+    body = {"targetEditionId": next_edition.id}
+
+    other = await client.post(url, json=body, headers=auth_headers)
+    response = await client.post(url, json=body, headers=depositor_headers)
+
+    assert other.status_code == 404
+
+    assert response.status_code == 201
+    data = response.json()
+    assert (data["number"], data["status"], data["articleCount"]) == (100, "draft", 3)
@@ -0,0 +1,163 @@
+"""List number allocation tests."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.exceptions import ListNumbersExhaustedError
+from app.models import Edition, ItemList
+from app.models.base import Base
+from app.models.edition import EditionStatus
+from app.models.item_list import label_color
+from app.services.list_number_service import ListNumberAllocator
+
+
+@pytest.fixture
+async def open_edition(db_session: AsyncSession) -> Edition:
+    """An edition open for declarations, without lists."""
+    edition = Edition(
+        name="Bourse Automne 2025",
+        status=EditionStatus.REGISTRATIONS_OPEN.value,
+        start_datetime=datetime(2025, 10, 4, 9, 0),
+        end_datetime=datetime(2025, 10, 5, 18, 0),
+    )
+    db_session.add(edition)
+    await db_session.flush()
+    return edition
+
+
+def test_label_colors():
+    """Test the precomputed label colors of each range."""
+    assert label_color("standard", 100) == "sky_blue"
+    assert label_color("standard", 250) == "yellow"
+    assert label_color("standard", 699) == "orange"
+    assert label_color("standard", 99) is None
+    assert label_color("list_1000", 1100) == "white"
+    assert label_color("list_2000", 2100) == "pink"
+
+
+@pytest.mark.asyncio
+async def test_numbers_follow_each_other_by_type(
+    db_session: AsyncSession, open_edition: Edition
+):
+    """Test that each list type has its own counter."""
+    allocator = ListNumberAllocator(db_session)
+
+    numbers = [
+        await allocator.allocate(open_edition.id, "standard"),
+        await allocator.allocate(open_edition.id, "list_1000"),
+        await allocator.allocate(open_edition.id, "standard"),
+    ]
+
+    assert numbers == [100, 1000, 101]
+
+
+@pytest.mark.asyncio
+async def test_counter_starts_after_existing_lists(
+    db_session: AsyncSession, edition: Edition, item_list: ItemList
+):
+    """Test that lists numbered before the counter existed are skipped."""
+    number = await ListNumberAllocator(db_session).allocate(edition.id, "standard")
+
+    assert number == item_list.number + 1
+
+
+@pytest.mark.asyncio
+async def test_batch_and_exhaustion(db_session: AsyncSession, open_edition: Edition):
+    """Test that a batch is taken whole or not at all."""
+    allocator = ListNumberAllocator(db_session)
+
+    assert await allocator.allocate_batch(open_edition.id, "standard", 3) == [
+        100,
+        101,
+        102,
+    ]
+    with pytest.raises(ListNumbersExhaustedError):
+        await allocator.allocate_batch(open_edition.id, "standard", 598)
+    batch = await allocator.allocate_batch(open_edition.id, "standard", 597)
+    assert batch[-1] == 699
+    with pytest.raises(ListNumbersExhaustedError):
+        await allocator.allocate(open_edition.id, "standard")
+
+
+@pytest.mark.asyncio
+async def test_released_numbers_are_reused(
+    db_session: AsyncSession, open_edition: Edition
+):
+    """Test that released numbers come back first, only with reuse enabled."""
+    reusing = ListNumberAllocator(db_session, reuse=True)
+    first, second, _ = await reusing.allocate_batch(open_edition.id, "standard", 3)
+
+    await ListNumberAllocator(db_session, reuse=False).release(
+        open_edition.id, "standard", first
+    )
+    assert await reusing.allocate(open_edition.id, "standard") == 103
+    await reusing.release(open_edition.id, "standard", second)
+    await reusing.release(open_edition.id, "standard", first)
+
+    assert [await reusing.allocate(open_edition.id, "standard") for _ in range(3)] == [
+        first,
+        second,
+        104,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_allocations_are_distinct(tmp_path):
+    """Test that concurrent registrations never share a number."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'numbers.db'}",
+        connect_args={"timeout": 30},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        edition = Edition(
+            name="Bourse concurrente",
+            start_datetime=datetime(2025, 10, 4, 9, 0),
+            end_datetime=datetime(2025, 10, 5, 18, 0),
+        )
+        session.add(edition)
+        await session.commit()
+
+    async def allocate() -> int:
+        async with session_factory() as session:
+            number = await ListNumberAllocator(session).allocate(edition.id, "standard")
+            await session.commit()
+            return number
+
+    try:
+        numbers = await asyncio.gather(*(allocate() for _ in range(100)))
+    finally:
+        await engine.dispose()
+
+    assert sorted(numbers) == list(range(100, 200))
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_list_endpoints(
+    client: AsyncClient, auth_headers: dict[str, str], open_edition: Edition
+):
+    """Test list creation with its number and color, and the list limit."""
+    url = f"/api/v1/editions/{open_edition.id}/listes"
+
+    responses = [
+        await client.post(url, json={"type": "standard"}, headers=auth_headers)
+        for _ in range(3)
+    ]
+
+    assert [r.status_code for r in responses] == [201, 201, 422]
+    first = responses[0].json()
+    assert (first["number"], first["labelColor"], first["status"]) == (
+        100,
+        "sky_blue",
+        "draft",
+    )
+    deleted = await client.delete(f"{url}/{first['id']}", headers=auth_headers)
+    assert deleted.status_code == 204
+    created = await client.post(url, json={}, headers=auth_headers)
+    assert created.json()["number"] == 102
@@ -0,0 +1,141 @@
+"""Structured logging pipeline tests."""
+
+import io
+import json
+import logging
+import queue
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.middleware.request_context import RequestContextMiddleware
+from app.utils.log import (
+    ContextQueueHandler,
+    JSONFormatter,
+    bind_context,
+    get_context,
+    log_context,
+    log_pipeline,
+)
+
+
+def make_record(level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", level, __file__, 1, "Sold %s", ("a1",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_format():
+    """Test that records are formatted with the documented fields."""
+    record = make_record(
+        logging.WARNING,
+        context={"correlation_id": "req-1", "edition_id": "e1"},
+        action="vente.create",
+        details={"price": "5.00"},
+        duration_ms=1.5,
+    )
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["level"] == "WARN"
+    assert entry["service"] == "api"
+    assert entry["message"] == "Sold a1"
+    assert entry["timestamp"].endswith("Z")
+    assert entry["correlation_id"] == "req-1"
+    assert entry["edition_id"] == "e1"
+    assert entry["action"] == "vente.create"
+    assert entry["details"] == {"price": "5.00"}
+    assert entry["duration_ms"] == 1.5
+
+
+def test_full_queue_drops_records():
+    """Test that records are dropped and counted when the queue is full."""
+    handler = ContextQueueHandler(queue.Queue(2))
+
+    for _ in range(5):
+        handler.handle(make_record())
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_debug_records_are_sampled():
+    """Test that DEBUG records are sampled while INFO records are all kept."""
+    handler = ContextQueueHandler(queue.Queue(), debug_sample_rate=0.0)
+
+    handler.handle(make_record(logging.DEBUG))
+    handler.handle(make_record(logging.INFO))
+
+    assert handler.queue.qsize() == 1
+    assert handler.sampled_out == 1
+
+
+def test_pipeline_writes_context():
+    """Test that the writer thread outputs records with the bound context."""
+    output = io.StringIO()
+    root = logging.getLogger()
+    previous = root.handlers[:]
+    token = log_context.set({"correlation_id": "req-2"})
+    try:
+        log_pipeline.start(logging.StreamHandler(output))
+        bind_context(user_id="u1", register_number=3)
+        logging.getLogger("app.test").info(
+            "Sale recorded", extra={"action": "vente.create"}
+        )
+        log_pipeline.stop()
+    finally:
+        log_context.reset(token)
+
+    entry = json.loads(output.getvalue())
+    assert entry["correlation_id"] == "req-2"
+    assert entry["user_id"] == "u1"
+    assert entry["register_number"] == 3
+    assert entry["action"] == "vente.create"
+    assert root.handlers == previous
+
+
+@pytest.mark.asyncio
+async def test_request_id_and_context():
+    """Test that the request ID is echoed and bound with the edition."""
+    seen = []
+
+    async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        seen.append(dict(get_context()))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    transport = ASGITransport(app=RequestContextMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        given = await client.get(
+            "/api/v1/editions/e1/ventes", headers={"X-Request-ID": "abc-123"}
+        )
+        generated = await client.get("/health", headers={"X-Request-ID": "bad id!"})
+
+    assert given.headers["x-request-id"] == "abc-123"
+    assert seen[0] == {"correlation_id": "abc-123", "edition_id": "e1"}
+    assert generated.headers["x-request-id"] not in ("", "bad id!")
+    assert seen[1] == {"correlation_id": generated.headers["x-request-id"]}
+    assert get_context() == {}
+
+
+@pytest.mark.asyncio
+async def test_unhandled_error_is_logged(caplog):
+    """Test that an unhandled error is logged with the request duration."""
+
+    async def failing_app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+        raise RuntimeError("boom")
+
+    middleware = RequestContextMiddleware(failing_app)
+    scope = {"type": "http", "method": "GET", "path": "/health", "headers": []}
+
+    with pytest.raises(RuntimeError):
+        await middleware(scope, None, None)
+
+    (record,) = [
+        r for r in caplog.records if r.name == "app.middleware.request_context"
+    ]
+    assert record.levelno == logging.ERROR
+    assert record.action == "request.error"
+    assert record.duration_ms >= 0
+    assert record.exc_info is not None
@@ -0,0 +1,182 @@
+"""Integer-cent money and payout tests.
+
+The property tests draw seeded random amounts and rates, and check that
+the cents computation gives the same results as the `Decimal` one.
+"""
+
+import json
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition, ItemList, Payout, User
+from app.models.article import ArticleStatus
+from app.models.item_list import ListStatus, ListType
+from app.models.payout import PayoutStatus
+from app.services.payout_service import PayoutService
+from app.utils.money import (
+    CENT,
+    commission_cents,
+    from_cents,
+    payout_cents,
+    rate_to_basis,
+    to_cents,
+)
+from app.utils.responses import FastJSONResponse
+
+CASES = 2000
+
+
+def _amount(rng: random.Random, high: int = 1_000_000) -> Decimal:
+    return Decimal(rng.randrange(high)).scaleb(-2)
+
+
+def _rate(rng: random.Random) -> Decimal:
+    return Decimal(rng.randrange(10_000)).scaleb(-4)
+
+
+def test_cents_round_trip():
+    """Test that any amount with 2 decimals converts exactly both ways."""
+    rng = random.Random(49)
+    for _ in range(CASES):
+        amount = _amount(rng)
+        assert from_cents(to_cents(amount)) == amount
+        assert str(from_cents(to_cents(amount))) == str(amount.quantize(CENT))
+    assert to_cents("12.345") == 1235
+    assert rate_to_basis(Decimal("0.2")) == 2000
+
+
+def test_commission_matches_decimal():
+    """Test that the commission in cents equals the rounded Decimal product."""
+    rng = random.Random(2025)
+    for _ in range(CASES):
+        gross, rate = _amount(rng), _rate(rng)
+        expected = (gross * rate).quantize(CENT, ROUND_HALF_UP)
+        assert commission_cents(to_cents(gross), rate_to_basis(rate)) == to_cents(
+            expected
+        )
+    # Half a cent goes up
+    assert commission_cents(5, 1000) == 1
+    assert commission_cents(4, 1250) == 1
+    assert commission_cents(3, 1000) == 0
+
+
+def test_payouts_of_lists_match_decimal():
+    """Test list payouts summed from article prices, in Decimal and cents."""
+    rng = random.Random(500)
+    for _ in range(200):
+        rate = _rate(rng)
+        prices = [_amount(rng, 20_000) for _ in range(rng.randrange(25))]
+        fees = _amount(rng, 300)
+        gross = sum(prices, Decimal("0.00"))
+        commission = (gross * rate).quantize(CENT, ROUND_HALF_UP)
+
+        cents = payout_cents(
+            sum(map(to_cents, prices)), rate_to_basis(rate), to_cents(fees)
+        )
+
+        assert cents == (to_cents(commission), to_cents(gross - commission - fees))
+        assert sum(cents) + to_cents(fees) == to_cents(gross)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_compute_payouts(db_session: AsyncSession, edition: Edition):
+    """Test amounts in cents, stored as euros and serialized as numbers."""
+    await db_session.execute(
+        update(Article)
+        .where(Article.barcode.in_(["012302", "012303"]))
+        .values(status=ArticleStatus.SOLD.value)
+    )
+    service = PayoutService(db_session)
+
+    (payout,) = await service.compute(edition.id)
+
+    assert (payout.total_articles, payout.sold_articles) == (3, 2)
+    assert (payout.gross_amount, payout.commission_amount, payout.net_amount) == (
+        4350,
+        870,
+        3480,
+    )
+    stored = await db_session.get(Payout, payout.id, populate_existing=True)
+    assert (stored.gross_amount, stored.net_amount) == (4350, 3480)
+    column = await db_session.scalar(text("SELECT gross_amount FROM payouts"))
+    assert Decimal(str(column)) == Decimal("43.50")
+    data = json.loads(FastJSONResponse(payout).body)
+    assert (data["grossAmount"], data["commissionAmount"]) == (43.5, 8.7)
+
+
+@pytest.mark.asyncio
+async def test_list_fees_by_list_type(
+    db_session: AsyncSession, edition: Edition, depositor: User
+):
+    """Test that lists 1000 and 2000 pay their fees out of the payout."""
+    for number, list_type in ((1100, ListType.LIST_1000), (2100, ListType.LIST_2000)):
+        item_list = ItemList(
+            number=number,
+            list_type=list_type.value,
+            status=ListStatus.CHECKED_IN.value,
+            edition_id=edition.id,
+            depositor_id=depositor.id,
+        )
+        db_session.add(item_list)
+        await db_session.flush()
+        db_session.add(
+            Article(
+                description="Robe",
+                category="clothing",
+                price=Decimal("12.00"),
+                line_number=1,
+                status=ArticleStatus.SOLD.value,
+                barcode=f"{number:04d}01",
+                item_list_id=item_list.id,
+            )
+        )
+    await db_session.flush()
+
+    payouts = await PayoutService(db_session).compute(edition.id)
+
+    assert [
+        (p.list_number, p.commission_amount, p.list_fees, p.net_amount) for p in payouts
+    ] == [(1100, 240, 100, 860), (2100, 240, 250, 710)]
+    for payout in payouts:
+        assert (
+            payout.commission_amount + payout.list_fees + payout.net_amount
+            == payout.gross_amount
+        )
+    stored = await db_session.scalars(
+        select(Payout.list_fees).order_by(Payout.list_fees)
+    )
+    assert list(stored) == [100, 250]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_recompute_keeps_settled_payouts(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+):
+    """Test that pending payouts are replaced and paid ones kept."""
+    service = PayoutService(db_session)
+    (first,) = await service.compute(edition.id)
+    (second,) = await service.compute(edition.id)
+    await db_session.execute(
+        update(Payout)
+        .where(Payout.id == second.id)
+        .values(status=PayoutStatus.PAID.value)
+    )
+
+    response = await client.post(
+        f"/api/v1/editions/{edition.id}/reversements", headers=auth_headers
+    )
+
+    assert first.id != second.id
+    assert response.json() == []
+    ids = await db_session.scalars(select(Payout.id))
+    assert list(ids) == [second.id]
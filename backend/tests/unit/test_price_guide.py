@@ -0,0 +1,153 @@
+"""Historical price guidance tests."""
+
+import statistics
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition, PriceGuide
+from app.models.article import ArticleStatus
+from app.models.edition import EditionStatus
+from app.services.price_guide_service import (
+    PriceGuideService,
+    price_guide,
+    size_band,
+)
+from app.services.seed_service import EditionShape, SeedService, SeedSummary
+
+SHAPE = EditionShape(depositors=50, lists=80, articles=1000, registers=2)
+
+
+@pytest.fixture(autouse=True)
+def reset_price_guide():
+    """Start and end every test with an empty price guide copy."""
+    price_guide.clear()
+    yield
+    price_guide.clear()
+
+
+@pytest.fixture
+async def closed_edition(db_session: AsyncSession) -> SeedSummary:
+    """A closed synthetic edition, with the price guide built from it."""
+    summary = await SeedService(db_session).generate(7, SHAPE)
+    edition = await db_session.get(Edition, summary.edition_id)
+    edition.status = EditionStatus.CLOSED.value
+    await db_session.flush()
+    await PriceGuideService(db_session).rebuild()
+    await db_session.commit()
+    return summary
+
+
+def test_size_bands():
+    """Test that free-text sizes are grouped into bands."""
+    assert [
+        size_band(size)
+        for size in ("3 mois", "18 mois", "4 ans", "8 ANS", "12 ans", "22", "38", "TU")
+    ] == [
+        "0–11 mois",
+        "12–36 mois",
+        "2–5 ans",
+        "6–10 ans",
+        "11 ans et plus",
+        "16–23",
+        "36 et plus",
+        "",
+    ]
+    assert size_band(None) == ""
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("closed_edition")
+async def test_category_guidance_matches_sold_prices(db_session: AsyncSession):
+    """Test the quartiles and sell-through of a category."""
+    result = await db_session.execute(
+        select(Article.price, Article.status).where(Article.category == "toys")
+    )
+    rows = result.all()
+    sold = sorted(
+        float(row.price) for row in rows if row.status == ArticleStatus.SOLD.value
+    )
+
+    guidance = await PriceGuideService(db_session).lookup("toys")
+
+    assert (guidance.offered, guidance.sold) == (len(rows), len(sold))
+    assert guidance.sell_through == round(len(sold) / len(rows), 4)
+    assert guidance.median_price == Decimal(str(statistics.median(sold))).quantize(
+        Decimal("0.01")
+    )
+    assert guidance.low_price <= guidance.median_price <= guidance.high_price
+    assert guidance.editions == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("closed_edition")
+async def test_lookup_falls_back_to_wider_rows(db_session: AsyncSession):
+    """Test that unknown brands and sizes get the band or category row."""
+    service = PriceGuideService(db_session)
+
+    by_band = await service.lookup("clothing", "6 ans", "Marque inconnue")
+    by_category = await service.lookup("clothing", "taille unique")
+
+    assert (by_band.size_band, by_band.brand) == ("6–10 ans", "")
+    assert (by_category.size_band, by_category.brand) == ("", "")
+    assert await service.lookup("car_seat") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("closed_edition")
+async def test_lookups_run_no_query(db_session: AsyncSession, test_engine):
+    """Test that guidance is served from memory once loaded."""
+    price_guide.clear()
+    service = PriceGuideService(db_session)
+    await service.lookup("toys")
+    statements = []
+
+    @event.listens_for(test_engine.sync_engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    try:
+        for size, brand in [("4 ans", "Kiabi"), ("38", None), (None, "Zara")]:
+            assert await service.lookup("clothing", size, brand) is not None
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert statements == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("edition", "item_list")
+async def test_open_editions_are_ignored(db_session: AsyncSession):
+    """Test that editions still in progress do not feed the guide."""
+    assert await PriceGuideService(db_session).rebuild() == 0
+
+    result = await db_session.execute(select(PriceGuide))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("closed_edition")
+async def test_price_guidance_endpoint(
+    client: AsyncClient, auth_headers: dict[str, str]
+):
+    """Test the guidance returned to the declaration form."""
+    response = await client.get(
+        "/api/v1/conseils-prix",
+        params={"categorie": "clothing", "taille": "2 ans", "marque": "Kiabi"},
+        headers=auth_headers,
+    )
+    unknown = await client.get(
+        "/api/v1/conseils-prix", params={"categorie": "car_seat"}, headers=auth_headers
+    )
+
+    body = response.json()
+    assert (body["category"], body["sizeBand"], body["brand"]) == (
+        "clothing",
+        "2–5 ans",
+        "kiabi",
+    )
+    assert isinstance(body["medianPrice"], float)
+    assert unknown.json() is None
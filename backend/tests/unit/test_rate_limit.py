@@ -0,0 +1,149 @@
+"""Rate limiting middleware tests."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+from app.middleware.rate_limit import (
+    MemoryRateLimitStore,
+    RateLimitMiddleware,
+    RatePolicy,
+    classify,
+)
+
+POLICIES = {
+    "auth": RatePolicy("auth", 2, 60),
+    "scan": RatePolicy("scan", 5, 60),
+    "export": RatePolicy("export", 1, 60),
+    "api": RatePolicy("api", 3, 60),
+}
+
+
+def bearer(user_id: str) -> dict[str, str]:
+    """Authorization header with a valid token for a user."""
+    token = jwt.encode(
+        {"sub": user_id}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def ok_app(_scope: Scope, _receive: Receive, send: Send) -> None:
+    """Minimal ASGI app answering 200."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def test_route_classes():
+    """Test that paths are mapped to their route class."""
+    assert classify("/api/v1/auth/login") == "auth"
+    assert classify("/api/v1/auth/password/reset") == "auth"
+    assert classify("/api/v1/editions/e1/ventes") == "scan"
+    assert classify("/api/v1/editions/e1/catalogue") == "scan"
+    assert classify("/api/v1/editions/e1/exports/ventes") == "export"
+    assert classify("/api/v1/editions/e1/listes/l1/etiquettes.pdf") == "export"
+    assert classify("/api/v1/editions/e1/listes") == "api"
+    assert classify("/health") is None
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_weights_previous_window():
+    """Test that the previous window still counts for its overlapping part."""
+    store = MemoryRateLimitStore()
+    policy = RatePolicy("api", 4, 60)
+    for _ in range(4):
+        assert await store.hit(policy, "c", 30.0) == 0
+    assert await store.hit(policy, "c", 59.0) == pytest.approx(1.0)
+
+    # 15 s into the next window, 75% of the previous 4 requests still count
+    assert await store.hit(policy, "c", 75.0) == 0
+    assert await store.hit(policy, "c", 75.0) > 0
+    # One window later the old requests are forgotten
+    assert await store.hit(policy, "c", 150.0) == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_clients_are_evicted():
+    """Test that clients idle for two windows are dropped."""
+    store = MemoryRateLimitStore()
+    policy = RatePolicy("api", 10, 60)
+    await store.hit(policy, "idle", 0.0)
+    await store.hit(policy, "active", 100.0)
+
+    await store.hit(policy, "active", 200.0)
+
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_above_limit():
+    """Test that clients above their limit get a 429 with Retry-After."""
+    app = RateLimitMiddleware(ok_app, MemoryRateLimitStore(), POLICIES)
+    headers = bearer("register-1")
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://t"
+    ) as client:
+        statuses = [
+            (
+                await client.get("/api/v1/editions/e1/listes", headers=headers)
+            ).status_code
+            for _ in range(4)
+        ]
+        response = await client.get("/api/v1/editions/e1/listes", headers=headers)
+        other = await client.get(
+            "/api/v1/editions/e1/listes", headers=bearer("register-2")
+        )
+        scans = [
+            (
+                await client.get("/api/v1/editions/e1/catalogue", headers=headers)
+            ).status_code
+            for _ in range(5)
+        ]
+
+    assert statuses == [200, 200, 200, 429]
+    assert response.json()["code"] == "RATE_LIMITED"
+    assert int(response.headers["retry-after"]) >= 1
+    assert other.status_code == 200
+    assert scans == [200] * 5
+
+
+@pytest.mark.asyncio
+async def test_auth_routes_are_limited_per_ip():
+    """Test that changing tokens does not bypass the login limit."""
+    app = RateLimitMiddleware(ok_app, MemoryRateLimitStore(), POLICIES)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://t"
+    ) as client:
+        statuses = [
+            (
+                await client.post(
+                    "/api/v1/auth/login", headers={"Authorization": f"Bearer {n}"}
+                )
+            ).status_code
+            for n in range(3)
+        ]
+
+    assert statuses == [200, 200, 429]
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_limited_per_ip():
+    """Test that made-up tokens share the client IP counter."""
+    store = MemoryRateLimitStore()
+    app = RateLimitMiddleware(ok_app, store, POLICIES)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://t"
+    ) as client:
+        statuses = [
+            (
+                await client.get(
+                    "/api/v1/editions/e1/listes",
+                    headers={"Authorization": f"Bearer bogus-{n}"},
+                )
+            ).status_code
+            for n in range(4)
+        ]
+
+    assert statuses == [200, 200, 200, 429]
+    assert len(store) == 1
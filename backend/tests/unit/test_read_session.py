@@ -0,0 +1,149 @@
+"""Read-only session tests."""
+
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.main import app
+from app.models import Edition, RegisterTotal
+from app.models import base as models_base
+from app.models.base import Base, ReadOnlySession, create_read_engine, get_read_session
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """A file database with an edition and a register total, and its URL."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'bourse.db'}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        edition = Edition(
+            name="Bourse Automne 2025",
+            start_datetime=date(2025, 10, 4),
+            end_datetime=date(2025, 10, 5),
+        )
+        session.add(edition)
+        await session.flush()
+        edition_id = edition.id
+        session.add(
+            RegisterTotal(
+                edition_id=edition_id,
+                day=date(2025, 10, 4),
+                register_number=1,
+                payment_method="cash",
+                sale_count=2,
+                amount=7,
+            )
+        )
+        await session.commit()
+    await engine.dispose()
+    return url, edition_id
+
+
+@pytest.fixture
+async def read_engine(database, monkeypatch):
+    """The read-only engine of the request dependency, on the file database."""
+    engine = create_read_engine(database[0])
+    monkeypatch.setattr(
+        models_base,
+        "read_session_factory",
+        async_sessionmaker(
+            engine,
+            sync_session_class=ReadOnlySession,
+            expire_on_commit=False,
+            autoflush=False,
+        ),
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("read_engine")
+async def test_read_session_refuses_writes(database):
+    """Test that queries run but changes and commits are refused."""
+    _, edition_id = database
+    async with models_base.read_session_factory() as session:
+        edition = await session.get(Edition, edition_id)
+        edition.name = "Renamed"
+
+        with pytest.raises(InvalidRequestError):
+            await session.flush()
+        with pytest.raises(InvalidRequestError):
+            await session.execute(update(Edition).values(name="Renamed"))
+        with pytest.raises(InvalidRequestError):
+            await session.commit()
+
+    async with models_base.read_session_factory() as session:
+        name = await session.scalar(select(Edition.name))
+    assert name == "Bourse Automne 2025"
+
+
+@pytest.mark.asyncio
+async def test_get_takes_only_its_queries(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    read_engine,
+    database,
+    monkeypatch,
+):
+    """Test the round trips of a GET: its SELECT, no COMMIT nor ROLLBACK."""
+    _, edition_id = database
+    app.dependency_overrides.pop(get_read_session)
+    round_trips = []
+
+    @event.listens_for(read_engine.sync_engine, "before_cursor_execute")
+    def record(_conn, _cursor, statement, *_args):
+        round_trips.append(statement.split()[0])
+
+    def counted(name, call):
+        def method(self):
+            round_trips.append(name.upper())
+            return call(self)
+
+        return method
+
+    # Transaction ends sent to the database, not only requested by SQLAlchemy
+    for name in ("commit", "rollback"):
+        call = getattr(AsyncAdapt_aiosqlite_connection, name)
+        monkeypatch.setattr(AsyncAdapt_aiosqlite_connection, name, counted(name, call))
+    url = f"/api/v1/editions/{edition_id}/caisses/1/z"
+    params = {"date": "2025-10-04"}
+
+    # The first request opens the pool's connection
+    await client.get(url, params=params, headers=auth_headers)
+    round_trips.clear()
+    response = await client.get(url, params=params, headers=auth_headers)
+
+    assert response.json()["amount"] == 7
+    assert round_trips == ["SELECT"]
+
+
+@pytest.mark.asyncio
+async def test_write_request_opens_no_read_session(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+    monkeypatch,
+):
+    """Test that an authenticated write uses its own session only."""
+    app.dependency_overrides.pop(get_read_session)
+    opened = []
+    monkeypatch.setattr(
+        models_base, "read_session_factory", lambda: opened.append(True)
+    )
+
+    response = await client.post(
+        f"/api/v1/editions/{edition.id}/caisses/recalcul",
+        params={"date": "2025-03-15"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert opened == []
@@ -0,0 +1,180 @@
+"""Register reconciliation tests."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Edition, RegisterTotal
+from app.models.sale import PaymentMethod
+from app.schemas.sale import OfflineSale
+from app.services.register_service import RegisterService, render_z_report_html
+from app.services.sale_service import SaleService
+
+
+async def _totals(db_session: AsyncSession) -> list[tuple]:
+    result = await db_session.execute(
+        select(
+            RegisterTotal.register_number,
+            RegisterTotal.payment_method,
+            RegisterTotal.sale_count,
+            RegisterTotal.amount,
+        )
+        .order_by(RegisterTotal.register_number, RegisterTotal.payment_method)
+        .execution_options(populate_existing=True)
+    )
+    return result.all()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_sales_update_running_totals(db_session: AsyncSession, edition: Edition):
+    """Test totals after a sale, a basket and a cancellation."""
+    service = SaleService(db_session)
+
+    sale = await service.record_sale(
+        edition.id, PaymentMethod.CARD, 1, barcode="012303"
+    )
+    await service.checkout_basket(
+        edition.id, ["012301", "012302"], PaymentMethod.CASH, 1
+    )
+    await service.cancel_sale(edition.id, sale.id, "Erreur de caisse")
+
+    assert await _totals(db_session) == [
+        (1, "card", 0, Decimal("0.00")),
+        (1, "cash", 2, Decimal("8.50")),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_offline_sales_count_on_their_day(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that a late sync adds to the totals of the day of the sales."""
+    service = SaleService(db_session)
+    await service.sync_offline_sales(
+        edition.id,
+        3,
+        [
+            OfflineSale(
+                offline_id="a1",
+                barcode="012301",
+                payment_method=PaymentMethod.CASH,
+                sold_at=datetime(2025, 3, 15, 17, 45),
+            )
+        ],
+    )
+
+    saturday = await RegisterService(db_session).z_report(
+        edition.id, 3, datetime(2025, 3, 15).date()
+    )
+    sunday = await RegisterService(db_session).z_report(
+        edition.id, 3, datetime(2025, 3, 16).date()
+    )
+
+    assert (saturday.sale_count, saturday.amount) == (1, Decimal("5.00"))
+    assert (sunday.sale_count, sunday.amount) == (0, Decimal("0.00"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_z_report_with_drawer_count(db_session: AsyncSession, edition: Edition):
+    """Test discrepancies between the drawer and the register."""
+    sale = await SaleService(db_session).record_sale(
+        edition.id, PaymentMethod.CASH, 2, barcode="012303"
+    )
+    day = sale.sold_at.date()
+
+    report = await RegisterService(db_session).record_count(
+        edition.id,
+        2,
+        day,
+        {PaymentMethod.CASH: Decimal("38.00"), PaymentMethod.CHECK: Decimal("0")},
+        note="Rendu de monnaie",
+    )
+
+    assert [
+        (line.payment_method, line.amount, line.discrepancy) for line in report.lines
+    ] == [
+        ("cash", Decimal("40.00"), Decimal("-2.00")),
+        ("card", Decimal("0.00"), None),
+        ("check", Decimal("0.00"), Decimal("0.00")),
+    ]
+    assert (report.amount, report.counted_amount, report.discrepancy) == (
+        Decimal("40.00"),
+        Decimal("38.00"),
+        Decimal("-2.00"),
+    )
+    html = render_z_report_html(report)
+    assert (
+        "<td>Espèces</td><td>1</td><td>40.00</td><td>38.00</td><td>-2.00</td>" in html
+    )
+    assert "Rendu de monnaie" in html
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_recompute_corrects_totals(db_session: AsyncSession, edition: Edition):
+    """Test that a recomputation restores totals from the sales."""
+    service = SaleService(db_session)
+    sale = await service.record_sale(
+        edition.id, PaymentMethod.CARD, 1, barcode="012303"
+    )
+    await service.record_sale(edition.id, PaymentMethod.CASH, 1, barcode="012301")
+    await db_session.execute(
+        update(RegisterTotal)
+        .where(RegisterTotal.payment_method == "card")
+        .values(sale_count=3, amount=Decimal("12.00"))
+    )
+
+    registers = RegisterService(db_session)
+    corrections = await registers.recompute(edition.id, sale.sold_at.date())
+    again = await registers.recompute(edition.id, sale.sold_at.date())
+
+    assert [
+        (c.payment_method, c.sale_count, c.amount, c.previous_amount)
+        for c in corrections
+    ] == [("card", 1, Decimal("40.00"), Decimal("12.00"))]
+    assert again == []
+    assert await _totals(db_session) == [
+        (1, "card", 1, Decimal("40.00")),
+        (1, "cash", 1, Decimal("5.00")),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_register_endpoints(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+):
+    """Test the drawer count, the Z-report and the recomputation endpoints."""
+    sale = await SaleService(db_session).record_sale(
+        edition.id, PaymentMethod.CHECK, 4, barcode="012302"
+    )
+    day = sale.sold_at.date().isoformat()
+    url = f"/api/v1/editions/{edition.id}/caisses"
+
+    counted = await client.put(
+        f"{url}/4/comptage",
+        json={"date": day, "amounts": {"check": "3.50"}},
+        headers=auth_headers,
+    )
+    printed = await client.get(
+        f"{url}/4/z", params={"date": day, "format": "html"}, headers=auth_headers
+    )
+    recomputed = await client.post(
+        f"{url}/recalcul", params={"date": day, "caisse": 4}, headers=auth_headers
+    )
+
+    data = counted.json()
+    assert (data["saleCount"], data["amount"], data["discrepancy"]) == (1, 3.5, 0)
+    assert printed.headers["content-type"].startswith("text/html")
+    assert "Ticket Z — caisse 4" in printed.text
+    assert recomputed.json() == []
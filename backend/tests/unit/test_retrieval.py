@@ -0,0 +1,247 @@
+"""Unsold article retrieval tests."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.exceptions import ItemListAlreadyRetrievedError, ItemListNotFoundError
+from app.models import Article, Edition, ItemList, User
+from app.models.article import ArticleStatus
+from app.models.item_list import ListStatus, ListType
+from app.services import retrieval_service
+from app.services.audit_service import AuditEvent, AuditWriter
+from app.services.cache_coherence import CacheCoherence
+from app.services.job_service import job_runner
+from app.services.retrieval_service import (
+    PicklistCache,
+    RetrievalService,
+    layout_key,
+    render_picklists_html,
+)
+
+
+async def _list(
+    db_session: AsyncSession,
+    edition: Edition,
+    depositor: User,
+    number: int,
+    label_color: str,
+    statuses: list[str],
+) -> ItemList:
+    item_list = ItemList(
+        number=number,
+        list_type=ListType.LIST_1000.value
+        if number >= 1000
+        else ListType.STANDARD.value,
+        label_color=label_color,
+        status=ListStatus.CHECKED_IN.value,
+        edition_id=edition.id,
+        depositor_id=depositor.id,
+    )
+    db_session.add(item_list)
+    await db_session.flush()
+    db_session.add_all(
+        Article(
+            description=f"Livre {line_number}",
+            category="books",
+            price=Decimal("1.50"),
+            line_number=line_number,
+            status=status,
+            barcode=f"{number:04d}{line_number:02d}",
+            item_list_id=item_list.id,
+        )
+        for line_number, status in enumerate(statuses, start=1)
+    )
+    await db_session.flush()
+    return item_list
+
+
+@pytest.fixture
+async def sale_ended(
+    db_session: AsyncSession, edition: Edition, depositor: User, item_list: ItemList
+) -> Edition:
+    """An edition whose sale is over, with the picklists built.
+
+    List 123 (sky blue) has its puzzle sold, list 205 (yellow) is sold out
+    and list 1005 (white) sold nothing.
+    """
+    await db_session.execute(
+        update(Article)
+        .where(Article.item_list_id == item_list.id, Article.barcode == "012302")
+        .values(status=ArticleStatus.SOLD.value)
+    )
+    on_sale, sold = ArticleStatus.ON_SALE.value, ArticleStatus.SOLD.value
+    await _list(db_session, edition, depositor, 1005, "white", [on_sale, on_sale])
+    await _list(db_session, edition, depositor, 205, "yellow", [sold])
+    await RetrievalService(db_session).prepare(edition.id)
+    return edition
+
+
+def test_layout_follows_label_colors():
+    """Test that bags are ordered by color zone, then by number."""
+    assert sorted(
+        [("white", 1001), ("yellow", 250), ("sky_blue", 180), ("yellow", 201)],
+        key=lambda bag: layout_key(*bag),
+    ) == [("sky_blue", 180), ("yellow", 201), ("yellow", 250), ("white", 1001)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_prepare_builds_picklists(
+    db_session: AsyncSession, edition: Edition, depositor: User
+):
+    """Test unsold articles and picklists at the end of the sale."""
+    await _list(
+        db_session, edition, depositor, 1005, "white", [ArticleStatus.ON_SALE.value]
+    )
+    service = RetrievalService(db_session)
+
+    preparation = await service.prepare(edition.id)
+
+    assert (preparation.lists, preparation.articles) == (2, 4)
+    result = await db_session.execute(select(Article.status).distinct())
+    assert result.scalars().all() == [ArticleStatus.UNSOLD.value]
+    picklists = await service.list_picklists(edition.id)
+    assert [(p.list_number, p.depositor_name) for p in picklists] == [
+        (123, "Marie Martin"),
+        (1005, "Marie Martin"),
+    ]
+    assert [(line.barcode, line.price) for line in picklists[0].lines] == [
+        ("012301", Decimal("5.00")),
+        ("012302", Decimal("3.50")),
+        ("012303", Decimal("40.00")),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_status_changes_are_audited(
+    db_session: AsyncSession, edition: Edition, depositor: User, monkeypatch
+):
+    """Test that unsold articles and retrieved lists are audited once each."""
+    writer = AuditWriter(async_sessionmaker(), batch_size=100, flush_interval=60)
+    monkeypatch.setattr(retrieval_service, "audit_log", writer)
+    white = await _list(
+        db_session, edition, depositor, 1005, "white", [ArticleStatus.ON_SALE.value]
+    )
+    service = RetrievalService(db_session)
+
+    await service.prepare(edition.id, actor_id="manager")
+    await service.process(edition.id, "1005", "donated", actor_id="volunteer")
+
+    assert [
+        (e["event"], e["entity_type"], e["entity_id"], e["actor_id"], e["details"])
+        for e in writer.pending
+    ] == [
+        (
+            AuditEvent.STATUS_OVERRIDDEN.value,
+            "edition",
+            edition.id,
+            "manager",
+            {"from_status": "on_sale", "status": "unsold", "articles": 4},
+        ),
+        (
+            AuditEvent.STATUS_OVERRIDDEN.value,
+            "liste",
+            white.id,
+            "volunteer",
+            {"status": "retrieved", "outcome": "donated", "articles": 1},
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_list_in_one_call(db_session: AsyncSession, sale_ended: Edition):
+    """Test that a list's unsold articles are all handed back at once."""
+    service = RetrievalService(db_session)
+
+    picklist = await service.process(sale_ended.id, "L123", "retrieved")
+    donated = await service.process(sale_ended.id, "1005", "donated")
+
+    result = await db_session.execute(
+        select(ItemList.number, ItemList.status, Article.status)
+        .join(Article)
+        .order_by(ItemList.number, Article.line_number)
+        .execution_options(populate_existing=True)
+    )
+    assert result.all() == [
+        (123, "retrieved", "retrieved"),
+        (123, "retrieved", "sold"),
+        (123, "retrieved", "retrieved"),
+        (205, "checked_in", "sold"),
+        (1005, "retrieved", "donated"),
+        (1005, "retrieved", "donated"),
+    ]
+    assert (picklist.outcome, donated.outcome) == ("retrieved", "donated")
+    assert (await service.get_picklist(sale_ended.id, "123")).outcome == "retrieved"
+    with pytest.raises(ItemListAlreadyRetrievedError):
+        await service.process(sale_ended.id, "123", "donated")
+    with pytest.raises(ItemListNotFoundError):
+        await service.process(sale_ended.id, "205", "retrieved")
+
+
+@pytest.mark.asyncio
+async def test_other_worker_sees_processed_list(
+    db_session: AsyncSession, sale_ended: Edition
+):
+    """Test that another worker reloads only the processed picklist."""
+    other = PicklistCache(CacheCoherence())
+    before = dict(await other.get(db_session, sale_ended.id))
+
+    await RetrievalService(db_session).process(sale_ended.id, "123", "retrieved")
+    after = await other.get(db_session, sale_ended.id)
+
+    assert before[123].outcome is None
+    assert after[123].outcome == "retrieved"
+    assert after[1005] is before[1005]
+    assert list(after) == [123, 1005]
+
+
+@pytest.mark.asyncio
+async def test_picklists_html(db_session: AsyncSession, sale_ended: Edition):
+    """Test the printable page, one section per label color."""
+    picklists = await RetrievalService(db_session).list_picklists(sale_ended.id)
+
+    html = render_picklists_html("Retrait", picklists)
+
+    assert html.index("Étiquettes bleu ciel") < html.index("Liste 123 — Marie Martin")
+    assert html.index("Liste 123") < html.index("Étiquettes blanc")
+    assert "<td>012303</td><td>Livre" not in html
+    assert "<td>☐</td><td>3</td><td>012303</td><td>Poussette canne</td>" in html
+
+
+@pytest.mark.asyncio
+async def test_retrieval_endpoints(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    test_engine,
+    sale_ended: Edition,
+    monkeypatch,
+    tmp_path,
+):
+    """Test the desk endpoints and the printable export job."""
+    monkeypatch.setattr(job_runner, "session_factory", async_sessionmaker(test_engine))
+    monkeypatch.setattr(job_runner, "output_dir", str(tmp_path))
+    url = f"/api/v1/editions/{sale_ended.id}/retrait"
+
+    white = await client.get(
+        f"{url}/listes", params={"couleur": "white"}, headers=auth_headers
+    )
+    processed = await client.post(
+        f"{url}/listes/L1005", json={"outcome": "donated"}, headers=auth_headers
+    )
+    export = await client.post(
+        f"{url}/export", json={"format": "html"}, headers=auth_headers
+    )
+    await job_runner.stop()
+    job = await client.get(f"/api/v1/jobs/{export.json()['id']}", headers=auth_headers)
+    download = await client.get(job.json()["resultUrl"], headers=auth_headers)
+
+    assert [picklist["listNumber"] for picklist in white.json()] == [1005]
+    assert processed.json()["outcome"] == "donated"
+    assert export.status_code == 202
+    assert "Liste 123" in download.text
+    assert "Liste 1005" not in download.text
@@ -0,0 +1,206 @@
+"""Sale service tests."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    ArticleAlreadySoldError,
+    ArticleNotAvailableError,
+    ArticleNotFoundError,
+    BasketUnavailableError,
+)
+from app.models import Article, Edition, ItemList, Sale
+from app.models.article import ArticleStatus
+from app.models.sale import PaymentMethod
+from app.schemas.sale import OfflineSale
+from app.services.catalog_service import get_catalog_version
+from app.services.sale_service import SaleService
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_record_sale_by_barcode(db_session: AsyncSession, edition: Edition):
+    """Test that a sale marks the article sold and bumps the catalog."""
+    sale = await SaleService(db_session).record_sale(
+        edition.id, PaymentMethod.CARD, 2, barcode="012303"
+    )
+
+    article = await db_session.get(Article, sale.article_id, populate_existing=True)
+    assert article.status == ArticleStatus.SOLD.value
+    assert article.change_version == await get_catalog_version(db_session, edition.id)
+    assert str(sale.price) == "40.00"
+    assert sale.register_number == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_second_sale_is_rejected(db_session: AsyncSession, edition: Edition):
+    """Test that selling the same article twice raises ArticleAlreadySoldError."""
+    service = SaleService(db_session)
+    await service.record_sale(edition.id, PaymentMethod.CASH, 1, barcode="012301")
+
+    with pytest.raises(ArticleAlreadySoldError):
+        await service.record_sale(edition.id, PaymentMethod.CASH, 2, barcode="012301")
+
+    count = await db_session.scalar(select(func.count(Sale.id)))
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_barcode(db_session: AsyncSession, edition: Edition):
+    """Test that an unknown barcode raises ArticleNotFoundError."""
+    with pytest.raises(ArticleNotFoundError):
+        await SaleService(db_session).record_sale(
+            edition.id, PaymentMethod.CASH, 1, barcode="999999"
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_article_not_on_sale(db_session: AsyncSession, edition: Edition):
+    """Test that an article not checked in cannot be sold."""
+    result = await db_session.execute(
+        select(Article).where(Article.barcode == "012302")
+    )
+    result.scalar_one().status = ArticleStatus.VALIDATED.value
+    await db_session.flush()
+
+    with pytest.raises(ArticleNotAvailableError):
+        await SaleService(db_session).record_sale(
+            edition.id, PaymentMethod.CASH, 1, barcode="012302"
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_create_sale_endpoint_conflict(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that the endpoint returns 201, then 409 for the same article."""
+    url = f"/api/v1/editions/{edition.id}/ventes"
+    body = {"barcode": "012301", "paymentMethod": "cash", "registerNumber": 1}
+
+    response = await client.post(url, json=body, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["price"] == 5.0
+
+    response = await client.post(url, json=body, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json()["code"] == "ARTICLE_ALREADY_SOLD"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_cancel_sale_puts_article_back_on_sale(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that cancelling a sale deletes it and frees the article."""
+    service = SaleService(db_session)
+    sale = await service.record_sale(
+        edition.id, PaymentMethod.CASH, 1, barcode="012301"
+    )
+
+    await service.cancel_sale(edition.id, sale.id, "Erreur de caisse")
+
+    article = await db_session.get(Article, sale.article_id, populate_existing=True)
+    assert article.status == ArticleStatus.ON_SALE.value
+    assert await db_session.scalar(select(func.count(Sale.id))) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_sync_offline_sales_reports_conflicts(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that offline sync records valid sales and reports the others."""
+    service = SaleService(db_session)
+    await service.record_sale(edition.id, PaymentMethod.CASH, 1, barcode="012301")
+    sales = [
+        OfflineSale(
+            offline_id=str(i),
+            barcode=barcode,
+            payment_method="cash",
+            sold_at=datetime(2025, 3, 15, 10, i),
+        )
+        for i, barcode in enumerate(["012301", "012302", "999999"])
+    ]
+
+    result = await service.sync_offline_sales(edition.id, 2, sales)
+
+    assert result.synchronized == 1
+    assert [(c.barcode, c.error) for c in result.conflicts] == [
+        ("012301", "already_sold"),
+        ("999999", "not_found"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkout_basket_sells_every_article(
+    db_session: AsyncSession, edition: Edition, item_list: ItemList
+):
+    """Test that a basket is sold in one transaction with a single payment."""
+    receipt = await SaleService(db_session).checkout_basket(
+        edition.id, ["012301", "012302", "012303"], PaymentMethod.CARD, 1
+    )
+
+    assert receipt.total == Decimal("48.50")
+    assert {sale.payment_method for sale in receipt.sales} == {"card"}
+    result = await db_session.execute(
+        select(Article.status).where(Article.item_list_id == item_list.id)
+    )
+    assert set(result.scalars()) == {ArticleStatus.SOLD.value}
+    assert await db_session.scalar(select(func.count(Sale.id))) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_checkout_basket_reports_each_failure(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that a basket with a sold article sells nothing and reports why."""
+    service = SaleService(db_session)
+    await service.record_sale(edition.id, PaymentMethod.CASH, 2, barcode="012302")
+
+    with pytest.raises(BasketUnavailableError) as exc_info:
+        await service.checkout_basket(
+            edition.id,
+            ["012301", "012302", "999999", "012301"],
+            PaymentMethod.CASH,
+            1,
+        )
+
+    assert exc_info.value.failures == [
+        {"barcode": "012302", "error": "already_sold"},
+        {"barcode": "999999", "error": "not_found"},
+        {"barcode": "012301", "error": "duplicate"},
+    ]
+    assert await db_session.scalar(select(func.count(Sale.id))) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_checkout_basket_endpoint_conflict(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that the basket endpoint returns 409 with the failed barcodes."""
+    url = f"/api/v1/editions/{edition.id}/ventes/panier"
+    body = {"barcodes": ["012301"], "paymentMethod": "cash", "registerNumber": 1}
+
+    response = await client.post(url, json=body, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["total"] == 5.0
+
+    response = await client.post(url, json=body, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json()["failures"] == [
+        {"barcode": "012301", "error": "already_sold"}
+    ]
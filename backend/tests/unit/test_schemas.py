@@ -0,0 +1,129 @@
+"""Read model and projection query tests."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Edition, ItemList, Sale
+from app.repositories.article_repository import ArticleRepository
+from app.repositories.item_list_repository import ItemListRepository
+from app.schemas.article import ArticleSummary
+from app.utils.responses import FastJSONResponse
+
+
+def test_read_model_serializes_camel_case_and_numeric_price():
+    """Test that read models match the frontend JSON conventions."""
+    article = ArticleSummary.from_row(
+        [
+            "a1",
+            1,
+            "Pantalon",
+            "clothing",
+            "8 ans",
+            None,
+            None,
+            Decimal("5.50"),
+            False,
+            None,
+            "on_sale",
+            "012301",
+        ]
+    )
+
+    data = json.loads(FastJSONResponse(article).body)
+
+    assert data["lineNumber"] == 1
+    assert data["price"] == 5.5
+    assert data["lotQuantity"] is None
+
+
+@pytest.mark.asyncio
+async def test_article_projection(db_session: AsyncSession, item_list: ItemList):
+    """Test that the projection query returns slim models in line order."""
+    articles = await ArticleRepository(db_session).list_summaries(item_list.id)
+
+    assert [a.line_number for a in articles] == [1, 2, 3]
+    assert all(isinstance(a, ArticleSummary) for a in articles)
+    assert articles[2].price == Decimal("40.00")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_item_list_summary_counts(db_session: AsyncSession, edition: Edition):
+    """Test that list overviews count articles and clothing in SQL."""
+    summaries = await ItemListRepository(db_session).list_summaries(edition.id)
+
+    assert len(summaries) == 1
+    assert summaries[0].article_count == 3
+    assert summaries[0].clothing_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_articles_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+    item_list: ItemList,
+):
+    """Test the list articles endpoint and its revalidation."""
+    url = f"/api/v1/editions/{edition.id}/listes/{item_list.id}/articles"
+    response = await client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [a["barcode"] for a in response.json()] == ["012301", "012302", "012303"]
+
+    response = await client.get(
+        url, headers={**auth_headers, "If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_list_articles_unknown_list(
+    client: AsyncClient, auth_headers: dict[str, str], edition: Edition
+):
+    """Test that an unknown list returns 404."""
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/listes/unknown/articles", headers=auth_headers
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sales_history_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+    edition: Edition,
+    item_list: ItemList,
+):
+    """Test the paginated sales history filtered by register."""
+    await db_session.refresh(item_list, ["articles"])
+    for register_number, article in enumerate(item_list.articles, start=1):
+        db_session.add(
+            Sale(
+                sold_at=datetime(2025, 3, 15, 10, register_number),
+                price=article.price,
+                payment_method="cash",
+                register_number=register_number,
+                edition_id=edition.id,
+                article_id=article.id,
+            )
+        )
+    await db_session.flush()
+
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/ventes",
+        params={"caisse": 2, "date": "2025-03-15"},
+        headers=auth_headers,
+    )
+
+    data = response.json()
+    assert data["total"] == 1
+    assert data["items"][0]["registerNumber"] == 2
+    assert data["page"] == 1
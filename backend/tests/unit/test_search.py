@@ -0,0 +1,184 @@
+"""Article search tests."""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Article, Edition, ItemList
+from app.models.article import ArticleStatus
+from app.services.catalog_service import next_catalog_version
+from app.services.search_service import (
+    EditionIndex,
+    SearchService,
+    normalize,
+    search_index,
+    tokenize,
+)
+
+
+@pytest.fixture
+async def brands(db_session: AsyncSession, item_list: ItemList) -> ItemList:
+    """Give the test list's articles a brand and a color."""
+    result = await db_session.execute(
+        select(Article).where(Article.item_list_id == item_list.id)
+    )
+    for article, (brand, color) in zip(
+        result.scalars(),
+        [("Okaïdi", "bleu"), ("Ravensburger", None), ("Yoyo", "écru")],
+        strict=True,
+    ):
+        article.brand, article.color = brand, color
+    await db_session.flush()
+    return item_list
+
+
+def test_tokens_ignore_case_and_accents():
+    """Test that French text is normalized for matching."""
+    assert normalize("Bébé Écru") == "bebe ecru"
+    assert tokenize("Tee-shirt, 6 ans (Okaïdi)") == [
+        "tee",
+        "shirt",
+        "6",
+        "ans",
+        "okaidi",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("brands")
+async def test_search_matches_words_accents_and_typos(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test exact, accent-insensitive, prefix and misspelled queries."""
+    service = SearchService(db_session)
+
+    async def barcodes(query: str) -> list[str]:
+        return [hit.barcode for hit in await service.search(edition.id, query)]
+
+    assert await barcodes("pantalon okaidi") == ["012301"]
+    assert await barcodes("ECRU") == ["012303"]
+    assert await barcodes("pous") == ["012303"]
+    assert await barcodes("pantallon") == ["012301"]
+    assert await barcodes("jouet") == ["012302"]
+    assert await barcodes("pantalon rouge") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_search_filters(db_session: AsyncSession, edition: Edition):
+    """Test the list number, price range and status filters."""
+    service = SearchService(db_session)
+
+    hits = await service.search(edition.id, "", min_price=Decimal("4"))
+    assert [hit.barcode for hit in hits] == ["012301", "012303"]
+    hits = await service.search(edition.id, "", list_number=124)
+    assert hits == []
+    hits = await service.search(edition.id, "", max_price=Decimal("10"), limit=1)
+    assert [hit.barcode for hit in hits] == ["012301"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_index_follows_catalog_changes(
+    db_session: AsyncSession, edition: Edition
+):
+    """Test that sales are applied as a catalog delta, not a rebuild."""
+    service = SearchService(db_session)
+    assert [hit.status for hit in await service.search(edition.id, "puzzle")] == [
+        "on_sale"
+    ]
+    result = await db_session.execute(
+        select(Article).where(Article.barcode == "012302")
+    )
+    article = result.scalar_one()
+    article.status = ArticleStatus.SOLD.value
+    article.change_version = await next_catalog_version(db_session, edition.id)
+    await db_session.flush()
+
+    hits = await service.search(edition.id, "puzzle", status="sold")
+
+    assert [hit.barcode for hit in hits] == ["012302"]
+
+
+@pytest.mark.asyncio
+async def test_invalidated_list_is_reloaded(
+    db_session: AsyncSession, edition: Edition, item_list: ItemList
+):
+    """Test that an edited list is reloaded on the next search."""
+    service = SearchService(db_session)
+    assert await service.search(edition.id, "trottinette") == []
+    db_session.add(
+        Article(
+            description="Trottinette",
+            category="toys",
+            price=Decimal("12.00"),
+            line_number=4,
+            item_list_id=item_list.id,
+        )
+    )
+    await db_session.flush()
+
+    search_index.invalidate_list(edition.id, item_list.id)
+    hits = await service.search(edition.id, "trottinette")
+
+    assert [(hit.list_number, hit.line_number) for hit in hits] == [(123, 4)]
+
+
+def test_remove_cleans_postings():
+    """Test that removed articles leave no postings behind."""
+    index = EditionIndex()
+    row = Article(
+        id="a1",
+        item_list_id="l1",
+        line_number=1,
+        barcode=None,
+        description="Robe",
+        category="clothing",
+        size=None,
+        brand=None,
+        color=None,
+        price=Decimal("4.00"),
+        status="draft",
+    )
+    row.list_number = 100
+    index.add(row)
+
+    index.remove_list("l1")
+
+    assert len(index) == 0
+    assert index.search("robe") == []
+    assert index._words == {} and index._trigrams == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_search_endpoint(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test the search endpoint with its French query aliases."""
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/articles/recherche",
+        params={"q": "poussete", "prix_max": "50"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    (hit,) = response.json()
+    assert (hit["barcode"], hit["listNumber"], hit["price"]) == ("012303", 123, 40.0)
+
+
+@pytest.mark.asyncio
+async def test_search_unknown_edition(
+    client: AsyncClient, auth_headers: dict[str, str]
+):
+    """Test that searching an unknown edition answers 404."""
+    response = await client.get(
+        "/api/v1/editions/unknown/articles/recherche?q=robe", headers=auth_headers
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,129 @@
+"""Synthetic edition generator tests."""
+
+from collections import Counter
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.exceptions import ValidationError
+from app.models import Article, ItemList, Sale
+from app.models.article import (
+    CLOTHING_CATEGORIES,
+    MAX_ARTICLES_PER_LIST,
+    MAX_CLOTHING_PER_LIST,
+    MAX_PRICES,
+    MIN_PRICE,
+    ArticleStatus,
+)
+from app.models.base import Base
+from app.models.item_list import LABEL_COLORS, MAX_LISTS_PER_DEPOSITOR
+from app.services.seed_service import EditionShape, SeedService, SeedSummary
+
+SMALL = EditionShape(depositors=20, lists=30, articles=200, registers=2)
+
+
+@pytest.mark.asyncio
+async def test_synthetic_edition_follows_list_rules(
+    db_session: AsyncSession, synthetic_edition: SeedSummary
+):
+    """Test that the full-size edition respects list and price rules."""
+    assert synthetic_edition.counts == {
+        "depositors": 500,
+        "lists": 1000,
+        "articles": 10000,
+        "sales": 6000,
+    }
+
+    result = await db_session.execute(
+        select(ItemList.list_type, ItemList.depositor_id, ItemList.label_color).where(
+            ItemList.edition_id == synthetic_edition.edition_id
+        )
+    )
+    lists = result.all()
+    per_depositor = Counter((row.list_type, row.depositor_id) for row in lists)
+    assert all(
+        count <= MAX_LISTS_PER_DEPOSITOR[list_type]
+        for (list_type, _), count in per_depositor.items()
+    )
+    assert {row.label_color for row in lists} == set(LABEL_COLORS.values())
+
+    result = await db_session.execute(
+        select(Article.item_list_id, Article.category, Article.price)
+    )
+    articles = result.all()
+    per_list = Counter(row.item_list_id for row in articles)
+    clothing = Counter(
+        row.item_list_id for row in articles if row.category in CLOTHING_CATEGORIES
+    )
+    assert max(per_list.values()) <= MAX_ARTICLES_PER_LIST
+    assert max(clothing.values()) <= MAX_CLOTHING_PER_LIST
+    assert all(
+        MIN_PRICE <= row.price <= MAX_PRICES.get(row.category, MAX_PRICES["default"])
+        for row in articles
+    )
+    assert "car_seat" not in {row.category for row in articles}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("synthetic_edition")
+async def test_sales_follow_arrival_curve(db_session: AsyncSession):
+    """Test that sales spread over the registers, busiest at opening."""
+    result = await db_session.execute(select(Sale.register_number, Sale.sold_at))
+    sales = result.all()
+    per_hour = Counter(row.sold_at.hour for row in sales)
+
+    assert {row.register_number for row in sales} == set(range(1, 9))
+    assert min(per_hour) == 9 and max(per_hour) == 17
+    assert per_hour[9] > per_hour[12]
+    result = await db_session.execute(
+        select(func.count(Article.id)).where(Article.status == ArticleStatus.SOLD.value)
+    )
+    assert result.scalar_one() == len(sales)
+
+
+async def _generate_rows(seed: int) -> list[tuple]:
+    """Generate a small edition in a fresh database; get its articles."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        await SeedService(session).generate(seed, SMALL)
+        result = await session.execute(
+            select(
+                Article.id, Article.description, Article.price, Article.status
+            ).order_by(Article.barcode)
+        )
+        rows = [tuple(row) for row in result]
+    await engine.dispose()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_same_seed_gives_same_rows():
+    """Test that the generator is deterministic for a seed."""
+    rows = await _generate_rows(5)
+
+    assert len(rows) == 200
+    assert await _generate_rows(5) == rows
+    assert await _generate_rows(6) != rows
+
+
+@pytest.mark.asyncio
+async def test_seed_already_generated(db_session: AsyncSession):
+    """Test that a seed's edition cannot be generated twice."""
+    await SeedService(db_session).generate(1, SMALL)
+
+    with pytest.raises(ValidationError):
+        await SeedService(db_session).generate(1, SMALL)
+
+
+@pytest.mark.asyncio
+async def test_shape_beyond_number_range(db_session: AsyncSession):
+    """Test that more standard lists than numbers are refused."""
+    with pytest.raises(ValidationError) as exc_info:
+        await SeedService(db_session).generate(
+            shape=EditionShape(depositors=2000, lists=2000, articles=20000)
+        )
+
+    assert exc_info.value.field == "lists"
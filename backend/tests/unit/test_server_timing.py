@@ -0,0 +1,104 @@
+"""Server-Timing header and slow request log tests."""
+
+import logging
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.models import Edition
+from app.utils.timing import PhaseTimer, phase, request_timer
+
+
+def parse(header: str) -> dict[str, float]:
+    """Map the metric names of a Server-Timing header to their durations."""
+    metrics = {}
+    for metric in header.split(", "):
+        name, duration = metric.split(";dur=")
+        metrics[name] = float(duration)
+    return metrics
+
+
+async def timed_app(_scope: Scope, _receive: Receive, send: Send) -> None:
+    """ASGI app spending time in the auth and db phases."""
+    with phase("auth"):
+        time.sleep(0.002)
+    with phase("db"):
+        time.sleep(0.003)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def test_breakdown_reports_remainder_as_handler():
+    """Test that time outside the measured phases is reported as handler."""
+    timer = PhaseTimer()
+    timer.add("db", 0.003)
+    timer.add("db", 0.002)
+    time.sleep(0.01)
+
+    breakdown = timer.breakdown()
+
+    assert list(breakdown) == ["db", "handler", "total"]
+    assert breakdown["db"] == 5.0
+    assert breakdown["handler"] >= 5.0
+    assert breakdown["total"] == pytest.approx(
+        breakdown["db"] + breakdown["handler"], abs=0.2
+    )
+
+
+def test_phase_outside_request_is_ignored():
+    """Test that marking a phase without a request timer is a no-op."""
+    with phase("auth"):
+        pass
+
+    assert request_timer.get() is None
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header():
+    """Test that the response carries the phases of the request."""
+    transport = ASGITransport(app=ServerTimingMiddleware(timed_app))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/health")
+
+    metrics = parse(response.headers["server-timing"])
+    assert list(metrics) == ["auth", "db", "handler", "total"]
+    assert metrics["auth"] >= 2.0
+    assert metrics["db"] >= 3.0
+    assert metrics["total"] >= metrics["auth"] + metrics["db"] - 0.2
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_logged(caplog):
+    """Test that requests above the threshold are logged with their phases."""
+    transport = ASGITransport(
+        app=ServerTimingMiddleware(timed_app, slow_threshold_ms=1)
+    )
+    with caplog.at_level(logging.WARNING, logger="app.middleware.server_timing"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/health")
+
+    (record,) = caplog.records
+    assert record.action == "request.slow"
+    assert record.details["status"] == 200
+    assert record.details["phases"]["db"] >= 3.0
+    assert record.duration_ms >= 5.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("item_list")
+async def test_api_reports_database_time(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    edition: Edition,
+):
+    """Test that API responses time authentication, SQL and serialization."""
+    response = await client.get(
+        f"/api/v1/editions/{edition.id}/catalogue", headers=auth_headers
+    )
+
+    metrics = parse(response.headers["server-timing"])
+    assert {"auth", "db", "serialize", "handler", "total"} <= set(metrics)
+    assert metrics["db"] > 0